@@ -62,7 +62,17 @@ if TYPE_CHECKING:
     from typing import Any
 
     from pinecone._client import Pinecone
-    from pinecone._internal.config import PineconeConfig, RetryConfig
+    from pinecone._internal.config import BatchRetryPolicy, PineconeConfig, RetryConfig
+    from pinecone._internal.embed_cache import EmbeddingCache
+    from pinecone._internal.instrumentation import RequestAttempt, RequestEvent, RequestListener
+    from pinecone._internal.metrics import (
+        ClientMetrics,
+        HistogramSnapshot,
+        MetricsSnapshot,
+        OperationMetrics,
+        PoolMetrics,
+    )
+    from pinecone._internal.polling import AsyncPoller, Poller
     from pinecone.admin import Admin
     from pinecone.async_client.async_index import AsyncIndex
     from pinecone.async_client.pinecone import AsyncPinecone
@@ -102,6 +112,7 @@ if TYPE_CHECKING:
     from pinecone.grpc import GrpcIndex
     from pinecone.grpc.future import PineconeFuture
     from pinecone.index import Index
+    from pinecone.index.bulk_import import ImportWriter, validate_import_files
     from pinecone.inference.models.index_embed import IndexEmbed
     from pinecone.models.admin.api_key import APIKeyList, APIKeyModel, APIKeyRole, APIKeyWithSecret
     from pinecone.models.admin.organization import OrganizationList, OrganizationModel
@@ -111,9 +122,10 @@ if TYPE_CHECKING:
         ChatCompletionResponse,
         ChatResponse,
     )
-    from pinecone.models.assistant.context import ContextResponse
-    from pinecone.models.assistant.evaluation import AlignmentResult
+    from pinecone.models.assistant.context import ContextResponse, MultiContextResponse
+    from pinecone.models.assistant.evaluation import AlignmentEvaluation, AlignmentResult
     from pinecone.models.assistant.file_model import AssistantFileModel
+    from pinecone.models.assistant.file_upload import FileUploadError, FileUploadResult
     from pinecone.models.assistant.list import ListAssistantsResponse, ListFilesResponse
     from pinecone.models.assistant.message import Message
     from pinecone.models.assistant.model import AssistantModel
@@ -151,6 +163,7 @@ if TYPE_CHECKING:
     from pinecone.models.imports.error_mode import ImportErrorMode
     from pinecone.models.imports.list import ImportList
     from pinecone.models.imports.model import ImportModel, StartImportResponse
+    from pinecone.models.imports.validation import ImportValidationReport
     from pinecone.models.indexes.index import (
         ByocSpecInfo,
         IndexModel,
@@ -218,20 +231,25 @@ __all__ = [
     "APIKeyRole",
     "APIKeyWithSecret",
     "Admin",
+    "AlignmentEvaluation",
     "AlignmentResult",
     "ApiError",
     "AssistantFileModel",
     "AssistantModel",
+    "AsyncBufferedWriter",
     "AsyncChatCompletionStream",
     "AsyncChatStream",
     "AsyncIndex",
     "AsyncPaginator",
     "AsyncPinecone",
+    "AsyncPoller",
     "AwsRegion",
     "AzureRegion",
     "BackupList",
     "BackupModel",
     "BatchResponseInfo",
+    "BatchRetryPolicy",
+    "BufferedWriter",
     "ByocSpec",
     "ByocSpecInfo",
     "ChatCompletionMessage",
@@ -241,6 +259,7 @@ __all__ = [
     "ChatResponse",
     "ChatStream",
     "ChatStreamChunk",
+    "ClientMetrics",
     "CloudProvider",
     "CollectionDescription",
     "CollectionList",
@@ -254,19 +273,25 @@ __all__ = [
     "DescribeIndexStatsResponse",
     "EmbedConfig",
     "EmbedModel",
+    "EmbeddingCache",
     "EmbeddingsList",
     "FetchByMetadataResponse",
     "FetchResponse",
     "Field",
+    "FileUploadError",
+    "FileUploadResult",
     "FilterBuilder",
     "ForbiddenError",
     "ForbiddenException",
     "GcpRegion",
     "GrpcIndex",
+    "HistogramSnapshot",
     "Hit",
     "ImportErrorMode",
     "ImportList",
     "ImportModel",
+    "ImportValidationReport",
+    "ImportWriter",
     "Index",
     "IndexEmbed",
     "IndexInitFailedError",
@@ -282,12 +307,15 @@ __all__ = [
     "ListResponse",
     "Message",
     "Metric",
+    "MetricsSnapshot",
     "ModelIndexEmbed",
     "ModelInfo",
     "ModelInfoList",
+    "MultiContextResponse",
     "NamespaceDescription",
     "NotFoundError",
     "NotFoundException",
+    "OperationMetrics",
     "OrganizationList",
     "OrganizationModel",
     "Page",
@@ -313,12 +341,17 @@ __all__ = [
     "PodSpec",
     "PodSpecInfo",
     "PodType",
+    "Poller",
+    "PoolMetrics",
     "ProjectList",
     "ProjectModel",
     "QueryNamespacesResults",
     "QueryResponse",
     "QueryResultsAggregator",
     "RankedDocument",
+    "RequestAttempt",
+    "RequestEvent",
+    "RequestListener",
     "RerankConfig",
     "RerankModel",
     "RerankResult",
@@ -353,6 +386,7 @@ __all__ = [
     "Vector",
     "VectorType",
     "__version__",
+    "validate_import_files",
 ]
 
 # Lazy-load heavy classes to keep cold import under 10ms.
@@ -389,20 +423,26 @@ _LAZY_IMPORTS: dict[str, tuple[str, str]] = {
     "APIKeyList": ("pinecone.models.admin.api_key", "APIKeyList"),
     "APIKeyModel": ("pinecone.models.admin.api_key", "APIKeyModel"),
     "APIKeyWithSecret": ("pinecone.models.admin.api_key", "APIKeyWithSecret"),
+    "AlignmentEvaluation": ("pinecone.models.assistant.evaluation", "AlignmentEvaluation"),
     "AlignmentResult": ("pinecone.models.assistant.evaluation", "AlignmentResult"),
     "AsyncPaginator": ("pinecone.models.pagination", "AsyncPaginator"),
     "AssistantFileModel": ("pinecone.models.assistant.file_model", "AssistantFileModel"),
+    "FileUploadError": ("pinecone.models.assistant.file_upload", "FileUploadError"),
+    "FileUploadResult": ("pinecone.models.assistant.file_upload", "FileUploadResult"),
     "AssistantModel": ("pinecone.models.assistant.model", "AssistantModel"),
     "AsyncChatCompletionStream": (
         "pinecone.models.assistant.streaming",
         "AsyncChatCompletionStream",
     ),
     "AsyncChatStream": ("pinecone.models.assistant.streaming", "AsyncChatStream"),
+    "AsyncBufferedWriter": ("pinecone.async_client.buffered_writer", "AsyncBufferedWriter"),
     "AsyncIndex": ("pinecone.async_client.async_index", "AsyncIndex"),
     "AsyncPinecone": ("pinecone.async_client.pinecone", "AsyncPinecone"),
+    "AsyncPoller": ("pinecone._internal.polling", "AsyncPoller"),
     "PineconeAsyncio": ("pinecone.async_client.pinecone", "AsyncPinecone"),
     "BackupList": ("pinecone.models.backups.list", "BackupList"),
     "BackupModel": ("pinecone.models.backups.model", "BackupModel"),
+    "BufferedWriter": ("pinecone.index.buffered_writer", "BufferedWriter"),
     "ByocSpec": ("pinecone.models.indexes.specs", "ByocSpec"),
     "ByocSpecInfo": ("pinecone.models.indexes.index", "ByocSpecInfo"),
     "CloudProvider": ("pinecone.models.enums", "CloudProvider"),
@@ -441,6 +481,7 @@ _LAZY_IMPORTS: dict[str, tuple[str, str]] = {
     ),
     "EmbedConfig": ("pinecone.models.indexes.specs", "EmbedConfig"),
     "EmbedModel": ("pinecone.models.enums", "EmbedModel"),
+    "EmbeddingCache": ("pinecone._internal.embed_cache", "EmbeddingCache"),
     "EmbeddingsList": ("pinecone.models.inference.embed", "EmbeddingsList"),
     "FetchByMetadataResponse": (
         "pinecone.models.vectors.responses",
@@ -456,6 +497,8 @@ _LAZY_IMPORTS: dict[str, tuple[str, str]] = {
     "ImportErrorMode": ("pinecone.models.imports.error_mode", "ImportErrorMode"),
     "ImportList": ("pinecone.models.imports.list", "ImportList"),
     "ImportModel": ("pinecone.models.imports.model", "ImportModel"),
+    "ImportValidationReport": ("pinecone.models.imports.validation", "ImportValidationReport"),
+    "ImportWriter": ("pinecone.index.bulk_import", "ImportWriter"),
     "Index": ("pinecone.index", "Index"),
     "IndexEmbed": ("pinecone.inference.models.index_embed", "IndexEmbed"),
     "IndexList": ("pinecone.models.indexes.list", "IndexList"),
@@ -478,6 +521,7 @@ _LAZY_IMPORTS: dict[str, tuple[str, str]] = {
     "ModelInfo": ("pinecone.models.inference.models", "ModelInfo"),
     "ModelIndexEmbed": ("pinecone.models.indexes.index", "ModelIndexEmbed"),
     "ModelInfoList": ("pinecone.models.inference.model_list", "ModelInfoList"),
+    "MultiContextResponse": ("pinecone.models.assistant.context", "MultiContextResponse"),
     "NamespaceDescription": (
         "pinecone.models.namespaces.models",
         "NamespaceDescription",
@@ -491,6 +535,7 @@ _LAZY_IMPORTS: dict[str, tuple[str, str]] = {
     "PodIndexEnvironment": ("pinecone.models.enums", "PodIndexEnvironment"),
     "PodSpec": ("pinecone.models.indexes.specs", "PodSpec"),
     "PodType": ("pinecone.models.enums", "PodType"),
+    "Poller": ("pinecone._internal.polling", "Poller"),
     "ProjectList": ("pinecone.models.admin.project", "ProjectList"),
     "ProjectModel": ("pinecone.models.admin.project", "ProjectModel"),
     "PodSpecInfo": ("pinecone.models.indexes.index", "PodSpecInfo"),
@@ -512,6 +557,15 @@ _LAZY_IMPORTS: dict[str, tuple[str, str]] = {
     "RestoreJobList": ("pinecone.models.backups.list", "RestoreJobList"),
     "RestoreJobModel": ("pinecone.models.backups.model", "RestoreJobModel"),
     "RetryConfig": ("pinecone._internal.config", "RetryConfig"),
+    "RequestAttempt": ("pinecone._internal.instrumentation", "RequestAttempt"),
+    "RequestEvent": ("pinecone._internal.instrumentation", "RequestEvent"),
+    "RequestListener": ("pinecone._internal.instrumentation", "RequestListener"),
+    "ClientMetrics": ("pinecone._internal.metrics", "ClientMetrics"),
+    "HistogramSnapshot": ("pinecone._internal.metrics", "HistogramSnapshot"),
+    "MetricsSnapshot": ("pinecone._internal.metrics", "MetricsSnapshot"),
+    "OperationMetrics": ("pinecone._internal.metrics", "OperationMetrics"),
+    "PoolMetrics": ("pinecone._internal.metrics", "PoolMetrics"),
+    "BatchRetryPolicy": ("pinecone._internal.config", "BatchRetryPolicy"),
     "SearchInputs": ("pinecone.models.vectors.search", "SearchInputs"),
     "SearchQuery": ("pinecone.db_data.dataclasses.search_query", "SearchQuery"),
     "SearchRecordsResponse": (
@@ -548,6 +602,7 @@ _LAZY_IMPORTS: dict[str, tuple[str, str]] = {
     "UpsertResponse": ("pinecone.models.vectors.responses", "UpsertResponse"),
     "Vector": ("pinecone.models.vectors.vector", "Vector"),
     "VectorType": ("pinecone.models.enums", "VectorType"),
+    "validate_import_files": ("pinecone.index.bulk_import", "validate_import_files"),
 }
 
 
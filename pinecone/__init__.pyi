@@ -4,9 +4,14 @@ Regenerate after changes to _LAZY_IMPORTS or __all__ in pinecone/__init__.py:
     uv run python scripts/generate_init_stub.py
 """
 from pinecone._client import Pinecone as Pinecone
-from pinecone._internal.config import PineconeConfig as PineconeConfig, RetryConfig as RetryConfig
+from pinecone._internal.config import BatchRetryPolicy as BatchRetryPolicy, PineconeConfig as PineconeConfig, RetryConfig as RetryConfig
+from pinecone._internal.embed_cache import EmbeddingCache as EmbeddingCache
+from pinecone._internal.instrumentation import RequestAttempt as RequestAttempt, RequestEvent as RequestEvent, RequestListener as RequestListener
+from pinecone._internal.metrics import ClientMetrics as ClientMetrics, HistogramSnapshot as HistogramSnapshot, MetricsSnapshot as MetricsSnapshot, OperationMetrics as OperationMetrics, PoolMetrics as PoolMetrics
+from pinecone._internal.polling import AsyncPoller as AsyncPoller, Poller as Poller
 from pinecone.admin import Admin as Admin
 from pinecone.async_client.async_index import AsyncIndex as AsyncIndex
+from pinecone.async_client.buffered_writer import AsyncBufferedWriter as AsyncBufferedWriter
 from pinecone.async_client.pinecone import AsyncPinecone as AsyncPinecone, AsyncPinecone as PineconeAsyncio
 from pinecone.db_control.enums.clouds import AwsRegion as AwsRegion, AzureRegion as AzureRegion, GcpRegion as GcpRegion
 from pinecone.db_control.models.collection_description import CollectionDescription as CollectionDescription
@@ -16,14 +21,17 @@ from pinecone.errors.exceptions import ApiError as ApiError, ConflictError as Co
 from pinecone.grpc import GrpcIndex as GrpcIndex
 from pinecone.grpc.future import PineconeFuture as PineconeFuture
 from pinecone.index import Index as Index
+from pinecone.index.buffered_writer import BufferedWriter as BufferedWriter
+from pinecone.index.bulk_import import ImportWriter as ImportWriter, validate_import_files as validate_import_files
 from pinecone.inference.models.index_embed import IndexEmbed as IndexEmbed
 from pinecone.models.admin.api_key import APIKeyList as APIKeyList, APIKeyModel as APIKeyModel, APIKeyRole as APIKeyRole, APIKeyWithSecret as APIKeyWithSecret
 from pinecone.models.admin.organization import OrganizationList as OrganizationList, OrganizationModel as OrganizationModel
 from pinecone.models.admin.project import ProjectList as ProjectList, ProjectModel as ProjectModel
 from pinecone.models.assistant.chat import ChatCompletionMessage as ChatCompletionMessage, ChatCompletionResponse as ChatCompletionResponse, ChatResponse as ChatResponse
-from pinecone.models.assistant.context import ContextResponse as ContextResponse
-from pinecone.models.assistant.evaluation import AlignmentResult as AlignmentResult
+from pinecone.models.assistant.context import ContextResponse as ContextResponse, MultiContextResponse as MultiContextResponse
+from pinecone.models.assistant.evaluation import AlignmentEvaluation as AlignmentEvaluation, AlignmentResult as AlignmentResult
 from pinecone.models.assistant.file_model import AssistantFileModel as AssistantFileModel
+from pinecone.models.assistant.file_upload import FileUploadError as FileUploadError, FileUploadResult as FileUploadResult
 from pinecone.models.assistant.list import ListAssistantsResponse as ListAssistantsResponse, ListFilesResponse as ListFilesResponse
 from pinecone.models.assistant.message import Message as Message
 from pinecone.models.assistant.model import AssistantModel as AssistantModel
@@ -37,6 +45,7 @@ from pinecone.models.enums import CloudProvider as CloudProvider, DeletionProtec
 from pinecone.models.imports.error_mode import ImportErrorMode as ImportErrorMode
 from pinecone.models.imports.list import ImportList as ImportList
 from pinecone.models.imports.model import ImportModel as ImportModel, StartImportResponse as StartImportResponse
+from pinecone.models.imports.validation import ImportValidationReport as ImportValidationReport
 from pinecone.models.indexes.index import ByocSpecInfo as ByocSpecInfo, IndexModel as IndexModel, IndexSpec as IndexSpec, IndexTags as IndexTags, ModelIndexEmbed as ModelIndexEmbed, PodSpecInfo as PodSpecInfo, ServerlessSpecInfo as ServerlessSpecInfo
 from pinecone.models.indexes.list import IndexList as IndexList
 from pinecone.models.indexes.specs import ByocSpec as ByocSpec, EmbedConfig as EmbedConfig, IntegratedSpec as IntegratedSpec, PodSpec as PodSpec, ServerlessSpec as ServerlessSpec
@@ -62,20 +71,25 @@ __all__ = [
     "APIKeyRole",
     "APIKeyWithSecret",
     "Admin",
+    "AlignmentEvaluation",
     "AlignmentResult",
     "ApiError",
     "AssistantFileModel",
     "AssistantModel",
+    "AsyncBufferedWriter",
     "AsyncChatCompletionStream",
     "AsyncChatStream",
     "AsyncIndex",
     "AsyncPaginator",
     "AsyncPinecone",
+    "AsyncPoller",
     "AwsRegion",
     "AzureRegion",
     "BackupList",
     "BackupModel",
     "BatchResponseInfo",
+    "BatchRetryPolicy",
+    "BufferedWriter",
     "ByocSpec",
     "ByocSpecInfo",
     "ChatCompletionMessage",
@@ -85,6 +99,7 @@ __all__ = [
     "ChatResponse",
     "ChatStream",
     "ChatStreamChunk",
+    "ClientMetrics",
     "CloudProvider",
     "CollectionDescription",
     "CollectionList",
@@ -98,19 +113,25 @@ __all__ = [
     "DescribeIndexStatsResponse",
     "EmbedConfig",
     "EmbedModel",
+    "EmbeddingCache",
     "EmbeddingsList",
     "FetchByMetadataResponse",
     "FetchResponse",
     "Field",
+    "FileUploadError",
+    "FileUploadResult",
     "FilterBuilder",
     "ForbiddenError",
     "ForbiddenException",
     "GcpRegion",
     "GrpcIndex",
+    "HistogramSnapshot",
     "Hit",
     "ImportErrorMode",
     "ImportList",
     "ImportModel",
+    "ImportValidationReport",
+    "ImportWriter",
     "Index",
     "IndexEmbed",
     "IndexInitFailedError",
@@ -126,12 +147,15 @@ __all__ = [
     "ListResponse",
     "Message",
     "Metric",
+    "MetricsSnapshot",
     "ModelIndexEmbed",
     "ModelInfo",
     "ModelInfoList",
+    "MultiContextResponse",
     "NamespaceDescription",
     "NotFoundError",
     "NotFoundException",
+    "OperationMetrics",
     "OrganizationList",
     "OrganizationModel",
     "Page",
@@ -157,12 +181,17 @@ __all__ = [
     "PodSpec",
     "PodSpecInfo",
     "PodType",
+    "Poller",
+    "PoolMetrics",
     "ProjectList",
     "ProjectModel",
     "QueryNamespacesResults",
     "QueryResponse",
     "QueryResultsAggregator",
     "RankedDocument",
+    "RequestAttempt",
+    "RequestEvent",
+    "RequestListener",
     "RerankConfig",
     "RerankModel",
     "RerankResult",
@@ -197,4 +226,5 @@ __all__ = [
     "Vector",
     "VectorType",
     "__version__",
+    "validate_import_files",
 ]
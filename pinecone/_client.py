@@ -2,23 +2,26 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from dataclasses import replace
 from typing import TYPE_CHECKING, Any, cast
 
 from pinecone._internal.config import PineconeConfig, RetryConfig
 from pinecone._internal.constants import CONTROL_PLANE_API_VERSION, DEFAULT_BASE_URL
-from pinecone._internal.indexes_helpers import _LegacyIndexKwargs, poll_index_until_ready
 from pinecone._internal.validation import require_non_empty
 from pinecone.errors.exceptions import ValidationError
 
 if TYPE_CHECKING:
+    from pinecone._internal.http_client import HTTPClient
+    from pinecone._internal.indexes_helpers import _LegacyIndexKwargs
+    from pinecone._internal.instrumentation import RequestListener
     from pinecone.client._assistant_namespace_proxy import _AssistantNamespaceProxy
     from pinecone.client.assistants import Assistants
     from pinecone.client.backups import Backups
     from pinecone.client.collections import Collections
     from pinecone.client.indexes import Indexes
     from pinecone.client.inference import Inference
+    from pinecone.client.poller import ResourcePoller
     from pinecone.client.restore_jobs import RestoreJobs
     from pinecone.grpc import GrpcIndex
     from pinecone.index import Index
@@ -71,6 +74,9 @@ class Pinecone:
         retry_config (RetryConfig | None): Custom retry configuration. When ``None``
             (default), uses built-in defaults (5 attempts, exponential backoff, retries
             on 500/502/503/504 for GET/HEAD).
+        request_listeners (Sequence[RequestListener]): Callables that receive a
+            :class:`~pinecone.RequestEvent` with the phase timings of every request
+            sent by this client and the indexes it creates. Defaults to none.
         pool_threads (int | None): Opt-in for the legacy ``async_req=True`` execution
             model on data-plane methods. When set, indexes created via
             :meth:`index` accept ``async_req=True`` on ``upsert``, ``query``,
@@ -112,6 +118,7 @@ class Pinecone:
         timeout: float = 30.0,
         connection_pool_maxsize: int = 0,
         retry_config: RetryConfig | None = None,
+        request_listeners: Sequence[RequestListener] = (),
         **kwargs: Any,
     ) -> None:
         legacy_pool_threads = kwargs.pop("pool_threads", None)
@@ -129,6 +136,7 @@ class Pinecone:
             ssl_verify=ssl_verify,
             connection_pool_maxsize=connection_pool_maxsize,
             retry_config=retry_config or RetryConfig(),
+            request_listeners=tuple(request_listeners),
         )
 
         if not config.api_key:
@@ -144,9 +152,8 @@ class Pinecone:
 
         self._config = config
 
-        from pinecone._internal.http_client import HTTPClient
-
-        self._http = HTTPClient(config, CONTROL_PLANE_API_VERSION)
+        # The control-plane client (and httpx with it) is created on first use.
+        self._http_client: HTTPClient | None = None
         self._indexes: Indexes | None = None
         self._collections: Collections | None = None
         self._backups: Backups | None = None
@@ -155,12 +162,22 @@ class Pinecone:
         self._assistants: Assistants | None = None
         self._host_cache: dict[str, str] = {}
         self._preview: Preview | None = None
+        self._poller: ResourcePoller | None = None
         self._legacy_pool_threads: int | None = legacy_pool_threads
 
     def __repr__(self) -> str:
         masked = f"...{self._config.api_key[-4:]}" if len(self._config.api_key) >= 4 else "***"
         return f"Pinecone(api_key='{masked}', host='{self._config.host}')"
 
+    @property
+    def _http(self) -> HTTPClient:
+        """Control-plane HTTP client, created on first use."""
+        if self._http_client is None:
+            from pinecone._internal.http_client import HTTPClient
+
+            self._http_client = HTTPClient(self._config, CONTROL_PLANE_API_VERSION)
+        return self._http_client
+
     @property
     def indexes(self) -> Indexes:
         """Access the Indexes namespace for control-plane index operations.
@@ -237,6 +254,26 @@ class Pinecone:
             self._restore_jobs = _RestoreJobs(http=self._http)
         return self._restore_jobs
 
+    @property
+    def poller(self) -> ResourcePoller:
+        """Access the ResourcePoller namespace for waiting on many operations.
+
+        Lazily imported and instantiated on first access. All waits share
+        one background polling thread.
+
+        Returns:
+            :class:`ResourcePoller` namespace instance.
+
+        Examples:
+
+            >>> model = pc.poller.index_ready("movie-recommendations").result()  # doctest: +SKIP
+        """
+        if self._poller is None:
+            from pinecone.client.poller import ResourcePoller as _ResourcePoller
+
+            self._poller = _ResourcePoller(self)
+        return self._poller
+
     @property
     def inference(self) -> Inference:
         """Access the Inference namespace for embed and rerank operations.
@@ -335,6 +372,7 @@ class Pinecone:
         host: str = "",
         grpc: bool = False,
         pool_threads: int | None = None,
+        metadata_type: type[Any] | None = None,
     ) -> Index | GrpcIndex:
         """Create a data plane client targeting a specific index.
 
@@ -356,6 +394,8 @@ class Pinecone:
                 used by the underlying HTTP client. Pass ``None`` to use the client-level
                 default set at :class:`Pinecone` construction time. Has no effect when
                 ``grpc=True``. Defaults to ``None``.
+            metadata_type (type | None): A :class:`msgspec.Struct` subclass or dataclass
+                that vector metadata is decoded into. Defaults to ``None`` (plain dicts).
 
         Returns:
             A sync :class:`Index` (HTTP) or :class:`~pinecone.grpc.GrpcIndex`
@@ -388,11 +428,16 @@ class Pinecone:
                 host=resolved_host,
                 api_key=self._config.api_key,
                 source_tag=self._config.source_tag or None,
+                request_listeners=self._config.request_listeners,
+                metadata_type=metadata_type,
             )
 
         from pinecone.index import Index as _Index
 
-        return _Index(**self._build_index_kwargs(resolved_host, pool_threads=pool_threads))
+        return _Index(
+            **self._build_index_kwargs(resolved_host, pool_threads=pool_threads),
+            metadata_type=metadata_type,
+        )
 
     def _build_index_kwargs(
         self,
@@ -401,6 +446,8 @@ class Pinecone:
         pool_threads: int | None = None,
     ) -> _LegacyIndexKwargs:
         """Return the kwargs dict for constructing an Index."""
+        from pinecone._internal.indexes_helpers import _LegacyIndexKwargs
+
         kwargs: _LegacyIndexKwargs = _LegacyIndexKwargs(
             host=host,
             api_key=self._config.api_key,
@@ -412,6 +459,7 @@ class Pinecone:
             ssl_verify=self._config.ssl_verify,
             source_tag=self._config.source_tag,
             connection_pool_maxsize=self._config.connection_pool_maxsize,
+            request_listeners=self._config.request_listeners,
         )
         effective = pool_threads if pool_threads is not None else self._legacy_pool_threads
         if effective is not None:
@@ -524,6 +572,8 @@ class Pinecone:
         if timeout == -1:
             return create_response
 
+        from pinecone._internal.indexes_helpers import poll_index_until_ready
+
         effective_timeout = timeout if timeout is not None else 300
         return poll_index_until_ready(self.indexes.describe, name, effective_timeout)
 
@@ -885,6 +935,7 @@ class Pinecone:
             ssl_verify=self._config.ssl_verify,
             source_tag=self._config.source_tag,
             connection_pool_maxsize=self._config.connection_pool_maxsize,
+            request_listeners=self._config.request_listeners,
         )
 
     def close(self) -> None:
@@ -908,7 +959,8 @@ class Pinecone:
             >>> with Pinecone(api_key="your-api-key") as pinecone_client:
             ...     _ = pinecone_client.indexes.list()
         """
-        self._http.close()
+        if self._http_client is not None:
+            self._http_client.close()
         if self._inference is not None:
             self._inference.close()
         if self._assistants is not None:
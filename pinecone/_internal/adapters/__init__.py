@@ -1,14 +1,24 @@
-"""Response adapters for transforming raw API JSON into SDK models."""
+"""Response adapters for transforming raw API JSON into SDK models.
+
+Adapters are loaded on first access so that importing one adapter module
+does not pull in the models of every other resource.
+"""
 
 from __future__ import annotations
 
-from pinecone._internal.adapters.assistants_adapter import AssistantsAdapter
-from pinecone._internal.adapters.backups_adapter import BackupsAdapter
-from pinecone._internal.adapters.collections_adapter import CollectionsAdapter
-from pinecone._internal.adapters.imports_adapter import ImportsAdapter
-from pinecone._internal.adapters.indexes_adapter import IndexesAdapter
-from pinecone._internal.adapters.inference_adapter import InferenceAdapter
-from pinecone._internal.adapters.vectors_adapter import VectorsAdapter, extract_response_info
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pinecone._internal.adapters.assistants_adapter import AssistantsAdapter
+    from pinecone._internal.adapters.backups_adapter import BackupsAdapter
+    from pinecone._internal.adapters.collections_adapter import CollectionsAdapter
+    from pinecone._internal.adapters.imports_adapter import ImportsAdapter
+    from pinecone._internal.adapters.indexes_adapter import IndexesAdapter
+    from pinecone._internal.adapters.inference_adapter import InferenceAdapter
+    from pinecone._internal.adapters.vectors_adapter import (
+        VectorsAdapter,
+        extract_response_info,
+    )
 
 __all__ = [
     "AssistantsAdapter",
@@ -20,3 +30,28 @@ __all__ = [
     "VectorsAdapter",
     "extract_response_info",
 ]
+
+_LAZY_IMPORTS: dict[str, str] = {
+    "AssistantsAdapter": "pinecone._internal.adapters.assistants_adapter",
+    "BackupsAdapter": "pinecone._internal.adapters.backups_adapter",
+    "CollectionsAdapter": "pinecone._internal.adapters.collections_adapter",
+    "ImportsAdapter": "pinecone._internal.adapters.imports_adapter",
+    "IndexesAdapter": "pinecone._internal.adapters.indexes_adapter",
+    "InferenceAdapter": "pinecone._internal.adapters.inference_adapter",
+    "VectorsAdapter": "pinecone._internal.adapters.vectors_adapter",
+    "extract_response_info": "pinecone._internal.adapters.vectors_adapter",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Lazy-load adapters on first access."""
+    if name in _LAZY_IMPORTS:
+        from importlib import import_module
+
+        module = import_module(_LAZY_IMPORTS[name])
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return list({*globals(), *__all__, *_LAZY_IMPORTS})
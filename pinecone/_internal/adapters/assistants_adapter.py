@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import msgspec
 import orjson
 
 from pinecone._internal.adapters._decode import decode_response
@@ -13,6 +14,11 @@ from pinecone.models.assistant.file_model import AssistantFileModel
 from pinecone.models.assistant.list import ListAssistantsResponse, ListFilesResponse
 from pinecone.models.assistant.model import AssistantModel
 from pinecone.models.assistant.operation import OperationModel
+from pinecone.models.assistant.streaming import ChatCompletionStreamChunk, ChatStreamChunk
+
+# Built once: streaming responses decode one payload per token.
+_CHAT_STREAM_DECODER: msgspec.json.Decoder[ChatStreamChunk] = msgspec.json.Decoder(ChatStreamChunk)
+_CHAT_COMPLETION_STREAM_DECODER = msgspec.json.Decoder(ChatCompletionStreamChunk)
 
 
 class AssistantsAdapter:
@@ -53,6 +59,35 @@ class AssistantsAdapter:
         """Decode raw JSON bytes into a ChatCompletionResponse."""
         return decode_response(data, ChatCompletionResponse)
 
+    @staticmethod
+    def to_chat_stream_chunk(data: bytes) -> ChatStreamChunk | None:
+        """Decode one SSE payload of a chat stream, dispatching on its ``type`` field.
+
+        Returns ``None`` for chunk types this client does not know, so that
+        new server-side chunk types do not break existing streams.
+
+        Raises:
+            ResponseParsingError: If *data* is not valid JSON.
+        """
+        try:
+            return _CHAT_STREAM_DECODER.decode(data)
+        except msgspec.ValidationError:
+            return None
+        except msgspec.DecodeError as exc:
+            raise ResponseParsingError(
+                f"Failed to parse chat stream chunk: {exc}", cause=exc
+            ) from exc
+
+    @staticmethod
+    def to_chat_completion_stream_chunk(data: bytes) -> ChatCompletionStreamChunk:
+        """Decode one SSE payload of a chat completion stream."""
+        try:
+            return _CHAT_COMPLETION_STREAM_DECODER.decode(data)
+        except msgspec.DecodeError as exc:
+            raise ResponseParsingError(
+                f"Failed to parse API response as ChatCompletionStreamChunk: {exc}", cause=exc
+            ) from exc
+
     @staticmethod
     def to_context_response(data: bytes) -> ContextResponse:
         """Decode raw JSON bytes into a ContextResponse."""
@@ -7,14 +7,19 @@ on the target Struct, plus any pre-processing documented in its docstring.
 
 from __future__ import annotations
 
+import dataclasses
+from typing import Any, NamedTuple
+
 import httpx
+import msgspec
 
 from pinecone._internal.adapters._decode import decode_response, decode_response_lax
+from pinecone.errors.exceptions import PineconeValueError
 from pinecone.models.namespaces.models import (
     ListNamespacesResponse,
     NamespaceDescription,
 )
-from pinecone.models.response_info import ResponseInfo
+from pinecone.models.response_info import ResponseInfo, _headers_dict, _LazyResponseInfo
 from pinecone.models.vectors.responses import (
     DescribeIndexStatsResponse,
     FetchByMetadataResponse,
@@ -24,10 +29,11 @@ from pinecone.models.vectors.responses import (
     UpdateResponse,
     UpsertResponse,
 )
-from pinecone.models.vectors.search import SearchRecordsResponse
+from pinecone.models.vectors.search import Hit, SearchRecordsResponse, SearchResult
+from pinecone.models.vectors.vector import ScoredVector, Vector
 
 
-def extract_response_info(response: httpx.Response) -> ResponseInfo:
+def extract_response_info(response: httpx.Response, *, lazy: bool = False) -> ResponseInfo:
     """Build a :class:`ResponseInfo` from *response* headers.
 
     Captures every header on *response*. httpx normalizes all header
@@ -35,10 +41,83 @@ def extract_response_info(response: httpx.Response) -> ResponseInfo:
     Typed convenience properties on :class:`ResponseInfo`
     (``request_id``, ``lsn_reconciled``, ``lsn_committed``) read from
     the stored ``raw_headers`` dict.
+
+    With *lazy*, the received headers are kept as they are instead: the
+    typed properties look up single headers when read, and the
+    ``raw_headers`` dict is only built on first access.
+    """
+    if lazy:
+        return _LazyResponseInfo(raw_headers=response.headers)  # type: ignore[arg-type]
+    return ResponseInfo(raw_headers=_headers_dict(response.headers))
+
+
+class TypedVectorModels(NamedTuple):
+    """Response model subclasses whose ``metadata`` is decoded into a user type.
+
+    Each model subclasses its untyped counterpart (so ``isinstance`` checks,
+    bracket access and ``to_dict()`` keep working) and only overrides the
+    field types that carry metadata.
+    """
+
+    vector: type[Vector]
+    scored_vector: type[ScoredVector]
+    query_response: type[QueryResponse]
+    fetch_response: type[FetchResponse]
+    fetch_by_metadata_response: type[FetchByMetadataResponse]
+    hit: type[Hit]
+    search_response: type[SearchRecordsResponse]
+
+
+def _typed(base: type[Any], fields: list[tuple[Any, ...]]) -> Any:
+    # Struct config (rename, kw_only, gc) is inherited from *base*.
+    return msgspec.defstruct(base.__name__, fields, bases=(base,))
+
+
+_TYPED_MODELS: dict[type[Any], TypedVectorModels] = {}
+
+
+def typed_vector_models(metadata_type: type[Any]) -> TypedVectorModels:
+    """Build (once per *metadata_type*) the response models for typed metadata.
+
+    Args:
+        metadata_type (type): A :class:`msgspec.Struct` subclass or a dataclass
+            describing the metadata documents stored in the index.
+
+    Returns:
+        TypedVectorModels: Response model subclasses that decode ``metadata``
+        (and search hit ``fields``) directly into *metadata_type*.
+
+    Raises:
+        PineconeValueError: If *metadata_type* is not a Struct or dataclass type.
     """
-    return ResponseInfo(
-        raw_headers=dict(response.headers),
+    if not isinstance(metadata_type, type) or not (
+        issubclass(metadata_type, msgspec.Struct) or dataclasses.is_dataclass(metadata_type)
+    ):
+        raise PineconeValueError(
+            f"metadata_type must be a msgspec.Struct subclass or a dataclass, got {metadata_type!r}"
+        )
+    cached = _TYPED_MODELS.get(metadata_type)
+    if cached is not None:
+        return cached
+    metadata = ("metadata", metadata_type | None, None)
+    vector = _typed(Vector, [metadata])
+    scored_vector = _typed(ScoredVector, [metadata])
+    hit = _typed(Hit, [("fields", metadata_type | None, None)])
+    result = _typed(SearchResult, [("hits", list[hit], [])])  # type: ignore[valid-type]
+    models = TypedVectorModels(
+        vector=vector,
+        scored_vector=scored_vector,
+        query_response=_typed(QueryResponse, [("matches", list[scored_vector], [])]),  # type: ignore[valid-type]
+        fetch_response=_typed(FetchResponse, [("vectors", dict[str, vector], {})]),  # type: ignore[valid-type]
+        fetch_by_metadata_response=_typed(
+            FetchByMetadataResponse,
+            [("vectors", dict[str, vector], {})],  # type: ignore[valid-type]
+        ),
+        hit=hit,
+        search_response=_typed(SearchRecordsResponse, [("result", result)]),
     )
+    _TYPED_MODELS[metadata_type] = models
+    return models
 
 
 class VectorsAdapter:
@@ -54,34 +133,48 @@ class VectorsAdapter:
         return decode_response(data, UpsertResponse)
 
     @staticmethod
-    def to_query_response(data: bytes) -> QueryResponse:
+    def to_query_response(data: bytes, metadata_type: type[Any] | None = None) -> QueryResponse:
         """Decode raw JSON bytes into a QueryResponse.
 
         Transformations:
+            - When *metadata_type* is given, each match's ``metadata`` is decoded
+              straight into that type (see :func:`typed_vector_models`).
             - Deprecated ``results`` field silently ignored (forbid_unknown_fields
               is False by default; claim unified-rs-0012).
             - Null namespace normalized to empty string via ``__post_init__``
               on QueryResponse (claim unified-rs-0013).
         """
-        return decode_response(data, QueryResponse)
+        if metadata_type is None:
+            return decode_response(data, QueryResponse)
+        return decode_response(data, typed_vector_models(metadata_type).query_response)
 
     @staticmethod
-    def to_fetch_response(data: bytes) -> FetchResponse:
+    def to_fetch_response(data: bytes, metadata_type: type[Any] | None = None) -> FetchResponse:
         """Decode raw JSON bytes into a FetchResponse.
 
         Transformations:
             - Direct decode; camelCase handled by Struct rename.
+            - When *metadata_type* is given, each vector's ``metadata`` is decoded
+              straight into that type.
         """
-        return decode_response(data, FetchResponse)
+        if metadata_type is None:
+            return decode_response(data, FetchResponse)
+        return decode_response(data, typed_vector_models(metadata_type).fetch_response)
 
     @staticmethod
-    def to_fetch_by_metadata_response(data: bytes) -> FetchByMetadataResponse:
+    def to_fetch_by_metadata_response(
+        data: bytes, metadata_type: type[Any] | None = None
+    ) -> FetchByMetadataResponse:
         """Decode raw JSON bytes into a FetchByMetadataResponse.
 
         Transformations:
             - Direct decode; camelCase handled by Struct rename.
+            - When *metadata_type* is given, each vector's ``metadata`` is decoded
+              straight into that type.
         """
-        return decode_response(data, FetchByMetadataResponse)
+        if metadata_type is None:
+            return decode_response(data, FetchByMetadataResponse)
+        return decode_response(data, typed_vector_models(metadata_type).fetch_by_metadata_response)
 
     @staticmethod
     def to_stats_response(data: bytes) -> DescribeIndexStatsResponse:
@@ -111,13 +204,19 @@ class VectorsAdapter:
         return decode_response(data, UpdateResponse)
 
     @staticmethod
-    def to_search_response(data: bytes) -> SearchRecordsResponse:
+    def to_search_response(
+        data: bytes, metadata_type: type[Any] | None = None
+    ) -> SearchRecordsResponse:
         """Decode raw JSON bytes into a SearchRecordsResponse.
 
         Transformations:
             - Direct decode; search API uses snake_case natively.
+            - When *metadata_type* is given, each hit's ``fields`` are decoded
+              straight into that type (``None`` when the hit has no fields).
         """
-        return decode_response(data, SearchRecordsResponse)
+        if metadata_type is None:
+            return decode_response(data, SearchRecordsResponse)
+        return decode_response(data, typed_vector_models(metadata_type).search_response)
 
     @staticmethod
     def to_namespace_description(data: bytes) -> NamespaceDescription:
@@ -0,0 +1,370 @@
+"""Dataset-level alignment evaluation for ``Assistants.evaluate_alignment_many``.
+
+Items are evaluated with bounded concurrency.  Failures that the client's
+:class:`~pinecone.BatchRetryPolicy` classifies as transient are retried
+after a backoff delay; a ``429`` response additionally pauses every new
+request until that delay has passed, so a rate-limited run slows down as a
+whole instead of each worker hammering the limit in turn.
+
+Successful evaluations can be appended to an NDJSON results file, one line
+per item.  A rerun with the same file skips every item already recorded,
+which lets a long run resume after a crash or a quota error.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import logging
+import os
+import time
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, Any
+
+import msgspec
+
+from pinecone._internal.batch import _create_progress_bar
+from pinecone._internal.config import BatchRetryPolicy
+from pinecone.errors.exceptions import ApiError, PineconeValueError
+from pinecone.models.assistant.evaluation import AlignmentEvaluation, AlignmentResult
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator, Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+#: Column or key names of one dataset item.
+FIELDS = ("question", "answer", "ground_truth_answer")
+
+Triple = tuple[int, str, str, str]
+"""``(index, question, answer, ground_truth_answer)``."""
+
+
+class _Record(msgspec.Struct, kw_only=True):
+    index: int
+    question: str
+    result: AlignmentResult
+
+
+_encode_record = msgspec.json.Encoder().encode
+_decode_record = msgspec.json.Decoder(_Record).decode
+
+
+def alignment_triples(data: Any) -> Iterator[Triple]:
+    """Yield the numbered triples of *data*.
+
+    *data* is a DataFrame with ``question``, ``answer`` and
+    ``ground_truth_answer`` columns, or an iterable whose items are mappings
+    with those keys or ``(question, answer, ground_truth_answer)`` sequences.
+    """
+    if hasattr(data, "itertuples") and hasattr(data, "columns"):
+        missing = [name for name in FIELDS if name not in data.columns]
+        if missing:
+            raise PineconeValueError(f"DataFrame is missing columns: {', '.join(missing)}")
+        rows: Iterable[Any] = data[list(FIELDS)].itertuples(index=False, name=None)
+    else:
+        rows = data
+    for index, row in enumerate(rows):
+        if isinstance(row, Mapping):
+            try:
+                values = tuple(row[name] for name in FIELDS)
+            except KeyError as exc:
+                raise PineconeValueError(f"Item {index} is missing key {exc}") from None
+        else:
+            values = tuple(row)
+            if len(values) != 3:
+                raise PineconeValueError(
+                    f"Item {index} must have question, answer and ground_truth_answer, "
+                    f"got {len(values)} values"
+                )
+        question, answer, ground_truth_answer = (str(v) for v in values)
+        yield index, question, answer, ground_truth_answer
+
+
+class AlignmentResultsFile:
+    """Append-only NDJSON log of successful alignment evaluations.
+
+    Opening the file loads the items recorded by earlier runs and truncates
+    a partially written last line left by a crash.  Each line records the
+    item's index and question, so a file written for a different dataset is
+    detected rather than silently skipping the wrong items.
+
+    Args:
+        path: Results file. Created when it does not exist.
+    """
+
+    def __init__(self, path: str | os.PathLike[str]) -> None:
+        self.path = os.fspath(path)
+        self._done: dict[int, str] = {}
+        self._load()
+        self._file = open(self.path, "ab")  # noqa: SIM115 - closed by close()
+
+    def _load(self) -> None:
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return
+        lines = data.split(b"\n")
+        torn = lines.pop()
+        if torn:
+            logger.warning("Discarding a partially written line in results file %s", self.path)
+            with open(self.path, "r+b") as f:
+                f.truncate(len(data) - len(torn))
+        for number, line in enumerate(lines, 1):
+            try:
+                record = _decode_record(line)
+            except msgspec.DecodeError:
+                raise PineconeValueError(
+                    f"Results file {self.path} is corrupt at line {number}"
+                ) from None
+            self._done[record.index] = record.question
+
+    @property
+    def completed(self) -> int:
+        """Number of items recorded so far, including earlier runs."""
+        return len(self._done)
+
+    def is_done(self, index: int, question: str) -> bool:
+        """Whether item *index* was already evaluated.
+
+        Raises:
+            :exc:`PineconeValueError`: If the recorded item has a different
+                question, meaning the file belongs to another dataset.
+        """
+        recorded = self._done.get(index)
+        if recorded is None:
+            return False
+        if recorded != question:
+            raise PineconeValueError(
+                f"Results file {self.path} records a different question for item {index}; "
+                f"use a new results file for a different dataset"
+            )
+        return True
+
+    def record(self, evaluation: AlignmentEvaluation) -> None:
+        """Append a successful *evaluation* and flush it to the OS."""
+        if evaluation.result is None:
+            return
+        record = _Record(
+            index=evaluation.index, question=evaluation.question, result=evaluation.result
+        )
+        self._file.write(_encode_record(record) + b"\n")
+        self._file.flush()
+        self._done[evaluation.index] = evaluation.question
+
+    def close(self) -> None:
+        """Sync and close the file."""
+        if not self._file.closed:
+            self._file.flush()
+            os.fsync(self._file.fileno())
+            self._file.close()
+
+    def __enter__(self) -> AlignmentResultsFile:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class _EvalState:
+    """Scheduling shared by the sync and async evaluators.
+
+    Not thread-safe: only the coordinating thread or task touches it.
+    """
+
+    def __init__(
+        self,
+        triples: Iterator[Triple],
+        policy: BatchRetryPolicy,
+        results: AlignmentResultsFile | None,
+    ) -> None:
+        self._source = triples
+        self.policy = policy
+        self.results = results
+        self.exhausted = False
+        self.paused_until = 0.0
+        self._delayed: list[tuple[float, int, Triple, int]] = []
+        self._sequence = itertools.count()
+
+    def next_item(self, now: float) -> tuple[Triple, int] | None:
+        """Return the next ``(triple, attempt)`` to send, or ``None`` for now."""
+        if now < self.paused_until:
+            return None
+        if self._delayed and self._delayed[0][0] <= now:
+            _, _, triple, attempt = heapq.heappop(self._delayed)
+            return triple, attempt
+        while not self.exhausted:
+            try:
+                triple = next(self._source)
+            except StopIteration:
+                self.exhausted = True
+                break
+            if self.results is None or not self.results.is_done(triple[0], triple[1]):
+                return triple, 1
+        return None
+
+    def seconds_until_ready(self, now: float) -> float | None:
+        """Return the wait before :meth:`next_item` can return an item.
+
+        ``None`` means nothing is waiting and the source is exhausted.
+        """
+        if not self.exhausted:
+            ready = now
+        elif self._delayed:
+            ready = self._delayed[0][0]
+        else:
+            return None
+        return max(0.0, ready - now, self.paused_until - now)
+
+    def succeeded(self, triple: Triple, result: AlignmentResult) -> AlignmentEvaluation:
+        index, question, answer, ground_truth_answer = triple
+        evaluation = AlignmentEvaluation(
+            index=index,
+            question=question,
+            answer=answer,
+            ground_truth_answer=ground_truth_answer,
+            result=result,
+        )
+        if self.results is not None:
+            self.results.record(evaluation)
+        return evaluation
+
+    def failed(
+        self, triple: Triple, attempt: int, exc: Exception, now: float
+    ) -> AlignmentEvaluation | None:
+        """Reschedule a transient failure, or return the final failed evaluation."""
+        if self.policy.classify(exc) == "retry" and attempt < self.policy.max_attempts:
+            delay = self.policy.backoff(attempt)
+            if isinstance(exc, ApiError) and exc.status_code == 429:
+                self.paused_until = max(self.paused_until, now + delay)
+                logger.info("Rate limited; pausing evaluations for %.2fs", delay)
+            heapq.heappush(self._delayed, (now + delay, next(self._sequence), triple, attempt + 1))
+            return None
+        index, question, answer, ground_truth_answer = triple
+        return AlignmentEvaluation(
+            index=index,
+            question=question,
+            answer=answer,
+            ground_truth_answer=ground_truth_answer,
+            error=exc,
+            error_message=str(exc),
+        )
+
+
+def evaluate_stream(
+    evaluate: Callable[[str, str, str], AlignmentResult],
+    data: Any,
+    *,
+    max_concurrency: int,
+    retry_policy: BatchRetryPolicy | None,
+    results_path: str | os.PathLike[str] | None,
+    show_progress: bool,
+    total: int | None,
+) -> Iterator[AlignmentEvaluation]:
+    """Evaluate every item of *data* in a thread pool, yielding results as they finish."""
+    results = AlignmentResultsFile(results_path) if results_path is not None else None
+    state = _EvalState(alignment_triples(data), retry_policy or BatchRetryPolicy(), results)
+    progress = _create_progress_bar(total, "Evaluations", show_progress)
+    if results is not None and total is not None:
+        progress.update(min(results.completed, total))
+    executor = ThreadPoolExecutor(max_workers=max_concurrency)
+    in_flight: dict[Future[AlignmentResult], tuple[Triple, int]] = {}
+    try:
+        while True:
+            now = time.monotonic()
+            while len(in_flight) < max_concurrency:
+                item = state.next_item(now)
+                if item is None:
+                    break
+                triple = item[0]
+                future = executor.submit(evaluate, triple[1], triple[2], triple[3])
+                in_flight[future] = item
+            timeout = None if len(in_flight) >= max_concurrency else state.seconds_until_ready(now)
+            if not in_flight:
+                if timeout is None:
+                    break
+                time.sleep(timeout)
+                continue
+            done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+            now = time.monotonic()
+            for future in done:
+                triple, attempt = in_flight.pop(future)
+                try:
+                    result = future.result()
+                except Exception as exc:
+                    evaluation = state.failed(triple, attempt, exc, now)
+                    if evaluation is None:
+                        continue
+                else:
+                    evaluation = state.succeeded(triple, result)
+                progress.update(1)
+                yield evaluation
+    finally:
+        for future in in_flight:
+            future.cancel()
+        executor.shutdown(wait=True)
+        progress.close()
+        if results is not None:
+            results.close()
+
+
+async def async_evaluate_stream(
+    evaluate: Callable[[str, str, str], Awaitable[AlignmentResult]],
+    data: Any,
+    *,
+    max_concurrency: int,
+    retry_policy: BatchRetryPolicy | None,
+    results_path: str | os.PathLike[str] | None,
+    show_progress: bool,
+    total: int | None,
+) -> AsyncIterator[AlignmentEvaluation]:
+    """Async version of :func:`evaluate_stream`; at most *max_concurrency* in flight."""
+    results = AlignmentResultsFile(results_path) if results_path is not None else None
+    state = _EvalState(alignment_triples(data), retry_policy or BatchRetryPolicy(), results)
+    progress = _create_progress_bar(total, "Evaluations", show_progress)
+    if results is not None and total is not None:
+        progress.update(min(results.completed, total))
+    in_flight: dict[asyncio.Future[AlignmentResult], tuple[Triple, int]] = {}
+    try:
+        while True:
+            now = time.monotonic()
+            while len(in_flight) < max_concurrency:
+                item = state.next_item(now)
+                if item is None:
+                    break
+                triple = item[0]
+                task = asyncio.ensure_future(evaluate(triple[1], triple[2], triple[3]))
+                in_flight[task] = item
+            timeout = None if len(in_flight) >= max_concurrency else state.seconds_until_ready(now)
+            if not in_flight:
+                if timeout is None:
+                    break
+                await asyncio.sleep(timeout)
+                continue
+            done, _ = await asyncio.wait(
+                in_flight, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            now = time.monotonic()
+            for finished in done:
+                triple, attempt = in_flight.pop(finished)
+                try:
+                    result = finished.result()
+                except Exception as exc:
+                    evaluation = state.failed(triple, attempt, exc, now)
+                    if evaluation is None:
+                        continue
+                else:
+                    evaluation = state.succeeded(triple, result)
+                progress.update(1)
+                yield evaluation
+    finally:
+        for pending in in_flight:
+            pending.cancel()
+        if in_flight:
+            await asyncio.gather(*in_flight, return_exceptions=True)
+        progress.close()
+        if results is not None:
+            results.close()
@@ -8,18 +8,33 @@ parallel, collect errors, and optionally display a tqdm progress bar.
 from __future__ import annotations
 
 import asyncio
-from concurrent.futures import ThreadPoolExecutor, as_completed
+import heapq
+import itertools
+import time
+from collections import deque
+from concurrent.futures import (
+    ALL_COMPLETED,
+    FIRST_COMPLETED,
+    Future,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
 from typing import TYPE_CHECKING, Any, TypeVar
 
 from pinecone.models.batch import BatchError, BatchResult
 from pinecone.models.response_info import BatchResponseInfo
 
 if TYPE_CHECKING:
-    from collections.abc import Awaitable, Callable
+    from collections.abc import Awaitable, Callable, Iterable
+
+    from pinecone._internal.checkpoint import BatchCheckpoint
+    from pinecone._internal.config import BatchRetryPolicy
 
 _MAX_WORKERS = 64
 
 T = TypeVar("T")
+P = TypeVar("P")
 
 
 # ---------------------------------------------------------------------------
@@ -31,6 +46,11 @@ def _validate_batch_params(batch_size: int, concurrency: int) -> None:
     """Raise ``ValueError`` for invalid batch_size or concurrency values."""
     if batch_size < 1:
         raise ValueError(f"batch_size must be >= 1, got {batch_size}")
+    _validate_concurrency(concurrency)
+
+
+def _validate_concurrency(concurrency: int) -> None:
+    """Raise ``ValueError`` for an out-of-range concurrency value."""
     if concurrency < 1 or concurrency > _MAX_WORKERS:
         raise ValueError(f"concurrency must be between 1 and {_MAX_WORKERS}, got {concurrency}")
 
@@ -70,7 +90,7 @@ class _NoOpProgressBar:
 
 
 def _create_progress_bar(
-    total: int,
+    total: int | None,
     desc: str,
     show: bool,
 ) -> Any:
@@ -141,6 +161,7 @@ def batch_execute(
     show_progress: bool = True,
     desc: str = "Batches",
     executor: ThreadPoolExecutor | None = None,
+    retry_policy: BatchRetryPolicy | None = None,
 ) -> BatchResult:
     """Execute *operation* on *items* in parallel batches.
 
@@ -162,6 +183,10 @@ def batch_execute(
             or torn down per call. Caller is responsible for ``shutdown()``.
             When ``None`` (default), a private executor is created and
             shut down at the end of this call.
+        retry_policy (BatchRetryPolicy | None): Re-queue and bisect failed
+            batches instead of recording them straight away. With a policy,
+            ``BatchError`` entries hold only items that could not be
+            processed, and several may share a ``batch_index``.
 
     Returns:
         BatchResult with aggregated success/failure counts.
@@ -187,6 +212,22 @@ def batch_execute(
     if executor is None:
         executor = ThreadPoolExecutor(max_workers=max_concurrency)
 
+    if retry_policy is not None:
+        try:
+            return _retry_execute(
+                batches=[(batch, None) for batch in batches],
+                operation=lambda batch, _: operation(batch),
+                policy=retry_policy,
+                rebuild=_no_payload,
+                max_concurrency=max_concurrency,
+                progress=progress,
+                executor=executor,
+            )
+        finally:
+            progress.close()
+            if own_executor:
+                executor.shutdown()
+
     try:
         future_to_batch = {
             executor.submit(operation, batch): (idx, batch) for idx, batch in enumerate(batches)
@@ -242,6 +283,7 @@ async def async_batch_execute(
     max_concurrency: int = 4,
     show_progress: bool = True,
     desc: str = "Batches",
+    retry_policy: BatchRetryPolicy | None = None,
 ) -> BatchResult:
     """Async version of :func:`batch_execute`.
 
@@ -258,6 +300,7 @@ async def async_batch_execute(
             (1-64, default 4).
         show_progress (bool): Display a tqdm progress bar when installed.
         desc (str): Label shown on the progress bar.
+        retry_policy (BatchRetryPolicy | None): As for :func:`batch_execute`.
 
     Returns:
         BatchResult with aggregated success/failure counts.
@@ -280,6 +323,23 @@ async def async_batch_execute(
     semaphore = asyncio.Semaphore(max_concurrency)
     progress = _create_progress_bar(total_batches, desc, show_progress)
 
+    if retry_policy is not None:
+
+        def _send(batch: list[dict[str, Any]], _: None) -> Awaitable[Any]:
+            return operation(batch)
+
+        try:
+            return await _async_retry_execute(
+                batches=[(batch, None) for batch in batches],
+                operation=_send,
+                policy=retry_policy,
+                rebuild=_no_payload,
+                max_concurrency=max_concurrency,
+                progress=progress,
+            )
+        finally:
+            progress.close()
+
     async def _run_batch(batch_idx: int, batch: list[dict[str, Any]]) -> None:
         # nonlocal is safe: asyncio coroutines run on a single thread,
         # so += and .append() cannot interleave between await points.
@@ -320,3 +380,546 @@ async def async_batch_execute(
         errors=errors,
         response_info=response_info,
     )
+
+
+# ---------------------------------------------------------------------------
+# Streaming executors
+# ---------------------------------------------------------------------------
+
+
+def _stream_result(
+    *,
+    total_item_count: int,
+    total_batches: int,
+    successful_item_count: int,
+    errors: list[BatchError],
+    lsn_reconciled_values: list[int],
+    lsn_committed_values: list[int],
+) -> BatchResult:
+    errors.sort(key=lambda e: e.batch_index)
+    return BatchResult(
+        total_item_count=total_item_count,
+        successful_item_count=successful_item_count,
+        failed_item_count=sum(len(e.items) for e in errors),
+        total_batch_count=total_batches,
+        successful_batch_count=total_batches - len(errors),
+        failed_batch_count=len(errors),
+        errors=errors,
+        response_info=_build_aggregate(lsn_reconciled_values, lsn_committed_values),
+    )
+
+
+def batch_execute_stream(
+    *,
+    batches: Iterable[tuple[list[dict[str, Any]], P]],
+    operation: Callable[[list[dict[str, Any]], P], Any],
+    max_concurrency: int = 4,
+    show_progress: bool = True,
+    desc: str = "Batches",
+    executor: ThreadPoolExecutor | None = None,
+    total: int | None = None,
+    retry_policy: BatchRetryPolicy | None = None,
+    rebuild: Callable[[list[dict[str, Any]]], P] | None = None,
+    checkpoint: BatchCheckpoint | None = None,
+) -> BatchResult:
+    """Execute *operation* on pre-built batches pulled lazily from an iterable.
+
+    Unlike :func:`batch_execute`, the input is never materialized: each
+    ``(items, payload)`` pair is pulled from *batches* only when fewer than
+    ``2 * max_concurrency`` batches are in flight, so memory stays bounded
+    for arbitrarily long inputs.  *operation* receives both the items and
+    the payload; *items* are recorded on ``BatchError`` for retry.
+
+    Args:
+        batches (Iterable[tuple[list[dict[str, Any]], P]]): Lazily produced
+            ``(items, payload)`` pairs.
+        operation (Callable): Callable that sends one batch.
+        max_concurrency (int): Thread pool size for concurrent requests
+            (1-64, default 4).
+        show_progress (bool): Display a tqdm progress bar when installed.
+        desc (str): Label shown on the progress bar.
+        executor (ThreadPoolExecutor | None): Optional caller-owned executor,
+            as for :func:`batch_execute`.
+        total (int | None): Number of batches, when known, for the progress bar.
+        retry_policy (BatchRetryPolicy | None): As for :func:`batch_execute`.
+        rebuild (Callable | None): Builds the payload for a subset of a
+            batch's items. Required for *retry_policy* to bisect batches;
+            without it, payload errors are final.
+        checkpoint (BatchCheckpoint | None): Skip the batches it records as
+            acknowledged and record each batch that succeeds. Skipped batches
+            are counted as successful on the result, and error batch indexes
+            are positions in the full *batches* sequence.
+
+    Returns:
+        BatchResult with aggregated success/failure counts.
+
+    Raises:
+        ValueError: If *max_concurrency* is out of range.
+        Exception: Whatever iterating *batches* raises; batches already
+            submitted are allowed to finish first.
+    """
+    _validate_concurrency(max_concurrency)
+
+    if checkpoint is not None:
+        wrapped, rebuild_tagged = checkpoint.wrap(operation, rebuild)
+        return checkpoint.merge(
+            batch_execute_stream(
+                batches=checkpoint.pending(batches),
+                operation=wrapped,
+                max_concurrency=max_concurrency,
+                show_progress=show_progress,
+                desc=desc,
+                executor=executor,
+                total=checkpoint.remaining(total),
+                retry_policy=retry_policy,
+                rebuild=rebuild_tagged,
+            )
+        )
+
+    errors: list[BatchError] = []
+    successful_item_count = 0
+    total_item_count = 0
+    total_batches = 0
+    lsn_reconciled_values: list[int] = []
+    lsn_committed_values: list[int] = []
+    in_flight: dict[Future[Any], tuple[int, list[dict[str, Any]]]] = {}
+    limit = 2 * max_concurrency
+
+    progress = _create_progress_bar(total, desc, show_progress)
+
+    own_executor = executor is None
+    if executor is None:
+        executor = ThreadPoolExecutor(max_workers=max_concurrency)
+
+    if retry_policy is not None:
+        try:
+            return _retry_execute(
+                batches=batches,
+                operation=operation,
+                policy=retry_policy,
+                rebuild=rebuild,
+                max_concurrency=max_concurrency,
+                progress=progress,
+                executor=executor,
+            )
+        finally:
+            progress.close()
+            if own_executor:
+                executor.shutdown()
+
+    def _collect(return_when: str) -> None:
+        nonlocal successful_item_count
+        done, _ = wait(in_flight, return_when=return_when)
+        for future in done:
+            batch_idx, items = in_flight.pop(future)
+            try:
+                batch_result = future.result()
+            except Exception as exc:
+                errors.append(
+                    BatchError(
+                        batch_index=batch_idx,
+                        items=items,
+                        error=exc,
+                        error_message=str(exc),
+                    )
+                )
+            else:
+                successful_item_count += len(items)
+                _collect_lsn(batch_result, lsn_reconciled_values, lsn_committed_values)
+            progress.update(1)
+
+    try:
+        for batch_idx, (items, payload) in enumerate(batches):
+            if len(in_flight) >= limit:
+                _collect(FIRST_COMPLETED)
+            in_flight[executor.submit(operation, items, payload)] = (batch_idx, items)
+            total_item_count += len(items)
+            total_batches += 1
+    finally:
+        if in_flight:
+            _collect(ALL_COMPLETED)
+        progress.close()
+        if own_executor:
+            executor.shutdown()
+
+    return _stream_result(
+        total_item_count=total_item_count,
+        total_batches=total_batches,
+        successful_item_count=successful_item_count,
+        errors=errors,
+        lsn_reconciled_values=lsn_reconciled_values,
+        lsn_committed_values=lsn_committed_values,
+    )
+
+
+async def async_batch_execute_stream(
+    *,
+    batches: Iterable[tuple[list[dict[str, Any]], P]],
+    operation: Callable[[list[dict[str, Any]], P], Awaitable[Any]],
+    max_concurrency: int = 4,
+    show_progress: bool = True,
+    desc: str = "Batches",
+    total: int | None = None,
+    retry_policy: BatchRetryPolicy | None = None,
+    rebuild: Callable[[list[dict[str, Any]]], P] | None = None,
+    checkpoint: BatchCheckpoint | None = None,
+) -> BatchResult:
+    """Async version of :func:`batch_execute_stream`.
+
+    At most *max_concurrency* batches are in flight at once; the next batch
+    is pulled from *batches* only when one of them completes.
+
+    Args:
+        batches (Iterable[tuple[list[dict[str, Any]], P]]): Lazily produced
+            ``(items, payload)`` pairs.
+        operation (Callable): Async callable that sends one batch.
+        max_concurrency (int): Maximum concurrent batch requests
+            (1-64, default 4).
+        show_progress (bool): Display a tqdm progress bar when installed.
+        desc (str): Label shown on the progress bar.
+        total (int | None): Number of batches, when known, for the progress bar.
+        retry_policy (BatchRetryPolicy | None): As for :func:`batch_execute`.
+        rebuild (Callable | None): As for :func:`batch_execute_stream`.
+        checkpoint (BatchCheckpoint | None): As for :func:`batch_execute_stream`.
+
+    Returns:
+        BatchResult with aggregated success/failure counts.
+
+    Raises:
+        ValueError: If *max_concurrency* is out of range.
+        Exception: Whatever iterating *batches* raises; batches already
+            started are allowed to finish first.
+    """
+    _validate_concurrency(max_concurrency)
+
+    if checkpoint is not None:
+        wrapped, rebuild_tagged = checkpoint.async_wrap(operation, rebuild)
+        return checkpoint.merge(
+            await async_batch_execute_stream(
+                batches=checkpoint.pending(batches),
+                operation=wrapped,
+                max_concurrency=max_concurrency,
+                show_progress=show_progress,
+                desc=desc,
+                total=checkpoint.remaining(total),
+                retry_policy=retry_policy,
+                rebuild=rebuild_tagged,
+            )
+        )
+
+    errors: list[BatchError] = []
+    successful_item_count = 0
+    total_item_count = 0
+    total_batches = 0
+    lsn_reconciled_values: list[int] = []
+    lsn_committed_values: list[int] = []
+    in_flight: dict[asyncio.Future[Any], tuple[int, list[dict[str, Any]]]] = {}
+
+    progress = _create_progress_bar(total, desc, show_progress)
+
+    if retry_policy is not None:
+        try:
+            return await _async_retry_execute(
+                batches=batches,
+                operation=operation,
+                policy=retry_policy,
+                rebuild=rebuild,
+                max_concurrency=max_concurrency,
+                progress=progress,
+            )
+        finally:
+            progress.close()
+
+    async def _collect(return_when: str) -> None:
+        nonlocal successful_item_count
+        done, _ = await asyncio.wait(in_flight, return_when=return_when)
+        for task in done:
+            batch_idx, items = in_flight.pop(task)
+            exc = task.exception()
+            if exc is not None:
+                if not isinstance(exc, Exception):
+                    raise exc
+                errors.append(
+                    BatchError(
+                        batch_index=batch_idx,
+                        items=items,
+                        error=exc,
+                        error_message=str(exc),
+                    )
+                )
+            else:
+                successful_item_count += len(items)
+                _collect_lsn(task.result(), lsn_reconciled_values, lsn_committed_values)
+            progress.update(1)
+
+    try:
+        for batch_idx, (items, payload) in enumerate(batches):
+            if len(in_flight) >= max_concurrency:
+                await _collect(asyncio.FIRST_COMPLETED)
+            task = asyncio.ensure_future(operation(items, payload))
+            in_flight[task] = (batch_idx, items)
+            total_item_count += len(items)
+            total_batches += 1
+    except asyncio.CancelledError:
+        for pending in in_flight:
+            pending.cancel()
+        in_flight.clear()
+        raise
+    finally:
+        if in_flight:
+            await _collect(asyncio.ALL_COMPLETED)
+        progress.close()
+
+    return _stream_result(
+        total_item_count=total_item_count,
+        total_batches=total_batches,
+        successful_item_count=successful_item_count,
+        errors=errors,
+        lsn_reconciled_values=lsn_reconciled_values,
+        lsn_committed_values=lsn_committed_values,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Retrying executors
+# ---------------------------------------------------------------------------
+
+
+class _Attempt:
+    """A pending send of one batch, or of a piece split off a batch."""
+
+    __slots__ = ("attempt", "batch_index", "items", "payload")
+
+    def __init__(
+        self, batch_index: int, items: list[dict[str, Any]], payload: Any, attempt: int = 1
+    ) -> None:
+        self.batch_index = batch_index
+        self.items = items
+        self.payload = payload
+        self.attempt = attempt
+
+
+class _RetryState:
+    """Bookkeeping shared by the sync and async retrying executors.
+
+    Holds attempts that are ready to send and those waiting out a backoff
+    delay, and counts the unresolved pieces of each original batch so that
+    a batch is reported done only once every piece split off it has either
+    succeeded or failed for good.  Not thread-safe: only the coordinating
+    thread or task touches it.
+    """
+
+    def __init__(
+        self,
+        policy: BatchRetryPolicy,
+        rebuild: Callable[[list[dict[str, Any]]], Any] | None,
+        progress: Any,
+    ) -> None:
+        self.policy = policy
+        self.rebuild = rebuild
+        self.progress = progress
+        self.ready: deque[_Attempt] = deque()
+        self.delayed: list[tuple[float, int, _Attempt]] = []
+        self.sequence = itertools.count()
+        self.unresolved: dict[int, int] = {}
+        self.failed_batches: set[int] = set()
+        self.errors: list[BatchError] = []
+        self.total_item_count = 0
+        self.total_batches = 0
+        self.successful_item_count = 0
+        self.lsn_reconciled_values: list[int] = []
+        self.lsn_committed_values: list[int] = []
+
+    def add(self, batch_index: int, items: list[dict[str, Any]], payload: Any) -> _Attempt:
+        self.total_batches += 1
+        self.total_item_count += len(items)
+        self.unresolved[batch_index] = 1
+        return _Attempt(batch_index, items, payload)
+
+    def next_ready(self, now: float) -> _Attempt | None:
+        while self.delayed and self.delayed[0][0] <= now:
+            self.ready.append(heapq.heappop(self.delayed)[2])
+        return self.ready.popleft() if self.ready else None
+
+    def seconds_until_ready(self, now: float) -> float | None:
+        """Return the wait until the next delayed attempt, or ``None`` if none."""
+        if self.ready:
+            return 0.0
+        if self.delayed:
+            return max(0.0, self.delayed[0][0] - now)
+        return None
+
+    def succeeded(self, attempt: _Attempt, result: Any) -> None:
+        self.successful_item_count += len(attempt.items)
+        _collect_lsn(result, self.lsn_reconciled_values, self.lsn_committed_values)
+        self._resolve(attempt.batch_index)
+
+    def failed(self, attempt: _Attempt, exc: Exception, now: float) -> None:
+        action = self.policy.classify(exc)
+        if action == "retry" and attempt.attempt < self.policy.max_attempts:
+            delay = self.policy.backoff(attempt.attempt)
+            attempt.attempt += 1
+            heapq.heappush(self.delayed, (now + delay, next(self.sequence), attempt))
+            return
+        if action == "bisect" and self.rebuild is not None and len(attempt.items) > 1:
+            # Halves jump the queue so a poisoned batch is isolated quickly.
+            mid = len(attempt.items) // 2
+            self.unresolved[attempt.batch_index] += 1
+            for half in (attempt.items[mid:], attempt.items[:mid]):
+                self.ready.appendleft(_Attempt(attempt.batch_index, half, self.rebuild(half)))
+            return
+        self.errors.append(
+            BatchError(
+                batch_index=attempt.batch_index,
+                items=attempt.items,
+                error=exc,
+                error_message=str(exc),
+            )
+        )
+        self.failed_batches.add(attempt.batch_index)
+        self._resolve(attempt.batch_index)
+
+    def _resolve(self, batch_index: int) -> None:
+        self.unresolved[batch_index] -= 1
+        if not self.unresolved[batch_index]:
+            del self.unresolved[batch_index]
+            self.progress.update(1)
+
+    def result(self) -> BatchResult:
+        self.errors.sort(key=lambda e: e.batch_index)
+        failed = len(self.failed_batches)
+        return BatchResult(
+            total_item_count=self.total_item_count,
+            successful_item_count=self.successful_item_count,
+            failed_item_count=sum(len(e.items) for e in self.errors),
+            total_batch_count=self.total_batches,
+            successful_batch_count=self.total_batches - failed,
+            failed_batch_count=failed,
+            errors=self.errors,
+            response_info=_build_aggregate(self.lsn_reconciled_values, self.lsn_committed_values),
+        )
+
+
+def _no_payload(items: list[dict[str, Any]]) -> None:
+    return None
+
+
+def _retry_execute(
+    *,
+    batches: Iterable[tuple[list[dict[str, Any]], P]],
+    operation: Callable[[list[dict[str, Any]], P], Any],
+    policy: BatchRetryPolicy,
+    rebuild: Callable[[list[dict[str, Any]]], P] | None,
+    max_concurrency: int,
+    progress: Any,
+    executor: ThreadPoolExecutor,
+) -> BatchResult:
+    """Run *batches* on *executor*, re-queuing failures according to *policy*.
+
+    The calling thread pulls batches lazily, keeps at most
+    ``2 * max_concurrency`` attempts in flight and waits out backoff delays
+    itself, so worker threads only ever run *operation*.
+    """
+    state = _RetryState(policy, rebuild, progress)
+    source = enumerate(batches)
+    exhausted = False
+    in_flight: dict[Future[Any], _Attempt] = {}
+    limit = 2 * max_concurrency
+
+    try:
+        while True:
+            now = time.monotonic()
+            while len(in_flight) < limit:
+                attempt = state.next_ready(now)
+                if attempt is None:
+                    if exhausted:
+                        break
+                    try:
+                        batch_idx, (items, payload) = next(source)
+                    except StopIteration:
+                        exhausted = True
+                        continue
+                    attempt = state.add(batch_idx, items, payload)
+                in_flight[executor.submit(operation, attempt.items, attempt.payload)] = attempt
+            timeout = None if len(in_flight) >= limit else state.seconds_until_ready(now)
+            if not in_flight:
+                if timeout is None:
+                    break
+                time.sleep(timeout)
+                continue
+            done, _ = wait(in_flight, timeout=timeout, return_when=FIRST_COMPLETED)
+            now = time.monotonic()
+            for future in done:
+                attempt = in_flight.pop(future)
+                try:
+                    batch_result = future.result()
+                except Exception as exc:
+                    state.failed(attempt, exc, now)
+                else:
+                    state.succeeded(attempt, batch_result)
+    finally:
+        # Only reached with work in flight when iterating *batches* raised.
+        if in_flight:
+            wait(in_flight)
+    return state.result()
+
+
+async def _async_retry_execute(
+    *,
+    batches: Iterable[tuple[list[dict[str, Any]], P]],
+    operation: Callable[[list[dict[str, Any]], P], Awaitable[Any]],
+    policy: BatchRetryPolicy,
+    rebuild: Callable[[list[dict[str, Any]]], P] | None,
+    max_concurrency: int,
+    progress: Any,
+) -> BatchResult:
+    """Async version of :func:`_retry_execute`; at most *max_concurrency* in flight."""
+    state = _RetryState(policy, rebuild, progress)
+    source = enumerate(batches)
+    exhausted = False
+    in_flight: dict[asyncio.Future[Any], _Attempt] = {}
+
+    try:
+        while True:
+            now = time.monotonic()
+            while len(in_flight) < max_concurrency:
+                attempt = state.next_ready(now)
+                if attempt is None:
+                    if exhausted:
+                        break
+                    try:
+                        batch_idx, (items, payload) = next(source)
+                    except StopIteration:
+                        exhausted = True
+                        continue
+                    attempt = state.add(batch_idx, items, payload)
+                in_flight[asyncio.ensure_future(operation(attempt.items, attempt.payload))] = (
+                    attempt
+                )
+            timeout = None if len(in_flight) >= max_concurrency else state.seconds_until_ready(now)
+            if not in_flight:
+                if timeout is None:
+                    break
+                await asyncio.sleep(timeout)
+                continue
+            done, _ = await asyncio.wait(
+                in_flight, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+            )
+            now = time.monotonic()
+            for task in done:
+                attempt = in_flight.pop(task)
+                exc = task.exception()
+                if exc is None:
+                    state.succeeded(attempt, task.result())
+                elif isinstance(exc, Exception):
+                    state.failed(attempt, exc, now)
+                else:
+                    raise exc
+    except asyncio.CancelledError:
+        for pending in in_flight:
+            pending.cancel()
+        raise
+    finally:
+        if in_flight:
+            await asyncio.wait(in_flight)
+    return state.result()
@@ -1,13 +1,18 @@
-"""Shared chunking and progress-bar utilities for batched upserts."""
+"""Shared chunking, packing and progress-bar utilities for batched writes."""
 
 from __future__ import annotations
 
-from collections.abc import Iterable, Sequence
-from typing import TypeVar
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterable, Iterator, Sequence
+from typing import Any, Literal, TypeVar
 
+from pinecone._internal.http_client import _encode_json
 from pinecone.errors.exceptions import PineconeValueError
 
 T = TypeVar("T")
+P = TypeVar("P")
+R = TypeVar("R")
 
 
 def validate_batch_size(batch_size: int) -> None:
@@ -41,3 +46,207 @@ def with_progress(
     except ImportError:
         return batches
     return tqdm(batches, desc=desc)  # type: ignore[no-any-return]
+
+
+#: Upper bound on a single write request body accepted by the data plane.
+MAX_REQUEST_BYTES = 2 * 1024 * 1024
+
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+#: Largest batch size ``batch_size="auto"`` will try, unless an endpoint's
+#: own per-request limit is lower.
+MAX_AUTO_BATCH_SIZE = 1000
+
+
+class BatchSizeTuner:
+    """Choose the batch size that maximizes observed write throughput.
+
+    Used for ``batch_size="auto"``. Starts at *initial* items per batch and
+    doubles after every *window* completed batches while items per second
+    improve by at least 5%.  The first size that does not improve is
+    abandoned in favour of the best size seen so far, which is then kept for
+    the rest of the run.  Batches may complete on worker threads, so all
+    state is guarded by a lock.
+
+    Args:
+        initial (int): Starting batch size.
+        maximum (int): Largest batch size to try.
+        window (int): Completed batches measured at each size.
+    """
+
+    _MIN_GAIN = 1.05
+
+    def __init__(self, initial: int = 50, maximum: int = MAX_AUTO_BATCH_SIZE, window: int = 3):
+        self._lock = threading.Lock()
+        self._maximum = maximum
+        self._window = window
+        self._size = min(initial, maximum)
+        self._best_size = self._size
+        self._best_rate = 0.0
+        self._items = 0
+        self._seconds = 0.0
+        self._samples = 0
+        self.settled = self._size >= maximum
+
+    @property
+    def current(self) -> int:
+        """Batch size to use for the next batch."""
+        return self._size
+
+    def record(self, item_count: int, seconds: float) -> None:
+        """Record that a batch of *item_count* items completed in *seconds*."""
+        with self._lock:
+            if self.settled:
+                return
+            self._items += item_count
+            self._seconds += seconds
+            self._samples += 1
+            if self._samples < self._window:
+                return
+            rate = self._items / self._seconds if self._seconds > 0 else float("inf")
+            self._items = 0
+            self._seconds = 0.0
+            self._samples = 0
+            if rate >= self._best_rate * self._MIN_GAIN:
+                self._best_rate = rate
+                self._best_size = self._size
+                if self._size < self._maximum:
+                    self._size = min(self._size * 2, self._maximum)
+                    return
+            self._size = self._best_size
+            self.settled = True
+
+    def __repr__(self) -> str:
+        return f"BatchSizeTuner(current={self._size}, settled={self.settled})"
+
+
+def resolve_batch_size(
+    batch_size: int | Literal["auto"], maximum: int = MAX_AUTO_BATCH_SIZE
+) -> int | BatchSizeTuner:
+    """Return a fixed batch size, or a fresh tuner for ``"auto"``.
+
+    Raises:
+        PineconeValueError: If *batch_size* is neither ``"auto"`` nor a
+            positive integer.
+    """
+    if batch_size == "auto":
+        return BatchSizeTuner(maximum=maximum)
+    validate_batch_size(batch_size)
+    return batch_size
+
+
+def batch_limit(batch_size: int | BatchSizeTuner) -> int:
+    """Return the item cap for the next batch."""
+    return batch_size.current if isinstance(batch_size, BatchSizeTuner) else batch_size
+
+
+def pack_batches(
+    items: Iterable[T],
+    *,
+    batch_size: int | BatchSizeTuner,
+    max_bytes: int,
+    size_of: Callable[[T], int],
+    overhead: int = 0,
+) -> Iterator[list[T]]:
+    """Lazily group *items* into batches bounded by count and encoded size.
+
+    Each batch holds at most ``batch_size`` items (read from the tuner when a
+    batch starts) and ``overhead`` plus the sum of ``size_of(item)`` stays
+    within *max_bytes*.  A batch is yielded as soon as it is full.  A single
+    item larger than *max_bytes* is yielded on its own so that the server,
+    not the client, reports it as oversized.
+
+    Args:
+        items (Iterable[T]): Items to pack, consumed once.
+        batch_size (int | BatchSizeTuner): Item cap per batch.
+        max_bytes (int): Byte cap per batch.
+        size_of (Callable[[T], int]): Encoded size of one item, including
+            its separator.
+        overhead (int): Bytes every batch adds around its items.
+    """
+    batch: list[T] = []
+    total = overhead
+    limit = batch_limit(batch_size)
+    for item in items:
+        size = size_of(item)
+        if batch and total + size > max_bytes:
+            yield batch
+            batch = []
+            total = overhead
+            limit = batch_limit(batch_size)
+        batch.append(item)
+        total += size
+        if len(batch) >= limit:
+            yield batch
+            batch = []
+            total = overhead
+            limit = batch_limit(batch_size)
+    if batch:
+        yield batch
+
+
+def iter_json_batches(
+    items: Iterable[dict[str, Any]],
+    *,
+    key: str,
+    batch_size: int | BatchSizeTuner,
+    max_bytes: int = MAX_REQUEST_BYTES,
+    fields: dict[str, Any] | None = None,
+) -> Iterator[tuple[list[dict[str, Any]], bytes]]:
+    """Encode *items* into JSON request bodies bounded by count and size.
+
+    Every item is serialized exactly once; the bytes are used both to
+    measure it and to assemble ``{key: [items...], **fields}``, so the
+    request body never has to be encoded again.
+
+    Yields:
+        ``(items, body)`` pairs, where *items* are the caller's dicts (kept
+        for failure reporting) and *body* is the complete JSON body.
+    """
+    prefix = b'{"' + key.encode() + b'":['
+    suffix = b"]," + _encode_json(fields)[1:] if fields else b"]}"
+    for batch in pack_batches(
+        ((item, _encode_json(item)) for item in items),
+        batch_size=batch_size,
+        max_bytes=max_bytes,
+        size_of=lambda pair: len(pair[1]) + 1,
+        overhead=len(prefix) + len(suffix) - 1,
+    ):
+        yield [item for item, _ in batch], prefix + b",".join(p for _, p in batch) + suffix
+
+
+def tuned(
+    operation: Callable[[list[T], P], R], batch_size: int | BatchSizeTuner
+) -> Callable[[list[T], P], R]:
+    """Wrap *operation* to feed successful batch timings to an auto tuner.
+
+    Returns *operation* unchanged for a fixed batch size.
+    """
+    if not isinstance(batch_size, BatchSizeTuner):
+        return operation
+    tuner = batch_size
+
+    def _timed(items: list[T], payload: P) -> R:
+        started = time.perf_counter()
+        result = operation(items, payload)
+        tuner.record(len(items), time.perf_counter() - started)
+        return result
+
+    return _timed
+
+
+def async_tuned(
+    operation: Callable[[list[T], P], Awaitable[R]], batch_size: int | BatchSizeTuner
+) -> Callable[[list[T], P], Awaitable[R]]:
+    """Async version of :func:`tuned`."""
+    if not isinstance(batch_size, BatchSizeTuner):
+        return operation
+    tuner = batch_size
+
+    async def _timed(items: list[T], payload: P) -> R:
+        started = time.perf_counter()
+        result = await operation(items, payload)
+        tuner.record(len(items), time.perf_counter() - started)
+        return result
+
+    return _timed
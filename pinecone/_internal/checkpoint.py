@@ -0,0 +1,379 @@
+"""Append-only checkpoint files for resumable batched upserts.
+
+A checkpoint is an NDJSON file.  Its first line describes the job (operation,
+transport, namespace and batching parameters), and every following line
+records one acknowledged batch.  Batches are numbered by their position in
+the source, which is deterministic because batches are packed from the same
+source with the same count and byte limits on every run.  A rerun of the same
+job therefore skips every batch already recorded.
+
+Lines are buffered and written with a single ``write`` followed by
+``fsync`` every *sync_every* batches or *sync_interval* seconds, whichever
+comes first, and once more when the checkpoint is closed.  A crash can lose
+at most the acknowledgements since the last sync; those batches are simply
+sent again, which is safe because upserts are idempotent.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from typing import Any, Literal, TypeVar
+
+import msgspec
+
+from pinecone._internal.batch import _build_aggregate, _collect_lsn
+from pinecone._internal.batching import MAX_REQUEST_BYTES
+from pinecone._internal.validation import require_positive
+from pinecone.errors.exceptions import PineconeValueError
+from pinecone.models.batch import BatchResult
+
+logger = logging.getLogger(__name__)
+
+P = TypeVar("P")
+R = TypeVar("R")
+
+_VERSION = 1
+
+#: ``(batch_number, first_item_offset, payload)``; pieces split off a batch
+#: by bisection carry ``None`` and are never recorded.
+Tagged = tuple[int | None, int, Any]
+
+
+class _Entry(msgspec.Struct, kw_only=True, omit_defaults=True):
+    batch: int
+    start: int
+    count: int
+    first: str
+    last: str
+    lsn_reconciled: int | None = None
+    lsn_committed: int | None = None
+
+
+_encode_entry = msgspec.json.Encoder().encode
+_decode_entry = msgspec.json.Decoder(_Entry).decode
+
+
+def _item_id(item: dict[str, Any]) -> str:
+    return str(item.get("id", item.get("_id", "")))
+
+
+class BatchCheckpoint:
+    """Acknowledged-batch log of one resumable batched upsert.
+
+    Opening a checkpoint loads the batches recorded by earlier runs and
+    truncates a partially written last line left by a crash.  Pass it as
+    ``checkpoint=`` to :func:`~pinecone._internal.batch.batch_execute_stream`
+    (or the async variant), and close it, or use it as a context manager, so
+    the final acknowledgements are synced to disk.
+
+    Args:
+        path: Checkpoint file. Created when it does not exist.
+        job: JSON-serializable description of the job. Opening an existing
+            checkpoint written for a different job raises.
+        sync_every: Acknowledged batches buffered before a sync.
+        sync_interval: Maximum seconds an acknowledgement stays unsynced
+            while batches keep completing.
+
+    Raises:
+        :exc:`PineconeValueError`: If the file belongs to a different job or
+            is corrupt.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        job: dict[str, Any],
+        sync_every: int = 64,
+        sync_interval: float = 1.0,
+    ) -> None:
+        require_positive("sync_every", sync_every)
+        self.path = os.fspath(path)
+        self._job = job
+        self._sync_every = sync_every
+        self._sync_interval = sync_interval
+        self._lock = threading.Lock()
+        self._done: dict[int, _Entry] = {}
+        self._pending: list[bytes] = []
+        self._last_sync = time.monotonic()
+        self._numbers: list[int] = []
+        self._lsn_reconciled: list[int] = []
+        self._lsn_committed: list[int] = []
+        self.skipped_batches = 0
+        self.skipped_items = 0
+        fresh = self._load()
+        self._file = open(self.path, "ab")  # noqa: SIM115 - closed by close()
+        if fresh:
+            header = {"version": _VERSION, "job": job}
+            self._file.write(msgspec.json.encode(header) + b"\n")
+            self._fsync()
+
+    # ------------------------------------------------------------------
+    # Loading
+    # ------------------------------------------------------------------
+
+    def _load(self) -> bool:
+        try:
+            with open(self.path, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return True
+        lines = data.split(b"\n")
+        torn = lines.pop()
+        if torn:
+            # A crash mid-write left a partial line; drop it before appending.
+            logger.warning("Discarding a partially written line in checkpoint %s", self.path)
+            with open(self.path, "r+b") as f:
+                f.truncate(len(data) - len(torn))
+        if not lines:
+            return True
+        try:
+            header = msgspec.json.decode(lines[0])
+        except msgspec.DecodeError:
+            raise PineconeValueError(f"Checkpoint {self.path} is corrupt") from None
+        if not isinstance(header, dict) or header.get("version") != _VERSION:
+            raise PineconeValueError(f"Checkpoint {self.path} is not an upsert checkpoint")
+        if header.get("job") != self._job:
+            raise PineconeValueError(
+                f"Checkpoint {self.path} was written for a different job "
+                f"({header.get('job')!r}); use a new checkpoint file or the same "
+                f"namespace and batch_size as the original run"
+            )
+        for number, line in enumerate(lines[1:], 2):
+            try:
+                entry = _decode_entry(line)
+            except msgspec.DecodeError:
+                raise PineconeValueError(
+                    f"Checkpoint {self.path} is corrupt at line {number}"
+                ) from None
+            self._done[entry.batch] = entry
+            self._note_lsn(entry)
+        return False
+
+    def _note_lsn(self, entry: _Entry) -> None:
+        if entry.lsn_reconciled is not None:
+            self._lsn_reconciled.append(entry.lsn_reconciled)
+        if entry.lsn_committed is not None:
+            self._lsn_committed.append(entry.lsn_committed)
+
+    @property
+    def completed_batches(self) -> int:
+        """Number of batches recorded as acknowledged, across all runs."""
+        with self._lock:
+            return len(self._done)
+
+    # ------------------------------------------------------------------
+    # Executor integration
+    # ------------------------------------------------------------------
+
+    def remaining(self, total: int | None) -> int | None:
+        """Return how many of *total* batches are not yet acknowledged."""
+        if total is None:
+            return None
+        return max(0, total - self.completed_batches)
+
+    def pending(
+        self, batches: Iterable[tuple[list[dict[str, Any]], P]]
+    ) -> Iterator[tuple[list[dict[str, Any]], Tagged]]:
+        """Yield the batches of *batches* that are not yet acknowledged.
+
+        Each payload is tagged with its batch number and item offset for
+        :meth:`wrap`.  Skipped batches are checked against the recorded
+        item count and first and last IDs.
+
+        Raises:
+            :exc:`PineconeValueError`: If a skipped batch no longer matches
+                its record, meaning the source changed since the checkpoint
+                was written.
+        """
+        start = 0
+        for batch_no, (items, payload) in enumerate(batches):
+            entry = self._done.get(batch_no)
+            if entry is None:
+                self._numbers.append(batch_no)
+                yield items, (batch_no, start, payload)
+            else:
+                if (
+                    entry.start != start
+                    or entry.count != len(items)
+                    or entry.first != _item_id(items[0])
+                    or entry.last != _item_id(items[-1])
+                ):
+                    raise PineconeValueError(
+                        f"Batch {batch_no} no longer matches checkpoint {self.path}; "
+                        f"the source changed since the checkpoint was written"
+                    )
+                self.skipped_batches += 1
+                self.skipped_items += len(items)
+            start += len(items)
+        if self.skipped_batches:
+            logger.info(
+                "Skipped %d batches (%d items) already acknowledged in %s",
+                self.skipped_batches,
+                self.skipped_items,
+                self.path,
+            )
+
+    def wrap(
+        self,
+        operation: Callable[[list[dict[str, Any]], P], R],
+        rebuild: Callable[[list[dict[str, Any]]], P] | None = None,
+    ) -> tuple[
+        Callable[[list[dict[str, Any]], Tagged], R],
+        Callable[[list[dict[str, Any]]], Tagged] | None,
+    ]:
+        """Wrap *operation* and *rebuild* to work on tagged payloads.
+
+        The wrapped operation records each whole batch it sends successfully.
+        """
+
+        def _operation(items: list[dict[str, Any]], tagged: Tagged) -> R:
+            batch_no, start, payload = tagged
+            result = operation(items, payload)
+            if batch_no is not None:
+                self.record(batch_no, start, items, result)
+            return result
+
+        return _operation, self._wrap_rebuild(rebuild)
+
+    def async_wrap(
+        self,
+        operation: Callable[[list[dict[str, Any]], P], Awaitable[R]],
+        rebuild: Callable[[list[dict[str, Any]]], P] | None = None,
+    ) -> tuple[
+        Callable[[list[dict[str, Any]], Tagged], Awaitable[R]],
+        Callable[[list[dict[str, Any]]], Tagged] | None,
+    ]:
+        """Async counterpart of :meth:`wrap`."""
+
+        async def _operation(items: list[dict[str, Any]], tagged: Tagged) -> R:
+            batch_no, start, payload = tagged
+            result = await operation(items, payload)
+            if batch_no is not None:
+                self.record(batch_no, start, items, result)
+            return result
+
+        return _operation, self._wrap_rebuild(rebuild)
+
+    @staticmethod
+    def _wrap_rebuild(
+        rebuild: Callable[[list[dict[str, Any]]], P] | None,
+    ) -> Callable[[list[dict[str, Any]]], Tagged] | None:
+        if rebuild is None:
+            return None
+        # Pieces of a bisected batch are not recorded: the batch is resent
+        # whole on the next run, which is harmless for an upsert.
+        return lambda items: (None, 0, rebuild(items))
+
+    def merge(self, result: BatchResult) -> BatchResult:
+        """Fold the skipped batches into *result* from an executor run.
+
+        Error batch indexes are translated back to source batch numbers and
+        the aggregate LSNs include those recorded by earlier runs.
+        """
+        for error in result.errors:
+            error.batch_index = self._numbers[error.batch_index]
+        with self._lock:
+            lsn_reconciled = list(self._lsn_reconciled)
+            lsn_committed = list(self._lsn_committed)
+        return BatchResult(
+            total_item_count=result.total_item_count + self.skipped_items,
+            successful_item_count=result.successful_item_count + self.skipped_items,
+            failed_item_count=result.failed_item_count,
+            total_batch_count=result.total_batch_count + self.skipped_batches,
+            successful_batch_count=result.successful_batch_count + self.skipped_batches,
+            failed_batch_count=result.failed_batch_count,
+            errors=result.errors,
+            response_info=_build_aggregate(lsn_reconciled, lsn_committed),
+        )
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def record(self, batch_no: int, start: int, items: list[dict[str, Any]], result: Any) -> None:
+        """Record batch *batch_no* as acknowledged. Safe to call from any thread."""
+        lsn_reconciled: list[int] = []
+        lsn_committed: list[int] = []
+        _collect_lsn(result, lsn_reconciled, lsn_committed)
+        entry = _Entry(
+            batch=batch_no,
+            start=start,
+            count=len(items),
+            first=_item_id(items[0]),
+            last=_item_id(items[-1]),
+            lsn_reconciled=lsn_reconciled[0] if lsn_reconciled else None,
+            lsn_committed=lsn_committed[0] if lsn_committed else None,
+        )
+        line = _encode_entry(entry) + b"\n"
+        with self._lock:
+            self._done[batch_no] = entry
+            self._note_lsn(entry)
+            self._pending.append(line)
+            if (
+                len(self._pending) >= self._sync_every
+                or time.monotonic() - self._last_sync >= self._sync_interval
+            ):
+                self._sync()
+
+    def _sync(self) -> None:
+        # Caller holds the lock.
+        if self._pending:
+            self._file.write(b"".join(self._pending))
+            self._pending.clear()
+            self._fsync()
+        self._last_sync = time.monotonic()
+
+    def _fsync(self) -> None:
+        self._file.flush()
+        os.fsync(self._file.fileno())
+
+    def close(self) -> None:
+        """Sync buffered acknowledgements and close the file."""
+        with self._lock:
+            if self._file.closed:
+                return
+            try:
+                self._sync()
+            finally:
+                self._file.close()
+
+    def __enter__(self) -> BatchCheckpoint:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def open_upsert_checkpoint(
+    path: str | os.PathLike[str],
+    *,
+    transport: Literal["rest", "grpc"],
+    namespace: str,
+    batch_size: int | Literal["auto"],
+) -> BatchCheckpoint:
+    """Open the checkpoint of a batched vector upsert.
+
+    Raises:
+        :exc:`PineconeValueError`: If *batch_size* is ``"auto"``, since batch
+            numbering must be the same on every run.
+    """
+    if batch_size == "auto":
+        raise PineconeValueError(
+            "checkpoint requires an integer batch_size, not 'auto', so batches "
+            "are numbered the same way on every run"
+        )
+    return BatchCheckpoint(
+        path,
+        job={
+            "operation": "upsert",
+            "transport": transport,
+            "namespace": namespace,
+            "batch_size": batch_size,
+            "max_bytes": MAX_REQUEST_BYTES,
+        },
+    )
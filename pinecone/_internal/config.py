@@ -4,8 +4,20 @@ from __future__ import annotations
 
 import logging
 import os
+import random
 from dataclasses import dataclass, field
-from typing import ClassVar
+from typing import TYPE_CHECKING, ClassVar, Literal
+
+from pinecone.errors.exceptions import (
+    ApiError,
+    PineconeConnectionError,
+    PineconeTimeoutError,
+    PineconeTypeError,
+    PineconeValueError,
+)
+
+if TYPE_CHECKING:
+    from pinecone._internal.instrumentation import RequestListener
 
 logger = logging.getLogger(__name__)
 
@@ -91,6 +103,103 @@ class RetryConfig:
     )
 
 
+@dataclass(frozen=True)
+class BatchRetryPolicy:
+    """Retry and bisection policy for failed batches of a batched write.
+
+    Pass as ``retry_policy=`` to a batched ``upsert``, ``upsert_records`` or
+    ``batch_upsert`` call.  It acts on batches that still fail after the
+    client's HTTP-level :class:`RetryConfig` has given up:
+
+    - A batch that fails with a transient error (a *retryable_status_codes*
+      response, a timeout or a connection error) is re-queued after an
+      exponential backoff delay with jitter, up to *max_attempts* attempts.
+    - A batch that fails with a payload error (a *bisect_status_codes*
+      response or a client-side validation error) is split in half and both
+      halves are re-sent, repeatedly, until the unprocessable items are
+      isolated.
+
+    Only those isolated items, and batches that used up their attempts, are
+    reported on the result's ``errors``.  Backoff delays are scheduled by the
+    thread or task coordinating the batches, so worker threads never sleep
+    while a batch waits.
+
+    Args:
+        max_attempts: Attempts per batch, including the first. Defaults to 5.
+        backoff_factor: Delay in seconds before the first retry, doubled
+            after each further attempt. Defaults to 0.5.
+        max_wait: Maximum delay in seconds. Defaults to 30.0.
+        retryable_status_codes: Status codes that re-queue a batch. Defaults
+            to ``{408, 429, 500, 502, 503, 504}``.
+        bisect_status_codes: Status codes that split a batch. Defaults to
+            ``{400, 413, 422}``.
+        bisect: Whether to split batches that fail with payload errors.
+            Defaults to ``True``.
+
+    Raises:
+        :exc:`PineconeValueError`: If *max_attempts* is less than 1 or a delay
+            is negative.
+
+    Examples:
+        .. code-block:: python
+
+            from pinecone import BatchRetryPolicy, Pinecone
+
+            pc = Pinecone(api_key="your-api-key")
+            index = pc.index("product-search")
+            response = index.upsert(
+                vectors=vectors,
+                batch_size=200,
+                retry_policy=BatchRetryPolicy(max_attempts=8),
+            )
+            # Only the vectors the server rejected on their own remain.
+            print(response.failed_items)
+    """
+
+    max_attempts: int = 5
+    backoff_factor: float = 0.5
+    max_wait: float = 30.0
+    retryable_status_codes: frozenset[int] = field(
+        default_factory=lambda: frozenset({408, 429, 500, 502, 503, 504})
+    )
+    bisect_status_codes: frozenset[int] = field(default_factory=lambda: frozenset({400, 413, 422}))
+    bisect: bool = True
+
+    def __post_init__(self) -> None:
+        if self.max_attempts < 1:
+            raise PineconeValueError(f"max_attempts must be at least 1, got {self.max_attempts}")
+        if self.backoff_factor < 0 or self.max_wait < 0:
+            raise PineconeValueError("backoff_factor and max_wait must not be negative")
+
+    def classify(self, exc: BaseException) -> Literal["retry", "bisect"] | None:
+        """Return how a batch that raised *exc* should be handled.
+
+        Returns:
+            ``"retry"`` for a transient failure, ``"bisect"`` for a payload
+            failure, or ``None`` when the failure is final.
+        """
+        if isinstance(exc, ApiError):
+            if exc.status_code in self.retryable_status_codes:
+                return "retry"
+            if exc.status_code in self.bisect_status_codes:
+                return "bisect" if self.bisect else None
+            return None
+        if isinstance(exc, (PineconeTimeoutError, PineconeConnectionError)):
+            return "retry"
+        if isinstance(exc, (PineconeValueError, PineconeTypeError)):
+            return "bisect" if self.bisect else None
+        return None
+
+    def backoff(self, attempt: int) -> float:
+        """Return the delay before retrying a batch that failed *attempt* times.
+
+        Uses the same floored full jitter as the HTTP transport: uniform in
+        [10%, 100%] of the exponential delay.
+        """
+        base_delay = min(self.backoff_factor * 2 ** (attempt - 1), self.max_wait)
+        return random.uniform(0.1 * base_delay, base_delay)
+
+
 @dataclass(frozen=True)
 class PineconeConfig:
     """SDK configuration with environment variable fallbacks.
@@ -104,6 +213,12 @@ class PineconeConfig:
         proxy_url: HTTP proxy URL.
         ssl_ca_certs: Path to CA certificate bundle.
         ssl_verify: Whether to verify SSL certificates.
+        connection_pool_maxsize: Maximum number of pooled connections. ``0``
+            picks a default from the CPU count.
+        retry_config: Retry behavior for transient errors.
+        request_listeners: Callables that receive a
+            :class:`~pinecone.RequestEvent` with the phase timings of every
+            request sent with this configuration. Defaults to none.
     """
 
     api_key: str = ""
@@ -117,6 +232,7 @@ class PineconeConfig:
     ssl_verify: bool = True
     connection_pool_maxsize: int = 0
     retry_config: RetryConfig = field(default_factory=RetryConfig)
+    request_listeners: tuple[RequestListener, ...] = ()
 
     _SENSITIVE_HEADER_KEYS: ClassVar[frozenset[str]] = frozenset(
         {"authorization", "api-key", "proxy-authorization"}
@@ -159,3 +275,5 @@ class PineconeConfig:
                 object.__setattr__(self, "additional_headers", env_headers)
         if self.source_tag:
             object.__setattr__(self, "source_tag", normalize_source_tag(self.source_tag))
+        if not isinstance(self.request_listeners, tuple):
+            object.__setattr__(self, "request_listeners", tuple(self.request_listeners))
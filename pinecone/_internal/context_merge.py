@@ -0,0 +1,140 @@
+"""Request building and snippet merging for ``Assistants.context_many``."""
+
+from __future__ import annotations
+
+import itertools
+from typing import TYPE_CHECKING, Any
+
+import msgspec
+
+from pinecone.errors.exceptions import PineconeValueError
+from pinecone.models.assistant.chat import ChatUsage
+from pinecone.models.assistant.context import (
+    ContextSource,
+    MultiContextResponse,
+    TextSnippet,
+)
+from pinecone.models.assistant.message import Message
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping, Sequence
+
+    from pinecone.models.assistant.context import ContextResponse, ContextSnippet
+
+
+def context_body(
+    *,
+    query: str | None,
+    messages: Sequence[Message | Mapping[str, str]] | None,
+    filter: dict[str, Any] | None,
+    top_k: int | None,
+    snippet_size: int | None,
+    multimodal: bool | None,
+    include_binary_content: bool | None,
+) -> dict[str, Any]:
+    """Validate context arguments and build the request body."""
+    query_truthy = query is not None and query != ""
+    messages_truthy = messages is not None and len(messages) > 0
+
+    if query_truthy and messages_truthy:
+        raise PineconeValueError("Exactly one of query or messages must be provided, not both.")
+    if not query_truthy and not messages_truthy:
+        raise PineconeValueError("Exactly one of query or messages must be provided.")
+
+    body: dict[str, Any] = {}
+
+    if query_truthy:
+        body["query"] = query
+    else:
+        if messages is None:
+            raise PineconeValueError("Exactly one of query or messages must be provided.")
+        parsed: list[Message] = [
+            m if isinstance(m, Message) else Message.from_dict(m) for m in messages
+        ]
+        body["messages"] = [{"role": m.role, "content": m.content} for m in parsed]
+
+    if top_k is not None and top_k < 0:
+        raise PineconeValueError("top_k must be a non-negative integer.")
+    if snippet_size is not None and snippet_size < 0:
+        raise PineconeValueError("snippet_size must be a non-negative integer.")
+
+    if filter is not None:
+        body["filter"] = filter
+    if top_k is not None:
+        body["top_k"] = top_k
+    if snippet_size is not None:
+        body["snippet_size"] = snippet_size
+    if multimodal is not None:
+        body["multimodal"] = multimodal
+    if include_binary_content is not None:
+        body["include_binary_content"] = include_binary_content
+    return body
+
+
+def context_pairs(
+    assistant_names: str | Sequence[str], queries: str | Sequence[str]
+) -> list[tuple[str, str]]:
+    """Return every ``(assistant_name, query)`` pair, assistants outermost."""
+    names = [assistant_names] if isinstance(assistant_names, str) else list(assistant_names)
+    texts = [queries] if isinstance(queries, str) else list(queries)
+    if not names:
+        raise PineconeValueError("assistant_names must not be empty")
+    if not texts or any(not q for q in texts):
+        raise PineconeValueError("queries must be non-empty strings")
+    return list(itertools.product(dict.fromkeys(names), dict.fromkeys(texts)))
+
+
+def _snippet_key(snippet: ContextSnippet) -> str | bytes:
+    if isinstance(snippet, TextSnippet):
+        return snippet.content
+    return msgspec.json.encode(snippet.content)
+
+
+class ContextMerger:
+    """Merges the context responses of several ``(assistant, query)`` pairs.
+
+    Snippets with identical content are kept once, at the highest score any
+    source gave them, whichever assistant or file they came from.
+    """
+
+    def __init__(self, pairs: list[tuple[str, str]]) -> None:
+        self._pairs = pairs
+        self._responses: dict[int, ContextResponse] = {}
+
+    def add(self, position: int, response: ContextResponse) -> None:
+        """Record the response for ``pairs[position]``."""
+        self._responses[position] = response
+
+    def result(self, top_n: int | None) -> MultiContextResponse:
+        """Return the merged snippets, keeping at most *top_n* when given."""
+        best: dict[str | bytes, tuple[ContextSnippet, int]] = {}
+        sources: list[ContextSource] = []
+        prompt = completion = total = 0
+        for position, (assistant_name, query) in enumerate(self._pairs):
+            response = self._responses[position]
+            sources.append(
+                ContextSource(
+                    assistant_name=assistant_name,
+                    query=query,
+                    usage=response.usage,
+                    id=response.id,
+                )
+            )
+            prompt += response.usage.prompt_tokens
+            completion += response.usage.completion_tokens
+            total += response.usage.total_tokens
+            for snippet in response.snippets:
+                key = _snippet_key(snippet)
+                kept = best.get(key)
+                if kept is None or snippet.score > kept[0].score:
+                    best[key] = (snippet, position)
+        # Python's sort is stable, so ties keep request order.
+        merged = sorted(best.values(), key=lambda item: -item[0].score)
+        if top_n is not None:
+            merged = merged[:top_n]
+        return MultiContextResponse(
+            snippets=[snippet for snippet, _ in merged],
+            origins=[position for _, position in merged],
+            sources=sources,
+            usage=ChatUsage(prompt_tokens=prompt, completion_tokens=completion, total_tokens=total),
+        )
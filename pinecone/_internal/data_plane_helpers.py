@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from array import array
+from collections.abc import Iterable, Mapping
 from typing import Any
 
 from pinecone._internal.config import normalize_host
 from pinecone.errors.exceptions import PineconeValueError, ValidationError
-from pinecone.models.vectors.vector import Vector
+from pinecone.models.batch import BatchResult
+from pinecone.models.response_info import ResponseInfo
+from pinecone.models.vectors.responses import UpsertResponse
+from pinecone.models.vectors.vector import ScoredVector, Vector
 
 
 def _validate_host(host: str) -> str:
@@ -73,3 +77,40 @@ def _vector_to_dict(v: Vector) -> dict[str, Any]:
     if v.metadata is not None:
         return {"id": id_, "values": vals, "metadata": v.metadata}
     return {"id": id_, "values": vals}
+
+
+def _batch_upsert_response(result: BatchResult) -> UpsertResponse:
+    """Convert a batched upsert's :class:`BatchResult` to an :class:`UpsertResponse`.
+
+    The aggregate LSNs become synthetic ``x-pinecone-lsn-*`` headers on
+    ``response_info``.
+    """
+    headers: dict[str, str] = {}
+    if result.response_info is not None:
+        if result.response_info.lsn_reconciled is not None:
+            headers["x-pinecone-lsn-reconciled"] = str(result.response_info.lsn_reconciled)
+        if result.response_info.lsn_committed is not None:
+            headers["x-pinecone-lsn-committed"] = str(result.response_info.lsn_committed)
+    return UpsertResponse(
+        upserted_count=result.successful_item_count,
+        response_info=ResponseInfo(raw_headers=headers) if headers else None,
+        total_item_count=result.total_item_count,
+        failed_item_count=result.failed_item_count,
+        total_batch_count=result.total_batch_count,
+        successful_batch_count=result.successful_batch_count,
+        failed_batch_count=result.failed_batch_count,
+        errors=result.errors,
+    )
+
+
+def _compact_sparse_values(vectors: Iterable[Vector | ScoredVector]) -> None:
+    """Re-back the sparse components of *vectors* with ``array`` storage in place.
+
+    Indices become ``array("I")`` and values ``array("f")``: 4 bytes per
+    element instead of a boxed Python object each.
+    """
+    for v in vectors:
+        sv = v.sparse_values
+        if sv is not None and isinstance(sv.indices, list):
+            sv.indices = array("I", sv.indices)  # type: ignore[assignment]
+            sv.values = array("f", sv.values)  # type: ignore[assignment]
@@ -0,0 +1,162 @@
+"""Request splitting and result assembly for ``Inference.embed_many``."""
+
+from __future__ import annotations
+
+from itertools import chain
+from typing import Any, Literal
+
+from msgspec import Struct
+
+from pinecone._internal.adapters._decode import decode_response
+from pinecone._internal.adapters.inference_adapter import InferenceAdapter
+from pinecone.errors.exceptions import ResponseParsingError
+from pinecone.models.inference.embed import (
+    DenseEmbedding,
+    EmbeddingMatrix,
+    EmbeddingsList,
+    EmbedUsage,
+    SparseEmbedding,
+    SparseEmbeddingMatrix,
+)
+
+#: Inputs per request when the model does not report ``max_batch_size``.
+DEFAULT_EMBED_BATCH_SIZE = 96
+
+EmbedOutput = Literal["embeddings", "numpy"]
+
+
+class _ArrayRow(Struct, kw_only=True):
+    values: list[float] | None = None
+    sparse_values: list[float] | None = None
+    sparse_indices: list[int] | None = None
+
+
+class _ArrayEnvelope(Struct, kw_only=True):
+    """Embed response decoded without building an embedding object per row."""
+
+    model: str
+    vector_type: str
+    data: list[_ArrayRow]
+    usage: EmbedUsage
+
+
+def split_inputs(
+    inputs: list[dict[str, Any]], batch_size: int
+) -> list[tuple[int, list[dict[str, Any]]]]:
+    """Return ``(offset, chunk)`` pairs of at most *batch_size* inputs each."""
+    return [(i, inputs[i : i + batch_size]) for i in range(0, len(inputs), batch_size)]
+
+
+def _check_count(received: int, count: int) -> None:
+    """Raise unless a response answers each of its *count* inputs exactly once."""
+    if received != count:
+        raise ResponseParsingError(f"embed response has {received} embeddings for {count} inputs")
+
+
+class EmbedAssembler:
+    """Collects the responses of an ``embed_many`` call in input order.
+
+    Responses may be added in any order; each is placed at the offset of
+    the chunk it answers.  With ``output="numpy"`` dense rows are copied
+    straight into one preallocated ``float32`` matrix as they arrive.
+    """
+
+    def __init__(self, total: int, output: EmbedOutput) -> None:
+        self._total = total
+        self._output = output
+        self._model = ""
+        self._vector_type: str | None = None
+        self._tokens = 0
+        self._embeddings: dict[int, list[Any]] = {}
+        self._matrix: Any = None
+        self._sparse: dict[int, tuple[Any, Any, Any]] = {}
+
+    def add(self, offset: int, count: int, content: bytes) -> None:
+        """Decode the response to the *count* inputs starting at *offset*."""
+        if self._output == "embeddings":
+            result = InferenceAdapter.to_embeddings_list(content)
+            self._record(result.model, result.vector_type, result.usage)
+            _check_count(len(result.data), count)
+            self._embeddings[offset] = result.data
+            return
+        envelope = decode_response(content, _ArrayEnvelope)
+        self._record(envelope.model, envelope.vector_type, envelope.usage)
+        _check_count(len(envelope.data), count)
+        import numpy as np
+
+        if envelope.vector_type == "sparse":
+            rows = envelope.data
+            self._sparse[offset] = (
+                np.fromiter((len(r.sparse_indices or ()) for r in rows), np.int64, len(rows)),
+                np.fromiter(chain.from_iterable(r.sparse_indices or () for r in rows), np.uint32),
+                np.fromiter(chain.from_iterable(r.sparse_values or () for r in rows), np.float32),
+            )
+            return
+        try:
+            block = np.array([r.values for r in envelope.data], dtype=np.float32)
+        except (TypeError, ValueError) as exc:
+            raise ResponseParsingError(
+                "embed response rows are missing values or differ in dimension", cause=exc
+            ) from exc
+        if self._matrix is None:
+            self._matrix = np.empty((self._total, block.shape[1]), dtype=np.float32)
+        elif block.shape[1] != self._matrix.shape[1]:
+            raise ResponseParsingError(
+                f"embed response has dimension {block.shape[1]}, "
+                f"earlier responses had {self._matrix.shape[1]}"
+            )
+        self._matrix[offset : offset + count] = block
+
+    def _record(self, model: str, vector_type: str, usage: EmbedUsage) -> None:
+        if self._vector_type is not None and vector_type != self._vector_type:
+            raise ResponseParsingError(
+                f"embed responses mix {self._vector_type!r} and {vector_type!r} embeddings"
+            )
+        self._model = model
+        self._vector_type = vector_type
+        self._tokens += usage.total_tokens
+
+    def result(self) -> EmbeddingsList | EmbeddingMatrix | SparseEmbeddingMatrix:
+        """Return the assembled embeddings once every chunk has been added."""
+        usage = EmbedUsage(total_tokens=self._tokens)
+        vector_type = self._vector_type or "dense"
+        if self._output == "embeddings":
+            data: list[DenseEmbedding] | list[SparseEmbedding] = [
+                item for offset in sorted(self._embeddings) for item in self._embeddings[offset]
+            ]
+            return EmbeddingsList(
+                model=self._model, vector_type=vector_type, data=data, usage=usage
+            )
+        import numpy as np
+
+        if vector_type == "sparse":
+            parts = [self._sparse[offset] for offset in sorted(self._sparse)]
+            indptr = np.zeros(self._total + 1, dtype=np.int64)
+            np.cumsum(np.concatenate([p[0] for p in parts]), out=indptr[1:])
+            return SparseEmbeddingMatrix(
+                model=self._model,
+                indptr=indptr,
+                indices=np.concatenate([p[1] for p in parts]),
+                values=np.concatenate([p[2] for p in parts]),
+                usage=usage,
+            )
+        return EmbeddingMatrix(model=self._model, values=self._matrix, usage=usage)
+
+
+def embeddings_to_arrays(result: EmbeddingsList) -> EmbeddingMatrix | SparseEmbeddingMatrix:
+    """Convert an :class:`EmbeddingsList` to the ``output="numpy"`` form."""
+    import numpy as np
+
+    if result.vector_type == "sparse":
+        rows = [e for e in result.data if isinstance(e, SparseEmbedding)]
+        indptr = np.zeros(len(rows) + 1, dtype=np.int64)
+        np.cumsum([len(r.sparse_indices) for r in rows], out=indptr[1:])
+        return SparseEmbeddingMatrix(
+            model=result.model,
+            indptr=indptr,
+            indices=np.fromiter(chain.from_iterable(r.sparse_indices for r in rows), np.uint32),
+            values=np.fromiter(chain.from_iterable(r.sparse_values for r in rows), np.float32),
+            usage=result.usage,
+        )
+    values = np.array([e.values for e in result.data if isinstance(e, DenseEmbedding)], np.float32)
+    return EmbeddingMatrix(model=result.model, values=values, usage=result.usage)
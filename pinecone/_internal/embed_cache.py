@@ -0,0 +1,269 @@
+"""Content-addressed cache of embeddings for ``Inference.embed``."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import sqlite3
+import struct
+import threading
+from array import array
+from collections import OrderedDict
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+import orjson
+
+from pinecone.errors.exceptions import PineconeValueError
+from pinecone.models.inference.embed import (
+    DenseEmbedding,
+    EmbeddingsList,
+    EmbedUsage,
+    SparseEmbedding,
+)
+
+_DENSE = b"D"
+_SPARSE = b"S"
+_SQLITE_CHUNK = 500
+
+
+def _encode(embedding: DenseEmbedding | SparseEmbedding) -> bytes | None:
+    """Pack an embedding as float32 (and uint32 index) bytes, or ``None`` if it cannot be."""
+    if isinstance(embedding, DenseEmbedding):
+        return _DENSE + array("f", embedding.values).tobytes()
+    if embedding.sparse_tokens is not None:
+        return None
+    count = len(embedding.sparse_indices)
+    return (
+        _SPARSE
+        + struct.pack("<I", count)
+        + array("I", embedding.sparse_indices).tobytes()
+        + array("f", embedding.sparse_values).tobytes()
+    )
+
+
+def _decode(blob: bytes) -> DenseEmbedding | SparseEmbedding:
+    body = memoryview(blob)[1:]
+    if blob[:1] == _DENSE:
+        values = array("f")
+        values.frombytes(body)
+        return DenseEmbedding(values=values.tolist())
+    (count,) = struct.unpack_from("<I", body)
+    indices = array("I")
+    indices.frombytes(body[4 : 4 + 4 * count])
+    values = array("f")
+    values.frombytes(body[4 + 4 * count :])
+    return SparseEmbedding(sparse_values=values.tolist(), sparse_indices=indices.tolist())
+
+
+class EmbeddingCache:
+    """Cache of embeddings keyed by model, parameters and input content.
+
+    Assign an instance to ``pc.inference.cache`` to make
+    :meth:`~pinecone.client.inference.Inference.embed` and ``embed_many``
+    look up every input first and send only the misses to the API; results
+    are stitched back in input order.  Each entry is keyed by a SHA-256
+    digest of the model name, the request parameters and the input, and
+    stored as float32 bytes, so cached values carry float32 precision.
+
+    Entries live in an in-memory LRU tier of *max_entries* and, when *path*
+    is given, in an SQLite file that persists across processes and is read
+    on memory misses.  The file is never pruned; delete it or call
+    :meth:`clear` to reset it.  Sparse embeddings requested with
+    ``return_tokens`` are not cached.  The cache is thread-safe and may be
+    shared by several clients; ``AsyncInference`` runs disk-tier lookups
+    and writes in a worker thread, off the event loop.
+
+    Args:
+        max_entries (int): Embeddings kept in memory. ``0`` disables the
+            memory tier. Defaults to 10000.
+        path (str | os.PathLike | None): SQLite file for the disk tier,
+            created if missing. ``None`` (default) keeps the cache in memory.
+
+    Raises:
+        :exc:`PineconeValueError`: If *max_entries* is negative.
+
+    Examples:
+        .. code-block:: python
+
+            from pinecone import EmbeddingCache, Pinecone
+
+            pc = Pinecone(api_key="your-api-key")
+            pc.inference.cache = EmbeddingCache(max_entries=100_000, path="embeddings.db")
+
+            for _ in range(2):
+                pc.inference.embed(
+                    model="multilingual-e5-large",
+                    inputs=["what is vector search?"],
+                    parameters={"input_type": "query"},
+                )
+            print(pc.inference.cache.hits, pc.inference.cache.misses)  # 1 1
+    """
+
+    def __init__(
+        self, max_entries: int = 10_000, *, path: str | os.PathLike[str] | None = None
+    ) -> None:
+        if max_entries < 0:
+            raise PineconeValueError(f"max_entries must not be negative, got {max_entries}")
+        self.max_entries = max_entries
+        self.path = None if path is None else os.fspath(path)
+        self.hits = 0
+        """Inputs answered from the cache so far."""
+        self.misses = 0
+        """Inputs that had to be sent to the API so far."""
+        self._memory: OrderedDict[bytes, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: sqlite3.Connection | None = None
+        if self.path is not None:
+            self._db = sqlite3.connect(self.path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings (key BLOB PRIMARY KEY, value BLOB NOT NULL)"
+            )
+            self._db.commit()
+
+    @staticmethod
+    def keys(
+        model: str, parameters: Mapping[str, Any] | None, inputs: Sequence[Mapping[str, Any]]
+    ) -> list[bytes]:
+        """Return the cache key of each input for *model* and *parameters*."""
+        prefix = hashlib.sha256(
+            orjson.dumps([model, dict(parameters or {})], option=orjson.OPT_SORT_KEYS)
+        )
+        keys = []
+        for item in inputs:
+            digest = prefix.copy()
+            digest.update(orjson.dumps(item, option=orjson.OPT_SORT_KEYS))
+            keys.append(digest.digest())
+        return keys
+
+    def get_many(self, keys: Sequence[bytes]) -> list[DenseEmbedding | SparseEmbedding | None]:
+        """Return the cached embedding for each key, or ``None`` where there is none."""
+        blobs: dict[bytes, bytes] = {}
+        with self._lock:
+            for key in keys:
+                blob = self._memory.get(key)
+                if blob is not None:
+                    self._memory.move_to_end(key)
+                    blobs[key] = blob
+            missing = [key for key in dict.fromkeys(keys) if key not in blobs]
+            if missing and self._db is not None:
+                for start in range(0, len(missing), _SQLITE_CHUNK):
+                    chunk = missing[start : start + _SQLITE_CHUNK]
+                    # Only the number of "?" placeholders is interpolated.
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = self._db.execute(
+                        f"SELECT key, value FROM embeddings WHERE key IN ({placeholders})",  # noqa: S608
+                        chunk,
+                    ).fetchall()
+                    for key, blob in rows:
+                        blobs[key] = blob
+                        self._remember(key, blob)
+            hits = sum(key in blobs for key in keys)
+            self.hits += hits
+            self.misses += len(keys) - hits
+        return [None if (blob := blobs.get(key)) is None else _decode(blob) for key in keys]
+
+    def put_many(
+        self, keys: Sequence[bytes], embeddings: Sequence[DenseEmbedding | SparseEmbedding]
+    ) -> None:
+        """Store one embedding per key in every tier."""
+        entries = [
+            (key, blob)
+            for key, embedding in zip(keys, embeddings, strict=True)
+            if (blob := _encode(embedding)) is not None
+        ]
+        with self._lock:
+            for key, blob in entries:
+                self._remember(key, blob)
+            if self._db is not None and entries:
+                self._db.executemany(
+                    "INSERT OR REPLACE INTO embeddings (key, value) VALUES (?, ?)", entries
+                )
+                self._db.commit()
+
+    def clear(self) -> None:
+        """Remove every entry from memory and from the SQLite file."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM embeddings")
+                self._db.commit()
+
+    def close(self) -> None:
+        """Close the SQLite connection. The memory tier stays usable."""
+        with self._lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    def __len__(self) -> int:
+        """Number of embeddings in the memory tier."""
+        return len(self._memory)
+
+    def __repr__(self) -> str:
+        return (
+            f"EmbeddingCache(max_entries={self.max_entries}, path={self.path!r}, "
+            f"hits={self.hits}, misses={self.misses})"
+        )
+
+    def _remember(self, key: bytes, blob: bytes) -> None:
+        if self.max_entries == 0:
+            return
+        self._memory[key] = blob
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+
+
+class CacheLookup:
+    """Cached and missing inputs of one embed call.
+
+    :attr:`missing` lists the distinct inputs to send to the API;
+    :meth:`complete` merges the API's answer for them with the cached
+    embeddings.
+    """
+
+    def __init__(
+        self,
+        cache: EmbeddingCache,
+        model: str,
+        parameters: Mapping[str, Any] | None,
+        inputs: list[dict[str, Any]],
+    ) -> None:
+        self._cache = cache
+        self._model = model
+        self._keys = cache.keys(model, parameters, inputs)
+        self._found = cache.get_many(self._keys)
+        positions: dict[bytes, int] = {}
+        for i, (key, embedding) in enumerate(zip(self._keys, self._found, strict=True)):
+            if embedding is None:
+                positions.setdefault(key, i)
+        self._missing_keys = list(positions)
+        self.missing = [inputs[i] for i in positions.values()]
+
+    def complete(self, result: EmbeddingsList | None) -> EmbeddingsList | None:
+        """Return embeddings for every input, or ``None`` if *result* cannot be stitched.
+
+        *result* is the API's response to :attr:`missing` (``None`` when
+        nothing was missing).  A response that does not have exactly one
+        embedding per missing input is not cached and ``None`` is returned,
+        so the caller can fall back to an uncached request.
+        """
+        if result is not None and len(result.data) != len(self.missing):
+            return None
+        fetched: dict[bytes, DenseEmbedding | SparseEmbedding] = {}
+        if result is not None:
+            fetched = dict(zip(self._missing_keys, result.data, strict=True))
+            self._cache.put_many(self._missing_keys, list(result.data))
+        data: list[Any] = [
+            embedding if embedding is not None else fetched[key]
+            for key, embedding in zip(self._keys, self._found, strict=True)
+        ]
+        vector_type = result.vector_type if result is not None else data[0].vector_type
+        return EmbeddingsList(
+            model=result.model if result is not None else self._model,
+            vector_type=vector_type,
+            data=data,
+            usage=EmbedUsage(total_tokens=result.usage.total_tokens if result else 0),
+        )
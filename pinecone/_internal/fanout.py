@@ -0,0 +1,118 @@
+"""Bounded concurrent fan-out of independent requests.
+
+Unlike the executors in :mod:`pinecone._internal.batch`, which collect
+per-batch errors into a :class:`~pinecone.models.batch.BatchResult`, these
+helpers are for operations whose results are only useful together (an
+embedding matrix, a merged ranking): the first failure cancels the
+remaining work and is raised to the caller.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import TYPE_CHECKING, TypeVar
+
+from pinecone._internal.batch import _create_progress_bar, _validate_concurrency
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncGenerator, Awaitable, Callable, Generator, Iterable
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+def fan_out(
+    operation: Callable[[T], R],
+    items: Iterable[T],
+    *,
+    max_concurrency: int = 4,
+    show_progress: bool = False,
+    desc: str = "Requests",
+    total: int | None = None,
+) -> Generator[tuple[int, R], None, None]:
+    """Run *operation* on each item in a thread pool and yield results as they finish.
+
+    Items are pulled lazily, keeping at most ``2 * max_concurrency`` calls
+    submitted at once.  Each result is yielded as ``(position, result)``,
+    where *position* is the item's index in *items*, so callers can restore
+    input order.
+
+    Raises:
+        ValueError: If *max_concurrency* is out of range.
+        Exception: The first exception raised by *operation*. Calls not yet
+            started are cancelled and running ones are allowed to finish.
+    """
+    _validate_concurrency(max_concurrency)
+    limit = 2 * max_concurrency
+    in_flight: dict[Future[R], int] = {}
+    progress = _create_progress_bar(total, desc, show_progress)
+    executor = ThreadPoolExecutor(max_workers=max_concurrency)
+
+    def _finished() -> list[tuple[int, R]]:
+        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+        results = []
+        for future in sorted(done, key=in_flight.__getitem__):
+            position = in_flight.pop(future)
+            results.append((position, future.result()))
+            progress.update(1)
+        return results
+
+    try:
+        for position, item in enumerate(items):
+            if len(in_flight) >= limit:
+                yield from _finished()
+            in_flight[executor.submit(operation, item)] = position
+        while in_flight:
+            yield from _finished()
+    finally:
+        for future in in_flight:
+            future.cancel()
+        executor.shutdown(wait=True)
+        progress.close()
+
+
+async def async_fan_out(
+    operation: Callable[[T], Awaitable[R]],
+    items: Iterable[T],
+    *,
+    max_concurrency: int = 4,
+    show_progress: bool = False,
+    desc: str = "Requests",
+    total: int | None = None,
+) -> AsyncGenerator[tuple[int, R], None]:
+    """Async counterpart of :func:`fan_out`, running at most *max_concurrency* tasks.
+
+    Raises:
+        ValueError: If *max_concurrency* is out of range.
+        Exception: The first exception raised by *operation*; the other
+            running tasks are cancelled.
+    """
+    _validate_concurrency(max_concurrency)
+    tasks: dict[asyncio.Future[R], int] = {}
+    progress = _create_progress_bar(total, desc, show_progress)
+
+    async def _finished() -> list[tuple[int, R]]:
+        done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+        results = []
+        for task in sorted(done, key=tasks.__getitem__):
+            position = tasks.pop(task)
+            results.append((position, task.result()))
+            progress.update(1)
+        return results
+
+    try:
+        for position, item in enumerate(items):
+            if len(tasks) >= max_concurrency:
+                for result in await _finished():
+                    yield result
+            tasks[asyncio.ensure_future(operation(item))] = position
+        while tasks:
+            for result in await _finished():
+                yield result
+    finally:
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.gather(*tasks, return_exceptions=True)
+        progress.close()
@@ -0,0 +1,149 @@
+"""Planning and processing tracking for ``Assistants.upload_files``."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from pinecone._internal.poll_targets import FileProcessingError
+from pinecone.errors.exceptions import PineconeTimeoutError, PineconeValueError
+from pinecone.models.assistant.file_upload import FileUploadError
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from pinecone.models.assistant.file_model import AssistantFileModel
+
+#: Metadata key holding the SHA-256 hex digest of an uploaded file's content.
+CONTENT_HASH_KEY = "content_sha256"
+
+_HASH_READ_SIZE = 1024 * 1024
+
+
+def hash_file(path: str) -> str:
+    """Return the SHA-256 hex digest of the file at *path*."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while block := f.read(_HASH_READ_SIZE):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def resolve_paths(paths: Iterable[str | os.PathLike[str]]) -> list[str]:
+    """Return *paths* as strings, checking that each is an existing file."""
+    resolved = [os.fspath(p) for p in paths]
+    if not resolved:
+        raise PineconeValueError("paths must not be empty")
+    for path in resolved:
+        if not os.path.isfile(path):
+            raise PineconeValueError(f"File not found: {path}")
+    return resolved
+
+
+def directory_files(directory: str | os.PathLike[str], pattern: str) -> list[str]:
+    """Return the files under *directory* matching the glob *pattern*, sorted."""
+    root = Path(directory)
+    if not root.is_dir():
+        raise PineconeValueError(f"Directory not found: {os.fspath(directory)}")
+    return sorted(str(p) for p in root.glob(pattern) if p.is_file())
+
+
+def content_hash(file: AssistantFileModel) -> str | None:
+    """Return the content hash recorded in *file*'s metadata, if any."""
+    value = (file.metadata or {}).get(CONTENT_HASH_KEY)
+    return value if isinstance(value, str) else None
+
+
+def files_by_hash(files: Iterable[AssistantFileModel]) -> dict[str, AssistantFileModel]:
+    """Index the usable files that carry a content hash by that hash."""
+    indexed: dict[str, AssistantFileModel] = {}
+    for file in files:
+        file_hash = content_hash(file)
+        if file_hash is not None and file.status not in ("ProcessingFailed", "Deleting"):
+            indexed.setdefault(file_hash, file)
+    return indexed
+
+
+def stale_files(files: Iterable[AssistantFileModel], hashes: set[str]) -> list[AssistantFileModel]:
+    """Return the files with a content hash that is not in *hashes*."""
+    return [
+        file
+        for file in files
+        if (file_hash := content_hash(file)) is not None
+        and file_hash not in hashes
+        and file.status != "Deleting"
+    ]
+
+
+class UploadPlan:
+    """Which local files to upload and which are already in the assistant.
+
+    Files whose hash matches an existing file are skipped, as are repeats
+    of the same content within *paths*.
+    """
+
+    def __init__(
+        self,
+        paths: list[str],
+        existing: dict[str, AssistantFileModel],
+        metadata: dict[str, Any] | None,
+    ) -> None:
+        self.uploads: list[tuple[str, dict[str, Any]]] = []
+        """``(path, metadata)`` of each file to upload."""
+        self.skipped: list[AssistantFileModel] = []
+        self.hashes: set[str] = set()
+        for path in paths:
+            file_hash = hash_file(path)
+            if file_hash in self.hashes:
+                continue
+            self.hashes.add(file_hash)
+            if file_hash in existing:
+                self.skipped.append(existing[file_hash])
+            else:
+                self.uploads.append((path, {**(metadata or {}), CONTENT_HASH_KEY: file_hash}))
+
+
+def processing_results(
+    uploaded: dict[str, str],
+    outcomes: list[AssistantFileModel | BaseException],
+    timeout: float | None,
+) -> tuple[list[AssistantFileModel], list[FileUploadError]]:
+    """Split the outcomes of waiting on each uploaded file.
+
+    *uploaded* maps each file id to its local path, in upload order, and
+    *outcomes* holds what each :func:`~pinecone._internal.poll_targets.file_processed`
+    watch ended with, in the same order. *timeout* is the per-file watch
+    timeout, used only in the error message.
+
+    Returns:
+        ``(processed, errors)``: the files that finished processing, in
+        upload order, and one :class:`FileUploadError` per failed file.
+
+    Raises:
+        :exc:`PineconeTimeoutError`: If any file was still processing when
+            its watch timed out.
+        Exception: The first other failure, such as an error listing files.
+    """
+    processed: list[AssistantFileModel] = []
+    errors: list[FileUploadError] = []
+    timeouts: list[PineconeTimeoutError] = []
+    for (file_id, path), outcome in zip(uploaded.items(), outcomes, strict=True):
+        if isinstance(outcome, FileProcessingError):
+            errors.append(
+                FileUploadError(
+                    path=path, file_id=file_id, error=outcome, error_message=outcome.reason
+                )
+            )
+        elif isinstance(outcome, PineconeTimeoutError):
+            timeouts.append(outcome)
+        elif isinstance(outcome, BaseException):
+            raise outcome
+        else:
+            processed.append(outcome)
+    if timeouts:
+        raise PineconeTimeoutError(
+            f"Processing of {len(timeouts)} files timed out after {timeout}s"
+        ) from timeouts[0]
+    return processed, errors
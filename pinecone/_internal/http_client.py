@@ -10,7 +10,8 @@ import random
 import socket
 import sys
 import time
-from collections.abc import AsyncGenerator, Generator
+from array import array
+from collections.abc import AsyncGenerator, AsyncIterator, Generator, Iterator
 from typing import Any
 from urllib.parse import urlsplit
 
@@ -20,6 +21,7 @@ import orjson
 from pinecone import __version__
 from pinecone._internal.config import PineconeConfig, RetryConfig
 from pinecone._internal.constants import API_VERSION_HEADER, DEFAULT_BASE_URL
+from pinecone._internal.instrumentation import RequestListener, _PoolGauge, _RequestTrace
 from pinecone._internal.user_agent import build_user_agent
 from pinecone.errors.exceptions import (
     ApiError,
@@ -59,9 +61,32 @@ def _default_pool_size() -> int:
     return max(5 * (os.cpu_count() or 1), 20)
 
 
+def _json_default(obj: Any) -> Any:
+    """Serialize the compact buffers orjson has no native support for.
+
+    ``array.array`` (e.g. array-backed sparse values) is handed back to orjson
+    as a zero-copy NumPy view when NumPy is already loaded, so its elements are
+    never boxed; otherwise it falls back to ``tolist()``. NumPy arrays orjson
+    cannot serialize natively (non-contiguous, unsupported dtype) also go
+    through ``tolist()``.
+    """
+    if isinstance(obj, array):
+        np = sys.modules.get("numpy")
+        if np is not None:
+            return np.frombuffer(obj, dtype=obj.typecode)
+        return obj.tolist()
+    if hasattr(obj, "dtype") and hasattr(obj, "tolist"):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
 def _encode_json(body: Any) -> bytes:
-    """Serialize *body* to JSON bytes using orjson (2-3x faster than stdlib json)."""
-    return orjson.dumps(body)
+    """Serialize *body* to JSON bytes using orjson (2-3x faster than stdlib json).
+
+    NumPy arrays are serialized natively and ``array.array`` values via
+    :func:`_json_default`.
+    """
+    return orjson.dumps(body, default=_json_default, option=orjson.OPT_SERIALIZE_NUMPY)
 
 
 def _prepare_json_kwargs(kwargs: dict[str, Any]) -> dict[str, Any]:
@@ -117,6 +142,58 @@ def _log_curl(
     logger.debug("curl equivalent:\n%s", curl_cmd)
 
 
+class _TracedSyncStream(httpx.SyncByteStream):
+    """Response stream that times the body read and finishes the request's trace on close."""
+
+    def __init__(self, stream: httpx.SyncByteStream, trace: _RequestTrace) -> None:
+        self._stream = stream
+        self._trace = trace
+
+    def __iter__(self) -> Iterator[bytes]:
+        self._trace.read_started()
+        size = 0
+        try:
+            for chunk in self._stream:
+                size += len(chunk)
+                yield chunk
+        except Exception as exc:
+            self._trace.finish(exc)
+            raise
+        self._trace.read_finished(size)
+
+    def close(self) -> None:
+        try:
+            self._stream.close()
+        finally:
+            self._trace.finish()
+
+
+class _TracedAsyncStream(httpx.AsyncByteStream):
+    """Async counterpart of :class:`_TracedSyncStream`."""
+
+    def __init__(self, stream: httpx.AsyncByteStream, trace: _RequestTrace) -> None:
+        self._stream = stream
+        self._trace = trace
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        self._trace.read_started()
+        size = 0
+        try:
+            async for chunk in self._stream:
+                size += len(chunk)
+                yield chunk
+        except Exception as exc:
+            self._trace.finish(exc)
+            raise
+        self._trace.read_finished(size)
+
+    async def aclose(self) -> None:
+        try:
+            await self._stream.aclose()
+        finally:
+            self._trace.finish()
+
+
 class _RetryTransport(httpx.BaseTransport):
     """Sync transport wrapper that retries on transient server errors."""
 
@@ -125,17 +202,30 @@ class _RetryTransport(httpx.BaseTransport):
         *,
         transport: httpx.HTTPTransport,
         retry_config: RetryConfig | None = None,
+        listeners: tuple[RequestListener, ...] = (),
+        pool_size: int = 0,
     ) -> None:
         self._transport = transport
         self._config = retry_config or RetryConfig()
+        self._listeners = listeners
+        self._pool = _PoolGauge(pool_size) if listeners and pool_size > 0 else None
 
     def handle_request(self, request: httpx.Request) -> httpx.Response:
+        trace = (
+            _RequestTrace.for_request(request, self._listeners, is_async=False, pool=self._pool)
+            if self._listeners
+            else None
+        )
         last_exc: httpx.TransportError | None = None
         for attempt in range(self._config.max_retries):
+            if trace is not None:
+                trace.begin_attempt()
             try:
                 response = self._transport.handle_request(request)
             except httpx.TransportError as exc:
                 last_exc = exc
+                if trace is not None:
+                    trace.end_attempt(error=exc)
                 if attempt < self._config.max_retries - 1:
                     logger.debug(
                         "Connection error on attempt %d/%d, retrying: %s",
@@ -143,11 +233,16 @@ class _RetryTransport(httpx.BaseTransport):
                         self._config.max_retries,
                         exc,
                     )
-                    time.sleep(self._compute_backoff(attempt))
+                    delay = self._compute_backoff(attempt)
+                    if trace is not None:
+                        trace.backoff(delay)
+                    time.sleep(delay)
                 continue
             last_exc = None
+            if trace is not None:
+                trace.end_attempt(status_code=response.status_code)
             if response.status_code not in self._config.retryable_status_codes:
-                return response
+                return self._respond(response, trace)
             if attempt < self._config.max_retries - 1:
                 response.close()
                 retry_after = response.headers.get("retry-after")
@@ -158,13 +253,25 @@ class _RetryTransport(httpx.BaseTransport):
                         delay = self._compute_backoff(attempt)
                 else:
                     delay = self._compute_backoff(attempt)
+                if trace is not None:
+                    trace.backoff(delay)
                 time.sleep(delay)
             else:
-                return response
+                return self._respond(response, trace)
         if last_exc is not None:
+            if trace is not None:
+                trace.finish(last_exc)
             raise last_exc
         raise RuntimeError("max_retries must be positive")
 
+    @staticmethod
+    def _respond(response: httpx.Response, trace: _RequestTrace | None) -> httpx.Response:
+        if trace is None:
+            return response
+        trace.respond(response.status_code, _extract_request_id(response.headers))
+        response.stream = _TracedSyncStream(response.stream, trace)  # type: ignore[arg-type]
+        return response
+
     def _compute_backoff(self, attempt: int) -> float:
         """Floored full jitter: uniform in [10%, 100%] of exponential base."""
         base_delay = min(
@@ -185,17 +292,30 @@ class _AsyncRetryTransport(httpx.AsyncBaseTransport):
         *,
         transport: httpx.AsyncHTTPTransport,
         retry_config: RetryConfig | None = None,
+        listeners: tuple[RequestListener, ...] = (),
+        pool_size: int = 0,
     ) -> None:
         self._transport = transport
         self._config = retry_config or RetryConfig()
+        self._listeners = listeners
+        self._pool = _PoolGauge(pool_size) if listeners and pool_size > 0 else None
 
     async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        trace = (
+            _RequestTrace.for_request(request, self._listeners, is_async=True, pool=self._pool)
+            if self._listeners
+            else None
+        )
         last_exc: httpx.TransportError | None = None
         for attempt in range(self._config.max_retries):
+            if trace is not None:
+                trace.begin_attempt()
             try:
                 response = await self._transport.handle_async_request(request)
             except httpx.TransportError as exc:
                 last_exc = exc
+                if trace is not None:
+                    trace.end_attempt(error=exc)
                 if attempt < self._config.max_retries - 1:
                     logger.debug(
                         "Connection error on attempt %d/%d, retrying: %s",
@@ -203,11 +323,16 @@ class _AsyncRetryTransport(httpx.AsyncBaseTransport):
                         self._config.max_retries,
                         exc,
                     )
-                    await asyncio.sleep(self._compute_backoff(attempt))
+                    delay = self._compute_backoff(attempt)
+                    if trace is not None:
+                        trace.backoff(delay)
+                    await asyncio.sleep(delay)
                 continue
             last_exc = None
+            if trace is not None:
+                trace.end_attempt(status_code=response.status_code)
             if response.status_code not in self._config.retryable_status_codes:
-                return response
+                return self._respond(response, trace)
             if attempt < self._config.max_retries - 1:
                 await response.aclose()
                 retry_after = response.headers.get("retry-after")
@@ -218,13 +343,25 @@ class _AsyncRetryTransport(httpx.AsyncBaseTransport):
                         delay = self._compute_backoff(attempt)
                 else:
                     delay = self._compute_backoff(attempt)
+                if trace is not None:
+                    trace.backoff(delay)
                 await asyncio.sleep(delay)
             else:
-                return response
+                return self._respond(response, trace)
         if last_exc is not None:
+            if trace is not None:
+                trace.finish(last_exc)
             raise last_exc
         raise RuntimeError("max_retries must be positive")
 
+    @staticmethod
+    def _respond(response: httpx.Response, trace: _RequestTrace | None) -> httpx.Response:
+        if trace is None:
+            return response
+        trace.respond(response.status_code, _extract_request_id(response.headers))
+        response.stream = _TracedAsyncStream(response.stream, trace)  # type: ignore[arg-type]
+        return response
+
     def _compute_backoff(self, attempt: int) -> float:
         """Floored full jitter: uniform in [10%, 100%] of exponential base."""
         base_delay = min(
@@ -393,6 +530,8 @@ class HTTPClient:
                 http2=False, limits=limits, socket_options=_build_socket_options()
             ),
             retry_config=config.retry_config,
+            listeners=config.request_listeners,
+            pool_size=pool_size,
         )
         proxy: httpx.Proxy | str | None = None
         if config.proxy_url:
@@ -510,6 +649,9 @@ class HTTPClient:
                 # Use the live transport reference (tests may swap _client).
                 response = self._client._transport.handle_request(request)
                 response.request = request
+                # Response.read() keeps a single-chunk body as received (a
+                # one-item join returns the chunk itself), so adapters decode
+                # straight from the transport's buffer without a copy.
                 try:
                     response.read()
                 except BaseException:
@@ -670,6 +812,8 @@ class AsyncHTTPClient:
                     http2=False, limits=limits, socket_options=_build_socket_options()
                 ),
                 retry_config=self._config.retry_config,
+                listeners=self._config.request_listeners,
+                pool_size=pool_size,
             )
             proxy: httpx.Proxy | str | None = None
             if self._config.proxy_url:
@@ -19,6 +19,7 @@ from typing_extensions import NotRequired
 from pinecone._internal.validation import require_non_empty
 
 if TYPE_CHECKING:
+    from pinecone._internal.instrumentation import RequestListener
     from pinecone.models.indexes.index import IndexModel
 from pinecone.errors.exceptions import PineconeTypeError, ValidationError
 from pinecone.models.enums import DeletionProtection, Metric, VectorType
@@ -52,6 +53,7 @@ class IndexKwargs(TypedDict):
     ssl_verify: bool
     source_tag: str
     connection_pool_maxsize: int
+    request_listeners: tuple[RequestListener, ...]
 
 
 class _LegacyIndexKwargs(IndexKwargs):
@@ -0,0 +1,562 @@
+"""Request lifecycle events for attributing latency.
+
+Pass ``request_listeners=`` to :class:`~pinecone.Pinecone`,
+:class:`~pinecone.PineconeAsyncio`, :class:`~pinecone.PineconeConfig`, the
+index clients or :class:`~pinecone.grpc.GrpcIndex` and every request the
+client sends is reported, once it has finished, as a :class:`RequestEvent`
+with the time spent in each phase: building the request, waiting for a
+pooled connection, connecting, TLS, waiting for the response, reading the
+body and decoding it, plus every retry attempt and its backoff.
+
+Timings are measured with :func:`time.perf_counter` and reported in
+seconds. When no listeners are configured none of this code runs.
+
+Requests made by a data-plane operation such as ``Index.query`` are
+attributed to that operation: ``serialize`` then covers everything the
+SDK did before handing the request to the transport (validation, building
+and encoding the body) and ``decode`` everything after the body was read
+until the result was returned. Requests made outside an operation, such
+as control-plane calls, and the individual batches of a concurrent batched
+write are reported on their own, without ``serialize`` and ``decode``.
+"""
+
+from __future__ import annotations
+
+import contextvars
+import functools
+import inspect
+import logging
+import threading
+import time
+from collections.abc import Awaitable, Callable, Coroutine
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Literal, ParamSpec, TypeVar
+
+if TYPE_CHECKING:
+    import httpx
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+#: Request extension under which the transport stores the request's trace.
+TRACE_EXTENSION = "pinecone.trace"
+
+
+@dataclass(frozen=True)
+class RequestAttempt:
+    """One attempt at sending a request.
+
+    Phase timings are ``None`` when the phase did not happen during the
+    attempt (``connect`` and ``tls`` on a reused connection) or cannot be
+    observed (all of them over gRPC, where the native channel owns the
+    connection).
+
+    Attributes:
+        number (int): 1 for the first attempt, 2 for the first retry, and so on.
+        duration (float): Seconds from handing the request to the transport
+            until the response headers arrived or the attempt failed.
+        status_code (int | None): HTTP status of the attempt, or ``None`` if
+            it failed without a response.
+        error (BaseException | None): The transport error that ended the
+            attempt, if any.
+        backoff (float): Seconds slept before the next attempt; ``0.0`` for
+            the final attempt.
+        pool_wait (float | None): Seconds waiting for a connection from the
+            pool.
+        connect (float | None): Seconds opening a new TCP connection.
+        tls (float | None): Seconds for the TLS handshake of a new connection.
+        ttfb (float | None): Seconds from starting to send the request until
+            the response headers arrived: upload plus server time.
+    """
+
+    number: int
+    duration: float
+    status_code: int | None = None
+    error: BaseException | None = None
+    backoff: float = 0.0
+    pool_wait: float | None = None
+    connect: float | None = None
+    tls: float | None = None
+    ttfb: float | None = None
+
+
+@dataclass(frozen=True)
+class RequestEvent:
+    """Timings and sizes of one finished request.
+
+    The connection phases (``pool_wait``, ``connect``, ``tls``, ``ttfb``)
+    are those of the final attempt; earlier attempts are in ``attempts``.
+
+    Attributes:
+        transport (Literal["rest", "grpc"]): Transport that sent the request.
+        operation (str | None): Client method the request was made for, such
+            as ``"query"``, or ``None`` outside a data-plane operation.
+        method (str): HTTP method, or the RPC name over gRPC (``"Query"``).
+        path (str): URL path, or the RPC path over gRPC
+            (``"/VectorService/Query"``).
+        host (str): Host the request was sent to.
+        status_code (int | None): Final HTTP status, the HTTP equivalent of
+            the gRPC status (200 for success), or ``None`` if no response
+            was received.
+        request_id (str | None): Server request id from the response headers.
+        request_bytes (int | None): Size of the request body, when known.
+        response_bytes (int | None): Size of the response body as received,
+            when known.
+        started_at (float): Wall-clock start of the operation (or of the
+            request outside an operation), as returned by :func:`time.time`.
+        total (float): Seconds from that start until the event was emitted.
+        serialize (float | None): Seconds spent before the request reached the
+            transport.
+        pool_wait (float | None): See :class:`RequestAttempt`.
+        connect (float | None): See :class:`RequestAttempt`.
+        tls (float | None): See :class:`RequestAttempt`.
+        ttfb (float | None): See :class:`RequestAttempt`.
+        body_read (float | None): Seconds reading the response body.
+        decode (float | None): Seconds from the end of the body read until
+            the operation returned its result.
+        attempts (tuple[RequestAttempt, ...]): Every attempt, in order.
+        error (BaseException | None): Exception the request or operation
+            failed with, if any.
+        pool_in_use (int | None): Connections of the client's pool busy with
+            this request and the others in flight when it was sent, capped
+            at ``pool_size``. ``None`` over gRPC.
+        pool_size (int | None): Maximum number of connections of the pool.
+        read_units (int | None): Read units reported in the ``usage`` of the
+            operation's result, on the event of the request that produced it.
+        write_units (int | None): Write units reported the same way.
+    """
+
+    transport: Literal["rest", "grpc"]
+    operation: str | None
+    method: str
+    path: str
+    host: str
+    status_code: int | None
+    request_id: str | None
+    request_bytes: int | None
+    response_bytes: int | None
+    started_at: float
+    total: float
+    serialize: float | None
+    pool_wait: float | None
+    connect: float | None
+    tls: float | None
+    ttfb: float | None
+    body_read: float | None
+    decode: float | None
+    attempts: tuple[RequestAttempt, ...]
+    error: BaseException | None = None
+    pool_in_use: int | None = None
+    pool_size: int | None = None
+    read_units: int | None = None
+    write_units: int | None = None
+
+    @property
+    def retries(self) -> int:
+        """Number of attempts after the first."""
+        return max(0, len(self.attempts) - 1)
+
+    @property
+    def backoff(self) -> float:
+        """Total seconds slept between attempts."""
+        return sum(attempt.backoff for attempt in self.attempts)
+
+
+#: Callable invoked with every :class:`RequestEvent`. Listeners run
+#: synchronously in the thread or task that made the request, so they should
+#: be quick; exceptions they raise are logged and otherwise ignored.
+RequestListener = Callable[[RequestEvent], None]
+
+
+def emit(listeners: tuple[RequestListener, ...], event: RequestEvent) -> None:
+    """Call every listener with *event*, logging instead of raising their errors."""
+    for listener in listeners:
+        try:
+            listener(event)
+        except Exception:
+            logger.exception("Request listener %r raised", listener)
+
+
+class _OperationScope:
+    """The data-plane operation running in the current context.
+
+    The first request of the operation is held back until the operation
+    returns, so its event can include the time spent decoding the response.
+    Operations that send several requests report each as it finishes.
+    """
+
+    __slots__ = ("name", "pending", "requests", "started", "started_at")
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.started = time.perf_counter()
+        self.started_at = time.time()
+        self.requests = 0
+        self.pending: _RequestTrace | None = None
+
+    def close(self, error: BaseException | None, result: object = None) -> None:
+        trace = self.pending
+        if trace is None:
+            return
+        self.pending = None
+        now = time.perf_counter()
+        usage = getattr(result, "usage", None)
+        trace.emit(
+            started=self.started,
+            started_at=self.started_at,
+            serialize=trace.started - self.started,
+            decode=now - (trace.finished or now),
+            error=error or trace.error,
+            read_units=getattr(usage, "read_units", None),
+            write_units=getattr(usage, "write_units", None),
+        )
+
+
+class _PoolGauge:
+    """Count of the requests in flight on one connection pool."""
+
+    __slots__ = ("_lock", "in_flight", "size")
+
+    def __init__(self, size: int) -> None:
+        self.size = size
+        self.in_flight = 0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> int:
+        """Count a new request; return the connections now in use."""
+        with self._lock:
+            self.in_flight += 1
+            return min(self.in_flight, self.size)
+
+    def release(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+
+_scope: contextvars.ContextVar[_OperationScope | None] = contextvars.ContextVar(
+    "pinecone_operation", default=None
+)
+
+
+class _Attempt:
+    __slots__ = (
+        "backoff",
+        "connect",
+        "connect_started",
+        "ended",
+        "error",
+        "number",
+        "pool_wait",
+        "sent",
+        "started",
+        "status_code",
+        "tls",
+        "tls_started",
+        "ttfb",
+    )
+
+    def __init__(self, number: int) -> None:
+        self.number = number
+        self.started = time.perf_counter()
+        self.ended: float | None = None
+        self.status_code: int | None = None
+        self.error: BaseException | None = None
+        self.backoff = 0.0
+        self.pool_wait: float | None = None
+        self.connect_started = 0.0
+        self.connect: float | None = None
+        self.tls_started = 0.0
+        self.tls: float | None = None
+        self.sent = 0.0
+        self.ttfb: float | None = None
+
+    def freeze(self) -> RequestAttempt:
+        return RequestAttempt(
+            number=self.number,
+            duration=(self.ended or time.perf_counter()) - self.started,
+            status_code=self.status_code,
+            error=self.error,
+            backoff=self.backoff,
+            pool_wait=self.pool_wait,
+            connect=self.connect,
+            tls=self.tls,
+            ttfb=self.ttfb,
+        )
+
+
+class _RequestTrace:
+    """Mutable record of one request, turned into a :class:`RequestEvent` when it finishes."""
+
+    __slots__ = (
+        "_attempts",
+        "_done",
+        "body_read",
+        "body_started",
+        "error",
+        "finished",
+        "host",
+        "listeners",
+        "method",
+        "operation",
+        "path",
+        "pool",
+        "pool_in_use",
+        "request_bytes",
+        "request_id",
+        "response_bytes",
+        "scope",
+        "started",
+        "started_at",
+        "status_code",
+        "transport",
+    )
+
+    def __init__(
+        self,
+        listeners: tuple[RequestListener, ...],
+        *,
+        transport: Literal["rest", "grpc"],
+        method: str,
+        path: str,
+        host: str,
+        request_bytes: int | None = None,
+        pool: _PoolGauge | None = None,
+    ) -> None:
+        self.listeners = listeners
+        self.transport: Literal["rest", "grpc"] = transport
+        self.method = method
+        self.path = path
+        self.host = host
+        self.pool = pool
+        self.pool_in_use = pool.acquire() if pool is not None else None
+        self.request_bytes = request_bytes
+        self.started = time.perf_counter()
+        self.started_at = time.time()
+        self.status_code: int | None = None
+        self.request_id: str | None = None
+        self.response_bytes: int | None = None
+        self.body_started = 0.0
+        self.body_read: float | None = None
+        self.finished: float | None = None
+        self.error: BaseException | None = None
+        self._attempts: list[_Attempt] = []
+        self._done = False
+        self.operation: str | None = None
+        self.scope = self._claim_scope()
+
+    def _claim_scope(self) -> _OperationScope | None:
+        scope = _scope.get()
+        if scope is None:
+            return None
+        self.operation = scope.name
+        scope.requests += 1
+        if scope.requests == 1:
+            return scope
+        # A second request: stop holding back the first one.
+        pending = scope.pending
+        if pending is not None:
+            scope.pending = None
+            pending.emit()
+        return None
+
+    @classmethod
+    def for_request(
+        cls,
+        request: httpx.Request,
+        listeners: tuple[RequestListener, ...],
+        *,
+        is_async: bool,
+        pool: _PoolGauge | None = None,
+    ) -> _RequestTrace:
+        """Start tracing *request*, registering the httpcore ``trace`` extension on it."""
+        length = request.headers.get("content-length")
+        trace = cls(
+            listeners,
+            transport="rest",
+            method=request.method,
+            path=request.url.path,
+            host=request.url.host,
+            request_bytes=int(length) if length and length.isdigit() else None,
+            pool=pool,
+        )
+        # Build a new dict: the client may share one extensions dict across requests.
+        request.extensions = {
+            **request.extensions,
+            "trace": trace.on_async_event if is_async else trace.on_event,
+            TRACE_EXTENSION: trace,
+        }
+        return trace
+
+    # -- attempts ------------------------------------------------------------
+
+    def begin_attempt(self) -> None:
+        self._attempts.append(_Attempt(len(self._attempts) + 1))
+
+    def end_attempt(
+        self, *, status_code: int | None = None, error: BaseException | None = None
+    ) -> None:
+        attempt = self._attempts[-1]
+        attempt.ended = time.perf_counter()
+        attempt.status_code = status_code
+        attempt.error = error
+
+    def backoff(self, delay: float) -> None:
+        self._attempts[-1].backoff = delay
+
+    def on_event(self, name: str, info: dict[str, Any]) -> None:
+        """Record a connection phase reported by httpcore's ``trace`` extension."""
+        if not self._attempts:
+            return
+        attempt = self._attempts[-1]
+        now = time.perf_counter()
+        step = name.partition(".")[2]
+        if step == "connect_tcp.started":
+            attempt.pool_wait = now - attempt.started
+            attempt.connect_started = now
+        elif step == "connect_tcp.complete":
+            attempt.connect = now - attempt.connect_started
+        elif step == "start_tls.started":
+            attempt.tls_started = now
+        elif step == "start_tls.complete":
+            attempt.tls = now - attempt.tls_started
+        elif step == "send_request_headers.started":
+            if attempt.pool_wait is None:
+                attempt.pool_wait = now - attempt.started
+            attempt.sent = now
+        elif step == "receive_response_headers.complete" and attempt.sent:
+            attempt.ttfb = now - attempt.sent
+
+    async def on_async_event(self, name: str, info: dict[str, Any]) -> None:
+        self.on_event(name, info)
+
+    # -- completion ----------------------------------------------------------
+
+    def respond(self, status_code: int, request_id: str | None) -> None:
+        """Record the final response, before its body is read."""
+        self.status_code = status_code
+        self.request_id = request_id
+
+    def read_started(self) -> None:
+        self.body_started = time.perf_counter()
+
+    def read_finished(self, size: int) -> None:
+        self.response_bytes = size
+        self.body_read = time.perf_counter() - self.body_started
+
+    def finish(self, error: BaseException | None = None) -> None:
+        """Mark the request finished; emit now or when its operation returns."""
+        if self._done:
+            return
+        self._done = True
+        self.finished = time.perf_counter()
+        self.error = error
+        if self.pool is not None:
+            self.pool.release()
+        scope = self.scope
+        if scope is not None and scope.requests == 1 and _scope.get() is scope:
+            scope.pending = self
+        else:
+            self.emit()
+
+    def emit(
+        self,
+        *,
+        started: float | None = None,
+        started_at: float | None = None,
+        serialize: float | None = None,
+        decode: float | None = None,
+        error: BaseException | None = None,
+        read_units: int | None = None,
+        write_units: int | None = None,
+    ) -> None:
+        attempts = tuple(attempt.freeze() for attempt in self._attempts)
+        last = attempts[-1] if attempts else None
+        event = RequestEvent(
+            transport=self.transport,
+            operation=self.operation,
+            method=self.method,
+            path=self.path,
+            host=self.host,
+            status_code=self.status_code,
+            request_id=self.request_id,
+            request_bytes=self.request_bytes,
+            response_bytes=self.response_bytes,
+            started_at=self.started_at if started_at is None else started_at,
+            total=time.perf_counter() - (self.started if started is None else started),
+            serialize=serialize,
+            pool_wait=last.pool_wait if last else None,
+            connect=last.connect if last else None,
+            tls=last.tls if last else None,
+            ttfb=last.ttfb if last else None,
+            body_read=self.body_read,
+            decode=decode,
+            attempts=attempts,
+            error=error or self.error,
+            pool_in_use=self.pool_in_use,
+            pool_size=self.pool.size if self.pool is not None else None,
+            read_units=read_units,
+            write_units=write_units,
+        )
+        emit(self.listeners, event)
+
+
+def traced(method: Callable[P, R]) -> Callable[P, R]:
+    """Attribute the requests made by a client method to that operation.
+
+    The client must have a ``_request_listeners`` attribute; without
+    listeners the method is called directly.
+    """
+    name = method.__name__
+
+    @functools.wraps(method)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+        if not getattr(args[0], "_request_listeners", None):
+            return method(*args, **kwargs)
+        scope = _OperationScope(name)
+        token = _scope.set(scope)
+        try:
+            result = method(*args, **kwargs)
+        except BaseException as exc:
+            scope.close(exc)
+            raise
+        finally:
+            _scope.reset(token)
+        scope.close(None, result)
+        return result
+
+    return wrapper
+
+
+def atraced(method: Callable[P, Coroutine[Any, Any, R]]) -> Callable[P, Awaitable[R]]:
+    """Async counterpart of :func:`traced`.
+
+    The wrapper is a plain function returning the coroutine, so a bad call
+    still raises ``TypeError`` immediately as it does without tracing.
+    """
+    name = method.__name__
+
+    async def run(coro: Coroutine[Any, Any, R]) -> R:
+        scope = _OperationScope(name)
+        token = _scope.set(scope)
+        try:
+            result = await coro
+        except BaseException as exc:
+            scope.close(exc)
+            raise
+        finally:
+            _scope.reset(token)
+        scope.close(None, result)
+        return result
+
+    @functools.wraps(method)
+    def wrapper(*args: P.args, **kwargs: P.kwargs) -> Awaitable[R]:
+        coro = method(*args, **kwargs)
+        if not getattr(args[0], "_request_listeners", None):
+            return coro
+        return run(coro)
+
+    if hasattr(inspect, "markcoroutinefunction"):  # Python 3.12+
+        inspect.markcoroutinefunction(wrapper)
+    return wrapper
@@ -0,0 +1,471 @@
+"""In-process latency histograms and counters built from request events.
+
+:class:`ClientMetrics` is a request listener: pass it in
+``request_listeners=`` and it aggregates every :class:`RequestEvent` the
+client emits, so retries and backoff inside the SDK are measured without
+wrapping calls in application timers::
+
+    metrics = ClientMetrics()
+    pc = Pinecone(request_listeners=[metrics])
+    ...
+    snapshot = metrics.snapshot()
+    snapshot.operation("query").latency.percentile(99)
+    text = metrics.to_openmetrics()  # serve with ClientMetrics.content_type
+
+Latencies go into HDR-style histograms: values are stored in buckets whose
+width grows with the value, so recording is a dictionary increment and every
+percentile is exact to within the configured number of significant figures
+no matter how many samples were recorded.
+"""
+
+from __future__ import annotations
+
+import math
+import sys
+import threading
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, ClassVar
+
+if TYPE_CHECKING:
+    from pinecone._internal.instrumentation import RequestEvent
+
+#: Bucket bounds (seconds) of the histograms in the OpenMetrics exposition.
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+#: Label of requests made outside a data-plane operation.
+OTHER_OPERATION = "other"
+
+_MICROS = 1_000_000
+
+
+class _Histogram:
+    """Log-linear histogram of durations, recorded in whole microseconds.
+
+    Values below ``2 * half`` get a bucket each. Above that, every power of
+    two is split into ``half`` buckets, so a bucket's width is at most
+    ``1 / half`` of its lower bound.
+    """
+
+    __slots__ = ("_counts", "_half", "_shift", "count", "max", "min", "sum")
+
+    def __init__(self, significant_figures: int) -> None:
+        # Same sizing as HdrHistogram: enough sub-buckets to tell apart
+        # values that differ in the last significant figure.
+        bits = math.ceil(math.log2(2 * 10**significant_figures))
+        self._shift = bits - 1
+        self._half = 1 << self._shift
+        self._counts: dict[int, int] = {}
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = 0.0
+
+    def record(self, seconds: float) -> None:
+        seconds = max(seconds, 0.0)
+        micros = int(seconds * _MICROS)
+        drop = micros.bit_length() - self._shift - 1
+        index = micros if drop <= 0 else (drop << self._shift) + (micros >> drop)
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.sum += seconds
+        if seconds < self.min:
+            self.min = seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def _bounds(self, index: int) -> tuple[int, int]:
+        """Return the lowest and highest microsecond value of bucket *index*."""
+        if index < 2 * self._half:
+            return index, index
+        drop = (index >> self._shift) - 1
+        sub = index - (drop << self._shift)
+        return sub << drop, ((sub + 1) << drop) - 1
+
+    def snapshot(self) -> HistogramSnapshot:
+        buckets = []
+        for index in sorted(self._counts):
+            low, high = self._bounds(index)
+            buckets.append((low / _MICROS, (high + 1) / _MICROS, self._counts[index]))
+        return HistogramSnapshot(
+            count=self.count,
+            sum=self.sum,
+            min=self.min if self.count else 0.0,
+            max=self.max,
+            buckets=tuple(buckets),
+        )
+
+
+@dataclass(frozen=True)
+class HistogramSnapshot:
+    """Recorded durations, in seconds.
+
+    Attributes:
+        count (int): Number of recorded values.
+        sum (float): Sum of the recorded values.
+        min (float): Smallest recorded value, ``0.0`` when empty.
+        max (float): Largest recorded value, ``0.0`` when empty.
+        buckets (tuple[tuple[float, float, int], ...]): Non-empty buckets as
+            ``(lower, upper, count)``, in ascending order; each holds the
+            values ``lower <= v < upper``, to microsecond resolution.
+    """
+
+    count: int
+    sum: float
+    min: float
+    max: float
+    buckets: tuple[tuple[float, float, int], ...]
+
+    @property
+    def mean(self) -> float:
+        return self.sum / self.count if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Return the *q*-th percentile (0-100), ``0.0`` when empty.
+
+        The result is the upper end of the bucket holding the value of that
+        rank, clamped to the recorded range.
+        """
+        if not 0 <= q <= 100:
+            raise ValueError(f"percentile must be between 0 and 100, got {q}")
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(q / 100 * self.count))
+        seen = 0
+        for _, upper, count in self.buckets:
+            seen += count
+            if seen >= rank:
+                return min(max(upper, self.min), self.max)
+        return self.max
+
+    def count_below(self, bound: float) -> int:
+        """Return the number of values up to *bound*, to the histogram's precision."""
+        return sum(count for lower, _, count in self.buckets if lower <= bound)
+
+
+@dataclass(frozen=True)
+class OperationMetrics:
+    """Totals of the requests of one operation over one transport.
+
+    Attributes:
+        operation (str): Client method, such as ``"query"``, or ``"other"``
+            for requests made outside a data-plane operation.
+        transport (str): ``"rest"`` or ``"grpc"``.
+        requests (int): Finished requests.
+        errors (int): Requests that ended with an exception.
+        retries (int): Attempts after the first, over all requests.
+        throttled (int): Attempts answered with HTTP 429 (or gRPC
+            ``RESOURCE_EXHAUSTED``).
+        timeouts (int): Attempts, or body reads, that timed out.
+        read_units (int): Read units reported in response ``usage``.
+        write_units (int): Write units reported in response ``usage``.
+        latency (HistogramSnapshot): :attr:`RequestEvent.total` of every
+            request, retries and backoff included.
+    """
+
+    operation: str
+    transport: str
+    requests: int
+    errors: int
+    retries: int
+    throttled: int
+    timeouts: int
+    read_units: int
+    write_units: int
+    latency: HistogramSnapshot
+
+
+@dataclass(frozen=True)
+class PoolMetrics:
+    """Connection pool usage of the REST clients of one host.
+
+    Attributes:
+        host (str): Host the pool connects to.
+        size (int): Maximum number of connections of the pool.
+        in_use (int): Connections in use when the most recently finished
+            request was sent.
+        peak_in_use (int): Highest ``in_use`` seen.
+        wait (HistogramSnapshot): Time requests waited for a connection.
+    """
+
+    host: str
+    size: int
+    in_use: int
+    peak_in_use: int
+    wait: HistogramSnapshot
+
+
+class _OperationTotals:
+    __slots__ = (
+        "errors",
+        "latency",
+        "read_units",
+        "requests",
+        "retries",
+        "throttled",
+        "timeouts",
+        "write_units",
+    )
+
+    def __init__(self, significant_figures: int) -> None:
+        self.latency = _Histogram(significant_figures)
+        self.requests = 0
+        self.errors = 0
+        self.retries = 0
+        self.throttled = 0
+        self.timeouts = 0
+        self.read_units = 0
+        self.write_units = 0
+
+
+class _PoolTotals:
+    __slots__ = ("in_use", "peak_in_use", "size", "wait")
+
+    def __init__(self, significant_figures: int) -> None:
+        self.wait = _Histogram(significant_figures)
+        self.size = 0
+        self.in_use = 0
+        self.peak_in_use = 0
+
+
+def _is_timeout(error: BaseException | None) -> bool:
+    if error is None:
+        return False
+    if isinstance(error, TimeoutError):  # includes PineconeTimeoutError
+        return True
+    # Only a REST request can have produced an httpx error, so httpx is loaded.
+    httpx = sys.modules.get("httpx")
+    return httpx is not None and isinstance(error, httpx.TimeoutException)
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    """Point-in-time copy of :class:`ClientMetrics`.
+
+    Attributes:
+        operations (tuple[OperationMetrics, ...]): One entry per operation and
+            transport, sorted by transport then operation.
+        pools (tuple[PoolMetrics, ...]): One entry per host, sorted by host.
+    """
+
+    operations: tuple[OperationMetrics, ...]
+    pools: tuple[PoolMetrics, ...]
+
+    def operation(self, name: str, transport: str = "rest") -> OperationMetrics | None:
+        """Return the metrics of operation *name* over *transport*, if it was seen."""
+        for metrics in self.operations:
+            if metrics.operation == name and metrics.transport == transport:
+                return metrics
+        return None
+
+    def to_openmetrics(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> str:
+        """Render the snapshot in the OpenMetrics text format.
+
+        Args:
+            buckets (tuple[float, ...]): Upper bounds, in seconds, of the
+                histogram buckets to expose. Defaults to :data:`DEFAULT_BUCKETS`.
+
+        Returns:
+            The exposition, ending with ``# EOF``.
+        """
+        lines: list[str] = []
+        op_labels = [_labels(transport=m.transport, operation=m.operation) for m in self.operations]
+        _histogram(
+            lines,
+            "pinecone_request_duration_seconds",
+            "Latency of SDK requests, including retries and backoff.",
+            [(labels, m.latency) for labels, m in zip(op_labels, self.operations, strict=True)],
+            buckets,
+        )
+        counters = (
+            ("pinecone_requests", "Finished requests.", "requests"),
+            ("pinecone_request_errors", "Requests that ended with an error.", "errors"),
+            ("pinecone_request_retries", "Retried attempts.", "retries"),
+            ("pinecone_throttled_responses", "Attempts answered with HTTP 429.", "throttled"),
+            ("pinecone_request_timeouts", "Attempts that timed out.", "timeouts"),
+            ("pinecone_read_units", "Read units reported by the server.", "read_units"),
+            ("pinecone_write_units", "Write units reported by the server.", "write_units"),
+        )
+        for name, help_text, attr in counters:
+            lines.append(f"# TYPE {name} counter")
+            lines.append(f"# HELP {name} {help_text}")
+            for labels, metrics in zip(op_labels, self.operations, strict=True):
+                lines.append(f"{name}_total{labels} {getattr(metrics, attr)}")
+        pool_labels = [_labels(host=p.host) for p in self.pools]
+        gauges = (
+            ("pinecone_pool_connections", "Maximum connections of the pool.", "size"),
+            ("pinecone_pool_connections_in_use", "Connections in use.", "in_use"),
+            ("pinecone_pool_connections_in_use_peak", "Peak connections in use.", "peak_in_use"),
+        )
+        for name, help_text, attr in gauges:
+            lines.append(f"# TYPE {name} gauge")
+            lines.append(f"# HELP {name} {help_text}")
+            for labels, pool in zip(pool_labels, self.pools, strict=True):
+                lines.append(f"{name}{labels} {getattr(pool, attr)}")
+        _histogram(
+            lines,
+            "pinecone_pool_wait_seconds",
+            "Time spent waiting for a pooled connection.",
+            [(labels, p.wait) for labels, p in zip(pool_labels, self.pools, strict=True)],
+            buckets,
+        )
+        lines.append("# EOF")
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return "{" + ",".join(f'{k}="{_escape(v)}"' for k, v in labels.items()) + "}"
+
+
+def _histogram(
+    lines: list[str],
+    name: str,
+    help_text: str,
+    series: list[tuple[str, HistogramSnapshot]],
+    buckets: tuple[float, ...],
+) -> None:
+    lines.append(f"# TYPE {name} histogram")
+    lines.append(f"# UNIT {name} seconds")
+    lines.append(f"# HELP {name} {help_text}")
+    for labels, histogram in series:
+        prefix = labels[:-1] + "," if labels != "{}" else "{"
+        for bound in sorted(buckets):
+            count = histogram.count_below(bound)
+            lines.append(f'{name}_bucket{prefix}le="{bound!r}"}} {count}')
+        lines.append(f'{name}_bucket{prefix}le="+Inf"}} {histogram.count}')
+        lines.append(f"{name}_count{labels} {histogram.count}")
+        lines.append(f"{name}_sum{labels} {histogram.sum!r}")
+
+
+class ClientMetrics:
+    """Request listener that keeps latency histograms and counters per operation.
+
+    Pass an instance in ``request_listeners=`` of :class:`~pinecone.Pinecone`,
+    :class:`~pinecone.PineconeAsyncio`, an index client or
+    :class:`~pinecone.grpc.GrpcIndex`; one instance can be shared by several
+    clients and threads.
+
+    Args:
+        significant_figures (int): Precision of the latency histograms, from
+            1 to 4. With the default of 2, percentiles are within 1% of the
+            recorded value.
+
+    Examples:
+        .. code-block:: python
+
+            from pinecone import ClientMetrics, Pinecone
+
+            metrics = ClientMetrics()
+            pc = Pinecone(api_key="your-api-key", request_listeners=[metrics])
+            index = pc.index("product-search")
+            index.query(vector=[0.1] * 1536, top_k=10)
+
+            query = metrics.snapshot().operation("query")
+            print(query.requests, query.latency.percentile(99))
+    """
+
+    #: Content type of :meth:`to_openmetrics` output, for HTTP responses.
+    content_type: ClassVar[str] = "application/openmetrics-text; version=1.0.0; charset=utf-8"
+
+    def __init__(self, *, significant_figures: int = 2) -> None:
+        if not 1 <= significant_figures <= 4:
+            raise ValueError(
+                f"significant_figures must be between 1 and 4, got {significant_figures}"
+            )
+        self._significant_figures = significant_figures
+        self._lock = threading.Lock()
+        self._operations: dict[tuple[str, str], _OperationTotals] = {}
+        self._pools: dict[str, _PoolTotals] = {}
+
+    def __call__(self, event: RequestEvent) -> None:
+        key = (event.transport, event.operation or OTHER_OPERATION)
+        attempts = event.attempts
+        throttled = sum(1 for attempt in attempts if attempt.status_code == 429)
+        timeouts = sum(1 for attempt in attempts if _is_timeout(attempt.error))
+        if _is_timeout(event.error) and not (attempts and _is_timeout(attempts[-1].error)):
+            timeouts += 1  # timed out reading the body
+        with self._lock:
+            totals = self._operations.get(key)
+            if totals is None:
+                totals = self._operations[key] = _OperationTotals(self._significant_figures)
+            totals.latency.record(event.total)
+            totals.requests += 1
+            totals.errors += event.error is not None
+            totals.retries += event.retries
+            totals.throttled += throttled
+            totals.timeouts += timeouts
+            totals.read_units += event.read_units or 0
+            totals.write_units += event.write_units or 0
+            if event.pool_in_use is None:
+                return
+            pool = self._pools.get(event.host)
+            if pool is None:
+                pool = self._pools[event.host] = _PoolTotals(self._significant_figures)
+            pool.size = event.pool_size or 0
+            pool.in_use = event.pool_in_use
+            pool.peak_in_use = max(pool.peak_in_use, event.pool_in_use)
+            if event.pool_wait is not None:
+                pool.wait.record(event.pool_wait)
+
+    def snapshot(self) -> MetricsSnapshot:
+        """Return a copy of the current metrics."""
+        with self._lock:
+            operations = tuple(
+                OperationMetrics(
+                    operation=operation,
+                    transport=transport,
+                    requests=t.requests,
+                    errors=t.errors,
+                    retries=t.retries,
+                    throttled=t.throttled,
+                    timeouts=t.timeouts,
+                    read_units=t.read_units,
+                    write_units=t.write_units,
+                    latency=t.latency.snapshot(),
+                )
+                for (transport, operation), t in sorted(self._operations.items())
+            )
+            pools = tuple(
+                PoolMetrics(
+                    host=host,
+                    size=p.size,
+                    in_use=p.in_use,
+                    peak_in_use=p.peak_in_use,
+                    wait=p.wait.snapshot(),
+                )
+                for host, p in sorted(self._pools.items())
+            )
+        return MetricsSnapshot(operations=operations, pools=pools)
+
+    def reset(self) -> None:
+        """Discard everything recorded so far."""
+        with self._lock:
+            self._operations.clear()
+            self._pools.clear()
+
+    def to_openmetrics(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> str:
+        """Render the current metrics in the OpenMetrics text format.
+
+        Shorthand for ``snapshot().to_openmetrics(buckets)``; Prometheus
+        scrapes it when served with :attr:`content_type`.
+        """
+        return self.snapshot().to_openmetrics(buckets)
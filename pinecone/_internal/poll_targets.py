@@ -0,0 +1,133 @@
+"""Snapshot resolvers for the resource pollers.
+
+Each factory returns a callable for :meth:`Poller.watch` that takes a
+mapping from resource identifier to model, as built from one list or
+describe call, and returns the model once it is final, ``None`` while it
+is pending, or raises if it failed.  A resource absent from the mapping is
+treated as pending, since a new resource may not be listed yet.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pinecone._internal.polling import IMPORT_TERMINAL_STATUSES
+from pinecone.errors.exceptions import (
+    IndexInitFailedError,
+    IndexTerminatedError,
+    PineconeError,
+)
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Mapping
+
+    from pinecone.models.assistant.file_model import AssistantFileModel
+    from pinecone.models.assistant.model import AssistantModel
+    from pinecone.models.backups.model import BackupModel
+    from pinecone.models.imports.model import ImportModel
+    from pinecone.models.indexes.index import IndexModel
+
+
+class FileProcessingError(PineconeError):
+    """An assistant file ended in ``ProcessingFailed``.
+
+    *reason* is the server's error message for the file.
+    """
+
+    def __init__(self, file_id: str, reason: str) -> None:
+        super().__init__(f"File processing failed for '{file_id}': {reason}")
+        self.file_id = file_id
+        self.reason = reason
+
+
+_ASSISTANT_TERMINAL_STATES = ("Failed", "InitializationFailed", "Terminated", "Terminating")
+
+
+def index_ready(name: str) -> Callable[[Mapping[str, IndexModel]], IndexModel | None]:
+    """Resolve when index *name* is ready."""
+
+    def resolve(indexes: Mapping[str, IndexModel]) -> IndexModel | None:
+        idx = indexes.get(name)
+        if idx is None:
+            return None
+        if idx.status.ready:
+            return idx
+        if idx.status.state == "InitializationFailed":
+            raise IndexInitFailedError(name)
+        if idx.status.state in ("Terminating", "Disabled"):
+            raise IndexTerminatedError(name, idx.status.state)
+        return None
+
+    return resolve
+
+
+def assistant_ready(
+    name: str,
+) -> Callable[[Mapping[str, AssistantModel]], AssistantModel | None]:
+    """Resolve when assistant *name* is ``Ready``."""
+
+    def resolve(assistants: Mapping[str, AssistantModel]) -> AssistantModel | None:
+        model = assistants.get(name)
+        if model is None:
+            return None
+        if model.status == "Ready":
+            return model
+        if model.status in _ASSISTANT_TERMINAL_STATES:
+            raise PineconeError(
+                f"Assistant '{name}' entered terminal state '{model.status}'. "
+                f"Check status with pc.assistants.describe(name='{name}')."
+            )
+        return None
+
+    return resolve
+
+
+def file_processed(
+    file_id: str,
+) -> Callable[[Mapping[str, AssistantFileModel]], AssistantFileModel | None]:
+    """Resolve when file *file_id* has finished processing.
+
+    Raises :exc:`FileProcessingError` if processing failed.
+    """
+
+    def resolve(files: Mapping[str, AssistantFileModel]) -> AssistantFileModel | None:
+        file = files.get(file_id)
+        if file is None or file.status == "Processing":
+            return None
+        if file.status == "ProcessingFailed":
+            raise FileProcessingError(file_id, file.error_message or "Unknown processing error")
+        return file
+
+    return resolve
+
+
+def import_done(import_id: str) -> Callable[[Mapping[str, ImportModel]], ImportModel | None]:
+    """Resolve when import *import_id* has completed, failed, or been cancelled.
+
+    The model is returned whatever the terminal status; callers inspect
+    ``status`` and ``error`` themselves.
+    """
+
+    def resolve(imports: Mapping[str, ImportModel]) -> ImportModel | None:
+        operation = imports.get(import_id)
+        if operation is None or operation.status not in IMPORT_TERMINAL_STATUSES:
+            return None
+        return operation
+
+    return resolve
+
+
+def backup_ready(backup_id: str) -> Callable[[Mapping[str, BackupModel]], BackupModel | None]:
+    """Resolve when backup *backup_id* is ``Ready``."""
+
+    def resolve(backups: Mapping[str, BackupModel]) -> BackupModel | None:
+        backup = backups.get(backup_id)
+        if backup is None:
+            return None
+        if backup.status == "Ready":
+            return backup
+        if backup.status == "Failed":
+            raise PineconeError(f"Backup '{backup_id}' entered terminal state 'Failed'")
+        return None
+
+    return resolve
@@ -0,0 +1,416 @@
+"""Delay schedules and a shared poller for long-running server-side operations."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import heapq
+import itertools
+import random
+import threading
+import time
+from concurrent.futures import Future, InvalidStateError
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
+
+from pinecone._internal.config import BatchRetryPolicy
+from pinecone.errors.exceptions import PineconeTimeoutError, PineconeValueError
+
+if TYPE_CHECKING:
+    from collections.abc import Awaitable, Callable, Hashable
+
+S = TypeVar("S")
+T = TypeVar("T")
+
+#: Statuses after which a bulk import no longer changes.
+IMPORT_TERMINAL_STATUSES = frozenset({"Completed", "Failed", "Cancelled"})
+
+# Decides which fetch errors are transient, the same way batch upserts do.
+_FETCH_RETRY_POLICY = BatchRetryPolicy()
+
+
+class ProgressBackoff:
+    """Poll delay that adapts to the progress an operation reports.
+
+    While the operation reports no progress the delay grows geometrically
+    from *initial* to *maximum*.  Once the reported percentage rises, the
+    delay becomes a quarter of the estimated time remaining at the observed
+    rate, kept within ``[initial, maximum]``, so a fast import is checked
+    often near its end and a slow one is not polled needlessly.
+
+    Args:
+        initial (float): First and shortest delay in seconds.
+        maximum (float): Longest delay in seconds.
+        factor (float): Growth of the delay between polls without progress.
+
+    Raises:
+        :exc:`PineconeValueError`: If *initial* is not positive, *maximum*
+            is below *initial*, or *factor* is below 1.
+    """
+
+    def __init__(self, initial: float = 1.0, maximum: float = 60.0, factor: float = 1.5) -> None:
+        if initial <= 0:
+            raise PineconeValueError(f"initial poll interval must be positive, got {initial}")
+        if maximum < initial:
+            raise PineconeValueError(
+                f"maximum poll interval ({maximum}) must be at least initial ({initial})"
+            )
+        if factor < 1:
+            raise PineconeValueError(f"backoff factor must be at least 1, got {factor}")
+        self.initial = initial
+        self.maximum = maximum
+        self.factor = factor
+        self._delay: float | None = None
+        self._last: tuple[float, float] | None = None
+
+    def next_delay(self, percent_complete: float | None, now: float | None = None) -> float:
+        """Return the seconds to wait after a poll that reported *percent_complete*."""
+        now = time.monotonic() if now is None else now
+        last, self._last = self._last, None
+        if percent_complete is not None:
+            self._last = (now, percent_complete)
+            if last is not None and percent_complete > last[1] and now > last[0]:
+                rate = (percent_complete - last[1]) / (now - last[0])
+                remaining = max(0.0, 100.0 - percent_complete) / rate
+                self._delay = min(self.maximum, max(self.initial, remaining / 4))
+                return self._delay
+            if last is not None and percent_complete <= last[1]:
+                # Keep the earlier sample so the rate spans the whole stall.
+                self._last = last
+        if self._delay is None:
+            self._delay = self.initial
+        else:
+            self._delay = min(self.maximum, self._delay * self.factor)
+        return self._delay
+
+
+class Backoff:
+    """Exponential poll delay with multiplicative jitter.
+
+    The delay starts at *initial* and grows by *factor* after every poll up
+    to *maximum*.  Each returned delay is scaled by a random factor in
+    ``[1 - jitter, 1 + jitter]`` so that many clients started together do
+    not poll in lockstep.
+
+    Args:
+        initial (float): First delay in seconds.
+        maximum (float): Longest delay in seconds, before jitter.
+        factor (float): Growth of the delay between polls.
+        jitter (float): Relative spread of each delay, in ``[0, 1)``.
+
+    Raises:
+        :exc:`PineconeValueError`: If *initial* is not positive, *maximum*
+            is below *initial*, *factor* is below 1, or *jitter* is out of
+            range.
+    """
+
+    def __init__(
+        self,
+        initial: float = 1.0,
+        maximum: float = 30.0,
+        factor: float = 2.0,
+        jitter: float = 0.2,
+    ) -> None:
+        if initial <= 0:
+            raise PineconeValueError(f"initial poll interval must be positive, got {initial}")
+        if maximum < initial:
+            raise PineconeValueError(
+                f"maximum poll interval ({maximum}) must be at least initial ({initial})"
+            )
+        if factor < 1:
+            raise PineconeValueError(f"backoff factor must be at least 1, got {factor}")
+        if not 0 <= jitter < 1:
+            raise PineconeValueError(f"jitter must be in [0, 1), got {jitter}")
+        self.initial = initial
+        self.maximum = maximum
+        self.factor = factor
+        self.jitter = jitter
+        self._delay = initial
+
+    def next_delay(self) -> float:
+        """Return the seconds to wait before the next poll."""
+        delay = self._delay
+        self._delay = min(self.maximum, delay * self.factor)
+        return delay * random.uniform(1 - self.jitter, 1 + self.jitter)  # noqa: S311
+
+    def reset(self) -> None:
+        """Start again from the initial delay."""
+        self._delay = self.initial
+
+
+class _Watch(Generic[S]):
+    """One resource waited on: how to judge a snapshot, and whom to tell."""
+
+    def __init__(
+        self,
+        resolve: Callable[[S], Any],
+        deadline: float | None,
+        timeout: float | None,
+        label: str,
+        future: Any,
+    ) -> None:
+        self.resolve = resolve
+        self.deadline = deadline
+        self.timeout = timeout
+        self.label = label
+        self.future = future
+
+
+class _Group(Generic[S]):
+    """Watches answered by the same fetch, e.g. one list call for many files."""
+
+    def __init__(self, key: Hashable, fetch: Any, backoff: Backoff) -> None:
+        self.key = key
+        self.fetch = fetch
+        self.backoff = backoff
+        self.watches: list[_Watch[S]] = []
+        self.due = 0.0
+
+
+class _PollSchedule:
+    """Bookkeeping shared by :class:`Poller` and :class:`AsyncPoller`."""
+
+    def __init__(self, initial: float, maximum: float, factor: float, jitter: float) -> None:
+        Backoff(initial, maximum, factor, jitter)  # validate once up front
+        self._backoff_args = (initial, maximum, factor, jitter)
+        self._groups: dict[Hashable, _Group[Any]] = {}
+        self._heap: list[tuple[float, int, Hashable]] = []
+        self._counter = itertools.count()
+
+    def _add(
+        self,
+        key: Hashable | None,
+        fetch: Any,
+        watch: _Watch[Any],
+        now: float,
+    ) -> None:
+        if key is None:
+            key = object()
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = _Group(key, fetch, Backoff(*self._backoff_args))
+            group.due = now
+            self._push(group)
+        elif group.due > now + group.backoff.initial:
+            # A newcomer should not inherit a long backoff.
+            group.backoff.reset()
+            group.due = now + group.backoff.initial
+            self._push(group)
+        group.watches.append(watch)
+
+    def _push(self, group: _Group[Any]) -> None:
+        heapq.heappush(self._heap, (group.due, next(self._counter), group.key))
+
+    def _next_due(self) -> tuple[float, _Group[Any]] | None:
+        """Return the earliest scheduled group, dropping stale heap entries."""
+        while self._heap:
+            due, _, key = self._heap[0]
+            group = self._groups.get(key)
+            if group is None or group.due != due:
+                heapq.heappop(self._heap)
+                continue
+            return due, group
+        return None
+
+    def _settle(
+        self,
+        group: _Group[Any],
+        snapshot: Any,
+        error: BaseException | None,
+        now: float,
+    ) -> None:
+        """Resolve the watches of *group* against one fetch and reschedule it.
+
+        A transient fetch *error* (one :meth:`BatchRetryPolicy.classify`
+        would retry) leaves the watches pending, so the group is fetched
+        again after its next, longer backoff delay; watches then fail only
+        at their deadline.  Any other fetch error fails every watch.
+
+        The group's current heap entry becomes stale once ``group.due``
+        changes and is dropped by :meth:`_next_due`.
+        """
+        transient = error is not None and _FETCH_RETRY_POLICY.classify(error) == "retry"
+        remaining: list[_Watch[Any]] = []
+        for watch in group.watches:
+            if watch.future.done():
+                continue
+            outcome: Any = None if transient else error
+            if outcome is None and not transient:
+                try:
+                    outcome = watch.resolve(snapshot)
+                except Exception as exc:
+                    outcome = exc
+            if outcome is None and watch.deadline is not None and now >= watch.deadline:
+                outcome = PineconeTimeoutError(f"{watch.label} not complete after {watch.timeout}s")
+                outcome.__cause__ = error
+            if outcome is None:
+                remaining.append(watch)
+                continue
+            # A caller may cancel a concurrent future between done() and here.
+            with contextlib.suppress(InvalidStateError, asyncio.InvalidStateError):
+                if isinstance(outcome, BaseException):
+                    watch.future.set_exception(outcome)
+                else:
+                    watch.future.set_result(outcome)
+        group.watches = remaining
+        if not remaining:
+            del self._groups[group.key]
+            return
+        delay = group.backoff.next_delay()
+        deadlines = [w.deadline for w in remaining if w.deadline is not None]
+        group.due = min([now + delay, *deadlines])
+        self._push(group)
+
+
+class Poller(_PollSchedule):
+    """Polls many long-running operations from one background thread.
+
+    Each :meth:`watch` returns a :class:`concurrent.futures.Future` that
+    resolves when the resource reaches a terminal state.  Watches that
+    pass the same *group* share one *fetch* call per round, so a single
+    list request can answer for every pending resource it covers.  Rounds
+    follow an exponential :class:`Backoff` with jitter, and a watch whose
+    *timeout* elapses fails with :exc:`PineconeTimeoutError`.  A fetch that
+    fails transiently (a timeout, a connection error, or a 408, 429 or 5xx
+    response) is retried on the next round; any other fetch error fails
+    every watch in its group.
+
+    The thread starts on the first watch and exits when nothing is pending.
+
+    Args:
+        initial (float): First delay between rounds in seconds. Defaults to 1.
+        maximum (float): Longest delay between rounds. Defaults to 30.
+        factor (float): Growth of the delay between rounds. Defaults to 2.
+        jitter (float): Relative random spread of each delay. Defaults to 0.2.
+    """
+
+    def __init__(
+        self,
+        initial: float = 1.0,
+        maximum: float = 30.0,
+        factor: float = 2.0,
+        jitter: float = 0.2,
+    ) -> None:
+        super().__init__(initial, maximum, factor, jitter)
+        self._lock = threading.Condition()
+        self._thread: threading.Thread | None = None
+
+    def watch(
+        self,
+        fetch: Callable[[], S],
+        resolve: Callable[[S], T | None],
+        *,
+        group: Hashable | None = None,
+        timeout: float | None = None,
+        label: str = "Operation",
+    ) -> Future[T]:
+        """Wait in the background for ``resolve(fetch())`` to return a result.
+
+        Args:
+            fetch: Reads the current state, e.g. a describe or list call.
+                Only the first watch's *fetch* is used for a *group*.
+            resolve: Returns the final result from a snapshot, ``None`` while
+                the resource is still pending, or raises if it failed.
+            group: Watches with equal, non-``None`` keys share each fetch.
+            timeout: Seconds to wait. ``None`` waits indefinitely.
+            label: Names the resource in the timeout message.
+
+        Returns:
+            A future for the resolved result.
+        """
+        future: Future[T] = Future()
+        now = time.monotonic()
+        deadline = None if timeout is None else now + timeout
+        with self._lock:
+            self._add(group, fetch, _Watch(resolve, deadline, timeout, label, future), now)
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="pinecone-poller", daemon=True
+                )
+                self._thread.start()
+            self._lock.notify()
+        return future
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                while True:
+                    scheduled = self._next_due()
+                    if scheduled is None:
+                        self._thread = None
+                        return
+                    due, group = scheduled
+                    wait = due - time.monotonic()
+                    if wait <= 0:
+                        break
+                    self._lock.wait(wait)
+            snapshot: Any = None
+            error: BaseException | None = None
+            try:
+                snapshot = group.fetch()
+            except Exception as exc:
+                error = exc
+            with self._lock:
+                self._settle(group, snapshot, error, time.monotonic())
+
+
+class AsyncPoller(_PollSchedule):
+    """Async counterpart of :class:`Poller`, polling from one asyncio task.
+
+    :meth:`watch` takes an async *fetch* and returns an
+    :class:`asyncio.Future`.  The task runs on the loop of the first watch
+    and exits when nothing is pending.
+    """
+
+    def __init__(
+        self,
+        initial: float = 1.0,
+        maximum: float = 30.0,
+        factor: float = 2.0,
+        jitter: float = 0.2,
+    ) -> None:
+        super().__init__(initial, maximum, factor, jitter)
+        self._wakeup: asyncio.Event | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    def watch(
+        self,
+        fetch: Callable[[], Awaitable[S]],
+        resolve: Callable[[S], T | None],
+        *,
+        group: Hashable | None = None,
+        timeout: float | None = None,
+        label: str = "Operation",
+    ) -> asyncio.Future[T]:
+        """Wait in the background for ``resolve(await fetch())`` to return a result.
+
+        Arguments are as for :meth:`Poller.watch`. Must be called from a
+        running event loop.
+        """
+        loop = asyncio.get_running_loop()
+        future: asyncio.Future[T] = loop.create_future()
+        now = time.monotonic()
+        deadline = None if timeout is None else now + timeout
+        self._add(group, fetch, _Watch(resolve, deadline, timeout, label, future), now)
+        if self._task is None or self._task.done():
+            self._wakeup = asyncio.Event()
+            self._task = loop.create_task(self._run(self._wakeup))
+        elif self._wakeup is not None:
+            self._wakeup.set()
+        return future
+
+    async def _run(self, wakeup: asyncio.Event) -> None:
+        while (scheduled := self._next_due()) is not None:
+            due, group = scheduled
+            wait = due - time.monotonic()
+            if wait > 0:
+                wakeup.clear()
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(wakeup.wait(), wait)
+                continue
+            snapshot: Any = None
+            error: BaseException | None = None
+            try:
+                snapshot = await group.fetch()
+            except Exception as exc:
+                error = exc
+            self._settle(group, snapshot, error, time.monotonic())
@@ -0,0 +1,350 @@
+"""Process-pool execution of batched vector upserts.
+
+Building, validating and JSON- or protobuf-encoding vectors holds the GIL,
+so thread-pool batching tops out at about one core no matter how many
+requests are in flight.  In process mode the input is cut into contiguous
+shards.  The dense values of each shard are copied into one shared memory
+block; the rest of each vector (ID, sparse values, metadata) is small and is
+pickled as a *skeleton* with the values left out.  A worker process, which
+owns its own client, reassembles the vectors and upserts them with the usual
+thread-pool batching, and the per-shard results are folded into one
+:class:`BatchResult`.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import logging
+import multiprocessing
+import os
+import pickle
+from array import array
+from collections.abc import Mapping, Sequence
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from multiprocessing.shared_memory import SharedMemory
+from typing import TYPE_CHECKING, Any, Literal, cast
+
+import msgspec
+
+from pinecone._internal.batch import _build_aggregate, _collect_lsn, _create_progress_bar
+from pinecone._internal.batching import MAX_AUTO_BATCH_SIZE
+from pinecone._internal.validation import require_positive
+from pinecone.errors.exceptions import PineconeError, PineconeValueError
+from pinecone.models.batch import BatchResult
+from pinecone.models.vectors.vector import Vector
+
+if TYPE_CHECKING:
+    from pinecone._internal.config import BatchRetryPolicy
+    from pinecone.models.vectors.responses import UpsertResponse
+
+logger = logging.getLogger(__name__)
+
+#: Length recorded for a vector whose values could not be packed; its
+#: skeleton is the original item and the worker validates it as is.
+_UNPACKED = -1
+
+_ITEM = 8  # bytes per int64 length and per float64 value
+
+# The client owned by this worker process, created by the pool initializer.
+_worker_client: Any = None
+
+
+def resolve_process_count(
+    workers: Literal["thread", "process"],
+    processes: int | None,
+    *,
+    batch_size: int | Literal["auto"] | None,
+    checkpoint: object | None = None,
+) -> int | None:
+    """Return the worker process count for *workers*, or ``None`` for threads.
+
+    Raises:
+        :exc:`PineconeValueError`: If *workers* is unknown, or process mode is
+            requested without *batch_size*, with a checkpoint, or with a
+            non-positive *processes*.
+    """
+    if workers == "thread":
+        return None
+    if workers != "process":
+        raise PineconeValueError(f"workers must be 'thread' or 'process', got {workers!r}")
+    if batch_size is None:
+        raise PineconeValueError("workers='process' requires batch_size to be set")
+    if checkpoint is not None:
+        raise PineconeValueError("checkpoint is not supported with workers='process'")
+    if processes is None:
+        return os.cpu_count() or 1
+    require_positive("processes", processes)
+    return processes
+
+
+def shard_size(
+    total: int, processes: int, batch_size: int | Literal["auto"], max_concurrency: int
+) -> int:
+    """Return how many vectors to hand a worker process at a time.
+
+    A shard holds enough batches to keep the worker's *max_concurrency*
+    requests busy twice over, but is cut smaller when that would leave some
+    of the *processes* idle.
+    """
+    batch = MAX_AUTO_BATCH_SIZE if batch_size == "auto" else batch_size
+    return max(1, min(batch * max_concurrency * 2, -(-total // processes)))
+
+
+def create_process_pool(
+    client_cls: type[Any], client_kwargs: dict[str, Any], processes: int
+) -> ProcessPoolExecutor:
+    """Return a pool whose *processes* workers each own a ``client_cls(**client_kwargs)``.
+
+    Workers are started with the ``spawn`` method, so no client, lock or
+    connection of the parent is inherited by a child.
+    """
+    return ProcessPoolExecutor(
+        max_workers=processes,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_worker,
+        initargs=(client_cls, client_kwargs),
+    )
+
+
+def _init_worker(client_cls: type[Any], client_kwargs: dict[str, Any]) -> None:
+    global _worker_client
+    _worker_client = client_cls(**client_kwargs)
+
+
+# ---------------------------------------------------------------------------
+# Shard packing (parent) and unpacking (worker)
+# ---------------------------------------------------------------------------
+
+
+def _split(item: Any) -> tuple[Any, Any]:
+    """Return ``(values, skeleton)``, or ``(None, item)`` if nothing to pack."""
+    if isinstance(item, Vector):
+        return item.values, msgspec.structs.replace(item, values=[])
+    if isinstance(item, tuple):
+        if len(item) in (2, 3):
+            return item[1], (item[0], None, *item[2:])
+        return None, item
+    if isinstance(item, Mapping) and "values" in item:
+        skeleton = dict(item)
+        skeleton["values"] = None
+        return item["values"], skeleton
+    return None, item
+
+
+def _restore(skeleton: Any, values: list[float]) -> Any:
+    if isinstance(skeleton, Vector):
+        return msgspec.structs.replace(skeleton, values=values)
+    if isinstance(skeleton, tuple):
+        return (skeleton[0], values, *skeleton[2:])
+    skeleton["values"] = values
+    return skeleton
+
+
+def _as_doubles(values: Any) -> array[float] | None:
+    if isinstance(values, array) and values.typecode == "d":
+        return values
+    try:
+        return array("d", values)
+    except TypeError:
+        return None
+
+
+def pack_shard(vectors: Sequence[Any]) -> tuple[SharedMemory, list[Any], int]:
+    """Copy the dense values of *vectors* into a new shared memory block.
+
+    The block holds one int64 length per vector followed by all values as
+    float64.  Returns ``(block, skeletons, value_count)``; the caller owns the
+    block and must close and unlink it.
+    """
+    skeletons: list[Any] = []
+    lengths = array("q")
+    packed: list[array[float]] = []
+    value_count = 0
+    for item in vectors:
+        values, skeleton = _split(item)
+        chunk = None if values is None else _as_doubles(values)
+        if chunk is None:
+            # Leave malformed input to the worker's validation.
+            skeletons.append(item)
+            lengths.append(_UNPACKED)
+            continue
+        skeletons.append(skeleton)
+        lengths.append(len(chunk))
+        packed.append(chunk)
+        value_count += len(chunk)
+
+    count = len(lengths)
+    shm = SharedMemory(create=True, size=max(1, _ITEM * (count + value_count)))
+    try:
+        buf = _buffer(shm)
+        buf[: _ITEM * count] = lengths.tobytes()
+        with buf[_ITEM * count : _ITEM * (count + value_count)].cast("d") as view:
+            pos = 0
+            for chunk in packed:
+                view[pos : pos + len(chunk)] = chunk
+                pos += len(chunk)
+    except BaseException:
+        release_shard(shm)
+        raise
+    return shm, skeletons, value_count
+
+
+def unpack_shard(name: str, skeletons: list[Any], value_count: int) -> list[Any]:
+    """Reassemble the vectors packed by :func:`pack_shard` from block *name*."""
+    shm = SharedMemory(name=name)
+    try:
+        count = len(skeletons)
+        vectors: list[Any] = []
+        buf = _buffer(shm)
+        with (
+            buf[: _ITEM * count].cast("q") as lengths,
+            buf[_ITEM * count : _ITEM * (count + value_count)].cast("d") as values,
+        ):
+            pos = 0
+            for skeleton, length in zip(skeletons, lengths, strict=True):
+                if length == _UNPACKED:
+                    vectors.append(skeleton)
+                    continue
+                # typeshed types every memoryview item as int; these are doubles.
+                chunk = cast("list[float]", values[pos : pos + length].tolist())
+                vectors.append(_restore(skeleton, chunk))
+                pos += length
+        return vectors
+    finally:
+        shm.close()
+
+
+def release_shard(shm: SharedMemory) -> None:
+    """Close and remove a block created by :func:`pack_shard`."""
+    shm.close()
+    with contextlib.suppress(FileNotFoundError):
+        shm.unlink()
+
+
+def _buffer(shm: SharedMemory) -> memoryview:
+    buf = shm.buf
+    if buf is None:
+        raise PineconeError(f"Shared memory block {shm.name!r} is closed")
+    return buf
+
+
+def _portable(exc: Exception) -> Exception:
+    # Errors travel back to the parent pickled; replace any that would not
+    # survive the trip.  Only bytes produced here are loaded.
+    try:
+        pickle.loads(pickle.dumps(exc))  # noqa: S301
+    except Exception:
+        return PineconeError(f"{type(exc).__name__}: {exc}")
+    return exc
+
+
+def upsert_shard(
+    name: str,
+    skeletons: list[Any],
+    value_count: int,
+    upsert_kwargs: dict[str, Any],
+) -> UpsertResponse:
+    """Worker entry point: upsert one shard with this process's client."""
+    vectors = unpack_shard(name, skeletons, value_count)
+    response: UpsertResponse = _worker_client.upsert(vectors=vectors, **upsert_kwargs)
+    for error in response.errors:
+        error.error = _portable(error.error)
+    return response
+
+
+# ---------------------------------------------------------------------------
+# Driver
+# ---------------------------------------------------------------------------
+
+
+def process_upsert(
+    *,
+    pool: Executor,
+    processes: int,
+    vectors: Sequence[Any],
+    shard_size: int,
+    namespace: str,
+    batch_size: int | str,
+    max_concurrency: int,
+    timeout: float | None,
+    retry_policy: BatchRetryPolicy | None,
+    show_progress: bool,
+) -> BatchResult:
+    """Upsert *vectors* through *pool* in shards of *shard_size* vectors.
+
+    At most ``2 * processes`` shards (and their shared memory blocks) exist
+    at once.  Each shard is batched on its own, and error batch indexes
+    count the batches of all shards in input order.
+
+    Raises:
+        Exception: Whatever a worker raised for a shard, typically a
+            validation error; unfinished shards are cancelled first.
+    """
+    upsert_kwargs = {
+        "namespace": namespace,
+        "batch_size": batch_size,
+        "max_concurrency": max_concurrency,
+        "show_progress": False,
+        "timeout": timeout,
+        "retry_policy": retry_policy,
+    }
+    starts = range(0, len(vectors), shard_size)
+    progress = _create_progress_bar(len(starts), "Upserting", show_progress)
+    results: dict[int, UpsertResponse] = {}
+    in_flight: dict[Future[UpsertResponse], tuple[int, SharedMemory]] = {}
+
+    def _collect() -> None:
+        done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+        for future in done:
+            shard_no, shm = in_flight.pop(future)
+            release_shard(shm)
+            results[shard_no] = future.result()
+            progress.update(1)
+
+    try:
+        for shard_no, start in enumerate(starts):
+            if len(in_flight) >= 2 * processes:
+                _collect()
+            shm, skeletons, value_count = pack_shard(vectors[start : start + shard_size])
+            try:
+                future = pool.submit(upsert_shard, shm.name, skeletons, value_count, upsert_kwargs)
+            except BaseException:
+                release_shard(shm)
+                raise
+            in_flight[future] = (shard_no, shm)
+        while in_flight:
+            _collect()
+    except BaseException:
+        for future in in_flight:
+            future.cancel()
+        wait(in_flight)
+        for _, shm in in_flight.values():
+            release_shard(shm)
+        raise
+    finally:
+        progress.close()
+
+    return _merge([results[i] for i in range(len(results))])
+
+
+def _merge(responses: list[UpsertResponse]) -> BatchResult:
+    errors = []
+    lsn_reconciled: list[int] = []
+    lsn_committed: list[int] = []
+    batch_offset = 0
+    for response in responses:
+        for error in response.errors:
+            error.batch_index += batch_offset
+            errors.append(error)
+        batch_offset += response.total_batch_count
+        _collect_lsn(response, lsn_reconciled, lsn_committed)
+    return BatchResult(
+        total_item_count=sum(r.total_item_count for r in responses),
+        successful_item_count=sum(r.upserted_count for r in responses),
+        failed_item_count=sum(r.failed_item_count for r in responses),
+        total_batch_count=batch_offset,
+        successful_batch_count=sum(r.successful_batch_count for r in responses),
+        failed_batch_count=sum(r.failed_batch_count for r in responses),
+        errors=errors,
+        response_info=_build_aggregate(lsn_reconciled, lsn_committed),
+    )
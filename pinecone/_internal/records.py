@@ -0,0 +1,169 @@
+"""NDJSON encoding and batching for integrated-inference record upserts.
+
+Each record is validated and serialized straight to bytes exactly once, and
+a request body is built from its lines with a single ``join``.  httpx only
+sends ``bytes`` bodies as is (a ``bytearray`` would be streamed item by
+item), so joining once avoids both the reallocations of a growing buffer and
+the final copy out of it.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+from typing import Any, Literal
+
+from pinecone._internal.batching import (
+    MAX_REQUEST_BYTES,
+    BatchSizeTuner,
+    batch_limit,
+    resolve_batch_size,
+)
+from pinecone._internal.http_client import _encode_json
+from pinecone._internal.validation import require_in_range
+from pinecone.errors.exceptions import ValidationError
+from pinecone.models.batch import BatchResult
+from pinecone.models.response_info import ResponseInfo
+from pinecone.models.vectors.responses import UpsertRecordsResponse
+
+#: Maximum number of records accepted by a single upsert_records request.
+MAX_RECORDS_PER_REQUEST = 96
+
+#: Maximum body size accepted by a single upsert_records request.
+MAX_RECORDS_REQUEST_BYTES = MAX_REQUEST_BYTES
+
+NDJSON_HEADERS = {"Content-Type": "application/x-ndjson"}
+
+
+def validate_namespace(namespace: Any) -> None:
+    """Raise ``ValidationError`` unless *namespace* is a non-empty string."""
+    if not isinstance(namespace, str):
+        raise ValidationError("namespace must be a string")
+    if not namespace or not namespace.strip():
+        raise ValidationError("namespace must be a non-empty string")
+
+
+def resolve_records_batch_size(batch_size: int | Literal["auto"]) -> int | BatchSizeTuner:
+    """Validate an upsert_records *batch_size*, returning a tuner for ``"auto"``.
+
+    Raises:
+        ValidationError: If *batch_size* is not ``"auto"`` or within [1, 96].
+    """
+    if batch_size == "auto":
+        return resolve_batch_size(batch_size, MAX_RECORDS_PER_REQUEST)
+    require_in_range("batch_size", batch_size, 1, MAX_RECORDS_PER_REQUEST)
+    return batch_size
+
+
+def encode_record(record: dict[str, Any], index: int) -> bytes:
+    """Validate *record* and return its NDJSON line (without the newline).
+
+    An ``id`` key is written as ``_id``; when both are present ``_id`` wins
+    and ``id`` is dropped.  The caller's dict is never modified, and it is
+    only copied when a key has to be renamed or dropped.
+
+    Raises:
+        ValidationError: If the record has no identifier or it is not a string.
+    """
+    if record.__class__ is not dict:
+        record = dict(record)
+    if "_id" in record:
+        if "id" in record:
+            record = {k: v for k, v in record.items() if k != "id"}
+    elif "id" in record:
+        record = {("_id" if k == "id" else k): v for k, v in record.items()}
+    else:
+        raise ValidationError(f"Record at index {index} must contain an '_id' or 'id' field")
+    resolved_id = record["_id"]
+    if not isinstance(resolved_id, str):
+        got = type(resolved_id).__name__
+        raise ValidationError(f"Record at index {index}: '_id' must be a string, got {got!r}")
+    return _encode_json(record)
+
+
+def encode_ndjson(records: Iterable[dict[str, Any]]) -> tuple[int, bytes]:
+    """Encode all of *records* into one NDJSON body.
+
+    Returns:
+        ``(record_count, body)``.
+
+    Raises:
+        ValidationError: If *records* is empty or a record is invalid.
+    """
+    lines = [encode_record(record, i) for i, record in enumerate(records)]
+    if not lines:
+        raise ValidationError("records must be a non-empty list")
+    return len(lines), _join_lines(lines)
+
+
+def _join_lines(lines: list[bytes]) -> bytes:
+    """Join NDJSON *lines* into one newline-terminated body."""
+    lines.append(b"")  # makes join() end the last line too
+    return b"\n".join(lines)
+
+
+def iter_ndjson_batches(
+    records: Iterable[dict[str, Any]],
+    batch_size: int | BatchSizeTuner,
+    max_bytes: int = MAX_RECORDS_REQUEST_BYTES,
+) -> Iterator[tuple[list[dict[str, Any]], bytes]]:
+    """Lazily encode *records* into NDJSON bodies bounded by count and size.
+
+    Yields ``(records, body)`` pairs where *records* are the caller's
+    original dicts (kept for failure reporting) and *body* holds at most
+    *batch_size* lines (read from the tuner as each batch starts) and at most
+    *max_bytes* bytes.  A batch is yielded as soon as it is full.  A single
+    record larger than *max_bytes* is sent on its own so the server reports
+    it.
+
+    Raises:
+        ValidationError: When an invalid record is reached (batches yielded
+            before it are unaffected), or when *records* is empty, as for
+            :func:`encode_ndjson`.
+    """
+    items: list[dict[str, Any]] = []
+    lines: list[bytes] = []
+    size = 0
+    limit = batch_limit(batch_size)
+    i = -1
+    for i, record in enumerate(records):
+        line = encode_record(record, i)
+        if items and size + len(line) + 1 > max_bytes:
+            yield items, _join_lines(lines)
+            items = []
+            lines = []
+            size = 0
+            limit = batch_limit(batch_size)
+        items.append(record)
+        lines.append(line)
+        size += len(line) + 1
+        if len(items) >= limit:
+            yield items, _join_lines(lines)
+            items = []
+            lines = []
+            size = 0
+            limit = batch_limit(batch_size)
+    if items:
+        yield items, _join_lines(lines)
+    elif i < 0:
+        raise ValidationError("records must be a non-empty list")
+
+
+def records_response(batch_result: BatchResult) -> UpsertRecordsResponse:
+    """Build an :class:`UpsertRecordsResponse` from a batched run."""
+    info = batch_result.response_info
+    headers: dict[str, str] = {}
+    if info is not None:
+        if info.lsn_reconciled is not None:
+            headers["x-pinecone-lsn-reconciled"] = str(info.lsn_reconciled)
+        if info.lsn_committed is not None:
+            headers["x-pinecone-lsn-committed"] = str(info.lsn_committed)
+    return UpsertRecordsResponse(
+        record_count=batch_result.successful_item_count,
+        response_info=ResponseInfo(raw_headers=headers) if headers else None,
+        total_item_count=batch_result.total_item_count,
+        failed_item_count=batch_result.failed_item_count,
+        total_batch_count=batch_result.total_batch_count,
+        successful_batch_count=batch_result.successful_batch_count,
+        failed_batch_count=batch_result.failed_batch_count,
+        errors=batch_result.errors,
+    )
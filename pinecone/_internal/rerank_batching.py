@@ -0,0 +1,76 @@
+"""Sharding and top-n merging for ``Inference.rerank_many``."""
+
+from __future__ import annotations
+
+import heapq
+from typing import Any
+
+from pinecone.errors.exceptions import ResponseParsingError
+from pinecone.models.inference.rerank import RankedDocument, RerankResult, RerankUsage
+
+#: Documents per request when the model does not report ``max_batch_size``.
+DEFAULT_RERANK_BATCH_SIZE = 100
+
+
+class RerankMerger:
+    """Keeps the best-scored documents across the shards of a ``rerank_many`` call.
+
+    Shard results may be added in any order.  With *top_n* set, a min-heap
+    of at most *top_n* entries holds the running winners, so memory stays
+    bounded by *top_n* rather than by the number of documents.  Equal
+    scores rank the document that came first in the input higher, as a
+    single request would.
+    """
+
+    def __init__(self, top_n: int | None) -> None:
+        self._top_n = top_n
+        self._heap: list[tuple[float, int]] = []
+        self._model = ""
+        self._units = 0
+
+    def add(self, offset: int, count: int, result: RerankResult) -> None:
+        """Merge the result for the *count* documents starting at *offset*."""
+        self.record(result)
+        for ranked in result.data:
+            if not 0 <= ranked.index < count:
+                raise ResponseParsingError(
+                    f"rerank response index {ranked.index} is outside a shard of {count} documents"
+                )
+            entry = (ranked.score, -(offset + ranked.index))
+            if self._top_n is None or len(self._heap) < self._top_n:
+                heapq.heappush(self._heap, entry)
+            elif entry > self._heap[0]:
+                heapq.heapreplace(self._heap, entry)
+
+    def record(self, result: RerankResult) -> None:
+        """Count the usage of *result* without merging its documents."""
+        self._model = result.model
+        self._units += result.usage.rerank_units
+
+    def ranking(self) -> list[tuple[int, float]]:
+        """Return ``(index, score)`` pairs of the documents kept so far, best first."""
+        return [(-neg_index, score) for score, neg_index in sorted(self._heap, reverse=True)]
+
+    def result(
+        self,
+        ranking: list[tuple[int, float]],
+        documents: list[dict[str, Any]] | None,
+    ) -> RerankResult:
+        """Build the merged :class:`RerankResult` for *ranking*.
+
+        Documents are attached from *documents* (the normalized inputs)
+        rather than echoed back by the API, or left ``None`` when it is
+        ``None``.
+        """
+        return RerankResult(
+            model=self._model,
+            data=[
+                RankedDocument(
+                    index=index,
+                    score=score,
+                    document=documents[index] if documents is not None else None,
+                )
+                for index, score in ranking
+            ],
+            usage=RerankUsage(rerank_units=self._units),
+        )
@@ -0,0 +1,96 @@
+"""Byte-level framing of ``text/event-stream`` responses.
+
+Only ``data:`` lines are of interest to the streaming endpoints, each
+carrying one complete JSON payload.  The framer splits raw response bytes
+into those payloads without decoding every line to ``str`` first, so each
+payload can go straight to a ``msgspec`` decoder.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+
+_DONE = b"[DONE]"
+
+
+class SSEFramer:
+    """Incrementally extracts ``data:`` payloads from SSE bytes.
+
+    Feed response chunks as they arrive; payloads are returned once their
+    line is complete.  Comment, ``event:`` and blank lines are skipped, and
+    a ``data: [DONE]`` line sets :attr:`done` and discards everything after
+    it.  Lines may end in ``\\n``, ``\\r\\n`` or ``\\r``.
+    """
+
+    def __init__(self) -> None:
+        self._buffer = b""
+        self.done = False
+
+    def feed(self, data: bytes) -> list[bytes]:
+        """Return the payloads of the lines completed by *data*."""
+        if self.done:
+            return []
+        buffer = self._buffer + data if self._buffer else data
+        payloads: list[bytes] = []
+        start = 0
+        while (end := buffer.find(b"\n", start)) >= 0:
+            if self._add_line(buffer[start:end], payloads):
+                return payloads
+            start = end + 1
+        rest = buffer[start:]
+        if b"\r" in rest:
+            # A bare CR ends a line too. A CRLF split across chunks then only
+            # adds a blank line, which is skipped.
+            *lines, rest = rest.split(b"\r")
+            for line in lines:
+                if self._add_line(line, payloads):
+                    return payloads
+        self._buffer = rest
+        return payloads
+
+    def flush(self) -> list[bytes]:
+        """Return the payload of a final line that has no line ending."""
+        payloads: list[bytes] = []
+        if not self.done and self._buffer:
+            self._add_line(self._buffer, payloads)
+        self._buffer = b""
+        return payloads
+
+    def _add_line(self, line: bytes, payloads: list[bytes]) -> bool:
+        """Append the payload of *line* (if any); return ``True`` at ``[DONE]``."""
+        for part in line.split(b"\r") if b"\r" in line else (line,):
+            if not part.startswith(b"data:"):
+                continue
+            payload = part[5:].lstrip()
+            if payload == _DONE:
+                self.done = True
+                self._buffer = b""
+                return True
+            if payload:
+                payloads.append(payload)
+        return False
+
+
+def iter_sse_data(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Yield the ``data:`` payloads of an SSE byte stream, stopping at ``[DONE]``."""
+    framer = SSEFramer()
+    for chunk in chunks:
+        yield from framer.feed(chunk)
+        if framer.done:
+            return
+    yield from framer.flush()
+
+
+async def aiter_sse_data(chunks: AsyncIterable[bytes]) -> AsyncIterator[bytes]:
+    """Async counterpart of :func:`iter_sse_data`."""
+    framer = SSEFramer()
+    async for chunk in chunks:
+        for payload in framer.feed(chunk):
+            yield payload
+        if framer.done:
+            return
+    for payload in framer.flush():
+        yield payload
@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import sys
+from array import array
+from collections.abc import Iterable
 from typing import Any
 
 from pinecone.errors.exceptions import PineconeTypeError, PineconeValueError
@@ -10,6 +13,13 @@ from pinecone.models.vectors.vector import Vector
 
 _RECOGNIZED_KEYS = {"id", "values", "sparse_values", "metadata"}
 
+# array.array typecodes accepted for compact sparse indices / values.
+_INDEX_TYPECODES = frozenset("bBhHiIlLqQ")
+_VALUE_TYPECODES = frozenset("fd")
+_MAX_SPARSE_INDEX = 2**32
+# Byte values with the sign bit clear, deleted to find negative elements.
+_NON_NEGATIVE_BYTES = bytes(range(0x80))
+
 
 def _from_tuple(item: tuple[Any, ...]) -> Vector:
     length = len(item)
@@ -125,6 +135,9 @@ def _parse_sparse(raw: Any) -> SparseValues:
             f"got {len(indices)} and {len(values)}"
         )
 
+    if _is_compact(indices) or _is_compact(values):
+        return _parse_compact_sparse(indices, values)
+
     if indices and not isinstance(indices[0], int):
         raise PineconeTypeError(
             f"sparse_values indices must be integers, got {type(indices[0]).__name__}"
@@ -144,6 +157,189 @@ def _parse_sparse(raw: Any) -> SparseValues:
     )
 
 
+def _is_compact(seq: Any) -> bool:
+    """Return True if *seq* is an ``array.array`` or a NumPy-style ndarray."""
+    return isinstance(seq, array) or hasattr(seq, "dtype")
+
+
+def _compact_kind(seq: Any) -> str:
+    """Classify a compact buffer as ``"int"``, ``"float"`` or ``""`` (unsupported)."""
+    if isinstance(seq, array):
+        if seq.typecode in _INDEX_TYPECODES:
+            return "int"
+        return "float" if seq.typecode in _VALUE_TYPECODES else ""
+    if hasattr(seq, "dtype"):
+        if getattr(seq, "ndim", 1) != 1:
+            return ""
+        kind = seq.dtype.kind
+        if kind in "iu":
+            return "int"
+        return "float" if kind == "f" else ""
+    return ""
+
+
+def _parse_compact_sparse(indices: Any, values: Any) -> SparseValues:
+    """Validate array-backed sparse components and keep them unboxed.
+
+    ``array.array`` and one-dimensional NumPy arrays are stored on the
+    resulting :class:`SparseValues` as-is; they are serialized directly from
+    their buffers on upsert. A plain list paired with a compact buffer is
+    accepted and left as a list.
+    """
+    index_kind = _compact_kind(indices) if _is_compact(indices) else "list"
+    if index_kind not in ("int", "list"):
+        raise PineconeTypeError(
+            f"sparse_values indices must be an integer array, got {_describe(indices)}"
+        )
+    value_kind = _compact_kind(values) if _is_compact(values) else "list"
+    if value_kind == "":
+        raise PineconeTypeError(f"sparse_values values must be floats, got {_describe(values)}")
+    if index_kind == "list" and indices and not isinstance(indices[0], int):
+        raise PineconeTypeError(
+            f"sparse_values indices must be integers, got {type(indices[0]).__name__}"
+        )
+    if value_kind == "list" and values and not isinstance(values[0], (int, float)):
+        raise PineconeTypeError(
+            f"sparse_values values must be floats, got {type(values[0]).__name__}"
+        )
+    if index_kind == "int":
+        check_sparse_indices(indices)
+    return SparseValues(indices, values)
+
+
+def check_sparse_indices(indices: Any) -> None:
+    """Raise if an integer buffer holds an index outside ``[0, 2**32)``.
+
+    Sparse indices are sent as ``uint32``; a wider or signed buffer would
+    otherwise wrap silently when packed. Buffers whose type cannot hold an
+    out-of-range value are not scanned, and neither kind of buffer is
+    scanned element by element in Python.
+    """
+    if isinstance(indices, array):
+        if (indices.typecode in "BHI" and indices.itemsize <= 4) or _array_in_range(indices):
+            return
+        low, high = min(indices), max(indices)
+    else:
+        dtype = indices.dtype
+        if (dtype.kind == "u" and dtype.itemsize <= 4) or not indices.size:
+            return
+        low, high = int(indices.min()), int(indices.max())
+    if low < 0 or high >= _MAX_SPARSE_INDEX:
+        bad = low if low < 0 else high
+        raise PineconeValueError(
+            f"sparse_values indices must be between 0 and {_MAX_SPARSE_INDEX - 1}, got {bad}"
+        )
+
+
+def _array_in_range(indices: array[int]) -> bool:
+    """Check a signed or wide integer array against ``[0, 2**32)`` on its raw bytes.
+
+    Every element is in range when its bytes above the low four are zero
+    (which also rules out negatives) or, for narrower signed types, when no
+    top byte has the sign bit set.
+    """
+    size = indices.itemsize
+    data = indices.tobytes()
+    little = sys.byteorder == "little"
+
+    def column(k: int) -> bytes:
+        """Return the *k*-th least significant byte of every element."""
+        return data[(k if little else size - 1 - k) :: size]
+
+    if size > 4:
+        return not b"".join(column(k) for k in range(4, size)).strip(b"\x00")
+    return not column(size - 1).translate(None, _NON_NEGATIVE_BYTES)
+
+
+def _describe(seq: Any) -> str:
+    if isinstance(seq, array):
+        return f"array({seq.typecode!r})"
+    return f"{type(seq).__name__}({getattr(seq, 'dtype', '?')})"
+
+
+def _ids_valid(ids: list[str]) -> bool:
+    """Check the ASCII / no-null rules for a whole batch of IDs in one pass."""
+    joined = "".join(ids)
+    return joined.isascii() and "\x00" not in joined
+
+
+def _build_tuples(items: list[Any]) -> list[Vector] | None:
+    """Convert homogeneous ``(id, values)`` / ``(id, values, metadata)`` tuples.
+
+    Returns ``None`` as soon as an item falls outside the fast shape so the
+    caller can fall back to per-item parsing (and its precise errors).
+    """
+    ids: list[str] = []
+    out: list[Vector] = []
+    for item in items:
+        if item.__class__ is not tuple:
+            return None
+        length = len(item)
+        if length == 2:
+            id_, values = item
+            metadata = None
+        elif length == 3:
+            id_, values, metadata = item
+            if metadata is not None and metadata.__class__ is not dict:
+                return None
+        else:
+            return None
+        if id_.__class__ is not str:
+            return None
+        if values.__class__ is not list:
+            try:
+                values = list(values)
+            except TypeError:
+                return None
+        if not values:
+            return None
+        ids.append(id_)
+        out.append(Vector(id_, values, None, metadata))
+    return out if _ids_valid(ids) else None
+
+
+def _build_dicts(items: list[Any]) -> list[Vector] | None:
+    """Convert homogeneous dense dicts (``id``, ``values`` and optional ``metadata``).
+
+    Dicts carrying ``sparse_values`` or any other key make this return
+    ``None`` so the caller falls back to per-item parsing.
+    """
+    ids: list[str] = []
+    out: list[Vector] = []
+    for item in items:
+        if item.__class__ is not dict:
+            return None
+        length = len(item)
+        try:
+            id_ = item["id"]
+            values = item["values"]
+            metadata = item["metadata"] if length == 3 else None
+        except KeyError:
+            return None
+        if length not in (2, 3) or id_.__class__ is not str:
+            return None
+        if metadata is not None and metadata.__class__ is not dict:
+            return None
+        if values.__class__ is not list:
+            try:
+                values = list(values)
+            except TypeError:
+                return None
+        if not values:
+            return None
+        ids.append(id_)
+        out.append(Vector(id_, values, None, metadata))
+    return out if _ids_valid(ids) else None
+
+
+def _build_vectors(items: list[Any]) -> list[Vector] | None:
+    """Pass through homogeneous ``Vector`` instances after a single validation pass."""
+    for item in items:
+        if item.__class__ is not Vector or (not item.values and item.sparse_values is None):
+            return None
+    return list(items)
+
+
 class VectorFactory:
     """Converts user-provided vector inputs into canonical ``Vector`` objects.
 
@@ -152,8 +348,48 @@ class VectorFactory:
     - ``Vector`` instance (passthrough)
     - ``tuple`` of 2 elements ``(id, values)`` or 3 elements ``(id, values, metadata)``
     - ``dict`` with keys drawn from ``{"id", "values", "sparse_values", "metadata"}``
+
+    Sparse ``indices`` / ``values`` may be given as lists, as ``array.array``
+    (e.g. ``array("I")`` / ``array("f")``), or as one-dimensional NumPy arrays.
+    Array-backed components are kept unboxed end to end.
     """
 
+    @staticmethod
+    def build_many(items: Iterable[Any]) -> list[Vector]:
+        """Convert a batch of user-provided vector inputs to ``Vector`` objects.
+
+        The input shape is detected once from the first element. Homogeneous
+        batches of tuples, dense dicts or ``Vector`` instances are converted by a
+        specialized loop that validates all IDs in a single pass; anything else
+        (mixed shapes, sparse dicts, invalid items) goes through :meth:`build`
+        item by item, so errors are identical to the per-item path.
+
+        Args:
+            items: Vector inputs in any format accepted by :meth:`build`.
+
+        Returns:
+            list[Vector]: The converted vectors, in input order.
+
+        Raises:
+            PineconeTypeError: If an item has an unsupported type.
+            PineconeValueError: If an item fails validation.
+        """
+        seq = items if isinstance(items, list) else list(items)
+        if not seq:
+            return []
+        first_type = seq[0].__class__
+        built: list[Vector] | None = None
+        if first_type is tuple:
+            built = _build_tuples(seq)
+        elif first_type is dict and "sparse_values" not in seq[0]:
+            built = _build_dicts(seq)
+        elif first_type is Vector:
+            built = _build_vectors(seq)
+        if built is not None:
+            return built
+        build = VectorFactory.build
+        return [build(item) for item in seq]
+
     @staticmethod
     def build(item: Any) -> Vector:
         """Convert a user-provided vector input to a ``Vector`` object."""
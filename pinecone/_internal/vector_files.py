@@ -0,0 +1,275 @@
+"""Memory-mapped readers for files of dense vectors.
+
+Supported formats:
+
+- ``.npy``: a two-dimensional NumPy array, memory-mapped with ``np.load``.
+- ``.fvecs`` / ``.bvecs``: the TEXMEX benchmark formats, where each row is
+  an ``int32`` dimension followed by that many ``float32`` (``fvecs``) or
+  ``uint8`` (``bvecs``) components.  Both are memory-mapped.
+- ``.h5`` / ``.hdf5``: a two-dimensional dataset of an HDF5 file (requires
+  ``h5py``), read one block of rows at a time.
+
+Rows are read in blocks and handed out as views, so a file much larger than
+memory can be streamed into the batched upsert path; float32 and float64
+rows are serialized straight from the mapped pages.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator, Sequence
+from itertools import islice
+from typing import Any, Literal
+
+from pinecone.errors.exceptions import PineconeTypeError, PineconeValueError
+
+VectorFileFormat = Literal["npy", "fvecs", "bvecs", "hdf5"]
+
+_SUFFIXES: dict[str, VectorFileFormat] = {
+    ".npy": "npy",
+    ".fvecs": "fvecs",
+    ".bvecs": "bvecs",
+    ".h5": "hdf5",
+    ".hdf5": "hdf5",
+}
+
+#: Rows read from the file at a time.
+_BLOCK_ROWS = 1024
+
+#: Dataset read from an HDF5 file when none is named (the ann-benchmarks layout).
+DEFAULT_HDF5_DATASET = "train"
+
+
+def _numpy() -> Any:
+    try:
+        import numpy as np
+    except ImportError:
+        raise RuntimeError(
+            "numpy is required for upsert_from_file. Install it with: pip install numpy"
+        ) from None
+    return np
+
+
+class VectorFile:
+    """Row-addressable view of a file of dense vectors.
+
+    Args:
+        path (str | os.PathLike): The file to read.
+        format (VectorFileFormat | None): File format. Inferred from the
+            suffix of *path* when ``None``.
+        dataset (str | None): Dataset to read from an HDF5 file. Defaults to
+            ``"train"``.
+
+    Raises:
+        :exc:`RuntimeError`: If ``numpy`` (or ``h5py`` for HDF5) is not installed.
+        :exc:`PineconeValueError`: If the format cannot be inferred, or the
+            file is not a two-dimensional array of vectors.
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        format: VectorFileFormat | None = None,
+        dataset: str | None = None,
+    ) -> None:
+        self.path = os.fspath(path)
+        if format is None:
+            suffix = os.path.splitext(self.path)[1].lower()
+            if suffix not in _SUFFIXES:
+                raise PineconeValueError(
+                    f"Cannot infer the format of {self.path!r}; pass format= as one of "
+                    f"{sorted(set(_SUFFIXES.values()))}"
+                )
+            format = _SUFFIXES[suffix]
+        self.format: VectorFileFormat = format
+        self._np = _numpy()
+        self._file: Any = None
+        self._dims: Any = None
+        if format == "npy":
+            self._rows = self._np.load(self.path, mmap_mode="r")
+        elif format in ("fvecs", "bvecs"):
+            self._rows = self._map_vecs(format)
+        elif format == "hdf5":
+            self._rows = self._open_hdf5(dataset or DEFAULT_HDF5_DATASET)
+        else:
+            raise PineconeValueError(
+                f"format must be one of {sorted(set(_SUFFIXES.values()))}, got {format!r}"
+            )
+        shape = tuple(self._rows.shape)
+        if len(shape) != 2 or shape[1] == 0:
+            self.close()
+            raise PineconeValueError(
+                f"{self.path!r} must hold a two-dimensional array of vectors, got shape {shape}"
+            )
+
+    def _map_vecs(self, format: str) -> Any:
+        np = self._np
+        width = 4 if format == "fvecs" else 1
+        size = os.path.getsize(self.path)
+        if size == 0:
+            return np.empty((0, 1), dtype=np.float32)
+        dimension = int(np.fromfile(self.path, dtype="<i4", count=1)[0])
+        row_bytes = 4 + width * dimension
+        if dimension <= 0 or size % row_bytes:
+            raise PineconeValueError(f"{self.path!r} is not a valid .{format} file")
+        count = size // row_bytes
+        if format == "fvecs":
+            words = np.memmap(self.path, dtype="<f4", mode="r", shape=(count, dimension + 1))
+            self._dims = words.view("<i4")[:, 0]
+            return words[:, 1:]
+        raw = np.memmap(self.path, dtype=np.uint8, mode="r", shape=(count, row_bytes))
+        self._dims = raw[:, :4]
+        return raw[:, 4:]
+
+    def _open_hdf5(self, dataset: str) -> Any:
+        try:
+            import h5py  # type: ignore[import-not-found]
+        except ImportError:
+            raise RuntimeError(
+                "h5py is required to read HDF5 files. Install it with: pip install h5py"
+            ) from None
+        self._file = h5py.File(self.path, "r")
+        if dataset not in self._file:
+            self.close()
+            raise PineconeValueError(f"{self.path!r} has no dataset {dataset!r}")
+        return self._file[dataset]
+
+    def __len__(self) -> int:
+        return int(self._rows.shape[0])
+
+    @property
+    def dimension(self) -> int:
+        """Number of components in each vector."""
+        return int(self._rows.shape[1])
+
+    def read(self, start: int, stop: int) -> Any:
+        """Return rows ``[start, stop)`` as a two-dimensional float array.
+
+        Float32 and float64 rows of memory-mapped files are returned as views
+        of the mapped pages; other types are converted to float32.
+
+        Raises:
+            :exc:`PineconeValueError`: If a ``.fvecs``/``.bvecs`` row records
+                a different dimension than the first row.
+        """
+        np = self._np
+        block = self._rows[start:stop]
+        if self._dims is not None:
+            dims = self._dims[start:stop]
+            if self.format == "bvecs":
+                dims = np.ascontiguousarray(dims).view("<i4")[:, 0]
+            bad = np.flatnonzero(dims != self.dimension)
+            if bad.size:
+                row = start + int(bad[0])
+                raise PineconeValueError(
+                    f"Row {row} of {self.path!r} has dimension {int(dims[bad[0]])}, "
+                    f"expected {self.dimension}"
+                )
+        if block.dtype == np.float32 or block.dtype == np.float64:
+            return block if block.dtype.isnative else block.astype(block.dtype.newbyteorder("="))
+        return block.astype(np.float32)
+
+    def close(self) -> None:
+        """Release the mapping or file handle. Safe to call more than once."""
+        self._rows = self._dims = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> VectorFile:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+def resolve_row_range(total: int, start: int, stop: int | None) -> tuple[int, int]:
+    """Clamp ``[start, stop)`` to a file of *total* rows.
+
+    Raises:
+        :exc:`PineconeValueError`: If *start* or *stop* is negative or *stop*
+            is before *start*.
+    """
+    if start < 0:
+        raise PineconeValueError(f"start must be non-negative, got {start}")
+    if stop is None:
+        stop = total
+    if stop < start:
+        raise PineconeValueError(f"stop ({stop}) must not be less than start ({start})")
+    return min(start, total), min(stop, total)
+
+
+def _check_id(id_: str) -> str:
+    """Return *id_* if it passes the checks ``VectorFactory`` applies to vector IDs."""
+    if not id_:
+        raise PineconeValueError("Vector ID must not be empty")
+    if not id_.isascii():
+        raise PineconeValueError(f"Vector ID must contain only ASCII characters, got: {id_!r}")
+    if "\x00" in id_:
+        raise PineconeValueError(f"Vector ID must not contain null characters, got: {id_!r}")
+    return id_
+
+
+def iter_ids(
+    ids: str | os.PathLike[str] | Sequence[Any] | Any | None, start: int, stop: int
+) -> Iterator[str]:
+    """Yield the IDs of rows ``[start, stop)`` from an ID source.
+
+    *ids* is ``None`` (the row number), a ``range`` or other sequence (the
+    element at the row number, including NumPy arrays of integers, strings or
+    bytes), or the path of a text file with one ID per line.
+
+    Raises:
+        :exc:`PineconeValueError`: If the source has fewer IDs than rows, or
+            an ID is empty or contains non-ASCII or null characters.
+        :exc:`PineconeTypeError`: If *ids* is not a supported source.
+    """
+    count = stop - start
+    if ids is None:
+        yield from map(str, range(start, stop))
+        return
+    if isinstance(ids, (str, os.PathLike)):
+        path = os.fspath(ids)
+        with open(path, encoding="utf-8") as f:
+            produced = 0
+            for line in islice(f, start, stop):
+                yield _check_id(line.rstrip("\r\n"))
+                produced += 1
+        if produced < count:
+            raise PineconeValueError(
+                f"ID file {path!r} has {start + produced} lines; rows up to {stop} need an ID"
+            )
+        return
+    if not hasattr(ids, "__len__") or not hasattr(ids, "__getitem__"):
+        raise PineconeTypeError(
+            f"ids must be a path, a sequence or an array, got {type(ids).__name__}"
+        )
+    if len(ids) < stop:
+        raise PineconeValueError(f"ids has {len(ids)} entries; rows up to {stop} need an ID")
+    chunk = ids[start:stop]
+    if hasattr(chunk, "tolist"):
+        chunk = chunk.tolist()
+    for id_ in chunk:
+        yield _check_id(id_.decode() if isinstance(id_, bytes) else str(id_))
+
+
+def iter_file_vectors(
+    file: VectorFile,
+    ids: str | os.PathLike[str] | Sequence[Any] | Any | None,
+    *,
+    start: int,
+    stop: int,
+    as_lists: bool = False,
+) -> Iterator[dict[str, Any]]:
+    """Yield ``{"id": ..., "values": ...}`` for rows ``[start, stop)`` of *file*.
+
+    Values are one-dimensional views of the file's rows, or Python lists
+    when *as_lists* is true (for transports that cannot read arrays).
+    """
+    id_iter = iter_ids(ids, start, stop)
+    for block_start in range(start, stop, _BLOCK_ROWS):
+        block = file.read(block_start, min(stop, block_start + _BLOCK_ROWS))
+        rows = block.tolist() if as_lists else block
+        for values in rows:
+            yield {"id": next(id_iter), "values": values}
@@ -0,0 +1,214 @@
+"""Per-namespace write buffer shared by the sync and async buffered writers.
+
+The buffer holds pending upserts and deletes keyed by vector ID so that
+repeated writes to the same ID inside one flush window collapse into a
+single operation.  It does no locking and no I/O; the writers own both.
+"""
+
+from __future__ import annotations
+
+import time
+from collections.abc import Iterable, Iterator
+from typing import Any
+
+from pinecone._internal.batching import MAX_REQUEST_BYTES
+from pinecone._internal.data_plane_helpers import _vector_to_dict
+from pinecone._internal.http_client import _encode_json
+from pinecone._internal.validation import require_positive
+from pinecone.errors.exceptions import PineconeTypeError, ValidationError
+from pinecone.models.vectors.vector import Vector
+
+#: Maximum number of IDs accepted by a single delete request.
+MAX_DELETE_IDS = 1000
+
+#: Approximate JSON overhead per delete ID (quotes and separator).
+_DELETE_ID_OVERHEAD = 3
+
+
+def validate_writer_params(
+    batch_size: int,
+    max_bytes: int,
+    flush_interval: float,
+    max_pending: int,
+) -> None:
+    """Raise ``ValidationError`` for invalid buffered writer thresholds."""
+    require_positive("batch_size", batch_size)
+    require_positive("max_bytes", max_bytes)
+    require_positive("max_pending", max_pending)
+    if max_bytes > MAX_REQUEST_BYTES:
+        raise ValidationError(f"max_bytes must be at most {MAX_REQUEST_BYTES}, got {max_bytes}")
+    if flush_interval <= 0:
+        raise ValidationError(f"flush_interval must be positive, got {flush_interval}")
+
+
+def validate_delete_ids(ids: Iterable[str]) -> list[str]:
+    """Return *ids* as a list after checking each is a non-empty string.
+
+    Raises:
+        :exc:`PineconeTypeError`: If *ids* is a single string or holds a
+            non-string.
+        :exc:`ValidationError`: If an ID is empty.
+    """
+    if isinstance(ids, str):
+        raise PineconeTypeError("ids must be an iterable of strings, not a single string")
+    checked = list(ids)
+    for id_ in checked:
+        if not isinstance(id_, str):
+            raise PineconeTypeError(f"Vector ID must be a string, got {type(id_).__name__}")
+        if not id_:
+            raise ValidationError("Vector ID must not be empty")
+    return checked
+
+
+class _NamespaceBuffer:
+    __slots__ = ("deletes", "upsert_sizes", "upserts")
+
+    def __init__(self) -> None:
+        self.upserts: dict[str, Vector] = {}
+        self.upsert_sizes: dict[str, int] = {}
+        self.deletes: dict[str, None] = {}
+
+
+class PendingWrites:
+    """Writes drained from a :class:`WriteBuffer` for one namespace."""
+
+    __slots__ = ("deletes", "namespace", "upsert_sizes", "upserts")
+
+    def __init__(
+        self,
+        namespace: str,
+        upserts: list[Vector],
+        upsert_sizes: list[int],
+        deletes: list[str],
+    ) -> None:
+        self.namespace = namespace
+        self.upserts = upserts
+        self.upsert_sizes = upsert_sizes
+        self.deletes = deletes
+
+
+class WriteBuffer:
+    """Coalescing accumulator of pending upserts and deletes.
+
+    An ID is pending in at most one of the upsert or delete sets of its
+    namespace: a later upsert replaces an earlier upsert or cancels an
+    earlier delete (the upsert overwrites the vector anyway), and a later
+    delete discards an earlier upsert.  The order in which a drained
+    namespace's deletes and upserts are sent therefore does not matter.
+    """
+
+    def __init__(self) -> None:
+        self._namespaces: dict[str, _NamespaceBuffer] = {}
+        self.pending_count = 0
+        self.pending_bytes = 0
+        self.oldest: float | None = None
+
+    def __len__(self) -> int:
+        return self.pending_count
+
+    def _namespace(self, namespace: str) -> _NamespaceBuffer:
+        buf = self._namespaces.get(namespace)
+        if buf is None:
+            buf = self._namespaces[namespace] = _NamespaceBuffer()
+        if self.oldest is None:
+            self.oldest = time.monotonic()
+        return buf
+
+    def add_upsert(self, namespace: str, vector: Vector) -> None:
+        """Buffer *vector* for upsert, replacing any pending write to its ID."""
+        size = len(_encode_json(_vector_to_dict(vector))) + 1
+        buf = self._namespace(namespace)
+        id_ = vector.id
+        previous = buf.upsert_sizes.get(id_)
+        if previous is not None:
+            self.pending_bytes -= previous
+            self.pending_count -= 1
+        elif id_ in buf.deletes:
+            del buf.deletes[id_]
+            self.pending_bytes -= len(id_) + _DELETE_ID_OVERHEAD
+            self.pending_count -= 1
+        buf.upserts[id_] = vector
+        buf.upsert_sizes[id_] = size
+        self.pending_bytes += size
+        self.pending_count += 1
+
+    def add_delete(self, namespace: str, id_: str) -> None:
+        """Buffer a delete of *id_*, discarding any pending upsert of it."""
+        buf = self._namespace(namespace)
+        if id_ in buf.deletes:
+            return
+        previous = buf.upsert_sizes.pop(id_, None)
+        if previous is not None:
+            del buf.upserts[id_]
+            self.pending_bytes -= previous
+            self.pending_count -= 1
+        buf.deletes[id_] = None
+        self.pending_bytes += len(id_) + _DELETE_ID_OVERHEAD
+        self.pending_count += 1
+
+    def is_due(self, batch_size: int, max_bytes: int, flush_interval: float) -> bool:
+        """Return whether a size, byte or age threshold has been reached."""
+        if self.pending_count == 0:
+            return False
+        if self.pending_count >= batch_size or self.pending_bytes >= max_bytes:
+            return True
+        return self.seconds_until_due(flush_interval) == 0.0
+
+    def seconds_until_due(self, flush_interval: float) -> float | None:
+        """Return how long until the oldest pending write hits *flush_interval*."""
+        if self.oldest is None:
+            return None
+        return max(0.0, self.oldest + flush_interval - time.monotonic())
+
+    def drain(self) -> list[PendingWrites]:
+        """Remove and return all pending writes, grouped by namespace."""
+        drained = [
+            PendingWrites(
+                namespace,
+                list(buf.upserts.values()),
+                list(buf.upsert_sizes.values()),
+                list(buf.deletes),
+            )
+            for namespace, buf in self._namespaces.items()
+            if buf.upserts or buf.deletes
+        ]
+        self._namespaces = {}
+        self.pending_count = 0
+        self.pending_bytes = 0
+        self.oldest = None
+        return drained
+
+
+def split_upserts(
+    vectors: list[Vector],
+    sizes: list[int],
+    batch_size: int,
+    max_bytes: int,
+) -> Iterator[list[Vector]]:
+    """Yield runs of *vectors* bounded by *batch_size* items and *max_bytes*.
+
+    A single vector larger than *max_bytes* is yielded on its own so that the
+    server, not the client, reports it as oversized.
+    """
+    start = 0
+    total = 0
+    for i, size in enumerate(sizes):
+        if i > start and (i - start >= batch_size or total + size > max_bytes):
+            yield vectors[start:i]
+            start = i
+            total = 0
+        total += size
+    if start < len(vectors):
+        yield vectors[start:]
+
+
+def split_deletes(ids: list[str], batch_size: int) -> Iterator[list[str]]:
+    """Yield runs of *ids* of at most *batch_size* (capped at 1000) elements."""
+    batch_size = min(batch_size, MAX_DELETE_IDS)
+    for i in range(0, len(ids), batch_size):
+        yield ids[i : i + batch_size]
+
+
+def failed_items(vectors: list[Vector]) -> list[dict[str, Any]]:
+    """Return *vectors* in the wire format recorded on a write error."""
+    return [_vector_to_dict(v) for v in vectors]
@@ -7,7 +7,7 @@ import io
 import logging
 import os
 import time
-from collections.abc import AsyncIterator, Mapping, Sequence
+from collections.abc import AsyncIterator, Iterable, Mapping, Sequence
 from typing import IO, TYPE_CHECKING, Any
 
 import anyio
@@ -15,13 +15,28 @@ import msgspec
 import msgspec.structs
 import orjson
 
+from pinecone._internal import poll_targets
 from pinecone._internal.adapters.assistants_adapter import AssistantsAdapter
+from pinecone._internal.alignment_eval import async_evaluate_stream
 from pinecone._internal.constants import (
     ASSISTANT_API_VERSION,
     ASSISTANT_API_VERSION_2026_04,
     ASSISTANT_EVALUATION_BASE_URL,
     DEFAULT_BASE_URL,
 )
+from pinecone._internal.context_merge import ContextMerger, context_body, context_pairs
+from pinecone._internal.fanout import async_fan_out
+from pinecone._internal.file_sync import (
+    UploadPlan,
+    directory_files,
+    files_by_hash,
+    processing_results,
+    resolve_paths,
+    stale_files,
+)
+from pinecone._internal.polling import AsyncPoller
+from pinecone._internal.sse import aiter_sse_data
+from pinecone._internal.validation import require_in_range, require_positive
 from pinecone.async_client._assistants_legacy import AsyncAssistantsLegacyNamespaceMixin
 from pinecone.errors.exceptions import (
     NotFoundError,
@@ -30,9 +45,10 @@ from pinecone.errors.exceptions import (
     PineconeValueError,
 )
 from pinecone.models.assistant.chat import ChatCompletionResponse, ChatResponse
-from pinecone.models.assistant.context import ContextResponse
-from pinecone.models.assistant.evaluation import AlignmentResult
+from pinecone.models.assistant.context import ContextResponse, MultiContextResponse
+from pinecone.models.assistant.evaluation import AlignmentEvaluation, AlignmentResult
 from pinecone.models.assistant.file_model import AssistantFileModel
+from pinecone.models.assistant.file_upload import FileUploadError, FileUploadResult
 from pinecone.models.assistant.list import ListAssistantsResponse, ListFilesResponse
 from pinecone.models.assistant.message import Message
 from pinecone.models.assistant.model import AssistantModel
@@ -46,7 +62,7 @@ from pinecone.models.assistant.streaming import (
 from pinecone.models.pagination import AsyncPaginator, Page
 
 if TYPE_CHECKING:
-    from pinecone._internal.config import PineconeConfig
+    from pinecone._internal.config import BatchRetryPolicy, PineconeConfig
     from pinecone._internal.http_client import AsyncHTTPClient
 
 logger = logging.getLogger(__name__)
@@ -122,6 +138,8 @@ class AsyncAssistants(AsyncAssistantsLegacyNamespaceMixin):
             retry_config=config.retry_config,
         )
         self._eval_http = _AsyncHTTPClient(eval_config, ASSISTANT_API_VERSION)
+        # Waits on files uploaded by upload_files and sync_directory.
+        self._poller = AsyncPoller()
 
     async def close(self) -> None:
         """Close the underlying HTTP client and any cached data-plane clients."""
@@ -795,6 +813,264 @@ class AsyncAssistants(AsyncAssistantsLegacyNamespaceMixin):
                     )
             await asyncio.sleep(_UPLOAD_POLL_INTERVAL_SECONDS)
 
+    async def upload_files(
+        self,
+        *,
+        assistant_name: str,
+        paths: Iterable[str | os.PathLike[str]],
+        metadata: dict[str, Any] | None = None,
+        multimodal: bool | None = None,
+        skip_existing: bool = True,
+        max_concurrency: int = 4,
+        timeout: float | None = None,
+        show_progress: bool = False,
+    ) -> FileUploadResult:
+        """Upload many local files to an assistant concurrently.
+
+        Each file's SHA-256 digest is stored in its metadata under
+        ``"content_sha256"``. With *skip_existing*, the assistant's files are
+        listed once up front and any local file whose digest matches an
+        existing file is skipped, as are repeats of the same content within
+        *paths*. Up to *max_concurrency* uploads run at a time, after which
+        the processing of all uploaded files is tracked with one listing of
+        the assistant's files per round, polled with exponential backoff and
+        jitter, instead of describing each file.
+
+        A file that fails to upload or to process is reported in
+        :attr:`FileUploadResult.errors` and does not stop the others.
+
+        Args:
+            assistant_name: Name of the target assistant.
+            paths: Local files to upload. Each is uploaded under its base name.
+            metadata: Optional metadata added to every uploaded file.
+            multimodal: Whether to enable multimodal processing for PDFs.
+            skip_existing: Skip files whose content is already in the
+                assistant. Defaults to ``True``.
+            max_concurrency: Uploads in flight at once (1-64). Defaults to 4.
+            timeout: Seconds to wait for processing to complete. ``None``
+                (default) waits indefinitely. Use ``-1`` to return right
+                after uploading.
+            show_progress: Display a tqdm progress bar over uploads when
+                tqdm is installed. Defaults to ``False``.
+
+        Returns:
+            :class:`FileUploadResult` with the uploaded, skipped and failed
+            files.
+
+        Raises:
+            :exc:`PineconeValueError`: If *paths* is empty, a path is not a
+                file, or *max_concurrency* is out of range.
+            :exc:`PineconeTimeoutError`: If processing does not complete
+                before *timeout*.
+            :exc:`ApiError`: If listing the existing files fails.
+
+        Examples:
+            .. code-block:: python
+
+                result = await pc.assistants.upload_files(
+                    assistant_name="research-assistant",
+                    paths=["/data/q1.pdf", "/data/q2.pdf"],
+                    max_concurrency=8,
+                )
+                print(len(result.uploaded), len(result.skipped), result.errors)
+        """
+        require_in_range("max_concurrency", max_concurrency, 1, 64)
+        resolved = await anyio.to_thread.run_sync(resolve_paths, list(paths))
+        existing: dict[str, AssistantFileModel] = {}
+        if skip_existing:
+            existing = files_by_hash(await self.list_files(assistant_name=assistant_name).to_list())
+        plan = await anyio.to_thread.run_sync(UploadPlan, resolved, existing, metadata)
+        return await self._upload_plan(
+            assistant_name, plan, multimodal, max_concurrency, timeout, show_progress
+        )
+
+    async def sync_directory(
+        self,
+        *,
+        assistant_name: str,
+        directory: str | os.PathLike[str],
+        pattern: str = "**/*",
+        metadata: dict[str, Any] | None = None,
+        multimodal: bool | None = None,
+        delete_missing: bool = False,
+        max_concurrency: int = 4,
+        timeout: float | None = None,
+        show_progress: bool = False,
+    ) -> FileUploadResult:
+        """Make an assistant's files match the contents of a local directory.
+
+        Uploads the files under *directory* that match *pattern* as
+        :meth:`upload_files` does, skipping files whose content is already
+        in the assistant. With *delete_missing*, files previously uploaded
+        by ``upload_files`` or ``sync_directory`` (those carrying a
+        ``"content_sha256"`` metadata entry) whose content is no longer in
+        the directory are deleted, so edited files replace their old
+        versions. This covers every such file in the assistant, including
+        ones uploaded from other directories. Files uploaded by other means
+        are never deleted, and nothing is deleted when any upload fails, so
+        a failed replacement never removes the version it was meant to
+        replace.
+
+        Args:
+            assistant_name: Name of the target assistant.
+            directory: Local directory to sync.
+            pattern: Glob pattern relative to *directory*. Defaults to
+                ``"**/*"`` (every file, recursively).
+            metadata: Optional metadata added to every uploaded file.
+            multimodal: Whether to enable multimodal processing for PDFs.
+            delete_missing: Delete previously synced files whose content is
+                not in the directory, unless an upload failed. Defaults to
+                ``False``.
+            max_concurrency: Uploads in flight at once (1-64). Defaults to 4.
+            timeout: Seconds to wait for processing to complete. ``None``
+                (default) waits indefinitely. Use ``-1`` to return right
+                after uploading.
+            show_progress: Display a tqdm progress bar over uploads when
+                tqdm is installed. Defaults to ``False``.
+
+        Returns:
+            :class:`FileUploadResult` with the uploaded, skipped, deleted and
+            failed files.
+
+        Raises:
+            :exc:`PineconeValueError`: If *directory* does not exist or
+                *max_concurrency* is out of range.
+            :exc:`PineconeTimeoutError`: If processing does not complete
+                before *timeout*.
+            :exc:`ApiError`: If listing or deleting files fails.
+
+        Examples:
+            .. code-block:: python
+
+                result = await pc.assistants.sync_directory(
+                    assistant_name="research-assistant",
+                    directory="/data/knowledge-base",
+                    pattern="**/*.pdf",
+                    delete_missing=True,
+                )
+        """
+        require_in_range("max_concurrency", max_concurrency, 1, 64)
+        paths = await anyio.to_thread.run_sync(directory_files, directory, pattern)
+        listing = await self.list_files(assistant_name=assistant_name).to_list()
+        plan = await anyio.to_thread.run_sync(UploadPlan, paths, files_by_hash(listing), metadata)
+        result = await self._upload_plan(
+            assistant_name, plan, multimodal, max_concurrency, timeout, show_progress
+        )
+        if delete_missing and result.errors:
+            logger.warning(
+                "Not deleting stale files from assistant %r: %d files failed to upload",
+                assistant_name,
+                len(result.errors),
+            )
+        elif delete_missing:
+            result.deleted = stale_files(listing, plan.hashes)
+            for file in result.deleted:
+                await self.delete_file(assistant_name=assistant_name, file_id=file.id, timeout=-1)
+        return result
+
+    async def _upload_plan(
+        self,
+        assistant_name: str,
+        plan: UploadPlan,
+        multimodal: bool | None,
+        max_concurrency: int,
+        timeout: float | None,
+        show_progress: bool,
+    ) -> FileUploadResult:
+        data_http = await self._data_plane_http(assistant_name)
+
+        async def _upload(item: tuple[str, dict[str, Any]]) -> AssistantFileModel | Exception:
+            path, file_metadata = item
+            try:
+                handle = io.BytesIO(await anyio.Path(path).read_bytes())
+                return await self._post_file(
+                    data_http,
+                    assistant_name,
+                    os.path.basename(path),
+                    handle,
+                    file_metadata,
+                    multimodal,
+                )
+            except (PineconeError, OSError) as exc:
+                return exc
+
+        logger.info(
+            "Uploading %d files to assistant %r (%d unchanged)",
+            len(plan.uploads),
+            assistant_name,
+            len(plan.skipped),
+        )
+        uploaded: dict[str, str] = {}
+        models: list[AssistantFileModel] = []
+        errors: list[FileUploadError] = []
+        async for position, outcome in async_fan_out(
+            _upload,
+            plan.uploads,
+            max_concurrency=max_concurrency,
+            show_progress=show_progress,
+            desc="Uploading",
+            total=len(plan.uploads),
+        ):
+            path = plan.uploads[position][0]
+            if isinstance(outcome, Exception):
+                errors.append(FileUploadError(path=path, error=outcome, error_message=str(outcome)))
+            else:
+                uploaded[outcome.id] = path
+                models.append(outcome)
+
+        if timeout == -1 or not uploaded:
+            return FileUploadResult(uploaded=models, skipped=plan.skipped, errors=errors)
+
+        async def fetch() -> dict[str, AssistantFileModel]:
+            files = self.list_files(assistant_name=assistant_name)
+            return {file.id: file async for file in files}
+
+        futures = [
+            self._poller.watch(
+                fetch,
+                poll_targets.file_processed(file_id),
+                group=("files", assistant_name),
+                timeout=timeout,
+                label=f"File '{file_id}'",
+            )
+            for file_id in uploaded
+        ]
+        outcomes = await asyncio.gather(*futures, return_exceptions=True)
+        processed, failures = processing_results(uploaded, outcomes, timeout)
+        return FileUploadResult(uploaded=processed, skipped=plan.skipped, errors=errors + failures)
+
+    async def _post_file(
+        self,
+        data_http: AsyncHTTPClient,
+        assistant_name: str,
+        upload_name: str,
+        handle: IO[bytes],
+        metadata: dict[str, Any] | None,
+        multimodal: bool | None,
+    ) -> AssistantFileModel:
+        """Upload one file with ``POST /files/{assistant_name}`` without waiting."""
+        import json as _json
+
+        params: dict[str, str] = {}
+        if metadata is not None:
+            params["metadata"] = _json.dumps(metadata)
+        if multimodal is not None:
+            params["multimodal"] = str(multimodal).lower()
+        logger.info("Uploading file %r to assistant %r", upload_name, assistant_name)
+        response = await data_http.post(
+            f"/files/{assistant_name}",
+            files={"file": (upload_name, handle)},
+            params=params,
+        )
+        file_model = self._adapter.to_file(response.content)
+        logger.debug(
+            "Uploaded file %r (id=%s, status=%s)",
+            upload_name,
+            file_model.id,
+            file_model.status,
+        )
+        return file_model
+
     async def _list_files_http(self, assistant_name: str) -> AsyncHTTPClient:
         """Return an AsyncHTTPClient for the assistant's data-plane host using v202604."""
         from pinecone._internal.config import PineconeConfig as _PineconeConfig
@@ -955,12 +1231,6 @@ class AsyncAssistants(AsyncAssistantsLegacyNamespaceMixin):
 
         data_http = await self._data_plane_http(assistant_name)
 
-        params: dict[str, str] = {}
-        if metadata is not None:
-            params["metadata"] = _json.dumps(metadata)
-        if multimodal is not None:
-            params["multimodal"] = str(multimodal).lower()
-
         if file_id is not None:
             # Use the 2026-04 upsert endpoint: PUT /files/{assistant_name}/{file_id}
             upsert_http = await self._upsert_http(assistant_name)
@@ -991,18 +1261,8 @@ class AsyncAssistants(AsyncAssistantsLegacyNamespaceMixin):
             )
             return await self.describe_file(assistant_name=assistant_name, file_id=file_id)
 
-        logger.info("Uploading file %r to assistant %r", upload_name, assistant_name)
-        response = await data_http.post(
-            f"/files/{assistant_name}",
-            files={"file": (upload_name, handle)},
-            params=params,
-        )
-        file_model = self._adapter.to_file(response.content)
-        logger.debug(
-            "Uploaded file %r (id=%s, status=%s)",
-            upload_name,
-            file_model.id,
-            file_model.status,
+        file_model = await self._post_file(
+            data_http, assistant_name, upload_name, handle, metadata, multimodal
         )
 
         if timeout == -1:
@@ -1133,45 +1393,112 @@ class AsyncAssistants(AsyncAssistantsLegacyNamespaceMixin):
                 for snippet in response.snippets:
                     print(snippet.content)
         """
-        query_truthy = query is not None and query != ""
-        messages_truthy = messages is not None and len(messages) > 0
+        body = context_body(
+            query=query,
+            messages=messages,
+            filter=filter,
+            top_k=top_k,
+            snippet_size=snippet_size,
+            multimodal=multimodal,
+            include_binary_content=include_binary_content,
+        )
 
-        if query_truthy and messages_truthy:
-            raise PineconeValueError("Exactly one of query or messages must be provided, not both.")
-        if not query_truthy and not messages_truthy:
-            raise PineconeValueError("Exactly one of query or messages must be provided.")
+        http = await self._data_plane_http(assistant_name)
+        response = await http.post(f"/chat/{assistant_name}/context", json=body)
+        return self._adapter.to_context_response(response.content)
 
-        body: dict[str, Any] = {}
+    async def context_many(
+        self,
+        *,
+        assistant_names: str | Sequence[str],
+        queries: str | Sequence[str],
+        filter: dict[str, Any] | None = None,
+        top_k: int | None = None,
+        snippet_size: int | None = None,
+        multimodal: bool | None = None,
+        include_binary_content: bool | None = None,
+        top_n: int | None = None,
+        max_concurrency: int = 8,
+    ) -> MultiContextResponse:
+        """Retrieve context from several assistants and queries concurrently.
 
-        if query_truthy:
-            body["query"] = query
-        else:
-            if messages is None:
-                raise PineconeValueError("Exactly one of query or messages must be provided.")
-            parsed: list[Message] = [
-                m if isinstance(m, Message) else Message.from_dict(m) for m in messages
-            ]
-            body["messages"] = [{"role": m.role, "content": m.content} for m in parsed]
-
-        if top_k is not None and top_k < 0:
-            raise PineconeValueError("top_k must be a non-negative integer.")
-        if snippet_size is not None and snippet_size < 0:
-            raise PineconeValueError("snippet_size must be a non-negative integer.")
+        Sends one context request per ``(assistant, query)`` pair, up to
+        *max_concurrency* at a time, so the latency is that of the slowest
+        request rather than the sum.  Snippets from all responses are merged
+        by score, highest first; snippets with identical content are kept
+        once, at their best score.
 
-        if filter is not None:
-            body["filter"] = filter
-        if top_k is not None:
-            body["top_k"] = top_k
-        if snippet_size is not None:
-            body["snippet_size"] = snippet_size
-        if multimodal is not None:
-            body["multimodal"] = multimodal
-        if include_binary_content is not None:
-            body["include_binary_content"] = include_binary_content
+        Args:
+            assistant_names: Assistant name or names to query.
+            queries: Query text or texts, each sent to every assistant.
+            filter: Metadata filter applied to every request. Omitted from
+                requests when ``None``.
+            top_k: Maximum snippets per request. Omitted when ``None``.
+            snippet_size: Maximum snippet size in tokens. Omitted when ``None``.
+            multimodal: Whether to include image-related context snippets.
+            include_binary_content: Whether image snippets include base64
+                image data.
+            top_n: Maximum number of merged snippets to return. ``None``
+                (default) returns every distinct snippet.
+            max_concurrency: Requests in flight at once (1-64). Defaults to 8.
 
-        http = await self._data_plane_http(assistant_name)
-        response = await http.post(f"/chat/{assistant_name}/context", json=body)
-        return self._adapter.to_context_response(response.content)
+        Returns:
+            :class:`MultiContextResponse` with the merged snippets, the
+            source of each snippet, and per-source and total usage.
+
+        Raises:
+            :exc:`PineconeValueError`: If *assistant_names* or *queries* is
+                empty, or an argument is out of range.
+            :exc:`ApiError`: If any request fails. Remaining requests are
+                cancelled.
+
+        Examples:
+            .. code-block:: python
+
+                response = await pc.assistants.context_many(
+                    assistant_names=["product-docs", "support-kb"],
+                    queries=["How do I rotate API keys?", "API key rotation"],
+                    top_n=10,
+                )
+                for snippet, origin in zip(response.snippets, response.origins):
+                    print(response.sources[origin].assistant_name, snippet.score)
+        """
+        require_in_range("max_concurrency", max_concurrency, 1, 64)
+        if top_n is not None:
+            require_positive("top_n", top_n)
+        pairs = context_pairs(assistant_names, queries)
+        bodies = [
+            context_body(
+                query=query,
+                messages=None,
+                filter=filter,
+                top_k=top_k,
+                snippet_size=snippet_size,
+                multimodal=multimodal,
+                include_binary_content=include_binary_content,
+            )
+            for _, query in pairs
+        ]
+        # Resolve each assistant's data-plane client once, before the
+        # context requests share them.
+        names = list(dict.fromkeys(name for name, _ in pairs))
+        clients: dict[str, AsyncHTTPClient] = {}
+        async for position, http in async_fan_out(
+            self._data_plane_http, names, max_concurrency=max_concurrency
+        ):
+            clients[names[position]] = http
+
+        async def _context(position: int) -> ContextResponse:
+            name = pairs[position][0]
+            response = await clients[name].post(f"/chat/{name}/context", json=bodies[position])
+            return self._adapter.to_context_response(response.content)
+
+        merger = ContextMerger(pairs)
+        async for position, response in async_fan_out(
+            _context, range(len(pairs)), max_concurrency=max_concurrency
+        ):
+            merger.add(position, response)
+        return merger.result(top_n)
 
     async def chat(
         self,
@@ -1305,7 +1632,7 @@ class AsyncAssistants(AsyncAssistantsLegacyNamespaceMixin):
         """Stream Pinecone-native chat chunks via SSE.
 
         POSTs to the given *url* with ``stream=True`` in the body, parses each
-        SSE line, and yields typed chunk objects dispatched by the ``type`` field.
+        SSE ``data:`` payload, and yields typed chunk objects dispatched by the ``type`` field.
 
         Args:
             data_http: AsyncHTTPClient targeting the assistant's data-plane host.
@@ -1326,21 +1653,12 @@ class AsyncAssistants(AsyncAssistantsLegacyNamespaceMixin):
             content=orjson.dumps(body),
             headers={"Content-Type": "application/json"},
         ) as response:
-            async for line in response.aiter_lines():
-                if not line:
-                    continue
-                if not line.startswith("data:"):
+            async for payload in aiter_sse_data(response.aiter_bytes()):
+                chunk = self._adapter.to_chat_stream_chunk(payload)
+                if chunk is None:
+                    logger.debug("Skipping unknown chunk: %.200r", payload)
                     continue
-                line = line[5:].lstrip()
-                if not line:
-                    continue
-                if line == "[DONE]":
-                    break
-                chunk_data: dict[str, Any] = orjson.loads(line)
-                try:
-                    yield msgspec.convert(chunk_data, ChatStreamChunk)
-                except msgspec.ValidationError:
-                    logger.debug("Skipping unknown chunk type: %s", chunk_data.get("type"))
+                yield chunk
 
     async def chat_completions(
         self,
@@ -1458,7 +1776,7 @@ class AsyncAssistants(AsyncAssistantsLegacyNamespaceMixin):
         """Stream OpenAI-compatible chat completion chunks via SSE.
 
         POSTs to the given *url* with ``stream=True`` in the body and yields
-        each SSE line parsed as a :class:`ChatCompletionStreamChunk`.
+        each SSE ``data:`` payload parsed as a :class:`ChatCompletionStreamChunk`.
 
         Args:
             data_http: AsyncHTTPClient targeting the assistant's data-plane host.
@@ -1477,17 +1795,8 @@ class AsyncAssistants(AsyncAssistantsLegacyNamespaceMixin):
             content=orjson.dumps(body),
             headers={"Content-Type": "application/json"},
         ) as response:
-            async for line in response.aiter_lines():
-                if not line:
-                    continue
-                if not line.startswith("data:"):
-                    continue
-                line = line[5:].lstrip()
-                if not line:
-                    continue
-                if line == "[DONE]":
-                    break
-                yield msgspec.convert(orjson.loads(line), ChatCompletionStreamChunk)
+            async for payload in aiter_sse_data(response.aiter_bytes()):
+                yield self._adapter.to_chat_completion_stream_chunk(payload)
 
     async def evaluate_alignment(
         self,
@@ -1536,6 +1845,86 @@ class AsyncAssistants(AsyncAssistantsLegacyNamespaceMixin):
         logger.debug("Alignment evaluation complete (alignment=%.3f)", result.scores.alignment)
         return result
 
+    def evaluate_alignment_many(
+        self,
+        data: Any,
+        *,
+        max_concurrency: int = 8,
+        retry_policy: BatchRetryPolicy | None = None,
+        results_path: str | os.PathLike[str] | None = None,
+        show_progress: bool = False,
+    ) -> AsyncIterator[AlignmentEvaluation]:
+        """Evaluate a dataset of answers against ground truth answers concurrently.
+
+        Runs :meth:`evaluate_alignment` for every item of *data*, up to
+        *max_concurrency* at a time, and yields each
+        :class:`AlignmentEvaluation` as soon as it finishes, in completion
+        order.  Transient failures (``429``, ``5xx``, timeouts and
+        connection errors) are retried with exponential backoff according
+        to *retry_policy*; a ``429`` also pauses new requests until its
+        backoff delay has passed.  Items that still fail are yielded with
+        ``error`` set instead of raising.
+
+        With *results_path*, every successful evaluation is appended to an
+        NDJSON file as it completes. Running again with the same file skips
+        the items it already records, so an interrupted run resumes where
+        it stopped; only the remaining items are yielded.
+
+        Args:
+            data: A DataFrame with ``question``, ``answer`` and
+                ``ground_truth_answer`` columns, or an iterable of mappings
+                with those keys or of ``(question, answer,
+                ground_truth_answer)`` tuples. Consumed lazily.
+            max_concurrency: Evaluations in flight at once (1-64). Defaults to 8.
+            retry_policy: Retry policy for failed evaluations. Defaults to
+                :class:`BatchRetryPolicy` with its default settings.
+            results_path: NDJSON file recording successful evaluations, used
+                to resume. ``None`` (default) keeps no record.
+            show_progress: Display a tqdm progress bar when tqdm is installed.
+                Defaults to ``False``.
+
+        Returns:
+            Async iterator of :class:`AlignmentEvaluation`, one per evaluated item.
+
+        Raises:
+            :exc:`PineconeValueError`: If *max_concurrency* is out of range,
+                an item is malformed, or *results_path* belongs to a
+                different dataset.
+
+        Examples:
+            .. code-block:: python
+
+                import pandas as pd
+
+                df = pd.read_parquet("eval-set.parquet")
+                scores = []
+                async for evaluation in pc.assistants.evaluate_alignment_many(
+                    df, max_concurrency=16, results_path="eval-results.ndjson"
+                ):
+                    if evaluation.ok:
+                        scores.append(evaluation.result.scores.alignment)
+                    else:
+                        print(evaluation.index, evaluation.error_message)
+        """
+        require_in_range("max_concurrency", max_concurrency, 1, 64)
+
+        async def _evaluate(
+            question: str, answer: str, ground_truth_answer: str
+        ) -> AlignmentResult:
+            return await self.evaluate_alignment(
+                question=question, answer=answer, ground_truth_answer=ground_truth_answer
+            )
+
+        return async_evaluate_stream(
+            _evaluate,
+            data,
+            max_concurrency=max_concurrency,
+            retry_policy=retry_policy,
+            results_path=results_path,
+            show_progress=show_progress,
+            total=len(data) if hasattr(data, "__len__") else None,
+        )
+
     async def _poll_until_ready(self, name: str, timeout: float | None) -> AssistantModel:
         """Poll ``GET /assistants/{name}`` until status is ``"Ready"`` or timeout."""
         start = time.monotonic()
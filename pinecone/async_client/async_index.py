@@ -5,30 +5,62 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
-from collections.abc import AsyncIterator, Mapping, Sequence
-from typing import TYPE_CHECKING, Any
+import time
+from collections.abc import AsyncIterator, Iterable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any, Literal
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+
     import pandas as pd  # type: ignore[import-untyped]
 
+    from pinecone._internal.batching import BatchSizeTuner
+    from pinecone._internal.instrumentation import RequestListener
+    from pinecone._internal.vector_files import VectorFileFormat
+    from pinecone.async_client.buffered_writer import AsyncBufferedWriter
+    from pinecone.models.batch import BatchResult, BufferedWriteError
+
 from pinecone._internal.adapters.imports_adapter import ImportsAdapter
-from pinecone._internal.adapters.vectors_adapter import VectorsAdapter, extract_response_info
-from pinecone._internal.batch import async_batch_execute
-from pinecone._internal.batching import validate_batch_size
-from pinecone._internal.config import PineconeConfig
+from pinecone._internal.adapters.vectors_adapter import (
+    VectorsAdapter,
+    extract_response_info,
+    typed_vector_models,
+)
+from pinecone._internal.batch import async_batch_execute_stream
+from pinecone._internal.batching import (
+    JSON_HEADERS,
+    MAX_REQUEST_BYTES,
+    async_tuned,
+    iter_json_batches,
+    resolve_batch_size,
+)
+from pinecone._internal.checkpoint import open_upsert_checkpoint
+from pinecone._internal.config import BatchRetryPolicy, PineconeConfig
 from pinecone._internal.constants import DATA_PLANE_API_VERSION
 from pinecone._internal.data_plane_helpers import (
+    _batch_upsert_response,
+    _compact_sparse_values,
     _normalize_search_vector_dict,
     _validate_host,
     _vector_to_dict,
 )
+from pinecone._internal.http_client import _encode_json
+from pinecone._internal.instrumentation import atraced
+from pinecone._internal.polling import IMPORT_TERMINAL_STATUSES, ProgressBackoff
+from pinecone._internal.records import (
+    NDJSON_HEADERS,
+    encode_ndjson,
+    iter_ndjson_batches,
+    records_response,
+    resolve_records_batch_size,
+    validate_namespace,
+)
 from pinecone._internal.validation import require_in_range, require_positive
 from pinecone._internal.vector_factory import VectorFactory
-from pinecone.errors.exceptions import PineconeValueError, ValidationError
+from pinecone.errors.exceptions import PineconeTimeoutError, PineconeValueError, ValidationError
 from pinecone.models.imports.list import ImportList
 from pinecone.models.imports.model import ImportModel, StartImportResponse
 from pinecone.models.namespaces.models import ListNamespacesResponse, NamespaceDescription
-from pinecone.models.response_info import ResponseInfo
 from pinecone.models.vectors.query_aggregator import QueryNamespacesResults, QueryResultsAggregator
 from pinecone.models.vectors.responses import (
     DescribeIndexStatsResponse,
@@ -64,6 +96,20 @@ class AsyncIndex:
         source_tag (str | None): Tag appended to the User-Agent string for request attribution.
         connection_pool_maxsize (int): Maximum number of connections to keep in the pool.
             ``0`` (default) uses httpx defaults.
+        metadata_type (type | None): A :class:`msgspec.Struct` subclass or dataclass
+            describing the metadata stored in this index. When set, ``metadata`` on
+            query/fetch results (and search hit ``fields``) is decoded and validated
+            straight into this type instead of a ``dict``. Defaults to ``None``.
+        compact_sparse (bool): If ``True``, sparse values returned by query and fetch
+            are re-backed by ``array("I")`` / ``array("f")`` instead of Python lists,
+            which keeps large sparse results compact in memory. Defaults to ``False``.
+        lazy_response_headers (bool): If ``True``, the ``response_info`` of data-plane
+            responses keeps the received headers and only parses the request ID and
+            LSN headers when they are read; the ``raw_headers`` dict is built on first
+            access instead of for every response. Defaults to ``False``.
+        request_listeners (Sequence[RequestListener]): Callables that receive a
+            :class:`~pinecone.RequestEvent` with the phase timings of every request
+            this client sends. Defaults to none.
 
     Raises:
         :exc:`PineconeValueError`: If no API key can be resolved or the host is invalid.
@@ -91,6 +137,10 @@ class AsyncIndex:
         ssl_verify: bool = True,
         source_tag: str | None = None,
         connection_pool_maxsize: int = 0,
+        metadata_type: type[Any] | None = None,
+        compact_sparse: bool = False,
+        lazy_response_headers: bool = False,
+        request_listeners: Sequence[RequestListener] = (),
     ) -> None:
         # Resolve API key: explicit arg > env var (check BEFORE host per unified-ord-0001)
         resolved_key = api_key or os.environ.get("PINECONE_API_KEY", "")
@@ -103,6 +153,12 @@ class AsyncIndex:
         # Validate and normalize host
         self._host = _validate_host(host)
 
+        if metadata_type is not None:
+            typed_vector_models(metadata_type)  # validate and build decoders up front
+        self._metadata_type = metadata_type
+        self._compact_sparse = compact_sparse
+        self._lazy_response_headers = lazy_response_headers
+
         config = PineconeConfig(
             api_key=resolved_key,
             host=self._host,
@@ -114,8 +170,10 @@ class AsyncIndex:
             ssl_verify=ssl_verify,
             source_tag=source_tag or "",
             connection_pool_maxsize=connection_pool_maxsize,
+            request_listeners=tuple(request_listeners),
         )
         self._config = config
+        self._request_listeners = config.request_listeners
 
         from pinecone._internal.http_client import AsyncHTTPClient
 
@@ -130,12 +188,17 @@ class AsyncIndex:
         """The data plane host URL for this index."""
         return self._host
 
+    @atraced
     async def upsert_records(
         self,
         *,
-        records: list[dict[str, Any]],
+        records: Iterable[dict[str, Any]],
         namespace: str,
+        batch_size: int | Literal["auto"] | None = None,
+        max_concurrency: int = 4,
+        show_progress: bool = True,
         timeout: float | None = None,
+        retry_policy: BatchRetryPolicy | None = None,
     ) -> UpsertRecordsResponse:
         """Upsert records for indexes with integrated inference.
 
@@ -143,19 +206,42 @@ class AsyncIndex:
         generated server-side.
 
         Args:
-            records: List of record dicts. Each must contain an ``_id`` or
-                ``id`` field. Additional fields are passed through for
-                server-side embedding.
+            records: Iterable of record dicts (a list, generator, or any other
+                iterable). Each must contain an ``_id`` or ``id`` field.
+                Additional fields are passed through for server-side embedding.
             namespace (str): Target namespace (required). Unlike :meth:`upsert`,
                 namespace has no default because the records API requires an
                 explicit namespace (must be non-empty).
+            batch_size (int | Literal["auto"] | None): Send at most this many
+                records (1–96) per request, also splitting so that no request
+                body exceeds 2 MiB. ``"auto"`` grows the batch size while
+                throughput improves. Records are encoded lazily and batches are
+                sent concurrently. Default ``None`` sends a single request.
+            max_concurrency (int): Maximum concurrent batch requests (range
+                1–64, default 4). Only used when ``batch_size`` is set.
+            show_progress (bool): When ``True`` and ``tqdm`` is installed,
+                display a progress bar across batches. Only used when
+                ``batch_size`` is set. Defaults to ``True``.
+            timeout (float | None): Per-request timeout in seconds. Overrides
+                the client-level default for this call only.
+            retry_policy (BatchRetryPolicy | None): Re-send batches that fail
+                with transient errors after a backoff, and split batches that
+                are rejected as invalid until only the offending records
+                remain. Only used when ``batch_size`` is set. Default ``None``
+                records each failed batch as is.
 
         Returns:
             :class:`UpsertRecordsResponse` with the count of records submitted.
+            When ``batch_size`` is set, per-batch failures are captured on the
+            response (``has_errors``, ``errors``, ``failed_items``) instead of
+            being raised.
 
         Raises:
             :exc:`PineconeValueError`: If namespace is not a string or is empty/whitespace,
-                records is empty, or a record is missing an identifier field.
+                records is empty, a record is missing an identifier field,
+                *batch_size* is outside [1, 96], or *max_concurrency* is
+                outside [1, 64]. With ``batch_size`` set, an invalid record is
+                detected when it is reached, after earlier batches were sent.
             :exc:`ApiError`: If the API returns an error response.
             :exc:`PineconeConnectionError`: If a network-level connection
                 fails (DNS, refused, transport error).
@@ -177,52 +263,66 @@ class AsyncIndex:
                 )
                 print(response.record_count)
 
+                # Stream a large corpus in concurrent batches of 96
+                response = await idx.upsert_records(
+                    namespace="articles-en",
+                    records=({"_id": doc.id, "text": doc.body} for doc in corpus),
+                    batch_size=96,
+                    max_concurrency=8,
+                )
+
         .. seealso::
            - :meth:`upsert` — for indexes where you provide your own vectors
              (no server-side embedding).
            - :meth:`start_import` — for bulk loading millions of vectors
              from cloud storage (S3, GCS).
         """
-        if not isinstance(namespace, str):
-            raise ValidationError("namespace must be a string")
-        if not namespace or not namespace.strip():
-            raise ValidationError("namespace must be a non-empty string")
-        if not records:
-            raise ValidationError("records must be a non-empty list")
-
-        for i, record in enumerate(records):
-            if "_id" not in record and "id" not in record:
-                raise ValidationError(f"Record at index {i} must contain an '_id' or 'id' field")
-
-        import orjson
-
-        normalized: list[dict[str, Any]] = []
-        for i, record in enumerate(records):
-            r = dict(record)  # shallow copy
-            if "_id" not in r and "id" in r:
-                r["_id"] = r.pop("id")
-            elif "_id" in r and "id" in r:
-                del r["id"]  # _id wins; drop the redundant 'id' key
-            resolved_id = r.get("_id")
-            if not isinstance(resolved_id, str):
-                got = type(resolved_id).__name__
-                raise ValidationError(f"Record at index {i}: '_id' must be a string, got {got!r}")
-            normalized.append(r)
-
-        ndjson_lines = [orjson.dumps(r).decode("utf-8") for r in normalized]
-        ndjson_body = "\n".join(ndjson_lines) + "\n"
-
-        logger.info("Upserting %d records into namespace %r (NDJSON)", len(records), namespace)
+        validate_namespace(namespace)
+        if batch_size is None:
+            record_count, body = encode_ndjson(records)
+            logger.info("Upserting %d records into namespace %r (NDJSON)", record_count, namespace)
+            return await self._upsert_records_body(
+                namespace=namespace, body=body, record_count=record_count, timeout=timeout
+            )
+
+        resolved = resolve_records_batch_size(batch_size)
+        require_in_range("max_concurrency", max_concurrency, 1, 64)
+
+        async def _operation(items: list[dict[str, Any]], body: bytes) -> UpsertRecordsResponse:
+            return await self._upsert_records_body(
+                namespace=namespace, body=body, record_count=len(items), timeout=timeout
+            )
+
+        batch_result = await async_batch_execute_stream(
+            batches=iter_ndjson_batches(records, resolved),
+            operation=async_tuned(_operation, resolved),
+            retry_policy=retry_policy,
+            rebuild=lambda items: encode_ndjson(items)[1],
+            max_concurrency=max_concurrency,
+            show_progress=show_progress,
+            desc="Upserting records",
+        )
+        return records_response(batch_result)
+
+    async def _upsert_records_body(
+        self,
+        *,
+        namespace: str,
+        body: bytes,
+        record_count: int,
+        timeout: float | None,
+    ) -> UpsertRecordsResponse:
         response = await self._http.post(
             f"/records/namespaces/{namespace}/upsert",
             timeout=timeout,
-            content=ndjson_body.encode("utf-8"),
-            headers={"Content-Type": "application/x-ndjson"},
+            content=body,
+            headers=NDJSON_HEADERS,
         )
-        result = UpsertRecordsResponse(record_count=len(records))
-        result.response_info = extract_response_info(response)
+        result = UpsertRecordsResponse(record_count=record_count)
+        result.response_info = extract_response_info(response, lazy=self._lazy_response_headers)
         return result
 
+    @atraced
     async def upsert(
         self,
         *,
@@ -233,10 +333,12 @@ class AsyncIndex:
             | Mapping[str, Any]
         ],
         namespace: str = "",
-        batch_size: int | None = None,
+        batch_size: int | Literal["auto"] | None = None,
         show_progress: bool = True,
         max_concurrency: int = 4,
         timeout: float | None = None,
+        retry_policy: BatchRetryPolicy | None = None,
+        checkpoint: str | os.PathLike[str] | None = None,
     ) -> UpsertResponse:
         """Upsert a batch of vectors into a namespace.
 
@@ -250,10 +352,11 @@ class AsyncIndex:
                 and optional ``sparse_values`` / ``metadata`` keys.
             namespace (str): Target namespace. Defaults to the default
                 (empty-string) namespace.
-            batch_size (int | None): Split *vectors* into chunks of this size
-                and send one request per chunk. Default ``None`` sends a single
-                request (current behaviour). Must be a positive integer if
-                provided.
+            batch_size (int | Literal["auto"] | None): Send at most this many
+                vectors per request, also splitting so that no request body
+                exceeds 2 MiB. ``"auto"`` starts at 50 and grows the batch size
+                while throughput improves (up to 1000). Default ``None`` sends a
+                single request (current behaviour).
             show_progress (bool): When ``True`` and ``tqdm`` is installed,
                 display a progress bar across batches. Has no effect when
                 ``batch_size`` is ``None`` or ``tqdm`` is not installed.
@@ -263,18 +366,32 @@ class AsyncIndex:
                 is set.
             timeout (float | None): Per-request timeout in seconds. Overrides
                 the client-level default for this call only.
+            retry_policy (BatchRetryPolicy | None): Re-send batches that fail
+                with transient errors after a backoff, and split batches that
+                are rejected as invalid until only the offending vectors
+                remain. Only used when ``batch_size`` is set. Default ``None``
+                records each failed batch as is.
+            checkpoint (str | os.PathLike | None): Path of a checkpoint file
+                that makes the upsert resumable. Each acknowledged batch is
+                appended to the file, and a rerun with the same *vectors*,
+                *namespace* and *batch_size* skips the batches it records.
+                Requires an integer *batch_size*. Default ``None``.
 
         Returns:
             :class:`UpsertResponse` with the count of vectors upserted.
             When ``batch_size`` triggers multiple requests, ``response_info``
             carries the aggregate LSN from all successful batches (or ``None``
-            if no LSN headers were returned).
+            if no LSN headers were returned). With *checkpoint*, the counts
+            and LSNs include the batches acknowledged by earlier runs.
 
         Raises:
             :exc:`PineconeTypeError`: If a vector element is not a recognized format.
             :exc:`PineconeValueError`: If a vector element is malformed.
             :exc:`PineconeValueError`: If *batch_size* is not a positive integer.
             :exc:`PineconeValueError`: If *max_concurrency* is outside [1, 64].
+            :exc:`PineconeValueError`: If *checkpoint* is given without an
+                integer *batch_size*, was written for a different upsert, or
+                no longer matches *vectors*.
             :exc:`ApiError`: If the API returns an error response.
             :exc:`PineconeConnectionError`: If a network-level connection
                 fails (DNS, refused, transport error).
@@ -324,50 +441,77 @@ class AsyncIndex:
              from cloud storage (S3, GCS).
         """
         if batch_size is None:
+            if checkpoint is not None:
+                raise PineconeValueError("checkpoint requires batch_size to be set")
             return await self._upsert_one_batch(
                 vectors=vectors, namespace=namespace, timeout=timeout
             )
 
-        validate_batch_size(batch_size)
+        resolved = resolve_batch_size(batch_size)
         require_in_range("max_concurrency", max_concurrency, 1, 64)
 
-        built = [VectorFactory.build(v) for v in vectors]
-        items: list[dict[str, Any]] = [_vector_to_dict(v) for v in built]
-
-        async def _operation(chunk: list[dict[str, Any]]) -> UpsertResponse:
-            return await self._upsert_dict_batch(items=chunk, namespace=namespace, timeout=timeout)
-
-        batch_result = await async_batch_execute(
-            items=items,
-            operation=_operation,
+        batch_result = await self._upsert_items(
+            items=(_vector_to_dict(v) for v in VectorFactory.build_many(vectors)),
+            namespace=namespace,
             batch_size=batch_size,
+            resolved=resolved,
             max_concurrency=max_concurrency,
             show_progress=show_progress,
-            desc="Upserting",
+            timeout=timeout,
+            retry_policy=retry_policy,
+            checkpoint=checkpoint,
         )
+        return _batch_upsert_response(batch_result)
 
-        synth_headers: dict[str, str] = {}
-        if batch_result.response_info is not None:
-            if batch_result.response_info.lsn_reconciled is not None:
-                synth_headers["x-pinecone-lsn-reconciled"] = str(
-                    batch_result.response_info.lsn_reconciled
-                )
-            if batch_result.response_info.lsn_committed is not None:
-                synth_headers["x-pinecone-lsn-committed"] = str(
-                    batch_result.response_info.lsn_committed
-                )
-        synth_response_info = ResponseInfo(raw_headers=synth_headers) if synth_headers else None
-        return UpsertResponse(
-            upserted_count=batch_result.successful_item_count,
-            response_info=synth_response_info,
-            total_item_count=batch_result.total_item_count,
-            failed_item_count=batch_result.failed_item_count,
-            total_batch_count=batch_result.total_batch_count,
-            successful_batch_count=batch_result.successful_batch_count,
-            failed_batch_count=batch_result.failed_batch_count,
-            errors=batch_result.errors,
+    async def _upsert_items(
+        self,
+        *,
+        items: Iterable[dict[str, Any]],
+        namespace: str,
+        batch_size: int | Literal["auto"],
+        resolved: int | BatchSizeTuner,
+        max_concurrency: int,
+        show_progress: bool,
+        timeout: float | None,
+        retry_policy: BatchRetryPolicy | None,
+        checkpoint: str | os.PathLike[str] | None,
+        total: int | None = None,
+    ) -> BatchResult:
+        fields = {"namespace": namespace} if namespace else {}
+        job = (
+            None
+            if checkpoint is None
+            else open_upsert_checkpoint(
+                checkpoint, transport="rest", namespace=namespace, batch_size=batch_size
+            )
         )
 
+        async def _operation(chunk: list[dict[str, Any]], body: bytes) -> UpsertResponse:
+            return await self._upsert_dict_batch(
+                items=chunk, namespace=namespace, timeout=timeout, body=body
+            )
+
+        try:
+            return await async_batch_execute_stream(
+                batches=iter_json_batches(
+                    items,
+                    key="vectors",
+                    batch_size=resolved,
+                    fields=fields,
+                ),
+                operation=async_tuned(_operation, resolved),
+                retry_policy=retry_policy,
+                rebuild=lambda chunk: _encode_json({"vectors": chunk, **fields}),
+                checkpoint=job,
+                max_concurrency=max_concurrency,
+                show_progress=show_progress,
+                desc="Upserting",
+                total=total,
+            )
+        finally:
+            if job is not None:
+                job.close()
+
     async def _upsert_one_batch(
         self,
         *,
@@ -380,7 +524,7 @@ class AsyncIndex:
         namespace: str,
         timeout: float | None,
     ) -> UpsertResponse:
-        built = [VectorFactory.build(v) for v in vectors]
+        built = VectorFactory.build_many(vectors)
         body: dict[str, Any] = {
             "vectors": [_vector_to_dict(v) for v in built],
         }
@@ -390,7 +534,7 @@ class AsyncIndex:
         logger.info("Upserting %d vectors into namespace %r", len(built), namespace)
         response = await self._http.post("/vectors/upsert", timeout=timeout, json=body)
         result = self._adapter.to_upsert_response(response.content)
-        result.response_info = extract_response_info(response)
+        result.response_info = extract_response_info(response, lazy=self._lazy_response_headers)
         logger.debug("Upserted %d vectors", result.upserted_count)
         return result
 
@@ -400,13 +544,18 @@ class AsyncIndex:
         items: list[dict[str, Any]],
         namespace: str,
         timeout: float | None,
+        body: bytes | None = None,
     ) -> UpsertResponse:
-        body: dict[str, Any] = {"vectors": items}
-        if namespace:
-            body["namespace"] = namespace
-        response = await self._http.post("/vectors/upsert", timeout=timeout, json=body)
+        if body is None:
+            payload: dict[str, Any] = {"vectors": items}
+            if namespace:
+                payload["namespace"] = namespace
+            body = _encode_json(payload)
+        response = await self._http.post(
+            "/vectors/upsert", timeout=timeout, content=body, headers=JSON_HEADERS
+        )
         result = self._adapter.to_upsert_response(response.content)
-        result.response_info = extract_response_info(response)
+        result.response_info = extract_response_info(response, lazy=self._lazy_response_headers)
         return result
 
     async def upsert_from_dataframe(
@@ -435,6 +584,93 @@ class AsyncIndex:
             "For very large datasets, use start_import() for bulk loading from cloud storage."
         )
 
+    async def upsert_from_file(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        ids: str | os.PathLike[str] | Sequence[Any] | None = None,
+        namespace: str = "",
+        format: VectorFileFormat | None = None,
+        dataset: str | None = None,
+        start: int = 0,
+        stop: int | None = None,
+        batch_size: int | Literal["auto"] = 500,
+        max_concurrency: int = 4,
+        show_progress: bool = True,
+        timeout: float | None = None,
+        retry_policy: BatchRetryPolicy | None = None,
+        checkpoint: str | os.PathLike[str] | None = None,
+    ) -> UpsertResponse:
+        """Upsert dense vectors from a ``.npy``, ``.fvecs``, ``.bvecs`` or HDF5 file.
+
+        The file is memory-mapped (HDF5 datasets are read a block at a time)
+        and its rows are streamed into the batched upsert path, so files
+        much larger than available memory can be loaded.
+
+        Args:
+            path (str | os.PathLike): The vector file. Its format is inferred
+                from the suffix unless *format* is given.
+            ids (str | os.PathLike | Sequence | None): The ID of each row:
+                ``None`` (default) uses the row number, a ``range``, list or
+                NumPy array gives the ID of row ``i`` at position ``i``, and
+                a path names a text file with one ID per line.
+            namespace (str): Target namespace. Defaults to ``""``.
+            format (Literal["npy", "fvecs", "bvecs", "hdf5"] | None): File
+                format, when the suffix does not identify it.
+            dataset (str | None): Dataset of an HDF5 file. Defaults to ``"train"``.
+            start (int): First row to upsert. Defaults to ``0``.
+            stop (int | None): Row to stop before. Defaults to the end of the file.
+            batch_size (int | Literal["auto"]): Vectors per request, as for
+                :meth:`upsert`. Defaults to ``500``.
+            max_concurrency (int): Concurrent requests, range ``[1, 64]``.
+                Defaults to ``4``.
+            show_progress (bool): If ``True`` and ``tqdm`` is installed,
+                display a progress bar. Defaults to ``True``.
+            timeout (float | None): Per-request timeout in seconds.
+            retry_policy (BatchRetryPolicy | None): Batch retry and bisection
+                policy; see :meth:`upsert`.
+            checkpoint (str | os.PathLike | None): Checkpoint file that makes
+                the load resumable; see :meth:`upsert`.
+
+        Returns:
+            :class:`UpsertResponse` with the batched upsert counters.
+
+        Raises:
+            :exc:`RuntimeError`: If ``numpy`` (or ``h5py`` for HDF5) is not installed.
+            :exc:`PineconeValueError`: If the format cannot be determined, the
+                file is not a two-dimensional array of vectors, the row range
+                is invalid, or *ids* has fewer entries than the rows.
+            :exc:`PineconeValueError`: If *batch_size* or *max_concurrency*
+                is invalid, or *checkpoint* does not match this load.
+
+        Examples:
+            .. code-block:: python
+
+                async with AsyncIndex(host="sift-abc123.svc.pinecone.io", api_key="...") as idx:
+                    response = await idx.upsert_from_file("sift_base.fvecs", batch_size=200)
+                    print(response.upserted_count)
+        """
+        from pinecone._internal.vector_files import VectorFile, iter_file_vectors, resolve_row_range
+
+        resolved = resolve_batch_size(batch_size)
+        require_in_range("max_concurrency", max_concurrency, 1, 64)
+        with VectorFile(path, format=format, dataset=dataset) as file:
+            first, last = resolve_row_range(len(file), start, stop)
+            batch_result = await self._upsert_items(
+                items=iter_file_vectors(file, ids, start=first, stop=last),
+                namespace=namespace,
+                batch_size=batch_size,
+                resolved=resolved,
+                max_concurrency=max_concurrency,
+                show_progress=show_progress,
+                timeout=timeout,
+                retry_policy=retry_policy,
+                checkpoint=checkpoint,
+                total=None if batch_size == "auto" else -(-(last - first) // batch_size),
+            )
+        return _batch_upsert_response(batch_result)
+
+    @atraced
     async def query(
         self,
         *,
@@ -541,8 +777,10 @@ class AsyncIndex:
 
         logger.info("Querying index with top_k=%d", top_k)
         response = await self._http.post("/query", timeout=timeout, json=body)
-        result = self._adapter.to_query_response(response.content)
-        result.response_info = extract_response_info(response)
+        result = self._adapter.to_query_response(response.content, self._metadata_type)
+        if self._compact_sparse:
+            _compact_sparse_values(result.matches)
+        result.response_info = extract_response_info(response, lazy=self._lazy_response_headers)
         logger.debug("Query returned %d matches", len(result.matches))
         return result
 
@@ -661,6 +899,7 @@ class AsyncIndex:
 
         return aggregator.get_results()
 
+    @atraced
     async def fetch(
         self,
         *,
@@ -703,11 +942,14 @@ class AsyncIndex:
 
         logger.info("Fetching %d vectors", len(ids))
         response = await self._http.get("/vectors/fetch", timeout=timeout, params=params)
-        result = self._adapter.to_fetch_response(response.content)
-        result.response_info = extract_response_info(response)
+        result = self._adapter.to_fetch_response(response.content, self._metadata_type)
+        if self._compact_sparse:
+            _compact_sparse_values(result.vectors.values())
+        result.response_info = extract_response_info(response, lazy=self._lazy_response_headers)
         logger.debug("Fetched %d vectors", len(result.vectors))
         return result
 
+    @atraced
     async def fetch_by_metadata(
         self,
         *,
@@ -773,10 +1015,13 @@ class AsyncIndex:
 
         logger.info("Fetching vectors by metadata")
         response = await self._http.post("/vectors/fetch_by_metadata", timeout=timeout, json=body)
-        result = self._adapter.to_fetch_by_metadata_response(response.content)
-        result.response_info = extract_response_info(response)
+        result = self._adapter.to_fetch_by_metadata_response(response.content, self._metadata_type)
+        if self._compact_sparse:
+            _compact_sparse_values(result.vectors.values())
+        result.response_info = extract_response_info(response, lazy=self._lazy_response_headers)
         return result
 
+    @atraced
     async def delete(
         self,
         *,
@@ -839,6 +1084,7 @@ class AsyncIndex:
         logger.info("Deleting vectors from namespace %r", namespace)
         await self._http.post("/vectors/delete", timeout=timeout, json=body)
 
+    @atraced
     async def update(
         self,
         *,
@@ -919,9 +1165,10 @@ class AsyncIndex:
         logger.info("Updating vectors in namespace %r", namespace)
         response = await self._http.post("/vectors/update", timeout=timeout, json=body)
         result = self._adapter.to_update_response(response.content)
-        result.response_info = extract_response_info(response)
+        result.response_info = extract_response_info(response, lazy=self._lazy_response_headers)
         return result
 
+    @atraced
     async def search(
         self,
         *,
@@ -1032,8 +1279,8 @@ class AsyncIndex:
         response = await self._http.post(
             f"/records/namespaces/{namespace}/search", timeout=timeout, json=body
         )
-        result = self._adapter.to_search_response(response.content)
-        result.response_info = extract_response_info(response)
+        result = self._adapter.to_search_response(response.content, self._metadata_type)
+        result.response_info = extract_response_info(response, lazy=self._lazy_response_headers)
         return result
 
     async def search_records(
@@ -1066,6 +1313,7 @@ class AsyncIndex:
             timeout=timeout,
         )
 
+    @atraced
     async def list_paginated(
         self,
         *,
@@ -1109,7 +1357,7 @@ class AsyncIndex:
         logger.info("Listing vectors in namespace %r", namespace)
         response = await self._http.get("/vectors/list", timeout=timeout, params=params)
         result = self._adapter.to_list_response(response.content)
-        result.response_info = extract_response_info(response)
+        result.response_info = extract_response_info(response, lazy=self._lazy_response_headers)
         return result
 
     async def list(
@@ -1157,6 +1405,7 @@ class AsyncIndex:
             else:
                 break
 
+    @atraced
     async def describe_index_stats(
         self,
         *,
@@ -1201,9 +1450,10 @@ class AsyncIndex:
         logger.info("Describing index stats")
         response = await self._http.post("/describe_index_stats", timeout=timeout, json=body)
         result = self._adapter.to_stats_response(response.content)
-        result.response_info = extract_response_info(response)
+        result.response_info = extract_response_info(response, lazy=self._lazy_response_headers)
         return result
 
+    @atraced
     async def create_namespace(
         self,
         *,
@@ -1248,6 +1498,7 @@ class AsyncIndex:
         response = await self._http.post("/namespaces", json=body)
         return self._adapter.to_namespace_description(response.content)
 
+    @atraced
     async def describe_namespace(
         self,
         *,
@@ -1294,6 +1545,7 @@ class AsyncIndex:
         response = await self._http.get(f"/namespaces/{effective}")
         return self._adapter.to_namespace_description(response.content)
 
+    @atraced
     async def delete_namespace(
         self,
         *,
@@ -1338,6 +1590,7 @@ class AsyncIndex:
         logger.info("Deleting namespace %r", effective)
         await self._http.delete(f"/namespaces/{effective}", timeout=timeout)
 
+    @atraced
     async def list_namespaces_paginated(
         self,
         *,
@@ -1555,6 +1808,72 @@ class AsyncIndex:
         response = await self._http.get(f"/bulk/imports/{str_id}")
         return self._imports_adapter.to_import_model(response.content)
 
+    async def wait_for_import(
+        self,
+        id: str | int,
+        *,
+        timeout: float | None = None,
+        poll_interval: float = 1.0,
+        max_interval: float = 60.0,
+        on_progress: Callable[[ImportModel], None] | None = None,
+    ) -> ImportModel:
+        """Wait until a bulk import completes, fails or is cancelled.
+
+        Polls :meth:`describe_import` with a delay that starts at
+        *poll_interval* and adapts to the reported progress: it grows
+        while ``percent_complete`` stays flat and shrinks toward the
+        estimated finish as it rises, never exceeding *max_interval*.
+
+        Args:
+            id: Import operation ID, as returned by :meth:`start_import`.
+            timeout (float | None): Seconds to wait before giving up.
+                ``None`` waits indefinitely.
+            poll_interval (float): Initial and shortest delay between polls,
+                in seconds. Defaults to 1.
+            max_interval (float): Longest delay between polls, in seconds.
+                Defaults to 60.
+            on_progress: Called with each :class:`ImportModel` observed.
+
+        Returns:
+            The final :class:`ImportModel`. Check its ``status``: a failed or
+            cancelled import is returned, not raised.
+
+        Raises:
+            :exc:`PineconeValueError`: If the ID or intervals are invalid.
+            :exc:`PineconeTimeoutError`: If the import is still running after
+                *timeout* seconds.
+            :exc:`ApiError`: If the API returns an error response.
+
+        Examples:
+            .. code-block:: python
+
+                operation = await idx.start_import(uri="s3://my-bucket/imports/products")
+                result = await idx.wait_for_import(
+                    operation.id,
+                    timeout=3600,
+                    on_progress=lambda m: print(m.status, m.percent_complete),
+                )
+                print(result.status, result.records_imported)
+        """
+        backoff = ProgressBackoff(poll_interval, max_interval)
+        str_id = self._validate_import_id(id)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            model = await self.describe_import(str_id)
+            if on_progress is not None:
+                on_progress(model)
+            if model.status in IMPORT_TERMINAL_STATUSES:
+                return model
+            delay = backoff.next_delay(model.percent_complete)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise PineconeTimeoutError(
+                        f"Import '{str_id}' is still {model.status} after {timeout}s"
+                    )
+                delay = min(delay, remaining)
+            await asyncio.sleep(delay)
+
     async def cancel_import(self, id: str | int) -> None:
         """Cancel a bulk import operation by ID.
 
@@ -1666,6 +1985,61 @@ class AsyncIndex:
         response = await self._http.get("/bulk/imports", params=params)
         return self._imports_adapter.to_import_list(response.content)
 
+    def buffered_writer(
+        self,
+        *,
+        batch_size: int = 100,
+        max_bytes: int = MAX_REQUEST_BYTES,
+        flush_interval: float = 1.0,
+        max_pending: int = 10_000,
+        on_error: Callable[[BufferedWriteError], None] | None = None,
+    ) -> AsyncBufferedWriter:
+        """Return a :class:`AsyncBufferedWriter` that batches writes to this index.
+
+        Small upserts and deletes are accumulated per namespace, coalesced by
+        ID, and sent from a background task once *batch_size* writes or
+        *max_bytes* of payload are pending, or *flush_interval* seconds have
+        passed since the oldest pending write.
+
+        Args:
+            batch_size (int): Pending writes that trigger a flush, and the
+                maximum number of vectors per request (default 100).
+            max_bytes (int): Estimated payload bytes that trigger a flush, and
+                the per-request cap (default and maximum 2 MiB).
+            flush_interval (float): Maximum seconds a write stays buffered
+                (default 1.0).
+            max_pending (int): Pending writes at which further writes wait
+                until the worker catches up (default 10000).
+            on_error (Callable[[BufferedWriteError], None] | None): Called
+                from the background task with each failed request.
+
+        Returns:
+            :class:`AsyncBufferedWriter` — await ``close()`` (or use it as an
+            async context manager) to flush remaining writes and stop the task.
+
+        Raises:
+            :exc:`PineconeValueError`: If a threshold is invalid.
+
+        Examples:
+            .. code-block:: python
+
+                async with idx.buffered_writer(flush_interval=0.5) as writer:
+                    async for event in events:
+                        await writer.upsert(vectors=[(event.id, event.embedding)])
+                        if event.retracted:
+                            await writer.delete(ids=[event.id])
+        """
+        from pinecone.async_client.buffered_writer import AsyncBufferedWriter
+
+        return AsyncBufferedWriter(
+            self,
+            batch_size=batch_size,
+            max_bytes=max_bytes,
+            flush_interval=flush_interval,
+            max_pending=max_pending,
+            on_error=on_error,
+        )
+
     async def close(self) -> None:
         """Close the underlying HTTP client and release resources."""
         await self._http.close()
@@ -0,0 +1,330 @@
+"""Background-flushing write buffer for :class:`AsyncIndex`."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections.abc import Callable, Iterable, Mapping, Sequence
+from typing import TYPE_CHECKING, Any
+
+from pinecone._internal.batching import MAX_REQUEST_BYTES
+from pinecone._internal.vector_factory import VectorFactory
+from pinecone._internal.write_buffer import (
+    PendingWrites,
+    WriteBuffer,
+    failed_items,
+    split_deletes,
+    split_upserts,
+    validate_delete_ids,
+    validate_writer_params,
+)
+from pinecone.errors.exceptions import PineconeValueError
+from pinecone.models.batch import BufferedWriteError
+from pinecone.models.vectors.vector import Vector
+
+if TYPE_CHECKING:
+    from pinecone.async_client.async_index import AsyncIndex
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncBufferedWriter:
+    """Accumulate small upserts and deletes and send them as full batches.
+
+    The asyncio counterpart of :class:`BufferedWriter`. Writes are buffered
+    per namespace and flushed by a background task when the buffer holds
+    *batch_size* pending writes, reaches *max_bytes* of estimated request
+    payload, or its oldest write is *flush_interval* seconds old.  Repeated
+    writes to the same ID within one flush window are coalesced.
+
+    The background task starts on the first write and is bound to the
+    running event loop. Failed requests never raise in the caller; each is
+    recorded on :attr:`errors` and passed to *on_error* when provided.
+
+    Obtain a writer from :meth:`AsyncIndex.buffered_writer` rather than
+    constructing one directly.
+
+    Args:
+        index: The :class:`AsyncIndex` to write through.
+        batch_size (int): Pending writes that trigger a flush, and the
+            maximum number of vectors per request (default 100).
+        max_bytes (int): Estimated request payload in bytes that triggers a
+            flush, and the per-request cap (default and maximum 2 MiB).
+        flush_interval (float): Maximum seconds a write waits in the buffer
+            before it is flushed (default 1.0).
+        max_pending (int): Pending writes at which :meth:`upsert` and
+            :meth:`delete` wait for the worker to catch up (default 10000).
+        on_error (Callable[[BufferedWriteError], None] | None): Called from
+            the background task with each failed request.
+
+    Raises:
+        :exc:`PineconeValueError`: If a threshold is not positive or
+            *max_bytes* exceeds 2 MiB.
+
+    Examples:
+        .. code-block:: python
+
+            import asyncio
+
+            from pinecone import AsyncPinecone
+
+
+            async def main() -> None:
+                async with AsyncPinecone(api_key="your-api-key") as pc:
+                    index = await pc.index("product-search")
+                    async with index.buffered_writer(flush_interval=0.5) as writer:
+                        async for event in stream():
+                            await writer.upsert(
+                                vectors=[(event.product_id, event.embedding)],
+                                namespace="products-en",
+                            )
+                    print(writer.upserted_count, writer.errors)
+
+
+            asyncio.run(main())
+    """
+
+    def __init__(
+        self,
+        index: AsyncIndex,
+        *,
+        batch_size: int = 100,
+        max_bytes: int = MAX_REQUEST_BYTES,
+        flush_interval: float = 1.0,
+        max_pending: int = 10_000,
+        on_error: Callable[[BufferedWriteError], None] | None = None,
+    ) -> None:
+        validate_writer_params(batch_size, max_bytes, flush_interval, max_pending)
+        self._index = index
+        self._batch_size = batch_size
+        self._max_bytes = max_bytes
+        self._flush_interval = flush_interval
+        self._max_pending = max_pending
+        self._on_error = on_error
+        self._buffer = WriteBuffer()
+        self._cond: asyncio.Condition | None = None
+        self._task: asyncio.Task[None] | None = None
+        self._flush_requested = False
+        self._closed = False
+        self._drained = 0
+        self._written = 0
+        self.errors: list[BufferedWriteError] = []
+        self.upserted_count = 0
+        self.deleted_count = 0
+
+    async def upsert(
+        self,
+        *,
+        vectors: Sequence[
+            Vector
+            | tuple[str, Sequence[float]]
+            | tuple[str, Sequence[float], Mapping[str, Any]]
+            | Mapping[str, Any]
+        ],
+        namespace: str = "",
+    ) -> None:
+        """Buffer *vectors* for upsert into *namespace*.
+
+        Vectors are validated immediately, so malformed input raises here
+        rather than in the background task. Waits only while the buffer is
+        full.
+
+        Args:
+            vectors: Vectors in any format accepted by :meth:`AsyncIndex.upsert`.
+            namespace (str): Target namespace. Defaults to ``""``.
+
+        Raises:
+            :exc:`PineconeTypeError`: If a vector element is not a recognized format.
+            :exc:`PineconeValueError`: If a vector element is malformed or the
+                writer is closed.
+        """
+        built = VectorFactory.build_many(vectors)
+        cond = self._start()
+        async with cond:
+            await self._wait_for_room(cond)
+            started = not len(self._buffer)
+            for vector in built:
+                self._buffer.add_upsert(namespace, vector)
+            self._notify_if_due(cond, started)
+
+    async def delete(self, *, ids: Iterable[str], namespace: str = "") -> None:
+        """Buffer deletes of *ids* from *namespace*.
+
+        Args:
+            ids (Iterable[str]): Vector IDs to delete.
+            namespace (str): Namespace to delete from. Defaults to ``""``.
+
+        Raises:
+            :exc:`PineconeTypeError`: If *ids* is a single string or holds a
+                non-string.
+            :exc:`PineconeValueError`: If an ID is empty or the writer is
+                closed.
+        """
+        checked = validate_delete_ids(ids)
+        cond = self._start()
+        async with cond:
+            await self._wait_for_room(cond)
+            started = not len(self._buffer)
+            for id_ in checked:
+                self._buffer.add_delete(namespace, id_)
+            self._notify_if_due(cond, started)
+
+    async def flush(self) -> None:
+        """Send every write buffered so far and wait for the requests to finish.
+
+        Wrap in :func:`asyncio.wait_for` to bound the wait.
+        """
+        cond = self._cond
+        if cond is None:
+            return
+        async with cond:
+            target = self._drained + (1 if len(self._buffer) else 0)
+            if self._written >= target:
+                return
+            self._flush_requested = True
+            cond.notify_all()
+            await cond.wait_for(lambda: self._written >= target)
+
+    async def close(self) -> None:
+        """Flush pending writes and stop the background task.
+
+        Further calls to :meth:`upsert` or :meth:`delete` raise. Calling
+        ``close()`` more than once is a no-op.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        if self._cond is None or self._task is None:
+            return
+        async with self._cond:
+            self._cond.notify_all()
+        await self._task
+
+    @property
+    def pending_count(self) -> int:
+        """Number of buffered writes not yet handed to the background task."""
+        return len(self._buffer)
+
+    async def __aenter__(self) -> AsyncBufferedWriter:
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"AsyncBufferedWriter(pending={len(self._buffer)}, "
+            f"upserted={self.upserted_count}, deleted={self.deleted_count}, "
+            f"errors={len(self.errors)})"
+        )
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _start(self) -> asyncio.Condition:
+        if self._closed:
+            raise PineconeValueError("Cannot write to a closed AsyncBufferedWriter")
+        if self._cond is None:
+            self._cond = asyncio.Condition()
+        if self._task is None:
+            self._task = asyncio.get_running_loop().create_task(
+                self._run(self._cond), name="pinecone-buffered-writer"
+            )
+        return self._cond
+
+    async def _wait_for_room(self, cond: asyncio.Condition) -> None:
+        # Caller holds the condition's lock.
+        if len(self._buffer) >= self._max_pending:
+            self._flush_requested = True
+            cond.notify_all()
+            await cond.wait_for(lambda: self._closed or len(self._buffer) < self._max_pending)
+        if self._closed:
+            raise PineconeValueError("Cannot write to a closed AsyncBufferedWriter")
+
+    def _notify_if_due(self, cond: asyncio.Condition, started: bool) -> None:
+        # Caller holds the condition's lock.  A write that opens a new flush
+        # window wakes the worker so it can arm the flush_interval timer.
+        if started or self._buffer.is_due(self._batch_size, self._max_bytes, self._flush_interval):
+            cond.notify_all()
+
+    async def _run(self, cond: asyncio.Condition) -> None:
+        while True:
+            async with cond:
+                while not (
+                    self._closed
+                    or self._flush_requested
+                    or self._buffer.is_due(self._batch_size, self._max_bytes, self._flush_interval)
+                ):
+                    delay = self._buffer.seconds_until_due(self._flush_interval)
+                    with contextlib.suppress(asyncio.TimeoutError):
+                        await asyncio.wait_for(cond.wait(), delay)
+                if not len(self._buffer):
+                    self._flush_requested = False
+                    if self._closed:
+                        return
+                    continue
+                self._flush_requested = False
+                pending = self._buffer.drain()
+                self._drained += 1
+                # Wake writers waiting on max_pending.
+                cond.notify_all()
+            try:
+                for writes in pending:
+                    await self._send(writes)
+            finally:
+                async with cond:
+                    self._written += 1
+                    cond.notify_all()
+
+    async def _send(self, writes: PendingWrites) -> None:
+        namespace = writes.namespace
+        for ids in split_deletes(writes.deletes, self._batch_size):
+            try:
+                await self._index.delete(ids=ids, namespace=namespace)
+            except Exception as exc:
+                self._record_error("delete", namespace, ids, [], exc)
+            else:
+                self.deleted_count += len(ids)
+        for chunk in split_upserts(
+            writes.upserts, writes.upsert_sizes, self._batch_size, self._max_bytes
+        ):
+            try:
+                await self._index.upsert(vectors=chunk, namespace=namespace)
+            except Exception as exc:
+                self._record_error(
+                    "upsert", namespace, [v.id for v in chunk], failed_items(chunk), exc
+                )
+            else:
+                self.upserted_count += len(chunk)
+
+    def _record_error(
+        self,
+        operation: str,
+        namespace: str,
+        ids: list[str],
+        items: list[dict[str, Any]],
+        exc: Exception,
+    ) -> None:
+        logger.warning(
+            "Buffered %s of %d vectors in namespace %r failed: %s",
+            operation,
+            len(ids),
+            namespace,
+            exc,
+        )
+        error = BufferedWriteError(
+            operation=operation,
+            namespace=namespace,
+            ids=ids,
+            items=items,
+            error=exc,
+            error_message=str(exc),
+        )
+        self.errors.append(error)
+        if self._on_error is not None:
+            try:
+                self._on_error(error)
+            except Exception:
+                logger.exception("AsyncBufferedWriter on_error callback raised")
@@ -2,23 +2,26 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
+from collections.abc import Mapping, Sequence
 from dataclasses import replace
 from typing import TYPE_CHECKING, Any
 
 from pinecone._internal.config import PineconeConfig, RetryConfig
 from pinecone._internal.constants import CONTROL_PLANE_API_VERSION, DEFAULT_BASE_URL
-from pinecone._internal.indexes_helpers import IndexKwargs, async_poll_index_until_ready
 from pinecone._internal.validation import require_non_empty
 from pinecone.errors.exceptions import ValidationError
 
 if TYPE_CHECKING:
+    from pinecone._internal.http_client import AsyncHTTPClient
+    from pinecone._internal.indexes_helpers import IndexKwargs
+    from pinecone._internal.instrumentation import RequestListener
     from pinecone.async_client.assistants import AsyncAssistants
     from pinecone.async_client.async_index import AsyncIndex
     from pinecone.async_client.backups import AsyncBackups
     from pinecone.async_client.collections import AsyncCollections
     from pinecone.async_client.indexes import AsyncIndexes
     from pinecone.async_client.inference import AsyncInference
+    from pinecone.async_client.poller import AsyncResourcePoller
     from pinecone.async_client.restore_jobs import AsyncRestoreJobs
     from pinecone.client._assistant_namespace_proxy import _AsyncAssistantNamespaceProxy
     from pinecone.inference.models.index_embed import IndexEmbed
@@ -71,6 +74,9 @@ class AsyncPinecone:
         retry_config (RetryConfig | None): Custom retry configuration. When ``None``
             (default), uses built-in defaults (5 attempts, exponential backoff, retries
             on 500/502/503/504 for GET/HEAD).
+        request_listeners (Sequence[RequestListener]): Callables that receive a
+            :class:`~pinecone.RequestEvent` with the phase timings of every request
+            sent by this client and the indexes it creates. Defaults to none.
 
     Raises:
         :exc:`PineconeValueError`: If no API key can be resolved from arguments or
@@ -120,6 +126,7 @@ class AsyncPinecone:
         timeout: float = 30.0,
         connection_pool_maxsize: int = 0,
         retry_config: RetryConfig | None = None,
+        request_listeners: Sequence[RequestListener] = (),
     ) -> None:
         if proxy_headers:
             raise NotImplementedError("proxy_headers is not yet supported for the async client")
@@ -135,6 +142,7 @@ class AsyncPinecone:
             ssl_verify=ssl_verify,
             connection_pool_maxsize=connection_pool_maxsize,
             retry_config=retry_config or RetryConfig(),
+            request_listeners=tuple(request_listeners),
         )
 
         if not config.api_key:
@@ -150,9 +158,8 @@ class AsyncPinecone:
 
         self._config = config
 
-        from pinecone._internal.http_client import AsyncHTTPClient
-
-        self._http = AsyncHTTPClient(config, CONTROL_PLANE_API_VERSION)
+        # The control-plane client (and httpx with it) is created on first use.
+        self._http_client: AsyncHTTPClient | None = None
         self._indexes: AsyncIndexes | None = None
         self._collections: AsyncCollections | None = None
         self._assistants: AsyncAssistants | None = None
@@ -160,12 +167,22 @@ class AsyncPinecone:
         self._restore_jobs: AsyncRestoreJobs | None = None
         self._inference: AsyncInference | None = None
         self._preview: AsyncPreview | None = None
+        self._poller: AsyncResourcePoller | None = None
         self._host_cache: dict[str, str] = {}
 
     def __repr__(self) -> str:
         masked = f"...{self._config.api_key[-4:]}" if len(self._config.api_key) >= 4 else "***"
         return f"AsyncPinecone(api_key='{masked}', host='{self._config.host}')"
 
+    @property
+    def _http(self) -> AsyncHTTPClient:
+        """Control-plane HTTP client, created on first use."""
+        if self._http_client is None:
+            from pinecone._internal.http_client import AsyncHTTPClient
+
+            self._http_client = AsyncHTTPClient(self._config, CONTROL_PLANE_API_VERSION)
+        return self._http_client
+
     @property
     def indexes(self) -> AsyncIndexes:
         """Access the AsyncIndexes namespace for control-plane index operations.
@@ -297,6 +314,29 @@ class AsyncPinecone:
             self._restore_jobs = _AsyncRestoreJobs(http=self._http)
         return self._restore_jobs
 
+    @property
+    def poller(self) -> AsyncResourcePoller:
+        """Access the AsyncResourcePoller namespace for waiting on many operations.
+
+        Lazily imported and instantiated on first access. All waits share
+        one background polling task.
+
+        Returns:
+            :class:`AsyncResourcePoller` namespace instance.
+
+        Examples:
+
+            .. code-block:: python
+
+                async with AsyncPinecone(api_key="your-api-key") as pc:
+                    model = await pc.poller.index_ready("movie-recommendations")
+        """
+        if self._poller is None:
+            from pinecone.async_client.poller import AsyncResourcePoller as _AsyncResourcePoller
+
+            self._poller = _AsyncResourcePoller(self)
+        return self._poller
+
     @property
     def inference(self) -> AsyncInference:
         """Access the AsyncInference namespace for embed and rerank operations.
@@ -427,6 +467,8 @@ class AsyncPinecone:
         if timeout == -1:
             return create_response
 
+        from pinecone._internal.indexes_helpers import async_poll_index_until_ready
+
         effective_timeout = timeout if timeout is not None else 300
         return await async_poll_index_until_ready(self.indexes.describe, name, effective_timeout)
 
@@ -761,10 +803,13 @@ class AsyncPinecone:
             ssl_verify=self._config.ssl_verify,
             source_tag=self._config.source_tag,
             connection_pool_maxsize=self._config.connection_pool_maxsize,
+            request_listeners=self._config.request_listeners,
         )
 
     def _build_index_kwargs(self, host: str) -> IndexKwargs:
         """Return the kwargs dict for constructing an AsyncIndex."""
+        from pinecone._internal.indexes_helpers import IndexKwargs
+
         return IndexKwargs(
             host=host,
             api_key=self._config.api_key,
@@ -776,6 +821,7 @@ class AsyncPinecone:
             ssl_verify=self._config.ssl_verify,
             source_tag=self._config.source_tag,
             connection_pool_maxsize=self._config.connection_pool_maxsize,
+            request_listeners=self._config.request_listeners,
         )
 
     async def _resolve_index_host(self, *, name: str, host: str) -> str:
@@ -820,6 +866,7 @@ class AsyncPinecone:
         name: str = "",
         *,
         host: str = "",
+        metadata_type: type[Any] | None = None,
     ) -> AsyncIndex:
         """Create an async data plane client targeting a specific index.
 
@@ -835,6 +882,8 @@ class AsyncPinecone:
             name (str): Name of the index. Triggers an async describe call to
                 resolve host on cache miss.
             host (str): Direct host URL of the index. Skips the describe call.
+            metadata_type (type | None): A :class:`msgspec.Struct` subclass or dataclass
+                that vector metadata is decoded into. Defaults to ``None`` (plain dicts).
 
         Returns:
             An async :class:`AsyncIndex` data plane client.
@@ -861,7 +910,7 @@ class AsyncPinecone:
         from pinecone.async_client.async_index import AsyncIndex as _AsyncIndex
 
         resolved_host = await self._resolve_index_host(name=name, host=host)
-        return _AsyncIndex(**self._build_index_kwargs(resolved_host))
+        return _AsyncIndex(**self._build_index_kwargs(resolved_host), metadata_type=metadata_type)
 
     async def close(self) -> None:
         """Close all open HTTP connections.
@@ -889,7 +938,8 @@ class AsyncPinecone:
             ...         _ = await pc.indexes.list()
             >>> asyncio.run(example())
         """
-        await self._http.close()
+        if self._http_client is not None:
+            await self._http_client.close()
         if self._assistants is not None:
             await self._assistants.close()
         if self._inference is not None:
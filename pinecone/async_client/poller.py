@@ -0,0 +1,147 @@
+"""Async poller namespace — wait for many long-running operations at once."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pinecone._internal import poll_targets
+from pinecone._internal.polling import AsyncPoller
+
+if TYPE_CHECKING:
+    import asyncio
+
+    from pinecone.async_client.async_index import AsyncIndex
+    from pinecone.async_client.pinecone import AsyncPinecone
+    from pinecone.models.assistant.file_model import AssistantFileModel
+    from pinecone.models.assistant.model import AssistantModel
+    from pinecone.models.backups.model import BackupModel
+    from pinecone.models.imports.model import ImportModel
+    from pinecone.models.indexes.index import IndexModel
+
+
+class AsyncResourcePoller:
+    """Async counterpart of :class:`~pinecone.client.poller.ResourcePoller`.
+
+    Every method returns an :class:`asyncio.Future` immediately; one
+    :class:`~pinecone._internal.polling.AsyncPoller` task checks all pending
+    resources, sharing one list call per round between resources of the
+    same kind.  Methods must be called from a running event loop.
+
+    Args:
+        pc (AsyncPinecone): Client used for the list and describe calls.
+        poller (AsyncPoller | None): Poller to schedule on. Defaults to a
+            new poller with a 1 second initial and 30 second maximum delay.
+
+    Examples:
+
+        .. code-block:: python
+
+            import asyncio
+
+            async with AsyncPinecone(api_key="your-api-key") as pc:
+                models = await asyncio.gather(
+                    *(pc.poller.index_ready(name, timeout=600) for name in names)
+                )
+    """
+
+    def __init__(self, pc: AsyncPinecone, poller: AsyncPoller | None = None) -> None:
+        self._pc = pc
+        self._poller = poller if poller is not None else AsyncPoller()
+
+    def __repr__(self) -> str:
+        """Return developer-friendly representation."""
+        return "AsyncResourcePoller()"
+
+    def index_ready(self, name: str, *, timeout: float | None = None) -> asyncio.Future[IndexModel]:
+        """Wait for an index to become ready.
+
+        See :meth:`ResourcePoller.index_ready <pinecone.client.poller.ResourcePoller.index_ready>`.
+        """
+        return self._poller.watch(
+            self._list_indexes,
+            poll_targets.index_ready(name),
+            group="indexes",
+            timeout=timeout,
+            label=f"Index '{name}'",
+        )
+
+    def assistant_ready(
+        self, name: str, *, timeout: float | None = None
+    ) -> asyncio.Future[AssistantModel]:
+        """Wait for an assistant to reach ``Ready``.
+
+        See :meth:`ResourcePoller.assistant_ready
+        <pinecone.client.poller.ResourcePoller.assistant_ready>`.
+        """
+        return self._poller.watch(
+            self._list_assistants,
+            poll_targets.assistant_ready(name),
+            group="assistants",
+            timeout=timeout,
+            label=f"Assistant '{name}'",
+        )
+
+    def file_processed(
+        self, assistant_name: str, file_id: str, *, timeout: float | None = None
+    ) -> asyncio.Future[AssistantFileModel]:
+        """Wait for an uploaded assistant file to finish processing.
+
+        See :meth:`ResourcePoller.file_processed
+        <pinecone.client.poller.ResourcePoller.file_processed>`.
+        """
+
+        async def fetch() -> dict[str, AssistantFileModel]:
+            files = self._pc.assistants.list_files(assistant_name=assistant_name)
+            return {file.id: file async for file in files}
+
+        return self._poller.watch(
+            fetch,
+            poll_targets.file_processed(file_id),
+            group=("files", assistant_name),
+            timeout=timeout,
+            label=f"File '{file_id}'",
+        )
+
+    def import_done(
+        self, index: AsyncIndex, import_id: str, *, timeout: float | None = None
+    ) -> asyncio.Future[ImportModel]:
+        """Wait for a bulk import to complete, fail, or be cancelled.
+
+        See :meth:`ResourcePoller.import_done <pinecone.client.poller.ResourcePoller.import_done>`.
+        """
+
+        async def fetch() -> dict[str, ImportModel]:
+            return {operation.id: operation async for operation in index.list_imports()}
+
+        return self._poller.watch(
+            fetch,
+            poll_targets.import_done(import_id),
+            group=("imports", index.host),
+            timeout=timeout,
+            label=f"Import '{import_id}'",
+        )
+
+    def backup_ready(
+        self, backup_id: str, *, timeout: float | None = None
+    ) -> asyncio.Future[BackupModel]:
+        """Wait for a backup to reach ``Ready``.
+
+        See :meth:`ResourcePoller.backup_ready
+        <pinecone.client.poller.ResourcePoller.backup_ready>`.
+        """
+
+        async def fetch() -> dict[str, BackupModel]:
+            return {backup_id: await self._pc.backups.describe(backup_id=backup_id)}
+
+        return self._poller.watch(
+            fetch,
+            poll_targets.backup_ready(backup_id),
+            timeout=timeout,
+            label=f"Backup '{backup_id}'",
+        )
+
+    async def _list_indexes(self) -> dict[str, IndexModel]:
+        return {idx.name: idx for idx in await self._pc.indexes.list()}
+
+    async def _list_assistants(self) -> dict[str, AssistantModel]:
+        return {model.name: model async for model in self._pc.assistants.list()}
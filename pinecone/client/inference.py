@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
+import contextlib
 import logging
 from collections.abc import Mapping, Sequence
 from functools import cached_property
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal, cast, overload
 
 from pinecone._internal.adapters.inference_adapter import (
     InferenceAdapter,
@@ -13,13 +14,32 @@ from pinecone._internal.adapters.inference_adapter import (
     normalize_rerank_documents,
 )
 from pinecone._internal.constants import INFERENCE_API_VERSION
-from pinecone._internal.validation import require_non_empty, require_one_of
+from pinecone._internal.embed_batching import (
+    DEFAULT_EMBED_BATCH_SIZE,
+    EmbedAssembler,
+    EmbedOutput,
+    embeddings_to_arrays,
+    split_inputs,
+)
+from pinecone._internal.embed_cache import CacheLookup, EmbeddingCache
+from pinecone._internal.fanout import fan_out
+from pinecone._internal.rerank_batching import DEFAULT_RERANK_BATCH_SIZE, RerankMerger
+from pinecone._internal.validation import (
+    require_in_range,
+    require_non_empty,
+    require_one_of,
+    require_positive,
+)
 from pinecone.errors.exceptions import ValidationError
 from pinecone.models import enums as _enums
 
 if TYPE_CHECKING:
     from pinecone._internal.config import PineconeConfig
-    from pinecone.models.inference.embed import EmbeddingsList
+    from pinecone.models.inference.embed import (
+        EmbeddingMatrix,
+        EmbeddingsList,
+        SparseEmbeddingMatrix,
+    )
     from pinecone.models.inference.model_list import ModelInfoList
     from pinecone.models.inference.models import ModelInfo
     from pinecone.models.inference.rerank import RerankResult
@@ -147,6 +167,9 @@ class Inference:
 
         self._http = HTTPClient(config, INFERENCE_API_VERSION)
         self._adapter = InferenceAdapter()
+        self._model_batch_sizes: dict[str, int] = {}
+        self.cache: EmbeddingCache | None = None
+        """Optional :class:`EmbeddingCache` consulted by ``embed`` and ``embed_many``."""
 
     def close(self) -> None:
         """Close the underlying HTTP client."""
@@ -179,6 +202,11 @@ class Inference:
     ) -> EmbeddingsList:
         """Generate embeddings for the provided inputs.
 
+        When :attr:`cache` holds an :class:`EmbeddingCache`, inputs already
+        embedded with the same model and parameters are answered from it and
+        only the rest are sent; ``usage`` then counts the tokens of that
+        request alone.
+
         Args:
             model (EmbedModel | str): Embedding model name.
             inputs (str | Sequence[str] | Sequence[Mapping[str, Any]]): Text inputs.
@@ -227,20 +255,216 @@ class Inference:
         """
         require_non_empty("model", str(model))
         normalized_inputs = normalize_embed_inputs(inputs)
-
-        body: dict[str, Any] = {
-            "model": str(model),
-            "inputs": normalized_inputs,
-        }
+        if self.cache is None:
+            return self._embed_request(str(model), normalized_inputs, parameters)
+
+        lookup = CacheLookup(self.cache, str(model), parameters, normalized_inputs)
+        fetched = None
+        if lookup.missing:
+            fetched = self._embed_request(str(model), lookup.missing, parameters)
+        result = lookup.complete(fetched)
+        if result is not None:
+            return result
+        # The response does not map one-to-one onto the inputs; skip the cache.
+        if fetched is not None and len(lookup.missing) == len(normalized_inputs):
+            return fetched
+        return self._embed_request(str(model), normalized_inputs, parameters)
+
+    def _embed_request(
+        self, model: str, inputs: list[dict[str, Any]], parameters: Mapping[str, Any] | None
+    ) -> EmbeddingsList:
+        body: dict[str, Any] = {"model": model, "inputs": inputs}
         if parameters is not None:
             body["parameters"] = parameters
 
-        logger.info("Generating embeddings with model %r", str(model))
+        logger.info("Generating embeddings with model %r", model)
         response = self._http.post("/embed", json=body)
         result = self._adapter.to_embeddings_list(response.content)
         logger.debug("Generated %d embeddings", len(result.data))
         return result
 
+    @overload
+    def embed_many(
+        self,
+        model: _enums.EmbedModel | str,
+        inputs: Sequence[str] | Sequence[Mapping[str, Any]],
+        parameters: Mapping[str, Any] | None = None,
+        *,
+        batch_size: int | None = None,
+        max_concurrency: int = 4,
+        output: Literal["embeddings"] = "embeddings",
+        show_progress: bool = False,
+    ) -> EmbeddingsList: ...
+
+    @overload
+    def embed_many(
+        self,
+        model: _enums.EmbedModel | str,
+        inputs: Sequence[str] | Sequence[Mapping[str, Any]],
+        parameters: Mapping[str, Any] | None = None,
+        *,
+        batch_size: int | None = None,
+        max_concurrency: int = 4,
+        output: Literal["numpy"],
+        show_progress: bool = False,
+    ) -> EmbeddingMatrix | SparseEmbeddingMatrix: ...
+
+    def embed_many(
+        self,
+        model: _enums.EmbedModel | str,
+        inputs: Sequence[str] | Sequence[Mapping[str, Any]],
+        parameters: Mapping[str, Any] | None = None,
+        *,
+        batch_size: int | None = None,
+        max_concurrency: int = 4,
+        output: EmbedOutput = "embeddings",
+        show_progress: bool = False,
+    ) -> EmbeddingsList | EmbeddingMatrix | SparseEmbeddingMatrix:
+        """Embed any number of inputs, split into concurrent requests.
+
+        Inputs are split into requests of at most *batch_size* inputs, by
+        default the model's ``max_batch_size`` as reported by
+        :meth:`get_model` (looked up once per model and cached). Up to
+        *max_concurrency* requests run at a time, and the embeddings are
+        returned in input order whatever order the responses arrive in.
+        With :attr:`cache` set, only inputs missing from the cache are sent.
+
+        Args:
+            model (EmbedModel | str): Embedding model name.
+            inputs (Sequence[str] | Sequence[Mapping[str, Any]]): Text inputs,
+                as for :meth:`embed`.
+            parameters (Mapping[str, Any] | None): Model-specific parameters,
+                sent with every request.
+            batch_size (int | None): Inputs per request. Defaults to the
+                model's limit.
+            max_concurrency (int): Requests in flight at once (1-64).
+                Defaults to 4.
+            output (str): ``"embeddings"`` (default) returns an
+                :class:`EmbeddingsList` like :meth:`embed`. ``"numpy"``
+                returns an :class:`EmbeddingMatrix` with a contiguous
+                ``float32`` matrix for dense models, or a
+                :class:`SparseEmbeddingMatrix` in CSR form for sparse models.
+                Requires ``numpy``.
+            show_progress (bool): Display a tqdm progress bar over requests
+                when tqdm is installed. Defaults to ``False``.
+
+        Returns:
+            The embeddings of all inputs, with ``usage`` summed over requests.
+
+        Raises:
+            :exc:`PineconeValueError`: If *model* or *inputs* is empty, or
+                *batch_size* or *max_concurrency* is out of range.
+            :exc:`PineconeTypeError`: If *inputs* has an invalid type.
+            :exc:`ApiError`: If a request fails. The remaining requests are
+                cancelled.
+
+        Examples:
+            .. code-block:: python
+
+                from pinecone import Pinecone
+
+                pc = Pinecone(api_key="your-api-key")
+                matrix = pc.inference.embed_many(
+                    model="multilingual-e5-large",
+                    inputs=passages,
+                    parameters={"input_type": "passage", "truncate": "END"},
+                    max_concurrency=8,
+                    output="numpy",
+                )
+                matrix.values.shape  # (len(passages), 1024)
+        """
+        require_non_empty("model", str(model))
+        require_in_range("max_concurrency", max_concurrency, 1, 64)
+        require_one_of("output", output, ("embeddings", "numpy"))
+        if batch_size is not None:
+            require_positive("batch_size", batch_size)
+        normalized_inputs = normalize_embed_inputs(inputs)
+        if self.cache is None:
+            return self._embed_many(
+                str(model),
+                normalized_inputs,
+                parameters,
+                batch_size,
+                max_concurrency,
+                output,
+                show_progress,
+            )
+
+        lookup = CacheLookup(self.cache, str(model), parameters, normalized_inputs)
+        fetched = None
+        if lookup.missing:
+            fetched = self._embed_many(
+                str(model),
+                lookup.missing,
+                parameters,
+                batch_size,
+                max_concurrency,
+                "embeddings",
+                show_progress,
+            )
+        result = lookup.complete(cast("EmbeddingsList | None", fetched))
+        if result is None:
+            # The responses do not map one-to-one onto the inputs; skip the cache.
+            return self._embed_many(
+                str(model),
+                normalized_inputs,
+                parameters,
+                batch_size,
+                max_concurrency,
+                output,
+                show_progress,
+            )
+        return result if output == "embeddings" else embeddings_to_arrays(result)
+
+    def _embed_many(
+        self,
+        model: str,
+        inputs: list[dict[str, Any]],
+        parameters: Mapping[str, Any] | None,
+        batch_size: int | None,
+        max_concurrency: int,
+        output: EmbedOutput,
+        show_progress: bool,
+    ) -> EmbeddingsList | EmbeddingMatrix | SparseEmbeddingMatrix:
+        if batch_size is None:
+            batch_size = self._model_batch_size(model, DEFAULT_EMBED_BATCH_SIZE)
+        chunks = split_inputs(inputs, batch_size)
+
+        def _send(chunk: tuple[int, list[dict[str, Any]]]) -> bytes:
+            body: dict[str, Any] = {"model": model, "inputs": chunk[1]}
+            if parameters is not None:
+                body["parameters"] = parameters
+            return self._http.post("/embed", json=body).content
+
+        logger.info(
+            "Embedding %d inputs with model %r in %d requests",
+            len(inputs),
+            model,
+            len(chunks),
+        )
+        assembler = EmbedAssembler(len(inputs), output)
+        with contextlib.closing(
+            fan_out(
+                _send,
+                chunks,
+                max_concurrency=max_concurrency,
+                show_progress=show_progress,
+                desc="Embedding",
+                total=len(chunks),
+            )
+        ) as results:
+            for position, content in results:
+                offset, chunk = chunks[position]
+                assembler.add(offset, len(chunk), content)
+        return assembler.result()
+
+    def _model_batch_size(self, model: str, default: int) -> int:
+        size = self._model_batch_sizes.get(model)
+        if size is None:
+            size = self.get_model(model=model).max_batch_size or default
+            self._model_batch_sizes[model] = size
+        return size
+
     def rerank(
         self,
         model: _enums.RerankModel | str,
@@ -318,6 +542,170 @@ class Inference:
         logger.debug("Reranked documents, got %d results", len(result.data))
         return result
 
+    def rerank_many(
+        self,
+        model: _enums.RerankModel | str,
+        query: str,
+        documents: Sequence[str] | Sequence[Mapping[str, Any]],
+        rank_fields: Sequence[str] = _DEFAULT_RANK_FIELDS,
+        return_documents: bool = True,
+        top_n: int | None = None,
+        parameters: Mapping[str, Any] | None = None,
+        *,
+        batch_size: int | None = None,
+        max_concurrency: int = 4,
+        finalists: int | None = None,
+        show_progress: bool = False,
+    ) -> RerankResult:
+        """Rerank any number of documents, split into concurrent requests.
+
+        Documents are split into shards of at most *batch_size*, by default
+        the model's ``max_batch_size`` as reported by :meth:`get_model`
+        (looked up once per model and cached). Up to *max_concurrency*
+        shards are reranked at a time and their results are merged by score
+        into a single ranking. Each shard only returns its own best *top_n*
+        documents, and document contents are attached locally instead of
+        being sent back by the API.
+
+        Scores from different requests are compared directly, which suits
+        models that score each document independently. Pass *finalists* to
+        rerank the best *finalists* documents of the first round together in
+        one more request and take the final ranking from it.
+
+        Args:
+            model (RerankModel | str): Reranking model name.
+            query (str): Query text to rank against.
+            documents (Sequence[str] | Sequence[Mapping[str, Any]]): Documents
+                to rank, as for :meth:`rerank`.
+            rank_fields (Sequence[str]): Document fields to rank on.
+                Defaults to ``["text"]``.
+            return_documents (bool): Include documents in the result.
+                Defaults to ``True``.
+            top_n (int | None): Number of top documents to return.
+                ``None`` returns all.
+            parameters (Mapping[str, Any] | None): Model-specific parameters,
+                sent with every request.
+            batch_size (int | None): Documents per request. Defaults to the
+                model's limit.
+            max_concurrency (int): Requests in flight at once (1-64).
+                Defaults to 4.
+            finalists (int | None): Documents reranked again in a second
+                round. Must be at least *top_n* and at most *batch_size*.
+                ``None`` (default) skips the second round.
+            show_progress (bool): Display a tqdm progress bar over requests
+                when tqdm is installed. Defaults to ``False``.
+
+        Returns:
+            A :class:`RerankResult` ordered by descending score, with
+            ``index`` referring to *documents* and ``usage`` summed over all
+            requests.
+
+        Raises:
+            :exc:`PineconeValueError`: If *model*, *query*, or *documents* is
+                empty, or *top_n*, *batch_size*, *max_concurrency* or
+                *finalists* is out of range.
+            :exc:`PineconeTypeError`: If *documents* has an invalid type.
+            :exc:`ApiError`: If a request fails. The remaining requests are
+                cancelled.
+
+        Examples:
+            .. code-block:: python
+
+                from pinecone import Pinecone
+
+                pc = Pinecone(api_key="your-api-key")
+                result = pc.inference.rerank_many(
+                    model="bge-reranker-v2-m3",
+                    query="Tell me about tech companies",
+                    documents=candidates,  # thousands of documents
+                    top_n=10,
+                    max_concurrency=8,
+                )
+        """
+        require_non_empty("model", str(model))
+        require_non_empty("query", query)
+        require_in_range("max_concurrency", max_concurrency, 1, 64)
+        if top_n is not None:
+            require_positive("top_n", top_n)
+        if batch_size is not None:
+            require_positive("batch_size", batch_size)
+        normalized_docs = normalize_rerank_documents(documents)
+        if batch_size is None:
+            batch_size = self._model_batch_size(str(model), DEFAULT_RERANK_BATCH_SIZE)
+        if finalists is not None:
+            require_in_range("finalists", finalists, top_n or 1, batch_size)
+        shards = split_inputs(normalized_docs, batch_size)
+        keep = finalists or top_n
+
+        def _send(shard: tuple[int, list[dict[str, Any]]]) -> RerankResult:
+            docs = shard[1]
+            return self._rerank_request(
+                str(model),
+                query,
+                docs,
+                rank_fields,
+                None if keep is None else min(keep, len(docs)),
+                parameters,
+            )
+
+        logger.info(
+            "Reranking %d documents with model %r in %d requests",
+            len(normalized_docs),
+            str(model),
+            len(shards),
+        )
+        merger = RerankMerger(keep)
+        with contextlib.closing(
+            fan_out(
+                _send,
+                shards,
+                max_concurrency=max_concurrency,
+                show_progress=show_progress,
+                desc="Reranking",
+                total=len(shards),
+            )
+        ) as results:
+            for position, result in results:
+                offset, docs = shards[position]
+                merger.add(offset, len(docs), result)
+        ranking = merger.ranking()
+        if finalists is not None and len(shards) > 1:
+            final = self._rerank_request(
+                str(model),
+                query,
+                [normalized_docs[index] for index, _ in ranking],
+                rank_fields,
+                top_n,
+                parameters,
+            )
+            merger.record(final)
+            ranking = [(ranking[ranked.index][0], ranked.score) for ranked in final.data]
+        elif top_n is not None:
+            ranking = ranking[:top_n]
+        return merger.result(ranking, normalized_docs if return_documents else None)
+
+    def _rerank_request(
+        self,
+        model: str,
+        query: str,
+        documents: list[dict[str, Any]],
+        rank_fields: Sequence[str],
+        top_n: int | None,
+        parameters: Mapping[str, Any] | None,
+    ) -> RerankResult:
+        body: dict[str, Any] = {
+            "model": model,
+            "query": query,
+            "documents": documents,
+            "rank_fields": rank_fields,
+            "return_documents": False,
+        }
+        if top_n is not None:
+            body["top_n"] = top_n
+        if parameters is not None:
+            body["parameters"] = parameters
+        return self._adapter.to_rerank_result(self._http.post("/rerank", json=body).content)
+
     def list_models(
         self,
         *,
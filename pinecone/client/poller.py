@@ -0,0 +1,191 @@
+"""Poller namespace — wait for many long-running operations at once."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from pinecone._internal import poll_targets
+from pinecone._internal.polling import Poller
+
+if TYPE_CHECKING:
+    from concurrent.futures import Future
+
+    from pinecone._client import Pinecone
+    from pinecone.index import Index
+    from pinecone.models.assistant.file_model import AssistantFileModel
+    from pinecone.models.assistant.model import AssistantModel
+    from pinecone.models.backups.model import BackupModel
+    from pinecone.models.imports.model import ImportModel
+    from pinecone.models.indexes.index import IndexModel
+
+
+class ResourcePoller:
+    """Waits for indexes, assistants, files, imports, and backups in the background.
+
+    Every method returns a :class:`concurrent.futures.Future` immediately.
+    A single :class:`~pinecone._internal.polling.Poller` thread checks all
+    pending resources with exponential backoff and jitter, and resources
+    of the same kind share one list call per round: fifty indexes being
+    created cost one ``list_indexes`` request per round instead of fifty
+    describe requests, and no caller thread is blocked while waiting.
+
+    Args:
+        pc (Pinecone): Client used for the list and describe calls.
+        poller (Poller | None): Poller to schedule on. Defaults to a new
+            poller with a 1 second initial and 30 second maximum delay.
+
+    Examples:
+
+        .. code-block:: python
+
+            from concurrent.futures import wait
+
+            from pinecone import Pinecone, ServerlessSpec
+
+            pc = Pinecone(api_key="your-api-key")
+            futures = []
+            for name in names:
+                pc.indexes.create(
+                    name=name,
+                    dimension=1536,
+                    spec=ServerlessSpec(cloud="aws", region="us-east-1"),
+                    timeout=-1,
+                )
+                futures.append(pc.poller.index_ready(name, timeout=600))
+            wait(futures)
+    """
+
+    def __init__(self, pc: Pinecone, poller: Poller | None = None) -> None:
+        self._pc = pc
+        self._poller = poller if poller is not None else Poller()
+
+    def __repr__(self) -> str:
+        """Return developer-friendly representation."""
+        return "ResourcePoller()"
+
+    def index_ready(self, name: str, *, timeout: float | None = None) -> Future[IndexModel]:
+        """Wait for an index to become ready.
+
+        Args:
+            name (str): Name of the index.
+            timeout (float | None): Seconds to wait. ``None`` waits indefinitely.
+
+        Returns:
+            A future for the ready :class:`IndexModel`. It fails with
+            :exc:`IndexInitFailedError` or :exc:`IndexTerminatedError` if the
+            index enters a terminal state, and with
+            :exc:`PineconeTimeoutError` if *timeout* elapses.
+        """
+        return self._poller.watch(
+            self._list_indexes,
+            poll_targets.index_ready(name),
+            group="indexes",
+            timeout=timeout,
+            label=f"Index '{name}'",
+        )
+
+    def assistant_ready(self, name: str, *, timeout: float | None = None) -> Future[AssistantModel]:
+        """Wait for an assistant to reach ``Ready``.
+
+        Args:
+            name (str): Name of the assistant.
+            timeout (float | None): Seconds to wait. ``None`` waits indefinitely.
+
+        Returns:
+            A future for the ready :class:`AssistantModel`. It fails with
+            :exc:`PineconeError` if the assistant enters a terminal state.
+        """
+        return self._poller.watch(
+            self._list_assistants,
+            poll_targets.assistant_ready(name),
+            group="assistants",
+            timeout=timeout,
+            label=f"Assistant '{name}'",
+        )
+
+    def file_processed(
+        self, assistant_name: str, file_id: str, *, timeout: float | None = None
+    ) -> Future[AssistantFileModel]:
+        """Wait for an uploaded assistant file to finish processing.
+
+        Files of the same assistant are checked together with one file
+        listing per round.
+
+        Args:
+            assistant_name (str): Name of the assistant holding the file.
+            file_id (str): Identifier of the file.
+            timeout (float | None): Seconds to wait. ``None`` waits indefinitely.
+
+        Returns:
+            A future for the processed :class:`AssistantFileModel`. It fails
+            with :exc:`PineconeError` if processing fails.
+        """
+
+        def fetch() -> dict[str, AssistantFileModel]:
+            files = self._pc.assistants.list_files(assistant_name=assistant_name)
+            return {file.id: file for file in files}
+
+        return self._poller.watch(
+            fetch,
+            poll_targets.file_processed(file_id),
+            group=("files", assistant_name),
+            timeout=timeout,
+            label=f"File '{file_id}'",
+        )
+
+    def import_done(
+        self, index: Index, import_id: str, *, timeout: float | None = None
+    ) -> Future[ImportModel]:
+        """Wait for a bulk import to complete, fail, or be cancelled.
+
+        Imports into the same index are checked together with one
+        ``list_imports`` pass per round.
+
+        Args:
+            index (Index): Index the import writes to.
+            import_id (str): Identifier of the import.
+            timeout (float | None): Seconds to wait. ``None`` waits indefinitely.
+
+        Returns:
+            A future for the finished :class:`ImportModel`, whatever its
+            terminal status.
+        """
+
+        def fetch() -> dict[str, ImportModel]:
+            return {operation.id: operation for operation in index.list_imports()}
+
+        return self._poller.watch(
+            fetch,
+            poll_targets.import_done(import_id),
+            group=("imports", index.host),
+            timeout=timeout,
+            label=f"Import '{import_id}'",
+        )
+
+    def backup_ready(self, backup_id: str, *, timeout: float | None = None) -> Future[BackupModel]:
+        """Wait for a backup to reach ``Ready``.
+
+        Args:
+            backup_id (str): Identifier of the backup.
+            timeout (float | None): Seconds to wait. ``None`` waits indefinitely.
+
+        Returns:
+            A future for the ready :class:`BackupModel`. It fails with
+            :exc:`PineconeError` if the backup fails.
+        """
+
+        def fetch() -> dict[str, BackupModel]:
+            return {backup_id: self._pc.backups.describe(backup_id=backup_id)}
+
+        return self._poller.watch(
+            fetch,
+            poll_targets.backup_ready(backup_id),
+            timeout=timeout,
+            label=f"Backup '{backup_id}'",
+        )
+
+    def _list_indexes(self) -> dict[str, IndexModel]:
+        return {idx.name: idx for idx in self._pc.indexes.list()}
+
+    def _list_assistants(self) -> dict[str, AssistantModel]:
+        return {model.name: model for model in self._pc.assistants.list()}
@@ -16,6 +16,13 @@ class PineconeError(Exception):
         super().__init__(message)
 
 
+def _restore_error(cls: type[Exception], args: tuple[Any, ...], state: dict[str, Any]) -> Exception:
+    exc = cls.__new__(cls, *args)
+    exc.args = args
+    exc.__dict__.update(state)
+    return exc
+
+
 class ApiError(PineconeError):
     """Server returned an error response."""
 
@@ -54,6 +61,12 @@ class ApiError(PineconeError):
             except Exception:
                 return "<ApiError: unrenderable>"
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # The keyword-only fields are not kept in ``args``, so the default
+        # exception pickling cannot rebuild this error (for example when it
+        # crosses a process pool); restore the attributes directly instead.
+        return (_restore_error, (type(self), self.args, self.__dict__))
+
     def __repr__(self) -> str:
         try:
             msg = self.message
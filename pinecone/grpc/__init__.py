@@ -5,21 +5,57 @@ from __future__ import annotations
 import builtins
 import logging
 import os
-from collections.abc import Iterator, Mapping, Sequence
+from array import array
+from collections.abc import Iterable, Iterator, Mapping, Sequence
 from concurrent.futures import ThreadPoolExecutor
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal, cast
+from urllib.parse import urlsplit
 
 if TYPE_CHECKING:
+    from collections.abc import Callable
+    from concurrent.futures import ProcessPoolExecutor
+
     import pandas as pd  # type: ignore[import-untyped]
 
-from pinecone._internal.adapters.vectors_adapter import VectorsAdapter, extract_response_info
-from pinecone._internal.batch import batch_execute
-from pinecone._internal.batching import chunked, validate_batch_size, with_progress
-from pinecone._internal.config import PineconeConfig
+    from pinecone._internal.batching import BatchSizeTuner
+    from pinecone._internal.http_client import HTTPClient
+    from pinecone._internal.instrumentation import RequestListener
+    from pinecone._internal.vector_files import VectorFileFormat
+    from pinecone.index.buffered_writer import BufferedWriter
+    from pinecone.models.batch import BatchResult, BufferedWriteError
+
+from pinecone._internal.adapters._decode import convert_response
+from pinecone._internal.adapters.vectors_adapter import (
+    VectorsAdapter,
+    extract_response_info,
+    typed_vector_models,
+)
+from pinecone._internal.batch import batch_execute_stream
+from pinecone._internal.batching import (
+    MAX_REQUEST_BYTES,
+    chunked,
+    pack_batches,
+    resolve_batch_size,
+    tuned,
+    validate_batch_size,
+    with_progress,
+)
+from pinecone._internal.checkpoint import open_upsert_checkpoint
+from pinecone._internal.config import BatchRetryPolicy, PineconeConfig
 from pinecone._internal.constants import DATA_PLANE_API_VERSION
-from pinecone._internal.data_plane_helpers import _validate_host
-from pinecone._internal.validation import require_in_range
-from pinecone._internal.vector_factory import VectorFactory
+from pinecone._internal.data_plane_helpers import _batch_upsert_response, _validate_host
+from pinecone._internal.http_client import _encode_json
+from pinecone._internal.instrumentation import _RequestTrace, traced
+from pinecone._internal.records import (
+    NDJSON_HEADERS,
+    encode_ndjson,
+    iter_ndjson_batches,
+    records_response,
+    resolve_records_batch_size,
+    validate_namespace,
+)
+from pinecone._internal.validation import require_in_range, require_one_of
+from pinecone._internal.vector_factory import VectorFactory, check_sparse_indices
 from pinecone.errors.exceptions import (
     PineconeValueError,
     ValidationError,
@@ -68,45 +104,110 @@ def _build_grpc_endpoint(host: str, secure: bool) -> str:
     return f"{scheme}://{bare}"
 
 
+def _pack_buffer(seq: Any, typecode: str) -> Any:
+    """Return *seq* as native-endian 4-byte ``bytes`` if it is array-backed.
+
+    GrpcChannel reads ``bytes`` sparse components straight into ``u32``/``f32``
+    vectors, avoiding a Python object per element. Lists pass through unchanged.
+    """
+    if typecode == "I" and (isinstance(seq, array) or hasattr(seq, "dtype")):
+        check_sparse_indices(seq)
+    if isinstance(seq, array):
+        if seq.typecode != typecode:
+            seq = array(typecode, seq)
+        return seq.tobytes()
+    if hasattr(seq, "dtype"):
+        return seq.astype("uint32" if typecode == "I" else "float32", copy=False).tobytes()
+    return seq
+
+
+def _sparse_to_grpc_dict(indices: Any, values: Any) -> dict[str, Any]:
+    """Build the GrpcChannel sparse dict, packing array-backed components."""
+    if isinstance(indices, list) and isinstance(values, list):
+        return {"indices": indices, "values": values}
+    return {"indices": _pack_buffer(indices, "I"), "values": _pack_buffer(values, "f")}
+
+
+def _sparse_from_grpc(sv: dict[str, Any]) -> SparseValues:
+    """Build SparseValues from a GrpcChannel dict (lists, or packed bytes when compact)."""
+    indices = sv["indices"]
+    values = sv["values"]
+    if isinstance(indices, bytes):
+        indices_arr = array("I")
+        indices_arr.frombytes(indices)
+        values_arr = array("f")
+        values_arr.frombytes(values)
+        return SparseValues(indices_arr, values_arr)  # type: ignore[arg-type]
+    return SparseValues(indices, values)
+
+
 def _vector_to_grpc_dict(v: Vector) -> dict[str, Any]:
     """Serialize a Vector to a dict matching GrpcChannel's expected input format."""
     d: dict[str, Any] = {"id": v.id, "values": v.values}
     if v.sparse_values is not None:
-        d["sparse_values"] = {
-            "indices": v.sparse_values.indices,
-            "values": v.sparse_values.values,
-        }
+        d["sparse_values"] = _sparse_to_grpc_dict(v.sparse_values.indices, v.sparse_values.values)
     if v.metadata is not None:
         d["metadata"] = v.metadata
     return d
 
 
-def _dict_to_vector(vid: str, data: dict[str, Any]) -> Vector:
+def _grpc_vector_size(item: dict[str, Any]) -> int:
+    """Estimate the protobuf-encoded size of a GrpcChannel vector dict.
+
+    Dense and sparse values take 4 bytes each, sparse indices up to 5 bytes
+    as varints, and metadata is measured as JSON plus a quarter for
+    ``Struct`` field framing, so the estimate errs on the high side.
+    """
+    size = 16 + len(item["id"].encode()) + 4 * len(item["values"])
+    sparse = item.get("sparse_values")
+    if sparse is not None:
+        indices = sparse["indices"]
+        count = len(indices) // 4 if isinstance(indices, bytes) else len(indices)
+        size += 8 + 9 * count
+    metadata = item.get("metadata")
+    if metadata:
+        encoded = len(_encode_json(metadata))
+        size += encoded + encoded // 4
+    return size
+
+
+def _convert_metadata(metadata: Any, metadata_type: type[Any] | None) -> Any:
+    """Convert a metadata dict from GrpcChannel into *metadata_type*, if one is registered."""
+    if metadata is None or metadata_type is None:
+        return metadata
+    return convert_response(metadata, metadata_type)
+
+
+def _dict_to_vector(
+    vid: str, data: dict[str, Any], metadata_type: type[Any] | None = None
+) -> Vector:
     """Convert a GrpcChannel vector dict to a Vector model."""
     sparse = None
     sv = data.get("sparse_values")
     if sv is not None:
-        sparse = SparseValues(sv["indices"], sv["values"])
+        sparse = _sparse_from_grpc(sv)
     return Vector(
         id=vid,
         values=data.get("values", []),
         sparse_values=sparse,
-        metadata=data.get("metadata"),
+        metadata=_convert_metadata(data.get("metadata"), metadata_type),
     )
 
 
-def _dict_to_scored_vector(data: dict[str, Any]) -> ScoredVector:
+def _dict_to_scored_vector(
+    data: dict[str, Any], metadata_type: type[Any] | None = None
+) -> ScoredVector:
     """Convert a GrpcChannel scored vector dict to a ScoredVector model."""
     sparse = None
     sv = data.get("sparse_values")
     if sv is not None:
-        sparse = SparseValues(sv["indices"], sv["values"])
+        sparse = _sparse_from_grpc(sv)
     return ScoredVector(
         id=data["id"],
         score=data.get("score", 0.0),
         values=data.get("values", []),
         sparse_values=sparse,
-        metadata=data.get("metadata"),
+        metadata=_convert_metadata(data.get("metadata"), metadata_type),
     )
 
 
@@ -147,6 +248,64 @@ def _dict_to_namespace_description(data: dict[str, Any]) -> NamespaceDescription
     )
 
 
+#: RPC names of the channel methods, reported on request events.
+_RPC_NAMES = {
+    "upsert": "Upsert",
+    "query": "Query",
+    "fetch": "Fetch",
+    "delete": "Delete",
+    "update": "Update",
+    "list": "List",
+    "describe_index_stats": "DescribeIndexStats",
+    "create_namespace": "CreateNamespace",
+    "describe_namespace": "DescribeNamespace",
+    "list_namespaces": "ListNamespaces",
+    "delete_namespace": "DeleteNamespace",
+}
+
+
+class _TracedChannel:
+    """Channel wrapper reporting every RPC to request listeners.
+
+    Serialization, retries and protobuf decoding happen inside the native
+    channel, so each RPC is reported as a single attempt covering the call.
+    """
+
+    def __init__(
+        self, channel: GrpcChannelProtocol, listeners: tuple[RequestListener, ...], host: str
+    ) -> None:
+        self._channel = channel
+        self._listeners = listeners
+        self._host = host
+
+    def __getattr__(self, name: str) -> Any:
+        method = getattr(self._channel, name)
+        rpc = _RPC_NAMES.get(name)
+        if rpc is None:
+            return method
+        listeners = self._listeners
+        host = self._host
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            trace = _RequestTrace(
+                listeners, transport="grpc", method=rpc, path=f"/VectorService/{rpc}", host=host
+            )
+            trace.begin_attempt()
+            try:
+                result = method(*args, **kwargs)
+            except Exception as exc:
+                trace.status_code = getattr(exc, "status_code", None)
+                trace.end_attempt(status_code=trace.status_code, error=exc)
+                trace.finish(exc)
+                raise
+            trace.status_code = 200
+            trace.end_attempt(status_code=200)
+            trace.finish()
+            return result
+
+        return call
+
+
 class GrpcIndex:
     """Synchronous gRPC data plane client targeting a specific Pinecone index.
 
@@ -162,9 +321,37 @@ class GrpcIndex:
         secure (bool): Whether to use TLS encryption. Defaults to ``True``.
         timeout (float): Request timeout in seconds. Defaults to ``20.0``.
         connect_timeout (float): Connection timeout in seconds. Defaults to ``1.0``.
+        metadata_type (type | None): A :class:`msgspec.Struct` subclass or dataclass
+            describing the metadata stored in this index. When set, ``metadata`` on
+            query/fetch results (and search hit ``fields``) is converted into this
+            type instead of a ``dict``. Defaults to ``None``.
+        compact_sparse (bool): If ``True``, sparse values returned by query and fetch
+            are backed by ``array("I")`` / ``array("f")`` decoded straight from the
+            wire instead of Python lists. Defaults to ``False``.
+        runtime (Literal["multi_thread", "current_thread", "shared"]): Tokio runtime
+            that drives this client's RPCs. ``"multi_thread"`` gives the client its
+            own runtime with one worker thread per core (or ``worker_threads``).
+            ``"current_thread"`` spawns no worker threads; each RPC is driven by
+            the calling thread, which suits single-threaded callers. Only one
+            thread can drive this runtime at a time, so RPCs issued from
+            several threads run one after another: ``upsert(batch_size=...,
+            max_concurrency=N)``, ``async_req=True`` and :meth:`buffered_writer`
+            get no concurrency from it.
+            ``"shared"`` runs every ``GrpcIndex`` in the process on one runtime,
+            so many index handles do not each spawn their own threads.
+            Defaults to ``"multi_thread"``.
+        worker_threads (int | None): Worker thread count of a ``"multi_thread"``
+            runtime. Defaults to ``None`` (one per core).
+        lazy_runtime (bool): If ``True``, the runtime and channel are created on
+            the first RPC instead of during construction. Defaults to ``False``.
+        request_listeners (Sequence[RequestListener]): Callables that receive a
+            :class:`~pinecone.RequestEvent` for every RPC and REST request this
+            client sends. Defaults to none. Clients of the worker processes used
+            by ``upsert(..., processes=N)`` do not report events.
 
     Raises:
-        :exc:`ValidationError`: If no API key can be resolved or the host is invalid.
+        :exc:`ValidationError`: If no API key can be resolved, the host is invalid,
+            or the runtime options are inconsistent.
 
     Examples:
 
@@ -185,6 +372,12 @@ class GrpcIndex:
         secure: bool = True,
         timeout: float = 20.0,
         connect_timeout: float = 1.0,
+        metadata_type: type[Any] | None = None,
+        compact_sparse: bool = False,
+        runtime: Literal["multi_thread", "current_thread", "shared"] = "multi_thread",
+        worker_threads: int | None = None,
+        lazy_runtime: bool = False,
+        request_listeners: Sequence[RequestListener] = (),
     ) -> None:
         # Resolve API key: explicit arg > env var
         resolved_key = api_key or os.environ.get("PINECONE_API_KEY", "")
@@ -197,6 +390,33 @@ class GrpcIndex:
         # Validate and normalize host
         self._host = _validate_host(host)
         self._source_tag = source_tag
+        # Constructor arguments for the clients of worker processes.
+        self._client_kwargs: dict[str, Any] = {
+            "host": self._host,
+            "api_key": resolved_key,
+            "api_version": api_version,
+            "source_tag": source_tag,
+            "secure": secure,
+            "timeout": timeout,
+            "connect_timeout": connect_timeout,
+            "metadata_type": metadata_type,
+            "compact_sparse": compact_sparse,
+            "runtime": runtime,
+            "worker_threads": worker_threads,
+            "lazy_runtime": lazy_runtime,
+        }
+
+        require_one_of("runtime", runtime, ("multi_thread", "current_thread", "shared"))
+        if worker_threads is not None:
+            if runtime != "multi_thread":
+                raise ValidationError(
+                    f"worker_threads can only be set with runtime='multi_thread', not {runtime!r}"
+                )
+            require_in_range("worker_threads", worker_threads, 1, 1024)
+
+        if metadata_type is not None:
+            typed_vector_models(metadata_type)  # validate and build decoders up front
+        self._metadata_type = metadata_type
 
         # Build gRPC endpoint and create the Rust-backed channel
         endpoint = _build_grpc_endpoint(self._host, secure)
@@ -213,24 +433,36 @@ class GrpcIndex:
             timeout,
             connect_timeout,
             source_tag=source_tag,
+            compact_sparse=compact_sparse,
+            runtime=runtime,
+            worker_threads=worker_threads,
+            lazy_runtime=lazy_runtime,
         )
+        self._request_listeners = tuple(request_listeners)
+        if self._request_listeners:
+            traced = _TracedChannel(
+                self._channel, self._request_listeners, urlsplit(endpoint).hostname or self._host
+            )
+            self._channel = cast("GrpcChannelProtocol", traced)
 
         self._executor = ThreadPoolExecutor()
         self._batch_executor: ThreadPoolExecutor | None = None
         self._batch_executor_workers: int = 0
+        self._process_pool: ProcessPoolExecutor | None = None
+        self._process_pool_workers: int = 0
 
         # REST HTTP client for records operations (integrated inference).
-        # upsert_records and search use REST endpoints with no gRPC equivalent.
-        from pinecone._internal.http_client import HTTPClient
-
-        rest_config = PineconeConfig(
+        # upsert_records and search use REST endpoints with no gRPC equivalent,
+        # so the client (and its TLS context) is only built when one is called.
+        self._rest_config = PineconeConfig(
             api_key=resolved_key,
             host=self._host,
             timeout=timeout,
             source_tag=source_tag or "",
             ssl_verify=secure,
+            request_listeners=self._request_listeners,
         )
-        self._http = HTTPClient(rest_config, DATA_PLANE_API_VERSION)
+        self._rest_client: HTTPClient | None = None
         self._adapter = VectorsAdapter()
 
         logger.info("GrpcIndex client created for host %s", self._host)
@@ -240,6 +472,19 @@ class GrpcIndex:
         """The data plane host URL for this index."""
         return self._host
 
+    @property
+    def _http(self) -> HTTPClient:
+        """REST client for the records endpoints, created on first use."""
+        if self._rest_client is None:
+            from pinecone._internal.http_client import HTTPClient
+
+            self._rest_client = HTTPClient(self._rest_config, DATA_PLANE_API_VERSION)
+        return self._rest_client
+
+    @_http.setter
+    def _http(self, client: HTTPClient) -> None:
+        self._rest_client = client
+
     def _get_batch_executor(self, max_concurrency: int) -> ThreadPoolExecutor:
         if self._batch_executor is None or self._batch_executor_workers != max_concurrency:
             if self._batch_executor is not None:
@@ -251,6 +496,17 @@ class GrpcIndex:
             self._batch_executor_workers = max_concurrency
         return self._batch_executor
 
+    def _get_process_pool(self, processes: int) -> ProcessPoolExecutor:
+        if self._process_pool is None or self._process_pool_workers != processes:
+            if self._process_pool is not None:
+                self._process_pool.shutdown(cancel_futures=True)
+            from pinecone._internal.process_upsert import create_process_pool
+
+            self._process_pool = create_process_pool(type(self), self._client_kwargs, processes)
+            self._process_pool_workers = processes
+        return self._process_pool
+
+    @traced
     def upsert(
         self,
         *,
@@ -261,10 +517,14 @@ class GrpcIndex:
             | Mapping[str, Any]
         ],
         namespace: str = "",
-        batch_size: int | None = None,
+        batch_size: int | Literal["auto"] | None = None,
         max_concurrency: int = 4,
         show_progress: bool = True,
         timeout: float | None = None,
+        retry_policy: BatchRetryPolicy | None = None,
+        checkpoint: str | os.PathLike[str] | None = None,
+        workers: Literal["thread", "process"] = "thread",
+        processes: int | None = None,
     ) -> UpsertResponse:
         """Upsert a batch of vectors into a namespace.
 
@@ -278,10 +538,13 @@ class GrpcIndex:
                 and optional ``sparse_values`` / ``metadata`` keys.
             namespace (str): Target namespace. Defaults to the default
                 (empty-string) namespace.
-            batch_size (int | None): If set, splits ``vectors`` into batches of
-                this size and submits them in **parallel** via a
-                ``ThreadPoolExecutor``. ``None`` (default) sends all vectors in
-                a single channel call. Must be a positive integer when set.
+            batch_size (int | Literal["auto"] | None): If set, splits
+                ``vectors`` into batches of at most this size, whose estimated
+                encoded size also stays under the 2 MiB upsert request limit,
+                and submits them in **parallel** via a ``ThreadPoolExecutor``.
+                ``"auto"`` starts at 50 and grows the batch size while
+                throughput improves (up to 1000). ``None`` (default) sends all
+                vectors in a single channel call.
             max_concurrency (int): Number of parallel threads used when
                 ``batch_size`` is set. Default ``4``, range ``[1, 64]``. Ignored
                 when ``batch_size`` is ``None``.
@@ -290,15 +553,41 @@ class GrpcIndex:
                 is ``None``. Defaults to ``True``.
             timeout (float | None): Per-call timeout in seconds. Applied per batch
                 when batching. None uses the client-level default.
+            retry_policy (BatchRetryPolicy | None): Re-send batches that fail
+                with transient errors after a backoff, and split batches that
+                are rejected as invalid until only the offending vectors
+                remain. Only used when ``batch_size`` is set. Default ``None``
+                records each failed batch as is.
+            checkpoint (str | os.PathLike | None): Path of a checkpoint file
+                that makes the upsert resumable. Each acknowledged batch is
+                appended to the file, and a rerun with the same *vectors*,
+                *namespace* and *batch_size* skips the batches it records.
+                Requires an integer *batch_size*. Default ``None``.
+            workers (Literal["thread", "process"]): ``"process"`` spreads the
+                work of building and encoding vectors, which holds the GIL in
+                ``"thread"`` mode, across a pool of worker processes. Each
+                process owns its own channel and sends up to
+                *max_concurrency* requests at a time. Requires
+                ``batch_size``; not supported with *checkpoint*. Defaults to
+                ``"thread"``.
+            processes (int | None): Size of the process pool in ``"process"``
+                mode. Defaults to the number of CPUs.
 
         Returns:
-            :class:`UpsertResponse` with the count of vectors upserted.
+            :class:`UpsertResponse` with the count of vectors upserted. With
+            *checkpoint*, the counts include the batches acknowledged by
+            earlier runs.
 
         Raises:
             :exc:`TypeError`: If a vector element is not a recognized format.
             :exc:`ValueError`: If a vector element is malformed.
             :exc:`PineconeValueError`: If ``batch_size`` is not a positive integer
                 or ``max_concurrency`` is outside ``[1, 64]``.
+            :exc:`PineconeValueError`: If *checkpoint* is given without an
+                integer *batch_size*, was written for a different upsert, or
+                no longer matches *vectors*.
+            :exc:`PineconeValueError`: If *workers* is not ``"thread"`` or
+                ``"process"``, or ``"process"`` is used without *batch_size*.
             :exc:`PineconeTimeoutError`: If the call exceeds *timeout* or the server
                 returns CANCELLED with a timeout cause.
 
@@ -312,6 +601,17 @@ class GrpcIndex:
             retry. Pass ``response.failed_items`` back to ``upsert(...)`` to retry
             only the failures.
 
+            With ``workers="process"`` the input is cut into shards whose dense
+            values are handed to the worker processes through shared memory.
+            Worker processes are started with the ``spawn`` method, so a script
+            that uses this mode must guard its entry point with
+            ``if __name__ == "__main__":``. The pool is kept for later calls
+            and shut down by :meth:`close`. Vectors are validated by the
+            workers one shard at a time rather than up front, so a malformed
+            vector raises only after the shards before it have been
+            upserted. Validate the input first, or upsert in ``"thread"``
+            mode, when the call must not write partially.
+
         Examples:
 
             .. code-block:: python
@@ -333,42 +633,102 @@ class GrpcIndex:
                 )
                 print(response.upserted_count)
         """
+        process_count = None
+        if workers != "thread":
+            from pinecone._internal.process_upsert import resolve_process_count
+
+            process_count = resolve_process_count(
+                workers, processes, batch_size=batch_size, checkpoint=checkpoint
+            )
         if batch_size is None:
-            built = [VectorFactory.build(v) for v in vectors]
+            if checkpoint is not None:
+                raise PineconeValueError("checkpoint requires batch_size to be set")
+            built = VectorFactory.build_many(vectors)
             grpc_vectors = [_vector_to_grpc_dict(v) for v in built]
             logger.info("Upserting %d vectors via gRPC into namespace %r", len(built), namespace)
             result = self._channel.upsert(grpc_vectors, namespace or None, timeout_s=timeout)
             return UpsertResponse(upserted_count=result.get("upserted_count", 0))
 
-        validate_batch_size(batch_size)
+        resolved = resolve_batch_size(batch_size)
         require_in_range("max_concurrency", max_concurrency, 1, 64)
+        if process_count is not None:
+            from pinecone._internal.process_upsert import process_upsert, shard_size
+
+            batch_result = process_upsert(
+                pool=self._get_process_pool(process_count),
+                processes=process_count,
+                vectors=vectors,
+                shard_size=shard_size(len(vectors), process_count, batch_size, max_concurrency),
+                namespace=namespace,
+                batch_size=batch_size,
+                max_concurrency=max_concurrency,
+                timeout=timeout,
+                retry_policy=retry_policy,
+                show_progress=show_progress,
+            )
+        else:
+            batch_result = self._upsert_grpc_items(
+                items=(_vector_to_grpc_dict(v) for v in VectorFactory.build_many(vectors)),
+                namespace=namespace,
+                batch_size=batch_size,
+                resolved=resolved,
+                max_concurrency=max_concurrency,
+                show_progress=show_progress,
+                timeout=timeout,
+                retry_policy=retry_policy,
+                checkpoint=checkpoint,
+            )
+        return _batch_upsert_response(batch_result)
 
-        built = [VectorFactory.build(v) for v in vectors]
-        items: builtins.list[dict[str, Any]] = [_vector_to_grpc_dict(v) for v in built]
+    def _upsert_grpc_items(
+        self,
+        *,
+        items: Iterable[dict[str, Any]],
+        namespace: str,
+        batch_size: int | Literal["auto"],
+        resolved: int | BatchSizeTuner,
+        max_concurrency: int,
+        show_progress: bool,
+        timeout: float | None,
+        retry_policy: BatchRetryPolicy | None,
+        checkpoint: str | os.PathLike[str] | None,
+        total: int | None = None,
+    ) -> BatchResult:
+        chunks = pack_batches(
+            items,
+            batch_size=resolved,
+            max_bytes=MAX_REQUEST_BYTES,
+            size_of=_grpc_vector_size,
+        )
 
-        def _operation(chunk: builtins.list[dict[str, Any]]) -> dict[str, Any]:
+        def _operation(chunk: builtins.list[dict[str, Any]], _: None) -> dict[str, Any]:
             return self._channel.upsert(chunk, namespace or None, timeout_s=timeout)
 
-        batch_result = batch_execute(
-            items=items,
-            operation=_operation,
-            batch_size=batch_size,
-            max_concurrency=max_concurrency,
-            show_progress=show_progress,
-            desc="Upserting",
-            executor=self._get_batch_executor(max_concurrency),
-        )
-
-        return UpsertResponse(
-            upserted_count=batch_result.successful_item_count,
-            total_item_count=batch_result.total_item_count,
-            failed_item_count=batch_result.failed_item_count,
-            total_batch_count=batch_result.total_batch_count,
-            successful_batch_count=batch_result.successful_batch_count,
-            failed_batch_count=batch_result.failed_batch_count,
-            errors=batch_result.errors,
+        job = (
+            None
+            if checkpoint is None
+            else open_upsert_checkpoint(
+                checkpoint, transport="grpc", namespace=namespace, batch_size=batch_size
+            )
         )
+        try:
+            return batch_execute_stream(
+                batches=((chunk, None) for chunk in chunks),
+                operation=tuned(_operation, resolved),
+                retry_policy=retry_policy,
+                rebuild=lambda chunk: None,
+                checkpoint=job,
+                max_concurrency=max_concurrency,
+                show_progress=show_progress,
+                desc="Upserting",
+                total=total,
+                executor=self._get_batch_executor(max_concurrency),
+            )
+        finally:
+            if job is not None:
+                job.close()
 
+    @traced
     def query(
         self,
         *,
@@ -438,10 +798,9 @@ class GrpcIndex:
         sv_dict: Mapping[str, Any] | None = None
         if sparse_vector is not None:
             if isinstance(sparse_vector, SparseValues):
-                sv_dict = {
-                    "indices": sparse_vector.indices,
-                    "values": sparse_vector.values,
-                }
+                sv_dict = _sparse_to_grpc_dict(sparse_vector.indices, sparse_vector.values)
+            elif "indices" in sparse_vector and "values" in sparse_vector:
+                sv_dict = _sparse_to_grpc_dict(sparse_vector["indices"], sparse_vector["values"])
             else:
                 sv_dict = sparse_vector
 
@@ -460,7 +819,9 @@ class GrpcIndex:
             timeout_s=timeout,
         )
 
-        matches = [_dict_to_scored_vector(m) for m in result.get("matches", [])]
+        matches = [
+            _dict_to_scored_vector(m, self._metadata_type) for m in result.get("matches", [])
+        ]
         usage = _dict_to_usage(result.get("usage"))
         return QueryResponse(
             matches=matches,
@@ -468,6 +829,7 @@ class GrpcIndex:
             usage=usage,
         )
 
+    @traced
     def fetch(
         self,
         *,
@@ -507,7 +869,7 @@ class GrpcIndex:
 
         vectors: dict[str, Vector] = {}
         for vid, vdata in result.get("vectors", {}).items():
-            vectors[vid] = _dict_to_vector(vid, vdata)
+            vectors[vid] = _dict_to_vector(vid, vdata, self._metadata_type)
 
         usage = _dict_to_usage(result.get("usage"))
         return FetchResponse(
@@ -516,6 +878,7 @@ class GrpcIndex:
             usage=usage,
         )
 
+    @traced
     def delete(
         self,
         *,
@@ -574,6 +937,7 @@ class GrpcIndex:
             timeout_s=timeout,
         )
 
+    @traced
     def update(
         self,
         *,
@@ -631,10 +995,9 @@ class GrpcIndex:
         sv_dict: Mapping[str, Any] | None = None
         if sparse_values is not None:
             if isinstance(sparse_values, SparseValues):
-                sv_dict = {
-                    "indices": sparse_values.indices,
-                    "values": sparse_values.values,
-                }
+                sv_dict = _sparse_to_grpc_dict(sparse_values.indices, sparse_values.values)
+            elif "indices" in sparse_values and "values" in sparse_values:
+                sv_dict = _sparse_to_grpc_dict(sparse_values["indices"], sparse_values["values"])
             else:
                 sv_dict = sparse_values
 
@@ -655,6 +1018,7 @@ class GrpcIndex:
 
         return UpdateResponse(matched_records=result.get("matched_records"))
 
+    @traced
     def list_paginated(
         self,
         *,
@@ -761,6 +1125,7 @@ class GrpcIndex:
             else:
                 break
 
+    @traced
     def describe_index_stats(
         self,
         *,
@@ -815,6 +1180,7 @@ class GrpcIndex:
         namespace: str = "",
         batch_size: int = 500,
         show_progress: bool = True,
+        checkpoint: str | os.PathLike[str] | None = None,
     ) -> UpsertResponse:
         """Upsert vectors from a pandas DataFrame using async batching.
 
@@ -831,6 +1197,9 @@ class GrpcIndex:
             show_progress: If ``True`` and ``tqdm`` is installed, display a
                 progress bar. If ``tqdm`` is not installed, silently falls
                 back to no progress bar.
+            checkpoint: Path of a checkpoint file that makes the load
+                resumable. The rows are then sent through :meth:`upsert` with
+                the same *batch_size*; see its *checkpoint* argument.
 
         Returns:
             :class:`UpsertResponse` with the total count of vectors upserted across
@@ -840,6 +1209,8 @@ class GrpcIndex:
             :exc:`RuntimeError`: If ``pandas`` is not installed.
             :exc:`PineconeValueError`: If *df* is not a ``pandas.DataFrame``.
             :exc:`PineconeValueError`: If *batch_size* is not a positive integer.
+            :exc:`PineconeValueError`: If *checkpoint* was written for a
+                different upsert or no longer matches *df*.
 
         Examples:
 
@@ -903,6 +1274,15 @@ class GrpcIndex:
                 record["metadata"] = row["metadata"]
             records.append(record)
 
+        if checkpoint is not None:
+            return self.upsert(
+                vectors=records,
+                namespace=namespace,
+                batch_size=batch_size,
+                show_progress=show_progress,
+                checkpoint=checkpoint,
+            )
+
         batches = chunked(records, batch_size)
         futures: builtins.list[PineconeFuture[UpsertResponse]] = [
             self.upsert_async(vectors=batch, namespace=namespace)
@@ -916,6 +1296,96 @@ class GrpcIndex:
 
         return UpsertResponse(upserted_count=total_count)
 
+    def upsert_from_file(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        ids: str | os.PathLike[str] | Sequence[Any] | None = None,
+        namespace: str = "",
+        format: VectorFileFormat | None = None,
+        dataset: str | None = None,
+        start: int = 0,
+        stop: int | None = None,
+        batch_size: int | Literal["auto"] = 500,
+        max_concurrency: int = 4,
+        show_progress: bool = True,
+        timeout: float | None = None,
+        retry_policy: BatchRetryPolicy | None = None,
+        checkpoint: str | os.PathLike[str] | None = None,
+    ) -> UpsertResponse:
+        """Upsert dense vectors from a ``.npy``, ``.fvecs``, ``.bvecs`` or HDF5 file.
+
+        The file is memory-mapped (HDF5 datasets are read a block at a time)
+        and its rows are streamed into the batched upsert path, so files
+        much larger than available memory can be loaded.
+
+        Args:
+            path (str | os.PathLike): The vector file. Its format is inferred
+                from the suffix unless *format* is given.
+            ids (str | os.PathLike | Sequence | None): The ID of each row:
+                ``None`` (default) uses the row number, a ``range``, list or
+                NumPy array gives the ID of row ``i`` at position ``i``, and
+                a path names a text file with one ID per line.
+            namespace (str): Target namespace. Defaults to ``""``.
+            format (Literal["npy", "fvecs", "bvecs", "hdf5"] | None): File
+                format, when the suffix does not identify it.
+            dataset (str | None): Dataset of an HDF5 file. Defaults to ``"train"``.
+            start (int): First row to upsert. Defaults to ``0``.
+            stop (int | None): Row to stop before. Defaults to the end of the file.
+            batch_size (int | Literal["auto"]): Vectors per request, as for
+                :meth:`upsert`. Defaults to ``500``.
+            max_concurrency (int): Parallel requests, range ``[1, 64]``.
+                Defaults to ``4``.
+            show_progress (bool): If ``True`` and ``tqdm`` is installed,
+                display a progress bar. Defaults to ``True``.
+            timeout (float | None): Per-call timeout in seconds.
+            retry_policy (BatchRetryPolicy | None): Batch retry and bisection
+                policy; see :meth:`upsert`.
+            checkpoint (str | os.PathLike | None): Checkpoint file that makes
+                the load resumable; see :meth:`upsert`.
+
+        Returns:
+            :class:`UpsertResponse` with the batched upsert counters.
+
+        Raises:
+            :exc:`RuntimeError`: If ``numpy`` (or ``h5py`` for HDF5) is not installed.
+            :exc:`PineconeValueError`: If the format cannot be determined, the
+                file is not a two-dimensional array of vectors, the row range
+                is invalid, or *ids* has fewer entries than the rows.
+            :exc:`PineconeValueError`: If *batch_size* or *max_concurrency*
+                is invalid, or *checkpoint* does not match this load.
+
+        Examples:
+
+            .. code-block:: python
+
+                from pinecone.grpc import GrpcIndex
+
+                idx = GrpcIndex(host="sift-benchmark-abc123.svc.pinecone.io", api_key="...")
+                response = idx.upsert_from_file("sift_base.fvecs", batch_size=200)
+                print(response.upserted_count)
+        """
+        from pinecone._internal.vector_files import VectorFile, iter_file_vectors, resolve_row_range
+
+        resolved = resolve_batch_size(batch_size)
+        require_in_range("max_concurrency", max_concurrency, 1, 64)
+        with VectorFile(path, format=format, dataset=dataset) as file:
+            first, last = resolve_row_range(len(file), start, stop)
+            batch_result = self._upsert_grpc_items(
+                # The channel reads dense values as a sequence of floats.
+                items=iter_file_vectors(file, ids, start=first, stop=last, as_lists=True),
+                namespace=namespace,
+                batch_size=batch_size,
+                resolved=resolved,
+                max_concurrency=max_concurrency,
+                show_progress=show_progress,
+                timeout=timeout,
+                retry_policy=retry_policy,
+                checkpoint=checkpoint,
+                total=None if batch_size == "auto" else -(-(last - first) // batch_size),
+            )
+        return _batch_upsert_response(batch_result)
+
     # ------------------------------------------------------------------
     # Async (future-returning) variants
     # ------------------------------------------------------------------
@@ -1110,12 +1580,17 @@ class GrpcIndex:
             )
         )
 
+    @traced
     def upsert_records(
         self,
         *,
-        records: builtins.list[dict[str, Any]],
+        records: Iterable[dict[str, Any]],
         namespace: str,
+        batch_size: int | Literal["auto"] | None = None,
+        max_concurrency: int = 4,
+        show_progress: bool = True,
         timeout: float | None = None,
+        retry_policy: BatchRetryPolicy | None = None,
     ) -> UpsertRecordsResponse:
         """Upsert records for indexes with integrated inference.
 
@@ -1124,18 +1599,42 @@ class GrpcIndex:
         because the Pinecone gRPC API does not expose a records upsert operation.
 
         Args:
-            records: List of record dicts. Each must contain an ``_id`` or
-                ``id`` field. Additional fields are passed through for
-                server-side embedding.
+            records: Iterable of record dicts (a list, generator, or any other
+                iterable). Each must contain an ``_id`` or ``id`` field.
+                Additional fields are passed through for server-side embedding.
             namespace (str): Target namespace (required). Use ``""`` for the
                 default namespace.
+            batch_size (int | Literal["auto"] | None): Send at most this many
+                records (1–96) per request, also splitting so that no request
+                body exceeds 2 MiB. ``"auto"`` grows the batch size while
+                throughput improves. Records are encoded lazily and batches are
+                sent concurrently. Default ``None`` sends a single request.
+            max_concurrency (int): Thread pool size for concurrent batch
+                requests (range 1–64, default 4). Only used when ``batch_size``
+                is set.
+            show_progress (bool): When ``True`` and ``tqdm`` is installed,
+                display a progress bar across batches. Only used when
+                ``batch_size`` is set. Defaults to ``True``.
+            timeout (float | None): Per-request timeout in seconds. Overrides
+                the client-level default for this call only.
+            retry_policy (BatchRetryPolicy | None): Re-send batches that fail
+                with transient errors after a backoff, and split batches that
+                are rejected as invalid until only the offending records
+                remain. Only used when ``batch_size`` is set. Default ``None``
+                records each failed batch as is.
 
         Returns:
             :class:`UpsertRecordsResponse` with the count of records submitted.
+            When ``batch_size`` is set, per-batch failures are captured on the
+            response (``has_errors``, ``errors``, ``failed_items``) instead of
+            being raised.
 
         Raises:
             :exc:`PineconeValueError`: If namespace is not a string or is empty/whitespace,
-                records is empty, or a record is missing an identifier field.
+                records is empty, a record is missing an identifier field,
+                *batch_size* is outside [1, 96], or *max_concurrency* is
+                outside [1, 64]. With ``batch_size`` set, an invalid record is
+                detected when it is reached, after earlier batches were sent.
             :exc:`ApiError`: If the API returns an error response.
             :exc:`PineconeConnectionError`: If a network-level connection
                 fails (DNS, refused, transport error).
@@ -1155,43 +1654,65 @@ class GrpcIndex:
                     ],
                 )
                 print(response.record_count)
-        """
-        if not isinstance(namespace, str):
-            raise ValidationError("namespace must be a string")
-        if not namespace or not namespace.strip():
-            raise ValidationError("namespace must be a non-empty string")
-        if not records:
-            raise ValidationError("records must be a non-empty list")
-
-        for i, record in enumerate(records):
-            if "_id" not in record and "id" not in record:
-                raise ValidationError(f"Record at index {i} must contain an '_id' or 'id' field")
 
-        import orjson
+                # Stream a large corpus in concurrent batches of 96
+                response = idx.upsert_records(
+                    namespace="articles-en",
+                    records=({"_id": doc.id, "text": doc.body} for doc in corpus),
+                    batch_size=96,
+                )
+        """
+        validate_namespace(namespace)
+        if batch_size is None:
+            record_count, body = encode_ndjson(records)
+            logger.info(
+                "Upserting %d records into namespace %r (NDJSON via REST)", record_count, namespace
+            )
+            return self._upsert_records_body(
+                namespace=namespace, body=body, record_count=record_count, timeout=timeout
+            )
 
-        normalized: builtins.list[dict[str, Any]] = []
-        for record in records:
-            r = dict(record)
-            if "_id" not in r and "id" in r:
-                r["_id"] = r.pop("id")
-            normalized.append(r)
+        resolved = resolve_records_batch_size(batch_size)
+        require_in_range("max_concurrency", max_concurrency, 1, 64)
+        if isinstance(records, builtins.list) and not records:
+            raise ValidationError("records must be a non-empty list")
 
-        ndjson_lines = [orjson.dumps(r).decode("utf-8") for r in normalized]
-        ndjson_body = "\n".join(ndjson_lines) + "\n"
+        def _operation(items: builtins.list[dict[str, Any]], body: bytes) -> UpsertRecordsResponse:
+            return self._upsert_records_body(
+                namespace=namespace, body=body, record_count=len(items), timeout=timeout
+            )
 
-        logger.info(
-            "Upserting %d records into namespace %r (NDJSON via REST)", len(records), namespace
+        batch_result = batch_execute_stream(
+            batches=iter_ndjson_batches(records, resolved),
+            operation=tuned(_operation, resolved),
+            retry_policy=retry_policy,
+            rebuild=lambda items: encode_ndjson(items)[1],
+            max_concurrency=max_concurrency,
+            show_progress=show_progress,
+            desc="Upserting records",
+            executor=self._get_batch_executor(max_concurrency),
         )
+        return records_response(batch_result)
+
+    def _upsert_records_body(
+        self,
+        *,
+        namespace: str,
+        body: bytes,
+        record_count: int,
+        timeout: float | None,
+    ) -> UpsertRecordsResponse:
         response = self._http.post(
             f"/records/namespaces/{namespace}/upsert",
             timeout=timeout,
-            content=ndjson_body.encode("utf-8"),
-            headers={"Content-Type": "application/x-ndjson"},
+            content=body,
+            headers=NDJSON_HEADERS,
         )
-        result = UpsertRecordsResponse(record_count=len(records))
+        result = UpsertRecordsResponse(record_count=record_count)
         result.response_info = extract_response_info(response)
         return result
 
+    @traced
     def search(
         self,
         *,
@@ -1318,7 +1839,7 @@ class GrpcIndex:
         response = self._http.post(
             f"/records/namespaces/{namespace}/search", timeout=timeout, json=body
         )
-        result = self._adapter.to_search_response(response.content)
+        result = self._adapter.to_search_response(response.content, self._metadata_type)
         result.response_info = extract_response_info(response)
         return result
 
@@ -1353,6 +1874,7 @@ class GrpcIndex:
             timeout=timeout,
         )
 
+    @traced
     def list_namespaces_paginated(
         self,
         *,
@@ -1439,6 +1961,7 @@ class GrpcIndex:
             else:
                 break
 
+    @traced
     def create_namespace(
         self,
         *,
@@ -1469,6 +1992,7 @@ class GrpcIndex:
         result = self._channel.create_namespace(name, schema, timeout_s=timeout)
         return _dict_to_namespace_description(result)
 
+    @traced
     def describe_namespace(
         self,
         *,
@@ -1507,6 +2031,7 @@ class GrpcIndex:
         result = self._channel.describe_namespace(effective, timeout_s=timeout)
         return _dict_to_namespace_description(result)
 
+    @traced
     def delete_namespace(
         self,
         *,
@@ -1543,12 +2068,70 @@ class GrpcIndex:
         logger.info("Deleting namespace %r via gRPC", effective)
         self._channel.delete_namespace(effective, timeout_s=timeout)
 
+    def buffered_writer(
+        self,
+        *,
+        batch_size: int = 100,
+        max_bytes: int = MAX_REQUEST_BYTES,
+        flush_interval: float = 1.0,
+        max_pending: int = 10_000,
+        on_error: Callable[[BufferedWriteError], None] | None = None,
+    ) -> BufferedWriter:
+        """Return a :class:`BufferedWriter` that batches writes to this index.
+
+        Small upserts and deletes are accumulated per namespace, coalesced by
+        ID, and sent from a background thread once *batch_size* writes or
+        *max_bytes* of payload are pending, or *flush_interval* seconds have
+        passed since the oldest pending write.
+
+        Args:
+            batch_size (int): Pending writes that trigger a flush, and the
+                maximum number of vectors per request (default 100).
+            max_bytes (int): Estimated payload bytes that trigger a flush, and
+                the per-request cap (default and maximum 2 MiB).
+            flush_interval (float): Maximum seconds a write stays buffered
+                (default 1.0).
+            max_pending (int): Pending writes at which further writes block
+                until the worker catches up (default 10000).
+            on_error (Callable[[BufferedWriteError], None] | None): Called
+                from the worker thread with each failed request.
+
+        Returns:
+            :class:`BufferedWriter` — call ``close()`` (or use it as a context
+            manager) to flush remaining writes and stop the worker.
+
+        Raises:
+            :exc:`PineconeValueError`: If a threshold is invalid.
+
+        Examples:
+            .. code-block:: python
+
+                with idx.buffered_writer(flush_interval=0.5) as writer:
+                    for event in events:
+                        writer.upsert(vectors=[(event.id, event.embedding)])
+                        if event.retracted:
+                            writer.delete(ids=[event.id])
+        """
+        from pinecone.index.buffered_writer import BufferedWriter
+
+        return BufferedWriter(
+            self,
+            batch_size=batch_size,
+            max_bytes=max_bytes,
+            flush_interval=flush_interval,
+            max_pending=max_pending,
+            on_error=on_error,
+        )
+
     def close(self) -> None:
         """Close the underlying gRPC channel, REST client, and release resources."""
         self._executor.shutdown(wait=True)
         if self._batch_executor is not None:
             self._batch_executor.shutdown(wait=False)
-        self._http.close()
+        if self._process_pool is not None:
+            self._process_pool.shutdown(cancel_futures=True)
+        if self._rest_client is not None:
+            self._rest_client.close()
         if hasattr(self._channel, "close"):
             self._channel.close()
 
@@ -0,0 +1,682 @@
+"""Staging and validation of Parquet files for :meth:`Index.start_import`.
+
+Bulk import reads a directory of Parquet files with one subdirectory per
+namespace (``__default__`` for the default namespace) and these columns:
+
+- ``id``: string, required.
+- ``values``: list of float32, for dense and hybrid indexes.
+- ``sparse_values``: struct of ``indices`` (list of uint32) and ``values``
+  (list of float32), for sparse and hybrid indexes.
+- ``metadata``: JSON object as a string, optional.
+
+:class:`ImportWriter` produces that layout from vectors, arrays or
+DataFrames, and :func:`validate_import_files` checks an existing directory
+before an import is started.  Both require ``pyarrow``.
+"""
+
+from __future__ import annotations
+
+import os
+import posixpath
+from collections.abc import Iterable, Iterator, Mapping, Sequence
+from itertools import islice
+from typing import TYPE_CHECKING, Any
+
+import orjson
+
+from pinecone._internal.validation import require_positive
+from pinecone._internal.vector_factory import VectorFactory
+from pinecone.errors.exceptions import PineconeValueError
+from pinecone.models.imports.validation import ImportValidationReport
+from pinecone.models.vectors.vector import Vector
+
+if TYPE_CHECKING:
+    import pandas as pd  # type: ignore[import-untyped]
+
+#: Directory that holds the default namespace's files.
+DEFAULT_NAMESPACE_DIR = "__default__"
+
+#: Estimated uncompressed bytes after which :class:`ImportWriter` starts a new file.
+DEFAULT_TARGET_FILE_BYTES = 512 * 1024 * 1024
+
+#: Rows per Parquet row group written by :class:`ImportWriter`.
+DEFAULT_ROW_GROUP_ROWS = 10_000
+
+#: Largest metadata object accepted per vector, in bytes of JSON.
+MAX_METADATA_BYTES = 40 * 1024
+
+_COLUMNS = ("id", "values", "sparse_values", "metadata")
+
+
+def _pyarrow() -> Any:
+    try:
+        import pyarrow as pa  # type: ignore[import-untyped,unused-ignore]
+    except ImportError:
+        raise RuntimeError(
+            "pyarrow is required for bulk import files. Install it with: pip install pyarrow"
+        ) from None
+    return pa
+
+
+def _resolve_filesystem(path: str | os.PathLike[str], filesystem: Any) -> tuple[Any, str]:
+    """Return ``(pyarrow filesystem, root path)`` for *path*.
+
+    *filesystem* may be a ``pyarrow.fs.FileSystem`` or an fsspec filesystem.
+    Without one, local paths use the local filesystem, URIs that pyarrow
+    understands (``s3://``, ``gs://``, ...) use pyarrow's own, and any other
+    scheme is opened through fsspec when it is installed.
+    """
+    _pyarrow()
+    import pyarrow.fs as pafs  # type: ignore[import-untyped,unused-ignore]
+
+    path = os.fspath(path)
+    if filesystem is not None:
+        if isinstance(filesystem, pafs.FileSystem):
+            return filesystem, path.rstrip("/")
+        return pafs.PyFileSystem(pafs.FSSpecHandler(filesystem)), path.rstrip("/")
+    if "://" not in path:
+        return pafs.LocalFileSystem(), os.path.abspath(path)
+    try:
+        fs, root = pafs.FileSystem.from_uri(path)
+    except (ValueError, NotImplementedError):
+        try:
+            import fsspec  # type: ignore[import-not-found,import-untyped,unused-ignore]
+        except ImportError:
+            raise PineconeValueError(
+                f"pyarrow cannot open {path!r}; install fsspec or pass filesystem="
+            ) from None
+        fs_spec, root = fsspec.core.url_to_fs(path)
+        fs = pafs.PyFileSystem(pafs.FSSpecHandler(fs_spec))
+    return fs, root.rstrip("/")
+
+
+def _namespace_dir(namespace: str) -> str:
+    if "/" in namespace:
+        raise PineconeValueError(f"namespace must not contain '/', got {namespace!r}")
+    return namespace or DEFAULT_NAMESPACE_DIR
+
+
+def _encode_metadata(metadata: Mapping[str, Any] | None) -> str | None:
+    return None if metadata is None else orjson.dumps(metadata).decode()
+
+
+class _NamespaceFiles:
+    """Open file and unwritten row batches of one namespace directory."""
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+        self.writer: Any = None
+        self.part = 0
+        self.bytes = 0
+        self.pending: list[Any] = []
+        self.pending_rows = 0
+
+
+class ImportWriter:
+    """Stream vectors into Parquet files laid out for :meth:`Index.start_import`.
+
+    Rows are buffered per namespace and written in row groups of
+    *row_group_rows*; a namespace's current file is closed and a new
+    ``part-NNNNN.parquet`` started once about *target_file_bytes* of
+    (uncompressed) data has gone into it.  Files are written under
+    ``<path>/<namespace>/``, with ``__default__`` for the default namespace.
+    Existing files of the same name are overwritten.
+
+    Args:
+        path (str | os.PathLike): Local directory or URI (for example
+            ``"s3://bucket/imports/run-1"``) to write to. Pass the same
+            location, as a URI, to :meth:`Index.start_import`.
+        dimension (int | None): Dense vector dimension. Taken from the first
+            dense vector when ``None``; every row must match it.
+        dense (bool): Write a ``values`` column. Defaults to ``True``.
+        sparse (bool): Write a ``sparse_values`` column. Defaults to ``False``.
+        target_file_bytes (int): Estimated uncompressed bytes per file.
+            Defaults to 512 MiB.
+        row_group_rows (int): Rows per Parquet row group. Defaults to 10000.
+        compression (str): Parquet compression codec. Defaults to ``"zstd"``.
+        filesystem: A ``pyarrow.fs.FileSystem`` or fsspec filesystem to
+            write through, for locations the URI alone cannot describe.
+
+    Raises:
+        :exc:`RuntimeError`: If ``pyarrow`` is not installed.
+        :exc:`PineconeValueError`: If neither *dense* nor *sparse* is set or
+            a size is not positive.
+
+    Examples:
+        .. code-block:: python
+
+            from pinecone import ImportWriter, Pinecone, validate_import_files
+
+            with ImportWriter("s3://my-bucket/imports/products") as writer:
+                writer.write_arrays(ids, embeddings, namespace="products-en")
+
+            report = validate_import_files("s3://my-bucket/imports/products")
+            if report.is_valid:
+                pc = Pinecone(api_key="your-api-key")
+                index = pc.index("product-search")
+                operation = index.start_import(uri="s3://my-bucket/imports/products")
+                index.wait_for_import(operation.id)
+    """
+
+    def __init__(
+        self,
+        path: str | os.PathLike[str],
+        *,
+        dimension: int | None = None,
+        dense: bool = True,
+        sparse: bool = False,
+        target_file_bytes: int = DEFAULT_TARGET_FILE_BYTES,
+        row_group_rows: int = DEFAULT_ROW_GROUP_ROWS,
+        compression: str = "zstd",
+        filesystem: Any = None,
+    ) -> None:
+        if not dense and not sparse:
+            raise PineconeValueError("ImportWriter needs dense=True, sparse=True or both")
+        if dimension is not None:
+            require_positive("dimension", dimension)
+        require_positive("target_file_bytes", target_file_bytes)
+        require_positive("row_group_rows", row_group_rows)
+        pa = _pyarrow()
+        self._fs, self._root = _resolve_filesystem(path, filesystem)
+        self.dimension = dimension
+        self._dense = dense
+        self._sparse = sparse
+        self._target_file_bytes = target_file_bytes
+        self._row_group_rows = row_group_rows
+        self._compression = compression
+        fields = [pa.field("id", pa.string(), nullable=False)]
+        if dense:
+            fields.append(pa.field("values", pa.list_(pa.float32())))
+        if sparse:
+            fields.append(
+                pa.field(
+                    "sparse_values",
+                    pa.struct(
+                        [("indices", pa.list_(pa.uint32())), ("values", pa.list_(pa.float32()))]
+                    ),
+                )
+            )
+        fields.append(pa.field("metadata", pa.string()))
+        self._schema = pa.schema(fields)
+        self._namespaces: dict[str, _NamespaceFiles] = {}
+        self._closed = False
+        self.files: list[str] = []
+        """Paths of the files completed so far."""
+        self.rows_written = 0
+        """Rows handed to the writer so far, including rows still buffered."""
+
+    # ------------------------------------------------------------------
+    # Input
+    # ------------------------------------------------------------------
+
+    def write(
+        self,
+        vectors: Iterable[
+            Vector
+            | tuple[str, Sequence[float]]
+            | tuple[str, Sequence[float], Mapping[str, Any]]
+            | Mapping[str, Any]
+        ],
+        *,
+        namespace: str = "",
+    ) -> None:
+        """Write vectors in any format accepted by :meth:`Index.upsert`.
+
+        *vectors* may be any iterable, including a generator; it is consumed
+        one row group at a time.
+
+        Raises:
+            :exc:`PineconeTypeError`: If a vector is not a recognized format.
+            :exc:`PineconeValueError`: If a vector is malformed, its dimension
+                differs, or it lacks the dense or sparse values the writer
+                was created for.
+        """
+        directory = _namespace_dir(namespace)
+        iterator = iter(vectors)
+        while chunk := list(islice(iterator, self._row_group_rows)):
+            self._append(directory, self._batch_from_vectors(VectorFactory.build_many(chunk)))
+
+    def write_arrays(
+        self,
+        ids: Sequence[str] | Any,
+        values: Any,
+        *,
+        namespace: str = "",
+        metadata: Sequence[Mapping[str, Any] | None] | None = None,
+    ) -> None:
+        """Write a two-dimensional array of dense vectors without per-row conversion.
+
+        Args:
+            ids: One string ID per row (a list or a NumPy/Arrow string array).
+            values: Array-like of shape ``(rows, dimension)``; converted to
+                float32.
+            namespace (str): Target namespace. Defaults to ``""``.
+            metadata: Optional metadata dict (or ``None``) per row.
+
+        Raises:
+            :exc:`PineconeValueError`: If the writer has no dense column, the
+                shapes disagree, or the dimension differs.
+        """
+        if not self._dense:
+            raise PineconeValueError("write_arrays requires a writer created with dense=True")
+        import numpy as np
+
+        pa = _pyarrow()
+        directory = _namespace_dir(namespace)
+        matrix = np.ascontiguousarray(values, dtype=np.float32)
+        if matrix.ndim != 2 or matrix.shape[1] == 0:
+            raise PineconeValueError(
+                f"values must be a two-dimensional array, got shape {matrix.shape}"
+            )
+        rows, dimension = matrix.shape
+        self._check_dimension(dimension, "values")
+        if len(ids) != rows or (metadata is not None and len(metadata) != rows):
+            raise PineconeValueError(
+                f"ids ({len(ids)}) and metadata must have one entry per row of values ({rows})"
+            )
+        for start in range(0, rows, self._row_group_rows):
+            stop = min(rows, start + self._row_group_rows)
+            id_array = pa.array(ids[start:stop], type=pa.string())
+            if id_array.null_count:
+                raise PineconeValueError("ids must not contain nulls")
+            offsets = pa.array(np.arange(stop - start + 1, dtype=np.int32) * np.int32(dimension))
+            columns = [id_array, pa.ListArray.from_arrays(offsets, matrix[start:stop].reshape(-1))]
+            if self._sparse:
+                columns.append(pa.nulls(stop - start, self._schema.field("sparse_values").type))
+            columns.append(
+                pa.nulls(stop - start, pa.string())
+                if metadata is None
+                else pa.array([_encode_metadata(m) for m in metadata[start:stop]], pa.string())
+            )
+            self._append(directory, pa.RecordBatch.from_arrays(columns, schema=self._schema))
+
+    def write_dataframe(self, df: pd.DataFrame, *, namespace: str = "") -> None:
+        """Write a DataFrame with the columns of :meth:`Index.upsert_from_dataframe`.
+
+        ``id`` and ``values`` are required; ``sparse_values`` and ``metadata``
+        are used when present.
+
+        Raises:
+            :exc:`RuntimeError`: If ``pandas`` is not installed.
+            :exc:`PineconeValueError`: If *df* is not a DataFrame or a row
+                is invalid.
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise RuntimeError(
+                "pandas is required for write_dataframe. Install it with: pip install pandas"
+            ) from None
+        if not isinstance(df, pd.DataFrame):
+            raise PineconeValueError("df must be a pandas DataFrame")
+        columns = [c for c in ("id", "values", "sparse_values", "metadata") if c in df.columns]
+
+        def _records() -> Iterator[dict[str, Any]]:
+            for row in df[columns].itertuples(index=False, name=None):
+                record = {c: v for c, v in zip(columns, row, strict=True) if v is not None}
+                if "values" in record:
+                    record["values"] = list(record["values"])
+                yield record
+
+        self.write(_records(), namespace=namespace)
+
+    # ------------------------------------------------------------------
+    # Output
+    # ------------------------------------------------------------------
+
+    def close(self) -> list[str]:
+        """Write buffered rows, close every file and return all file paths.
+
+        Calling ``close()`` more than once returns the same list.
+        """
+        if not self._closed:
+            self._closed = True
+            for state in self._namespaces.values():
+                self._flush(state)
+                self._close_file(state)
+        return self.files
+
+    def __enter__(self) -> ImportWriter:
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return (
+            f"ImportWriter(root={self._root!r}, rows_written={self.rows_written}, "
+            f"files={len(self.files)})"
+        )
+
+    # ------------------------------------------------------------------
+    # Internals
+    # ------------------------------------------------------------------
+
+    def _check_dimension(self, dimension: int, what: str) -> None:
+        if self.dimension is None:
+            self.dimension = dimension
+        elif dimension != self.dimension:
+            raise PineconeValueError(f"{what} has dimension {dimension}, expected {self.dimension}")
+
+    def _batch_from_vectors(self, vectors: list[Vector]) -> Any:
+        pa = _pyarrow()
+        dense: list[Any] = []
+        sparse: list[dict[str, Any] | None] = []
+        for v in vectors:
+            if self._dense:
+                if not v.values:
+                    raise PineconeValueError(f"Vector {v.id!r} has no dense values")
+                self._check_dimension(len(v.values), f"Vector {v.id!r}")
+                dense.append(v.values)
+            elif v.values:
+                raise PineconeValueError(
+                    f"Vector {v.id!r} has dense values; the writer was created with dense=False"
+                )
+            if self._sparse:
+                sv = v.sparse_values
+                sparse.append(
+                    None if sv is None else {"indices": list(sv.indices), "values": list(sv.values)}
+                )
+            elif v.sparse_values is not None:
+                raise PineconeValueError(
+                    f"Vector {v.id!r} has sparse values; the writer was created with sparse=False"
+                )
+        columns = [pa.array([v.id for v in vectors], type=pa.string())]
+        if self._dense:
+            columns.append(pa.array(dense, type=self._schema.field("values").type))
+        if self._sparse:
+            columns.append(pa.array(sparse, type=self._schema.field("sparse_values").type))
+        columns.append(pa.array([_encode_metadata(v.metadata) for v in vectors], type=pa.string()))
+        return pa.RecordBatch.from_arrays(columns, schema=self._schema)
+
+    def _append(self, directory: str, batch: Any) -> None:
+        if self._closed:
+            raise PineconeValueError("Cannot write to a closed ImportWriter")
+        state = self._namespaces.get(directory)
+        if state is None:
+            state = self._namespaces[directory] = _NamespaceFiles(
+                posixpath.join(self._root, directory)
+                if "://" not in self._root
+                else f"{self._root}/{directory}"
+            )
+        state.pending.append(batch)
+        state.pending_rows += batch.num_rows
+        self.rows_written += batch.num_rows
+        if state.pending_rows >= self._row_group_rows:
+            self._flush(state)
+
+    def _flush(self, state: _NamespaceFiles) -> None:
+        if not state.pending:
+            return
+        pa = _pyarrow()
+        import pyarrow.parquet as pq  # type: ignore[import-untyped,unused-ignore]
+
+        table = pa.Table.from_batches(state.pending, schema=self._schema)
+        state.pending.clear()
+        state.pending_rows = 0
+        if state.writer is None:
+            self._fs.create_dir(state.directory, recursive=True)
+            state.writer = pq.ParquetWriter(
+                f"{state.directory}/part-{state.part:05d}.parquet",
+                self._schema,
+                filesystem=self._fs,
+                compression=self._compression,
+            )
+        state.writer.write_table(table, row_group_size=self._row_group_rows)
+        state.bytes += table.nbytes
+        if state.bytes >= self._target_file_bytes:
+            self._close_file(state)
+
+    def _close_file(self, state: _NamespaceFiles) -> None:
+        if state.writer is None:
+            return
+        state.writer.close()
+        self.files.append(f"{state.directory}/part-{state.part:05d}.parquet")
+        state.writer = None
+        state.part += 1
+        state.bytes = 0
+
+
+# ---------------------------------------------------------------------------
+# Validation
+# ---------------------------------------------------------------------------
+
+
+class _Errors:
+    def __init__(self, limit: int) -> None:
+        self.limit = limit
+        self.messages: list[str] = []
+        self.dropped = 0
+
+    def add(self, message: str) -> None:
+        if len(self.messages) < self.limit:
+            self.messages.append(message)
+        else:
+            self.dropped += 1
+
+    def result(self) -> list[str]:
+        if self.dropped:
+            return [*self.messages, f"... and {self.dropped} more"]
+        return self.messages
+
+
+def _schema_problems(schema: Any) -> list[str]:
+    pa = _pyarrow()
+    types = pa.types
+    problems: list[str] = []
+    names = set(schema.names)
+    extra = sorted(names - set(_COLUMNS))
+    if extra:
+        problems.append(f"unexpected columns {extra}; allowed columns are {list(_COLUMNS)}")
+    if "id" not in names:
+        problems.append("missing required column 'id'")
+    elif not types.is_string(schema.field("id").type) and not types.is_large_string(
+        schema.field("id").type
+    ):
+        problems.append(f"column 'id' must be a string, got {schema.field('id').type}")
+    if "values" not in names and "sparse_values" not in names:
+        problems.append("needs a 'values' or 'sparse_values' column")
+    if "values" in names:
+        t = schema.field("values").type
+        if not (_is_list(t) and types.is_floating(t.value_type)):
+            problems.append(f"column 'values' must be a list of floats, got {t}")
+    if "sparse_values" in names:
+        t = schema.field("sparse_values").type
+        ok = (
+            types.is_struct(t)
+            and {t.field(i).name for i in range(t.num_fields)} == {"indices", "values"}
+            and _is_list(t.field("indices").type)
+            and types.is_integer(t.field("indices").type.value_type)
+            and _is_list(t.field("values").type)
+            and types.is_floating(t.field("values").type.value_type)
+        )
+        if not ok:
+            problems.append(
+                "column 'sparse_values' must be a struct of 'indices' (list of integers) "
+                f"and 'values' (list of floats), got {t}"
+            )
+    if "metadata" in names:
+        t = schema.field("metadata").type
+        if not types.is_string(t) and not types.is_large_string(t):
+            problems.append(f"column 'metadata' must be a JSON string, got {t}")
+    return problems
+
+
+def _is_list(t: Any) -> bool:
+    types = _pyarrow().types
+    return bool(types.is_list(t) or types.is_large_list(t) or types.is_fixed_size_list(t))
+
+
+def _first_true(pc: Any, mask: Any) -> int:
+    return int(pc.index(mask, True).as_py())
+
+
+def validate_import_files(
+    path: str | os.PathLike[str],
+    *,
+    dimension: int | None = None,
+    filesystem: Any = None,
+    check_ids: bool = True,
+    max_errors: int = 100,
+) -> ImportValidationReport:
+    """Check a directory of Parquet files before passing it to :meth:`Index.start_import`.
+
+    Reads only the needed columns, a batch at a time, and checks them with
+    vectorized ``pyarrow.compute`` kernels:
+
+    - every file sits in a namespace directory directly below *path*,
+    - the columns and their types match the import schema,
+    - IDs are present and non-empty, and unique within each namespace,
+    - dense vectors all have the same dimension (*dimension* when given)
+      and contain only finite values,
+    - sparse indices and values have matching lengths,
+    - metadata strings do not exceed 40 KB.
+
+    The ID uniqueness check holds every ID of a namespace in memory; pass
+    ``check_ids=False`` to skip it for very large directories.
+
+    Args:
+        path (str | os.PathLike): Local directory or URI to check.
+        dimension (int | None): Expected dense dimension, typically that of
+            the target index. Defaults to the dimension of the first vector.
+        filesystem: A ``pyarrow.fs.FileSystem`` or fsspec filesystem.
+        check_ids (bool): Check that IDs are unique per namespace.
+            Defaults to ``True``.
+        max_errors (int): Most error messages to collect. Defaults to 100.
+
+    Returns:
+        :class:`ImportValidationReport` with counts and any problems found.
+
+    Raises:
+        :exc:`RuntimeError`: If ``pyarrow`` is not installed.
+
+    Examples:
+        .. code-block:: python
+
+            from pinecone import validate_import_files
+
+            report = validate_import_files("s3://my-bucket/imports/products", dimension=1536)
+            for problem in report.errors:
+                print(problem)
+    """
+    pa = _pyarrow()
+    import pyarrow.compute as pc  # type: ignore[import-untyped,unused-ignore]
+    import pyarrow.fs as pafs  # type: ignore[import-untyped,unused-ignore]
+    import pyarrow.parquet as pq  # type: ignore[import-untyped,unused-ignore]
+
+    fs, root = _resolve_filesystem(path, filesystem)
+    errors = _Errors(max_errors)
+    infos = fs.get_file_info(pafs.FileSelector(root, recursive=True, allow_not_found=True))
+    files = sorted(
+        info.path
+        for info in infos
+        if info.type == pafs.FileType.File and info.path.endswith(".parquet")
+    )
+    if not files:
+        errors.add(f"no .parquet files found under {os.fspath(path)!r}")
+
+    namespaces: dict[str, int] = {}
+    ids_by_namespace: dict[str, list[Any]] = {}
+    total_rows = 0
+    for file in files:
+        rel = posixpath.relpath(file, root)
+        parts = rel.split("/")
+        if len(parts) != 2:
+            errors.add(
+                f"{rel}: files must be directly inside a namespace directory "
+                f"('{DEFAULT_NAMESPACE_DIR}' for the default namespace)"
+            )
+        namespace = parts[0] if len(parts) > 1 else DEFAULT_NAMESPACE_DIR
+        with fs.open_input_file(file) as f:
+            parquet = pq.ParquetFile(f)
+            problems = _schema_problems(parquet.schema_arrow)
+            for problem in problems:
+                errors.add(f"{rel}: {problem}")
+            if problems:
+                continue
+            row = 0
+            for batch in parquet.iter_batches(batch_size=65_536):
+                dimension = _check_batch(pc, batch, rel, row, dimension, errors)
+                if check_ids:
+                    ids_by_namespace.setdefault(namespace, []).append(
+                        batch.column("id").cast(pa.large_string())
+                    )
+                row += batch.num_rows
+        namespaces[namespace] = namespaces.get(namespace, 0) + row
+        total_rows += row
+
+    for namespace, chunks in ids_by_namespace.items():
+        counts = pc.value_counts(pa.chunked_array(chunks, type=pa.large_string()))
+        repeated = counts.filter(pc.greater(counts.field("counts"), 1))
+        if len(repeated):
+            examples = [v.as_py() for v in repeated.field("values")[:5]]
+            errors.add(
+                f"namespace {namespace!r}: {len(repeated)} IDs appear more than once, "
+                f"e.g. {examples}"
+            )
+
+    return ImportValidationReport(
+        files=len(files),
+        rows=total_rows,
+        namespaces=namespaces,
+        dimension=dimension,
+        errors=errors.result(),
+    )
+
+
+def _check_batch(
+    pc: Any, batch: Any, rel: str, offset: int, dimension: int | None, errors: _Errors
+) -> int | None:
+    """Check one record batch; return the dense dimension seen so far."""
+    ids = batch.column("id")
+    if ids.null_count:
+        errors.add(f"{rel}: {ids.null_count} rows have no id")
+    empty = pc.equal(pc.utf8_length(ids), 0)
+    if pc.any(empty).as_py():
+        errors.add(f"{rel}: empty id at row {offset + _first_true(pc, empty)}")
+
+    names = batch.schema.names
+    if "values" in names:
+        values = batch.column("values")
+        lengths = pc.list_value_length(values)
+        missing = pc.fill_null(pc.equal(lengths, 0), True)
+        if "sparse_values" in names:
+            missing = pc.and_(missing, pc.is_null(batch.column("sparse_values")))
+        if pc.any(missing).as_py():
+            errors.add(f"{rel}: row {offset + _first_true(pc, missing)} has no vector values")
+        present = pc.drop_null(pc.if_else(pc.greater(lengths, 0), lengths, None))
+        if len(present):
+            if dimension is None:
+                dimension = int(present[0].as_py())
+            wrong = pc.fill_null(
+                pc.and_(pc.greater(lengths, 0), pc.not_equal(lengths, dimension)), False
+            )
+            if pc.any(wrong).as_py():
+                first = _first_true(pc, wrong)
+                errors.add(
+                    f"{rel}: row {offset + first} has dimension {lengths[first].as_py()}, "
+                    f"expected {dimension}"
+                )
+        flat = pc.list_flatten(values)
+        if len(flat) and not pc.all(pc.is_finite(flat)).as_py():
+            errors.add(f"{rel}: 'values' contains NaN or infinite numbers")
+    if "sparse_values" in names:
+        sparse = batch.column("sparse_values")
+        index_lengths = pc.list_value_length(pc.struct_field(sparse, "indices"))
+        value_lengths = pc.list_value_length(pc.struct_field(sparse, "values"))
+        mismatch = pc.fill_null(pc.not_equal(index_lengths, value_lengths), False)
+        if pc.any(mismatch).as_py():
+            errors.add(
+                f"{rel}: row {offset + _first_true(pc, mismatch)} has sparse indices and "
+                "values of different lengths"
+            )
+    if "metadata" in names:
+        too_big = pc.fill_null(
+            pc.greater(pc.binary_length(batch.column("metadata")), MAX_METADATA_BYTES), False
+        )
+        if pc.any(too_big).as_py():
+            errors.add(
+                f"{rel}: row {offset + _first_true(pc, too_big)} has metadata over "
+                f"{MAX_METADATA_BYTES // 1024} KB"
+            )
+    return dimension
@@ -33,18 +33,25 @@ if TYPE_CHECKING:
         ContextReference,
         ContextResponse,
         ContextSnippet,
+        ContextSource,
         ContextTextBlock,
         FileReference,
+        MultiContextResponse,
         MultimodalSnippet,
         PageReference,
         TextSnippet,
     )
     from pinecone.models.assistant.evaluation import (  # noqa: F401
+        AlignmentEvaluation,
         AlignmentResult,
         AlignmentScores,
         EntailmentResult,
     )
     from pinecone.models.assistant.file_model import AssistantFileModel  # noqa: F401
+    from pinecone.models.assistant.file_upload import (  # noqa: F401
+        FileUploadError,
+        FileUploadResult,
+    )
     from pinecone.models.assistant.list import (  # noqa: F401
         ListAssistantsResponse,
         ListFilesResponse,
@@ -69,7 +76,7 @@ if TYPE_CHECKING:
         CreateIndexFromBackupResponse,
         RestoreJobModel,
     )
-    from pinecone.models.batch import BatchError, BatchResult  # noqa: F401
+    from pinecone.models.batch import BatchError, BatchResult, BufferedWriteError  # noqa: F401
     from pinecone.models.collections.list import CollectionList  # noqa: F401
     from pinecone.models.collections.model import CollectionModel  # noqa: F401
     from pinecone.models.enums import (  # noqa: F401
@@ -83,6 +90,7 @@ if TYPE_CHECKING:
     )
     from pinecone.models.imports.list import ImportList  # noqa: F401
     from pinecone.models.imports.model import ImportModel, StartImportResponse  # noqa: F401
+    from pinecone.models.imports.validation import ImportValidationReport  # noqa: F401
     from pinecone.models.indexes.index import (  # noqa: F401
         ByocSpecInfo,
         IndexModel,
@@ -102,9 +110,11 @@ if TYPE_CHECKING:
     from pinecone.models.inference.embed import (  # noqa: F401
         DenseEmbedding,
         Embedding,
+        EmbeddingMatrix,
         EmbeddingsList,
         EmbedUsage,
         SparseEmbedding,
+        SparseEmbeddingMatrix,
     )
     from pinecone.models.inference.model_list import ModelInfoList  # noqa: F401
     from pinecone.models.inference.models import (  # noqa: F401
@@ -151,6 +161,7 @@ _LAZY_IMPORTS: dict[str, str] = {
     "BatchError": "pinecone.models.batch",
     "BatchResponseInfo": "pinecone.models.response_info",
     "BatchResult": "pinecone.models.batch",
+    "BufferedWriteError": "pinecone.models.batch",
     # Admin
     "APIKeyList": "pinecone.models.admin.api_key",
     "APIKeyModel": "pinecone.models.admin.api_key",
@@ -176,17 +187,22 @@ _LAZY_IMPORTS: dict[str, str] = {
     "ContextReference": "pinecone.models.assistant.context",
     "ContextResponse": "pinecone.models.assistant.context",
     "ContextSnippet": "pinecone.models.assistant.context",
+    "ContextSource": "pinecone.models.assistant.context",
     "ContextTextBlock": "pinecone.models.assistant.context",
     "FileReference": "pinecone.models.assistant.context",
+    "MultiContextResponse": "pinecone.models.assistant.context",
     "MultimodalSnippet": "pinecone.models.assistant.context",
     "PageReference": "pinecone.models.assistant.context",
     "TextSnippet": "pinecone.models.assistant.context",
     # Assistant — evaluation
+    "AlignmentEvaluation": "pinecone.models.assistant.evaluation",
     "AlignmentResult": "pinecone.models.assistant.evaluation",
     "AlignmentScores": "pinecone.models.assistant.evaluation",
     "EntailmentResult": "pinecone.models.assistant.evaluation",
     # Assistant — misc
     "AssistantFileModel": "pinecone.models.assistant.file_model",
+    "FileUploadError": "pinecone.models.assistant.file_upload",
+    "FileUploadResult": "pinecone.models.assistant.file_upload",
     "ListAssistantsResponse": "pinecone.models.assistant.list",
     "ListFilesResponse": "pinecone.models.assistant.list",
     "Message": "pinecone.models.assistant.message",
@@ -223,6 +239,7 @@ _LAZY_IMPORTS: dict[str, str] = {
     "ImportList": "pinecone.models.imports.list",
     "ImportModel": "pinecone.models.imports.model",
     "StartImportResponse": "pinecone.models.imports.model",
+    "ImportValidationReport": "pinecone.models.imports.validation",
     # Indexes
     "ByocSpecInfo": "pinecone.models.indexes.index",
     "IndexModel": "pinecone.models.indexes.index",
@@ -239,9 +256,11 @@ _LAZY_IMPORTS: dict[str, str] = {
     # Inference
     "DenseEmbedding": "pinecone.models.inference.embed",
     "Embedding": "pinecone.models.inference.embed",
+    "EmbeddingMatrix": "pinecone.models.inference.embed",
     "EmbeddingsList": "pinecone.models.inference.embed",
     "EmbedUsage": "pinecone.models.inference.embed",
     "SparseEmbedding": "pinecone.models.inference.embed",
+    "SparseEmbeddingMatrix": "pinecone.models.inference.embed",
     "ModelInfoList": "pinecone.models.inference.model_list",
     "ModelInfo": "pinecone.models.inference.models",
     "ModelInfoSupportedParameter": "pinecone.models.inference.models",
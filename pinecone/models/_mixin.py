@@ -15,6 +15,7 @@ Two mixins are provided:
 
 from __future__ import annotations
 
+import dataclasses
 from collections.abc import Iterator
 from typing import Any, ClassVar
 
@@ -22,7 +23,10 @@ from msgspec import Struct
 
 
 def _struct_to_dict_recursive(value: Any) -> Any:
-    """Recursively convert Struct instances and nested containers to plain dicts."""
+    """Recursively convert Struct/dataclass instances and nested containers to plain dicts."""
+    cls = value.__class__
+    if cls is float or cls is str or cls is int or value is None:
+        return value
     if isinstance(value, Struct):
         return {
             field: _struct_to_dict_recursive(getattr(value, field))
@@ -32,6 +36,11 @@ def _struct_to_dict_recursive(value: Any) -> Any:
         return [_struct_to_dict_recursive(item) for item in value]
     if isinstance(value, dict):
         return {k: _struct_to_dict_recursive(v) for k, v in value.items()}
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            field.name: _struct_to_dict_recursive(getattr(value, field.name))
+            for field in dataclasses.fields(value)
+        }
     return value
 
 
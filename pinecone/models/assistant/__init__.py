@@ -20,18 +20,22 @@ from pinecone.models.assistant.context import (
     ContextReference,
     ContextResponse,
     ContextSnippet,
+    ContextSource,
     ContextTextBlock,
     FileReference,
+    MultiContextResponse,
     MultimodalSnippet,
     PageReference,
     TextSnippet,
 )
 from pinecone.models.assistant.evaluation import (
+    AlignmentEvaluation,
     AlignmentResult,
     AlignmentScores,
     EntailmentResult,
 )
 from pinecone.models.assistant.file_model import AssistantFileModel
+from pinecone.models.assistant.file_upload import FileUploadError, FileUploadResult
 from pinecone.models.assistant.list import ListAssistantsResponse, ListFilesResponse
 from pinecone.models.assistant.message import Message
 from pinecone.models.assistant.model import AssistantModel
@@ -134,6 +138,7 @@ DocxReference = FileReference
 """Deprecated alias for :class:`FileReference`."""
 
 __all__ = [
+    "AlignmentEvaluation",
     "AlignmentResponse",  # deprecated alias for AlignmentResult
     "AlignmentResult",
     "AlignmentScores",
@@ -165,12 +170,15 @@ __all__ = [
     "ContextReference",
     "ContextResponse",
     "ContextSnippet",
+    "ContextSource",
     "ContextTextBlock",
     "DocxReference",  # deprecated alias for FileReference
     "EntailmentResult",
     "EvaluatedFact",  # deprecated alias for EntailmentResult
     "FileModel",  # deprecated alias for AssistantFileModel
     "FileReference",
+    "FileUploadError",
+    "FileUploadResult",
     "Highlight",  # deprecated alias for ChatHighlight
     "Image",  # deprecated alias for ContextImageData
     "ImageBlock",  # deprecated alias for ContextImageBlock
@@ -181,6 +189,7 @@ __all__ = [
     "Message",
     "MessageDelta",  # deprecated alias for StreamContentDelta
     "Metrics",  # deprecated alias for AlignmentScores
+    "MultiContextResponse",
     "MultimodalSnippet",
     "PageReference",
     "PdfReference",  # deprecated alias for FileReference
@@ -353,3 +353,50 @@ class ContextResponse(StructDictMixin, Struct, kw_only=True):
             section_rows.append(("...", f"{len(self.snippets) - 5} more"))
         builder.section("Snippets", section_rows)
         return builder.build()
+
+
+class ContextSource(StructDictMixin, Struct, kw_only=True):
+    """One assistant and query whose context was merged by ``context_many``.
+
+    Attributes:
+        assistant_name: Name of the assistant queried.
+        query: Query sent to the assistant.
+        usage: Token usage of this request.
+        id: Identifier of the underlying context response, if returned.
+    """
+
+    assistant_name: str
+    query: str
+    usage: ChatUsage
+    id: str | None = None
+
+    @safe_display
+    def __repr__(self) -> str:
+        return (
+            f"ContextSource(assistant_name={self.assistant_name!r},"
+            f" query={truncate_text(self.query, 40)!r}, usage={self.usage!r})"
+        )
+
+
+class MultiContextResponse(StructDictMixin, Struct, kw_only=True):
+    """Context snippets merged from several assistants and queries.
+
+    Attributes:
+        snippets: Distinct snippets from every source, highest score first.
+        origins: For each snippet, the position in *sources* of the request
+            that returned it with the score shown.
+        sources: One entry per assistant and query, in request order.
+        usage: Token usage summed over all sources.
+    """
+
+    snippets: list[ContextSnippet]
+    origins: list[int]
+    sources: list[ContextSource]
+    usage: ChatUsage
+
+    @safe_display
+    def __repr__(self) -> str:
+        return (
+            f"MultiContextResponse(snippets={len(self.snippets)},"
+            f" sources={len(self.sources)}, usage={self.usage!r})"
+        )
@@ -171,3 +171,46 @@ class AlignmentResult(StructDictMixin, Struct, kw_only=True):
             ]
             builder.section("Contradictions", contradiction_rows, theme="error")
         return builder.build()
+
+
+class AlignmentEvaluation(Struct, kw_only=True):
+    """One evaluated item of a dataset passed to ``evaluate_alignment_many``.
+
+    Attributes:
+        index: Position of the item in the input dataset.
+        question: The question of the item.
+        answer: The generated answer that was evaluated.
+        ground_truth_answer: The ground truth answer compared against.
+        result: The evaluation, or ``None`` if it failed.
+        error: The exception that caused the failure, or ``None``.
+        error_message: Human-readable description of the error, or ``None``.
+    """
+
+    index: int
+    question: str
+    answer: str
+    ground_truth_answer: str
+    result: AlignmentResult | None = None
+    error: Exception | None = None
+    error_message: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        """Whether the item was evaluated successfully."""
+        return self.result is not None
+
+    def __repr__(self) -> str:
+        outcome = repr(self.result) if self.result is not None else repr(self.error_message)
+        return f"AlignmentEvaluation(index={self.index}, {outcome})"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary, with the exception converted to a string."""
+        return {
+            "index": self.index,
+            "question": self.question,
+            "answer": self.answer,
+            "ground_truth_answer": self.ground_truth_answer,
+            "result": self.result.to_dict() if self.result is not None else None,
+            "error": str(self.error) if self.error is not None else None,
+            "error_message": self.error_message,
+        }
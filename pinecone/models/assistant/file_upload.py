@@ -0,0 +1,76 @@
+"""Result models for multi-file assistant uploads."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from msgspec import Struct
+
+from pinecone.models.assistant.file_model import AssistantFileModel
+
+
+class FileUploadError(Struct, kw_only=True):
+    """A local file that could not be uploaded or failed processing.
+
+    Attributes:
+        path: Local path of the file.
+        error: The exception that caused the failure.
+        error_message: Human-readable description of the error.
+        file_id: ID of the uploaded file when the upload succeeded but
+            processing failed, otherwise ``None``.
+    """
+
+    path: str
+    error: Exception
+    error_message: str
+    file_id: str | None = None
+
+    def __repr__(self) -> str:
+        return f"FileUploadError(path={self.path!r}, error_message={self.error_message!r})"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary, with the exception converted to a string."""
+        return {
+            "path": self.path,
+            "error": str(self.error),
+            "error_message": self.error_message,
+            "file_id": self.file_id,
+        }
+
+
+class FileUploadResult(Struct, kw_only=True):
+    """Outcome of :meth:`~pinecone.client.assistants.Assistants.upload_files`.
+
+    Attributes:
+        uploaded: Files uploaded by this call, in their final state (or as
+            returned by the upload when not waiting for processing).
+        skipped: Existing files whose content matched a local file, which
+            was therefore not uploaded.
+        deleted: Files removed by ``sync_directory(delete_missing=True)``.
+        errors: Local files that failed to upload or to process.
+    """
+
+    uploaded: list[AssistantFileModel]
+    skipped: list[AssistantFileModel]
+    errors: list[FileUploadError]
+    deleted: list[AssistantFileModel] = []
+
+    @property
+    def has_errors(self) -> bool:
+        """Whether any file failed."""
+        return bool(self.errors)
+
+    def __repr__(self) -> str:
+        return (
+            f"FileUploadResult(uploaded={len(self.uploaded)}, skipped={len(self.skipped)}, "
+            f"deleted={len(self.deleted)}, errors={len(self.errors)})"
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary, with errors converted to plain dicts."""
+        return {
+            "uploaded": [f.to_dict() for f in self.uploaded],
+            "skipped": [f.to_dict() for f in self.skipped],
+            "deleted": [f.to_dict() for f in self.deleted],
+            "errors": [e.to_dict() for e in self.errors],
+        }
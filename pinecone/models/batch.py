@@ -59,6 +59,51 @@ class BatchError(Struct, kw_only=True):
         return msgspec.json.encode(self.to_dict()).decode("utf-8")
 
 
+class BufferedWriteError(Struct, kw_only=True):
+    """Details about a failed flush from a buffered writer.
+
+    Attributes:
+        operation: ``"upsert"`` or ``"delete"``.
+        namespace: Namespace the failed request targeted.
+        ids: IDs of the vectors in the failed request.
+        items: Upserted vectors in wire format (empty for deletes), so they
+            can be passed back to ``upsert(...)`` for retry.
+        error: The exception that caused the failure.
+        error_message: Human-readable description of the error.
+    """
+
+    operation: str
+    namespace: str
+    ids: list[str]
+    items: list[dict[str, Any]]
+    error: Exception
+    error_message: str
+
+    def __repr__(self) -> str:
+        return (
+            f"BufferedWriteError(operation={self.operation!r}, "
+            f"namespace={self.namespace!r}, "
+            f"id_count={len(self.ids)}, "
+            f"error_message={self.error_message!r})"
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary, with exception converted to string.
+
+        Returns:
+            Dictionary with all fields, where the error field is converted
+            to its string representation for serializability.
+        """
+        return {
+            "operation": self.operation,
+            "namespace": self.namespace,
+            "ids": self.ids,
+            "items": self.items,
+            "error": str(self.error),
+            "error_message": self.error_message,
+        }
+
+
 class BatchResult(Struct, kw_only=True):
     """Aggregated result of a batch operation.
 
@@ -10,11 +10,13 @@ if TYPE_CHECKING:
         ImportModel,
         StartImportResponse,
     )
+    from pinecone.models.imports.validation import ImportValidationReport  # noqa: F401
 
 _LAZY_IMPORTS: dict[str, str] = {
     "ImportModel": "pinecone.models.imports.model",
     "StartImportResponse": "pinecone.models.imports.model",
     "ImportList": "pinecone.models.imports.list",
+    "ImportValidationReport": "pinecone.models.imports.validation",
 }
 
 __all__ = list(_LAZY_IMPORTS.keys())
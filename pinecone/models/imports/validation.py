@@ -0,0 +1,33 @@
+"""Result model for local validation of bulk import files."""
+
+from __future__ import annotations
+
+from msgspec import Struct, field
+
+from pinecone.models._mixin import StructDictMixin
+
+
+class ImportValidationReport(StructDictMixin, Struct, kw_only=True):
+    """Outcome of :func:`~pinecone.index.bulk_import.validate_import_files`.
+
+    Attributes:
+        files: Number of Parquet files checked.
+        rows: Total number of rows across all files.
+        namespaces: Row count per namespace directory (``"__default__"``
+            for the default namespace).
+        dimension: Dense vector dimension found in the files, or ``None``
+            if they hold no dense values.
+        errors: Problems found, one message each. Empty when the files are
+            ready for :meth:`~pinecone.Index.start_import`.
+    """
+
+    files: int
+    rows: int
+    namespaces: dict[str, int] = field(default_factory=dict)
+    dimension: int | None = None
+    errors: list[str] = field(default_factory=list)
+
+    @property
+    def is_valid(self) -> bool:
+        """``True`` if no problems were found."""
+        return not self.errors
@@ -5,9 +5,11 @@ from __future__ import annotations
 from pinecone.models.inference.embed import (
     DenseEmbedding,
     Embedding,
+    EmbeddingMatrix,
     EmbeddingsList,
     EmbedUsage,
     SparseEmbedding,
+    SparseEmbeddingMatrix,
 )
 from pinecone.models.inference.model_list import ModelInfoList
 from pinecone.models.inference.models import ModelInfo, ModelInfoSupportedParameter
@@ -17,6 +19,7 @@ __all__ = [
     "DenseEmbedding",
     "EmbedUsage",
     "Embedding",
+    "EmbeddingMatrix",
     "EmbeddingsList",
     "ModelInfo",
     "ModelInfoList",
@@ -25,4 +28,5 @@ __all__ = [
     "RerankResult",
     "RerankUsage",
     "SparseEmbedding",
+    "SparseEmbeddingMatrix",
 ]
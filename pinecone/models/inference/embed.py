@@ -147,3 +147,93 @@ class EmbeddingsList(Struct, kw_only=True):
             f"count={len(self.data)}, "
             f"usage={self.usage!r})"
         )
+
+
+class EmbeddingMatrix(Struct, kw_only=True):
+    """Dense embeddings from ``embed_many(output="numpy")`` as one NumPy matrix.
+
+    Attributes:
+        model: The model used to generate embeddings.
+        values: C-contiguous ``float32`` array of shape ``(len(inputs), dimension)``;
+            row *i* is the embedding of input *i*.
+        usage: Token usage summed over all requests.
+        vector_type: Always ``"dense"``.
+    """
+
+    model: str
+    values: Any
+    usage: EmbedUsage
+    vector_type: str = "dense"
+
+    @property
+    def dimension(self) -> int:
+        """Number of columns of :attr:`values`."""
+        return int(self.values.shape[1])
+
+    def __len__(self) -> int:
+        return int(self.values.shape[0])
+
+    def __repr__(self) -> str:
+        return (
+            f"EmbeddingMatrix(model={self.model!r}, shape={tuple(self.values.shape)}, "
+            f"usage={self.usage!r})"
+        )
+
+
+class SparseEmbeddingMatrix(Struct, kw_only=True):
+    """Sparse embeddings from ``embed_many(output="numpy")`` in CSR form.
+
+    The entries of embedding *i* are ``indices[indptr[i]:indptr[i + 1]]``
+    and ``values[indptr[i]:indptr[i + 1]]``; :meth:`row` returns them as
+    views. Token strings (``sparse_tokens``) are not kept.
+
+    Attributes:
+        model: The model used to generate embeddings.
+        indptr: ``int64`` array of ``len(inputs) + 1`` row offsets.
+        indices: ``uint32`` array of the non-zero dimensions of every row.
+        values: ``float32`` array of the non-zero values of every row.
+        usage: Token usage summed over all requests.
+        vector_type: Always ``"sparse"``.
+    """
+
+    model: str
+    indptr: Any
+    indices: Any
+    values: Any
+    usage: EmbedUsage
+    vector_type: str = "sparse"
+
+    def row(self, i: int) -> tuple[Any, Any]:
+        """Return ``(indices, values)`` of embedding *i* as array views."""
+        start, stop = int(self.indptr[i]), int(self.indptr[i + 1])
+        return self.indices[start:stop], self.values[start:stop]
+
+    def to_scipy(self, dimension: int | None = None) -> Any:
+        """Return a ``scipy.sparse.csr_array`` sharing these arrays.
+
+        Args:
+            dimension: Number of columns. Defaults to the largest index plus one.
+
+        Raises:
+            :exc:`RuntimeError`: If ``scipy`` is not installed.
+        """
+        try:
+            from scipy import sparse  # type: ignore[import-not-found,import-untyped,unused-ignore]
+        except ImportError:
+            raise RuntimeError(
+                "scipy is required for to_scipy. Install it with: pip install scipy"
+            ) from None
+        if dimension is None:
+            dimension = int(self.indices.max()) + 1 if len(self.indices) else 0
+        return sparse.csr_array(
+            (self.values, self.indices, self.indptr), shape=(len(self), dimension)
+        )
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+    def __repr__(self) -> str:
+        return (
+            f"SparseEmbeddingMatrix(model={self.model!r}, rows={len(self)}, "
+            f"nnz={len(self.indices)}, usage={self.usage!r})"
+        )
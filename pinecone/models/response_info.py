@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+from typing import TYPE_CHECKING, Any
+
 from msgspec import Struct, field
 
 from pinecone.models._mixin import StructDictMixin
 
+if TYPE_CHECKING:
+    import httpx
+
 __all__ = ["BatchResponseInfo", "ResponseInfo"]
 
 
@@ -44,7 +49,7 @@ class ResponseInfo(StructDictMixin, Struct, kw_only=True, gc=False):
             :class:`str` with the request ID, or ``None`` when the header
             is absent.
         """
-        return self.raw_headers.get("x-pinecone-request-id")
+        return self._header("x-pinecone-request-id")
 
     @property
     def lsn_reconciled(self) -> int | None:
@@ -56,7 +61,7 @@ class ResponseInfo(StructDictMixin, Struct, kw_only=True, gc=False):
             :class:`int` LSN, or ``None`` when the header is absent or
             its value is not a valid integer.
         """
-        return _parse_int(self.raw_headers.get("x-pinecone-lsn-reconciled"))
+        return _parse_int(self._header("x-pinecone-lsn-reconciled"))
 
     @property
     def lsn_committed(self) -> int | None:
@@ -68,7 +73,7 @@ class ResponseInfo(StructDictMixin, Struct, kw_only=True, gc=False):
             :class:`int` LSN, or ``None`` when the header is absent or
             its value is not a valid integer.
         """
-        return _parse_int(self.raw_headers.get("x-pinecone-lsn-committed"))
+        return _parse_int(self._header("x-pinecone-lsn-committed"))
 
     def is_reconciled(self, target: int) -> bool:
         """Return ``True`` when the reconciled LSN meets or exceeds *target*.
@@ -107,6 +112,67 @@ class ResponseInfo(StructDictMixin, Struct, kw_only=True, gc=False):
         lsn = self.lsn_reconciled
         return lsn is not None and lsn >= target
 
+    def _header(self, name: str) -> str | None:
+        return self.raw_headers.get(name)
+
+
+def _headers_dict(headers: httpx.Headers) -> dict[str, str]:
+    """Copy *headers* into a lowercase-keyed ``dict``, as ``dict(headers)`` does.
+
+    ``dict(headers)`` looks every key up again, scanning the header list
+    each time; building from :meth:`httpx.Headers.multi_items` is a single
+    pass. Repeated headers are joined with ``", "`` like httpx does.
+    """
+    items = headers.multi_items()
+    result = dict(items)
+    if len(result) != len(items):
+        result = {}
+        for key, value in items:
+            result[key] = f"{result[key]}, {value}" if key in result else value
+    return result
+
+
+# Slot holding ResponseInfo.raw_headers, which _LazyResponseInfo shadows
+# with a property.
+_RAW_HEADERS: Any = ResponseInfo.__dict__["raw_headers"]
+
+
+class _LazyResponseInfo(ResponseInfo, kw_only=True, gc=False):
+    """:class:`ResponseInfo` that keeps the received :class:`httpx.Headers`.
+
+    Returned by indexes created with ``lazy_response_headers=True``.
+    :attr:`request_id`, :attr:`lsn_reconciled` and :attr:`lsn_committed`
+    are looked up in the received headers when first read, and the
+    ``raw_headers`` dict is only built the first time it is accessed, so
+    a response whose metadata is never read costs no header copy.
+
+    ``msgspec`` encoders read struct fields directly and cannot encode the
+    stored headers; read ``raw_headers`` or call :meth:`to_dict` before
+    encoding an instance with ``msgspec``.
+    """
+
+    @property  # type: ignore[misc]
+    def raw_headers(self) -> dict[str, str]:
+        """All HTTP response headers, keys normalized to lowercase."""
+        headers = _RAW_HEADERS.__get__(self)
+        if headers.__class__ is dict:
+            return headers
+        result = _headers_dict(headers)
+        _RAW_HEADERS.__set__(self, result)
+        return result
+
+    @raw_headers.setter
+    def raw_headers(self, value: dict[str, str]) -> None:
+        _RAW_HEADERS.__set__(self, value)
+
+    def __repr__(self) -> str:
+        """Return the repr of the materialized headers."""
+        return f"ResponseInfo(raw_headers={self.raw_headers!r})"
+
+    def _header(self, name: str) -> str | None:
+        # Both dict and httpx.Headers lookups work on the lowercase names.
+        return _RAW_HEADERS.__get__(self).get(name)  # type: ignore[no-any-return]
+
 
 def _parse_int(value: str | None) -> int | None:
     if value is None:
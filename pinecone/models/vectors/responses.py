@@ -318,18 +318,50 @@ class UpsertRecordsResponse(StructDictMixin, Struct, kw_only=True, gc=False):
 
     Attributes:
         record_count (int): Number of records submitted by the caller. This is a
-            client-side count, not a server-confirmed count.
+            client-side count, not a server-confirmed count. For batched calls it
+            counts only records in successful batches.
         response_info (ResponseInfo | None): HTTP response metadata (request ID, LSN values), or
             ``None`` if not populated.
+        total_item_count (int): Total number of records submitted. Defaults to ``0`` for
+            non-batched calls.
+        failed_item_count (int): Number of records in failed batches. Defaults to ``0``.
+        total_batch_count (int): Total number of batches executed. Defaults to ``0`` for
+            non-batched calls.
+        successful_batch_count (int): Number of batches that succeeded. Defaults to ``0``.
+        failed_batch_count (int): Number of batches that failed. Defaults to ``0``.
+        errors (list[BatchError]): Per-batch error details. Empty for non-batched calls
+            or when all batches succeed.
+
+    For batched calls (``batch_size`` set on ``upsert_records``), failed records
+    can be retried with ``upsert_records(records=response.failed_items, ...)``.
     """
 
     record_count: int
     response_info: ResponseInfo | None = None
+    total_item_count: int = 0
+    failed_item_count: int = 0
+    total_batch_count: int = 0
+    successful_batch_count: int = 0
+    failed_batch_count: int = 0
+    errors: list[BatchError] = []
 
     @property
     def _response_info(self) -> ResponseInfo | None:
         return self.response_info
 
+    @property
+    def has_errors(self) -> bool:
+        """Whether any batches failed."""
+        return len(self.errors) > 0
+
+    @property
+    def failed_items(self) -> list[dict[str, Any]]:
+        """All records from failed batches, flattened for retry."""
+        items: list[dict[str, Any]] = []
+        for error in self.errors:
+            items.extend(error.items)
+        return items
+
     def __getitem__(self, key: str) -> Any:
         """Support bracket access (e.g. response['record_count'])."""
         if key not in self.__struct_fields__:
@@ -340,6 +372,16 @@ class UpsertRecordsResponse(StructDictMixin, Struct, kw_only=True, gc=False):
         """Support ``in`` operator (e.g. ``'record_count' in response``)."""
         return key in self.__struct_fields__
 
+    def __repr__(self) -> str:
+        if not self.has_errors and self.total_batch_count == 0:
+            return f"UpsertRecordsResponse(record_count={self.record_count})"
+        status = "PARTIAL FAILURE" if self.has_errors else "SUCCESS"
+        return (
+            f"UpsertRecordsResponse({status}: "
+            f"{self.record_count}/{self.total_item_count} records, "
+            f"{self.successful_batch_count}/{self.total_batch_count} batches)"
+        )
+
 
 class UpdateResponse(DictLikeStruct, Struct, rename="camel", kw_only=True, gc=False):
     """Response from an update operation.
@@ -15,6 +15,11 @@ class SparseValues(DictLikeStruct, Struct, rename="camel", gc=False):
     Attributes:
         indices (list[int]): Non-zero dimension indices of the sparse vector.
         values (list[float]): Values corresponding to each index in ``indices``.
+
+    Both components may also be backed by ``array.array`` (e.g. ``array("I")`` and
+    ``array("f")``) or one-dimensional NumPy arrays. Such buffers are serialized
+    without converting each element to a Python object, and clients created with
+    ``compact_sparse=True`` return query/fetch results in ``array`` form.
     """
 
     indices: list[int]
@@ -2,20 +2,25 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
 import msgspec
 
 from pinecone._internal.adapters.vectors_adapter import extract_response_info
-from pinecone._internal.batch import async_batch_execute
-from pinecone._internal.validation import require_in_range, require_non_empty, require_positive
+from pinecone._internal.batch import async_batch_execute_stream
+from pinecone._internal.batching import async_tuned
+from pinecone._internal.validation import require_in_range, require_non_empty
 from pinecone.errors.exceptions import PineconeValueError
 from pinecone.models.batch import (
     BatchResult,  # SDK utility result, not wire-shape — see preview-channel.md § Type isolation
 )
 from pinecone.preview._internal.adapters.documents import PreviewDocumentsAdapter
 from pinecone.preview._internal.constants import INDEXES_API_VERSION
-from pinecone.preview.documents import _validate_documents
+from pinecone.preview.documents import (
+    _document_batches,
+    _resolve_batch_size,
+    _validate_documents,
+)
 from pinecone.preview.models.documents import (
     PreviewDocumentFetchResponse,
     PreviewDocumentSearchResponse,
@@ -25,7 +30,7 @@ from pinecone.preview.models.documents import (
 if TYPE_CHECKING:
     from collections.abc import Awaitable, Callable
 
-    from pinecone._internal.config import PineconeConfig
+    from pinecone._internal.config import BatchRetryPolicy, PineconeConfig
     from pinecone._internal.http_client import AsyncHTTPClient
     from pinecone.preview.models.score_by import PreviewScoreByQuery
 
@@ -230,9 +235,10 @@ class AsyncPreviewDocuments:
         *,
         namespace: str,
         documents: list[dict[str, Any]],
-        batch_size: int = 50,
+        batch_size: int | Literal["auto"] = 50,
         max_concurrency: int | None = None,
         show_progress: bool = True,
+        retry_policy: BatchRetryPolicy | None = None,
         **kwargs: Any,
     ) -> BatchResult:
         """Upsert a large list of documents in parallel batches (async).
@@ -250,8 +256,15 @@ class AsyncPreviewDocuments:
             documents: Documents to upsert. Each must contain a non-empty,
                 unique ``_id`` string field.
             batch_size: Maximum documents per request (positive integer, default 50).
+                Batches are also split so that no request body exceeds 2 MiB.
+                ``"auto"`` starts at 50 and grows the batch size while
+                throughput improves (up to 1000).
             max_concurrency: Asyncio concurrency limit (1–64, default 4).
             show_progress: Display a tqdm progress bar when installed.
+            retry_policy: Re-send batches that fail with transient errors after
+                a backoff, and split batches that are rejected as invalid until
+                only the offending documents remain. Default ``None`` records
+                each failed batch as is.
 
         Returns:
             :class:`~pinecone.models.batch.BatchResult` with aggregated success
@@ -301,16 +314,22 @@ class AsyncPreviewDocuments:
 
         require_non_empty("namespace", namespace)
         require_non_empty("documents", documents)
-        require_positive("batch_size", batch_size)
+        resolved = _resolve_batch_size(batch_size)
         require_in_range("max_concurrency", effective_max_concurrency, 1, 64)
 
-        return await async_batch_execute(
-            items=documents,
-            operation=lambda chunk: self.upsert(namespace=namespace, documents=chunk),
-            batch_size=batch_size,
+        async def _operation(chunk: list[dict[str, Any]], _: None) -> PreviewDocumentUpsertResponse:
+            return await self.upsert(namespace=namespace, documents=chunk)
+
+        batches, total = _document_batches(documents, resolved)
+        return await async_batch_execute_stream(
+            batches=batches,
+            operation=async_tuned(_operation, resolved),
             max_concurrency=effective_max_concurrency,
             show_progress=show_progress,
             desc="Upserting",
+            total=total,
+            retry_policy=retry_policy,
+            rebuild=lambda chunk: None,
         )
 
     async def search(
@@ -3,12 +3,20 @@
 from __future__ import annotations
 
 from concurrent.futures import ThreadPoolExecutor
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Literal
 
 import msgspec
 
 from pinecone._internal.adapters.vectors_adapter import extract_response_info
-from pinecone._internal.batch import batch_execute
+from pinecone._internal.batch import batch_execute_stream
+from pinecone._internal.batching import (
+    MAX_REQUEST_BYTES,
+    BatchSizeTuner,
+    pack_batches,
+    resolve_batch_size,
+    tuned,
+)
+from pinecone._internal.http_client import _encode_json
 from pinecone._internal.validation import require_in_range, require_non_empty, require_positive
 from pinecone.errors.exceptions import PineconeValueError
 from pinecone.models.batch import (
@@ -23,7 +31,9 @@ from pinecone.preview.models.documents import (
 )
 
 if TYPE_CHECKING:
-    from pinecone._internal.config import PineconeConfig
+    from collections.abc import Iterable
+
+    from pinecone._internal.config import BatchRetryPolicy, PineconeConfig
     from pinecone.preview.models.score_by import PreviewScoreByQuery
 
 __all__ = ["PreviewDocuments"]
@@ -49,6 +59,36 @@ def _validate_documents(documents: list[dict[str, Any]]) -> None:
         seen_ids.add(doc_id)
 
 
+def _resolve_batch_size(batch_size: int | Literal["auto"]) -> int | BatchSizeTuner:
+    if batch_size == "auto":
+        return resolve_batch_size(batch_size)
+    require_positive("batch_size", batch_size)
+    return batch_size
+
+
+def _document_batches(
+    documents: list[dict[str, Any]], batch_size: int | BatchSizeTuner
+) -> tuple[Iterable[tuple[list[dict[str, Any]], None]], int | None]:
+    """Pack *documents* into request-sized batches, with their count when known.
+
+    Each document is measured as its JSON encoding inside the
+    ``{"documents":[...]}`` envelope.  A fixed batch size is packed up front
+    so the progress bar has a total; an auto-tuned one is packed lazily as
+    the tuner adjusts.
+    """
+    chunks = pack_batches(
+        documents,
+        batch_size=batch_size,
+        max_bytes=MAX_REQUEST_BYTES,
+        size_of=lambda doc: len(_encode_json(doc)) + 1,
+        overhead=len(b'{"documents":[]}'),
+    )
+    if isinstance(batch_size, BatchSizeTuner):
+        return ((chunk, None) for chunk in chunks), None
+    packed = [(chunk, None) for chunk in chunks]
+    return packed, len(packed)
+
+
 class PreviewDocuments:
     """Documents sub-namespace for a preview index.
 
@@ -212,9 +252,10 @@ class PreviewDocuments:
         *,
         namespace: str,
         documents: list[dict[str, Any]],
-        batch_size: int = 50,
+        batch_size: int | Literal["auto"] = 50,
         max_concurrency: int | None = None,
         show_progress: bool = True,
+        retry_policy: BatchRetryPolicy | None = None,
         **kwargs: Any,
     ) -> BatchResult:
         """Upsert a large list of documents in parallel batches.
@@ -232,8 +273,15 @@ class PreviewDocuments:
             documents: Documents to upsert. Each must contain a non-empty,
                 unique ``_id`` string field.
             batch_size: Maximum documents per request (positive integer, default 50).
+                Batches are also split so that no request body exceeds 2 MiB.
+                ``"auto"`` starts at 50 and grows the batch size while
+                throughput improves (up to 1000).
             max_concurrency: Thread pool size for concurrent requests (1–64, default 4).
             show_progress: Display a tqdm progress bar when installed.
+            retry_policy: Re-send batches that fail with transient errors after
+                a backoff, and split batches that are rejected as invalid until
+                only the offending documents remain. Default ``None`` records
+                each failed batch as is.
 
         Returns:
             :class:`~pinecone.models.batch.BatchResult` with aggregated success
@@ -282,17 +330,23 @@ class PreviewDocuments:
 
         require_non_empty("namespace", namespace)
         require_non_empty("documents", documents)
-        require_positive("batch_size", batch_size)
+        resolved = _resolve_batch_size(batch_size)
         require_in_range("max_concurrency", effective_max_concurrency, 1, 64)
 
-        return batch_execute(
-            items=documents,
-            operation=lambda chunk: self.upsert(namespace=namespace, documents=chunk),
-            batch_size=batch_size,
+        def _operation(chunk: list[dict[str, Any]], _: None) -> PreviewDocumentUpsertResponse:
+            return self.upsert(namespace=namespace, documents=chunk)
+
+        batches, total = _document_batches(documents, resolved)
+        return batch_execute_stream(
+            batches=batches,
+            operation=tuned(_operation, resolved),
             max_concurrency=effective_max_concurrency,
             show_progress=show_progress,
             desc="Upserting",
             executor=self._get_batch_executor(effective_max_concurrency),
+            total=total,
+            retry_policy=retry_policy,
+            rebuild=lambda chunk: None,
         )
 
     def search(
@@ -1,11 +1,12 @@
+use std::sync::OnceLock;
 use std::time::Duration;
 
 use hyper_util::client::legacy::connect::{proxy::Tunnel, HttpConnector};
 use pyo3::exceptions::PyRuntimeError;
 use pyo3::prelude::*;
-use pyo3::types::PyDict;
+use pyo3::types::{PyBytes, PyDict};
 use tonic::service::interceptor::InterceptedService;
-use tonic::transport::{Channel, ClientTlsConfig};
+use tonic::transport::{Channel, ClientTlsConfig, Endpoint};
 
 use crate::proto;
 use crate::proto::vector_service_client::VectorServiceClient;
@@ -410,34 +411,78 @@ fn py_dict_to_struct(dict: &Bound<'_, PyDict>) -> PyResult<prost_types::Struct>
 }
 
 /// Convert a proto SparseValues into a Python dict with "indices" and "values" keys.
-fn sparse_values_to_py_dict(py: Python<'_>, sv: &proto::SparseValues) -> PyResult<Py<PyDict>> {
+///
+/// With `compact`, both components are returned as native-endian `bytes`
+/// (4 bytes per element) instead of lists, so the caller can wrap them in
+/// `array('I')` / `array('f')` without creating a Python object per element.
+fn sparse_values_to_py_dict(
+    py: Python<'_>,
+    sv: &proto::SparseValues,
+    compact: bool,
+) -> PyResult<Py<PyDict>> {
     let dict = PyDict::new(py);
-    dict.set_item("indices", &sv.indices)?;
-    dict.set_item("values", &sv.values)?;
+    if compact {
+        let indices: Vec<u8> = sv.indices.iter().flat_map(|i| i.to_ne_bytes()).collect();
+        let values: Vec<u8> = sv.values.iter().flat_map(|v| v.to_ne_bytes()).collect();
+        dict.set_item("indices", PyBytes::new(py, &indices))?;
+        dict.set_item("values", PyBytes::new(py, &values))?;
+    } else {
+        dict.set_item("indices", &sv.indices)?;
+        dict.set_item("values", &sv.values)?;
+    }
     Ok(dict.unbind())
 }
 
+/// Reinterpret a packed native-endian `bytes` buffer as 4-byte elements.
+fn unpack_words<T>(
+    bytes: &Bound<'_, PyBytes>,
+    field: &str,
+    from_ne_bytes: fn([u8; 4]) -> T,
+) -> PyResult<Vec<T>> {
+    let buf = bytes.as_bytes();
+    if buf.len() % 4 != 0 {
+        return Err(pinecone_value_error(
+            bytes.py(),
+            &format!("sparse_values '{field}' buffer length must be a multiple of 4"),
+        ));
+    }
+    Ok(buf
+        .chunks_exact(4)
+        .map(|c| from_ne_bytes([c[0], c[1], c[2], c[3]]))
+        .collect())
+}
+
 /// Extract sparse values from a Python dict.
+///
+/// Each component may be a sequence of numbers or a packed native-endian
+/// `bytes` buffer of `u32` indices / `f32` values (produced from
+/// `array.array` or NumPy inputs on the Python side).
 fn py_dict_to_sparse_values(dict: &Bound<'_, PyDict>) -> PyResult<proto::SparseValues> {
     let py = dict.py();
-    let indices: Vec<u32> = dict
+    let raw_indices = dict
         .get_item("indices")?
-        .ok_or_else(|| response_parsing_error(py, "sparse_values missing 'indices'"))?
-        .extract()?;
-    let values: Vec<f32> = dict
+        .ok_or_else(|| response_parsing_error(py, "sparse_values missing 'indices'"))?;
+    let raw_values = dict
         .get_item("values")?
-        .ok_or_else(|| response_parsing_error(py, "sparse_values missing 'values'"))?
-        .extract()?;
+        .ok_or_else(|| response_parsing_error(py, "sparse_values missing 'values'"))?;
+    let indices: Vec<u32> = match raw_indices.downcast::<PyBytes>() {
+        Ok(b) => unpack_words(b, "indices", u32::from_ne_bytes)?,
+        Err(_) => raw_indices.extract()?,
+    };
+    let values: Vec<f32> = match raw_values.downcast::<PyBytes>() {
+        Ok(b) => unpack_words(b, "values", f32::from_ne_bytes)?,
+        Err(_) => raw_values.extract()?,
+    };
     Ok(proto::SparseValues { indices, values })
 }
 
 /// Convert a proto Vector to a Python dict.
-fn vector_to_py_dict(py: Python<'_>, v: &proto::Vector) -> PyResult<Py<PyDict>> {
+fn vector_to_py_dict(py: Python<'_>, v: &proto::Vector, compact: bool) -> PyResult<Py<PyDict>> {
     let dict = PyDict::new(py);
     dict.set_item("id", &v.id)?;
     dict.set_item("values", &v.values)?;
     if let Some(ref sv) = v.sparse_values {
-        dict.set_item("sparse_values", sparse_values_to_py_dict(py, sv)?)?;
+        dict.set_item("sparse_values", sparse_values_to_py_dict(py, sv, compact)?)?;
     }
     if let Some(ref md) = v.metadata {
         dict.set_item("metadata", struct_to_py_dict(py, md)?)?;
@@ -446,13 +491,17 @@ fn vector_to_py_dict(py: Python<'_>, v: &proto::Vector) -> PyResult<Py<PyDict>>
 }
 
 /// Convert a proto ScoredVector to a Python dict.
-fn scored_vector_to_py_dict(py: Python<'_>, sv: &proto::ScoredVector) -> PyResult<Py<PyDict>> {
+fn scored_vector_to_py_dict(
+    py: Python<'_>,
+    sv: &proto::ScoredVector,
+    compact: bool,
+) -> PyResult<Py<PyDict>> {
     let dict = PyDict::new(py);
     dict.set_item("id", &sv.id)?;
     dict.set_item("score", sv.score)?;
     dict.set_item("values", &sv.values)?;
     if let Some(ref sparse) = sv.sparse_values {
-        dict.set_item("sparse_values", sparse_values_to_py_dict(py, sparse)?)?;
+        dict.set_item("sparse_values", sparse_values_to_py_dict(py, sparse, compact)?)?;
     }
     if let Some(ref md) = sv.metadata {
         dict.set_item("metadata", struct_to_py_dict(py, md)?)?;
@@ -514,12 +563,160 @@ fn py_dict_to_metadata_schema(dict: &Bound<'_, PyDict>) -> PyResult<proto::Metad
     Ok(proto::MetadataSchema { fields })
 }
 
+type Client = VectorServiceClient<InterceptedService<Channel, MetadataInterceptor>>;
+
+/// Which tokio runtime a channel drives its RPCs on.
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+enum RuntimeMode {
+    /// A multi-threaded runtime owned by the channel; one worker per core
+    /// unless a worker count is given.
+    MultiThread { worker_threads: Option<usize> },
+    /// A single-threaded runtime owned by the channel. RPCs are driven by the
+    /// calling thread, so no worker threads are spawned.
+    CurrentThread,
+    /// One multi-threaded runtime shared by every channel in the process.
+    Shared,
+}
+
+impl RuntimeMode {
+    fn parse(mode: &str, worker_threads: Option<usize>) -> Result<Self, String> {
+        if worker_threads == Some(0) {
+            return Err("worker_threads must be at least 1".to_string());
+        }
+        match (mode, worker_threads) {
+            ("multi_thread", _) => Ok(Self::MultiThread { worker_threads }),
+            ("current_thread" | "shared", Some(_)) => Err(format!(
+                "worker_threads can only be set with runtime='multi_thread', not '{mode}'"
+            )),
+            ("current_thread", None) => Ok(Self::CurrentThread),
+            ("shared", None) => Ok(Self::Shared),
+            _ => Err(format!(
+                "Invalid runtime '{mode}'; expected 'multi_thread', 'current_thread', or 'shared'"
+            )),
+        }
+    }
+}
+
+/// Runtime used by `RuntimeMode::Shared` channels, created by the first of them.
+static SHARED_RUNTIME: OnceLock<tokio::runtime::Runtime> = OnceLock::new();
+
+/// A runtime owned by one channel, or the process-wide shared runtime.
+enum RuntimeHandle {
+    Owned(tokio::runtime::Runtime),
+    Shared(&'static tokio::runtime::Runtime),
+}
+
+impl std::ops::Deref for RuntimeHandle {
+    type Target = tokio::runtime::Runtime;
+
+    fn deref(&self) -> &Self::Target {
+        match self {
+            Self::Owned(runtime) => runtime,
+            Self::Shared(runtime) => runtime,
+        }
+    }
+}
+
+fn build_runtime(mode: RuntimeMode) -> std::io::Result<RuntimeHandle> {
+    match mode {
+        RuntimeMode::MultiThread { worker_threads } => {
+            let mut builder = tokio::runtime::Builder::new_multi_thread();
+            if let Some(n) = worker_threads {
+                builder.worker_threads(n);
+            }
+            builder.enable_all().build().map(RuntimeHandle::Owned)
+        }
+        RuntimeMode::CurrentThread => tokio::runtime::Builder::new_current_thread()
+            .enable_all()
+            .build()
+            .map(RuntimeHandle::Owned),
+        RuntimeMode::Shared => {
+            if let Some(runtime) = SHARED_RUNTIME.get() {
+                return Ok(RuntimeHandle::Shared(runtime));
+            }
+            let runtime = tokio::runtime::Builder::new_multi_thread()
+                .enable_all()
+                .build()?;
+            // Another thread may have won the race; its runtime is kept and ours dropped.
+            let _ = SHARED_RUNTIME.set(runtime);
+            Ok(RuntimeHandle::Shared(
+                SHARED_RUNTIME.get().expect("shared runtime was just set"),
+            ))
+        }
+    }
+}
+
+/// The runtime and client of a channel. They are created together because
+/// the client's connection tasks are spawned onto the runtime.
+struct Connection {
+    runtime: RuntimeHandle,
+    client: Client,
+}
+
+/// Everything needed to open a `Connection`, kept so that it can be opened
+/// on the first RPC instead of at construction time.
+struct ConnectionSpec {
+    endpoint: Endpoint,
+    proxy: Option<http::Uri>,
+    interceptor: MetadataInterceptor,
+    runtime: RuntimeMode,
+}
+
+impl ConnectionSpec {
+    fn open(&self) -> Result<Connection, String> {
+        let runtime = build_runtime(self.runtime)
+            .map_err(|e| format!("Failed to create tokio runtime: {e}"))?;
+
+        // Use lazy connection — the channel establishes the actual TCP/TLS connection
+        // on the first RPC call, not at construction time. This means GrpcIndex
+        // construction never fails due to transient network issues; callers discover
+        // connectivity problems only when they make an actual request.
+        //
+        // connect_lazy() must be called within a Tokio runtime context so that
+        // hyper-util's TokioExecutor can register its executor. We use runtime.enter()
+        // to set the context without actually running any async code.
+        let channel = {
+            let _guard = runtime.enter();
+            match &self.proxy {
+                Some(proxy_dst) => {
+                    let mut http_connector = HttpConnector::new();
+                    http_connector.enforce_http(false);
+                    let tunnel_connector = Tunnel::new(proxy_dst.clone(), http_connector);
+                    self.endpoint.connect_with_connector_lazy(tunnel_connector)
+                }
+                None => self.endpoint.connect_lazy(),
+            }
+        };
+
+        Ok(Connection {
+            client: VectorServiceClient::with_interceptor(channel, self.interceptor.clone())
+                .max_decoding_message_size(MAX_MESSAGE_SIZE)
+                .max_encoding_message_size(MAX_MESSAGE_SIZE),
+            runtime,
+        })
+    }
+}
+
 /// A gRPC channel wrapper exposed to Python.
 #[pyclass]
 pub struct GrpcChannel {
-    client: VectorServiceClient<InterceptedService<Channel, MetadataInterceptor>>,
-    runtime: tokio::runtime::Runtime,
+    spec: ConnectionSpec,
+    connection: OnceLock<Connection>,
     retry_config: RetryConfig,
+    compact_sparse: bool,
+}
+
+impl GrpcChannel {
+    /// Return the channel's connection, opening it on first use.
+    fn connection(&self, py: Python<'_>) -> PyResult<&Connection> {
+        if let Some(connection) = self.connection.get() {
+            return Ok(connection);
+        }
+        let connection = self.spec.open().map_err(|e| pinecone_error(py, &e))?;
+        // Concurrent first RPCs may both open one; the loser's is dropped unused.
+        let _ = self.connection.set(connection);
+        Ok(self.connection.get().expect("connection was just set"))
+    }
 }
 
 #[pymethods]
@@ -538,8 +735,17 @@ impl GrpcChannel {
     ///     source_tag: Optional source tag appended to the User-Agent string.
     ///     proxy_url: Optional HTTP proxy URL (e.g. "http://proxy.example.com:8080").
     ///                When set, gRPC traffic is tunnelled through the proxy via HTTP CONNECT.
+    ///     compact_sparse: Return sparse indices/values from query and fetch as packed
+    ///                native-endian u32/f32 `bytes` instead of lists (default false).
+    ///     runtime: Tokio runtime to run RPCs on: "multi_thread" (a runtime owned by
+    ///                this channel, the default), "current_thread" (no worker threads;
+    ///                RPCs are driven by the calling thread), or "shared" (one
+    ///                multi-threaded runtime for every channel in the process).
+    ///     worker_threads: Worker count for runtime="multi_thread" (default one per core).
+    ///     lazy_runtime: Create the runtime and connection on the first RPC instead of
+    ///                at construction time (default false).
     #[new]
-    #[pyo3(signature = (endpoint, api_key, api_version, version, secure=true, timeout_s=None, connect_timeout_s=None, max_retries=None, source_tag=None, proxy_url=None))]
+    #[pyo3(signature = (endpoint, api_key, api_version, version, secure=true, timeout_s=None, connect_timeout_s=None, max_retries=None, source_tag=None, proxy_url=None, compact_sparse=false, runtime="multi_thread", worker_threads=None, lazy_runtime=false))]
     #[allow(clippy::too_many_arguments)]
     fn new(
         py: Python<'_>,
@@ -553,11 +759,13 @@ impl GrpcChannel {
         max_retries: Option<u32>,
         source_tag: Option<&str>,
         proxy_url: Option<&str>,
+        compact_sparse: bool,
+        runtime: &str,
+        worker_threads: Option<usize>,
+        lazy_runtime: bool,
     ) -> PyResult<Self> {
-        let runtime = tokio::runtime::Builder::new_multi_thread()
-            .enable_all()
-            .build()
-            .map_err(|e| pinecone_error(py, &format!("Failed to create tokio runtime: {e}")))?;
+        let runtime_mode = RuntimeMode::parse(runtime, worker_threads)
+            .map_err(|e| pinecone_value_error(py, &e))?;
 
         let request_timeout = secs_to_duration(py, timeout_s.unwrap_or(20.0), "timeout_s")?;
         let connection_timeout =
@@ -580,28 +788,13 @@ impl GrpcChannel {
                 .map_err(|e| pinecone_value_error(py, &format!("Failed to configure TLS: {e}")))?;
         }
 
-        // Use lazy connection — the channel establishes the actual TCP/TLS connection
-        // on the first RPC call, not at construction time. This means GrpcIndex
-        // construction never fails due to transient network issues; callers discover
-        // connectivity problems only when they make an actual request.
-        //
-        // connect_lazy() must be called within a Tokio runtime context so that
-        // hyper-util's TokioExecutor can register its executor. We use runtime.enter()
-        // to set the context without actually running any async code.
-        let channel = {
-            let _guard = runtime.enter();
-            if let Some(proxy_url_str) = proxy_url {
-                let proxy_dst: http::Uri = proxy_url_str.parse().map_err(|e| {
+        let proxy = proxy_url
+            .map(|proxy_url_str| {
+                proxy_url_str.parse::<http::Uri>().map_err(|e| {
                     pinecone_value_error(py, &format!("Invalid proxy URL '{proxy_url_str}': {e}"))
-                })?;
-                let mut http_connector = HttpConnector::new();
-                http_connector.enforce_http(false);
-                let tunnel_connector = Tunnel::new(proxy_dst, http_connector);
-                endpoint_builder.connect_with_connector_lazy(tunnel_connector)
-            } else {
-                endpoint_builder.connect_lazy()
-            }
-        };
+                })
+            })
+            .transpose()?;
 
         let interceptor = MetadataInterceptor::new(api_key, api_version)
             .map_err(|e| pinecone_value_error(py, &format!("Invalid metadata value: {e}")))?;
@@ -611,13 +804,21 @@ impl GrpcChannel {
             ..RetryConfig::default()
         };
 
-        Ok(Self {
-            client: VectorServiceClient::with_interceptor(channel, interceptor)
-                .max_decoding_message_size(MAX_MESSAGE_SIZE)
-                .max_encoding_message_size(MAX_MESSAGE_SIZE),
-            runtime,
+        let channel = Self {
+            spec: ConnectionSpec {
+                endpoint: endpoint_builder,
+                proxy,
+                interceptor,
+                runtime: runtime_mode,
+            },
+            connection: OnceLock::new(),
             retry_config,
-        })
+            compact_sparse,
+        };
+        if !lazy_runtime {
+            channel.connection(py)?;
+        }
+        Ok(channel)
     }
 
     /// Upsert vectors.
@@ -670,12 +871,13 @@ impl GrpcChannel {
         let timeout = timeout_s
             .map(|secs| secs_to_duration(py, secs, "timeout_s"))
             .transpose()?;
-        let client = self.client.clone();
+        let conn = self.connection(py)?;
+        let client = conn.client.clone();
         let retry_config = self.retry_config.clone();
         #[allow(clippy::result_large_err)]
         let response = py
             .allow_threads(|| {
-                self.runtime.block_on(retry_on_transient(&retry_config, || {
+                conn.runtime.block_on(retry_on_transient(&retry_config, || {
                     let mut c = client.clone();
                     let r = request.clone();
                     async move {
@@ -754,12 +956,13 @@ impl GrpcChannel {
         let timeout = timeout_s
             .map(|secs| secs_to_duration(py, secs, "timeout_s"))
             .transpose()?;
-        let client = self.client.clone();
+        let conn = self.connection(py)?;
+        let client = conn.client.clone();
         let retry_config = self.retry_config.clone();
         #[allow(clippy::result_large_err)]
         let response = py
             .allow_threads(|| {
-                self.runtime.block_on(retry_on_transient(&retry_config, || {
+                conn.runtime.block_on(retry_on_transient(&retry_config, || {
                     let mut c = client.clone();
                     let r = request.clone();
                     async move {
@@ -777,7 +980,7 @@ impl GrpcChannel {
         let matches: Vec<Py<PyDict>> = inner
             .matches
             .iter()
-            .map(|m| scored_vector_to_py_dict(py, m))
+            .map(|m| scored_vector_to_py_dict(py, m, self.compact_sparse))
             .collect::<PyResult<_>>()?;
 
         let dict = PyDict::new(py);
@@ -815,12 +1018,13 @@ impl GrpcChannel {
         let timeout = timeout_s
             .map(|secs| secs_to_duration(py, secs, "timeout_s"))
             .transpose()?;
-        let client = self.client.clone();
+        let conn = self.connection(py)?;
+        let client = conn.client.clone();
         let retry_config = self.retry_config.clone();
         #[allow(clippy::result_large_err)]
         let response = py
             .allow_threads(|| {
-                self.runtime.block_on(retry_on_transient(&retry_config, || {
+                conn.runtime.block_on(retry_on_transient(&retry_config, || {
                     let mut c = client.clone();
                     let r = request.clone();
                     async move {
@@ -837,7 +1041,7 @@ impl GrpcChannel {
         let inner = response.into_inner();
         let vectors_dict = PyDict::new(py);
         for (id, vector) in &inner.vectors {
-            vectors_dict.set_item(id, vector_to_py_dict(py, vector)?)?;
+            vectors_dict.set_item(id, vector_to_py_dict(py, vector, self.compact_sparse)?)?;
         }
 
         let dict = PyDict::new(py);
@@ -881,11 +1085,12 @@ impl GrpcChannel {
         let timeout = timeout_s
             .map(|secs| secs_to_duration(py, secs, "timeout_s"))
             .transpose()?;
-        let client = self.client.clone();
+        let conn = self.connection(py)?;
+        let client = conn.client.clone();
         let retry_config = self.retry_config.clone();
         #[allow(clippy::result_large_err)]
         py.allow_threads(|| {
-            self.runtime.block_on(retry_on_transient(&retry_config, || {
+            conn.runtime.block_on(retry_on_transient(&retry_config, || {
                 let mut c = client.clone();
                 let r = request.clone();
                 async move {
@@ -945,12 +1150,13 @@ impl GrpcChannel {
         let timeout = timeout_s
             .map(|secs| secs_to_duration(py, secs, "timeout_s"))
             .transpose()?;
-        let client = self.client.clone();
+        let conn = self.connection(py)?;
+        let client = conn.client.clone();
         let retry_config = self.retry_config.clone();
         #[allow(clippy::result_large_err)]
         let response = py
             .allow_threads(|| {
-                self.runtime.block_on(retry_on_transient(&retry_config, || {
+                conn.runtime.block_on(retry_on_transient(&retry_config, || {
                     let mut c = client.clone();
                     let r = request.clone();
                     async move {
@@ -1003,12 +1209,13 @@ impl GrpcChannel {
         let timeout = timeout_s
             .map(|secs| secs_to_duration(py, secs, "timeout_s"))
             .transpose()?;
-        let client = self.client.clone();
+        let conn = self.connection(py)?;
+        let client = conn.client.clone();
         let retry_config = self.retry_config.clone();
         #[allow(clippy::result_large_err)]
         let response = py
             .allow_threads(|| {
-                self.runtime.block_on(retry_on_transient(&retry_config, || {
+                conn.runtime.block_on(retry_on_transient(&retry_config, || {
                     let mut c = client.clone();
                     let r = request.clone();
                     async move {
@@ -1074,12 +1281,13 @@ impl GrpcChannel {
         let timeout = timeout_s
             .map(|secs| secs_to_duration(py, secs, "timeout_s"))
             .transpose()?;
-        let client = self.client.clone();
+        let conn = self.connection(py)?;
+        let client = conn.client.clone();
         let retry_config = self.retry_config.clone();
         #[allow(clippy::result_large_err)]
         let response = py
             .allow_threads(|| {
-                self.runtime.block_on(retry_on_transient(&retry_config, || {
+                conn.runtime.block_on(retry_on_transient(&retry_config, || {
                     let mut c = client.clone();
                     let r = request.clone();
                     async move {
@@ -1152,12 +1360,13 @@ impl GrpcChannel {
         let timeout = timeout_s
             .map(|secs| secs_to_duration(py, secs, "timeout_s"))
             .transpose()?;
-        let client = self.client.clone();
+        let conn = self.connection(py)?;
+        let client = conn.client.clone();
         let retry_config = self.retry_config.clone();
         #[allow(clippy::result_large_err)]
         let response = py
             .allow_threads(|| {
-                self.runtime.block_on(retry_on_transient(&retry_config, || {
+                conn.runtime.block_on(retry_on_transient(&retry_config, || {
                     let mut c = client.clone();
                     let r = request.clone();
                     async move {
@@ -1211,12 +1420,13 @@ impl GrpcChannel {
         let timeout = timeout_s
             .map(|secs| secs_to_duration(py, secs, "timeout_s"))
             .transpose()?;
-        let client = self.client.clone();
+        let conn = self.connection(py)?;
+        let client = conn.client.clone();
         let retry_config = self.retry_config.clone();
         #[allow(clippy::result_large_err)]
         let response = py
             .allow_threads(|| {
-                self.runtime.block_on(retry_on_transient(&retry_config, || {
+                conn.runtime.block_on(retry_on_transient(&retry_config, || {
                     let mut c = client.clone();
                     let r = request.clone();
                     async move {
@@ -1256,11 +1466,12 @@ impl GrpcChannel {
         let timeout = timeout_s
             .map(|secs| secs_to_duration(py, secs, "timeout_s"))
             .transpose()?;
-        let client = self.client.clone();
+        let conn = self.connection(py)?;
+        let client = conn.client.clone();
         let retry_config = self.retry_config.clone();
         #[allow(clippy::result_large_err)]
         py.allow_threads(|| {
-            self.runtime.block_on(retry_on_transient(&retry_config, || {
+            conn.runtime.block_on(retry_on_transient(&retry_config, || {
                 let mut c = client.clone();
                 let r = request.clone();
                 async move {
@@ -1306,12 +1517,13 @@ impl GrpcChannel {
         let timeout = timeout_s
             .map(|secs| secs_to_duration(py, secs, "timeout_s"))
             .transpose()?;
-        let client = self.client.clone();
+        let conn = self.connection(py)?;
+        let client = conn.client.clone();
         let retry_config = self.retry_config.clone();
         #[allow(clippy::result_large_err)]
         let response = py
             .allow_threads(|| {
-                self.runtime.block_on(retry_on_transient(&retry_config, || {
+                conn.runtime.block_on(retry_on_transient(&retry_config, || {
                     let mut c = client.clone();
                     let r = request.clone();
                     async move {
@@ -1361,12 +1573,13 @@ impl GrpcChannel {
         let timeout = timeout_s
             .map(|secs| secs_to_duration(py, secs, "timeout_s"))
             .transpose()?;
-        let client = self.client.clone();
+        let conn = self.connection(py)?;
+        let client = conn.client.clone();
         let retry_config = self.retry_config.clone();
         #[allow(clippy::result_large_err)]
         let response = py
             .allow_threads(|| {
-                self.runtime.block_on(retry_on_transient(&retry_config, || {
+                conn.runtime.block_on(retry_on_transient(&retry_config, || {
                     let mut c = client.clone();
                     let r = request.clone();
                     async move {
@@ -1383,7 +1596,7 @@ impl GrpcChannel {
         let inner = response.into_inner();
         let vectors_dict = PyDict::new(py);
         for (id, vector) in &inner.vectors {
-            vectors_dict.set_item(id, vector_to_py_dict(py, vector)?)?;
+            vectors_dict.set_item(id, vector_to_py_dict(py, vector, self.compact_sparse)?)?;
         }
 
         let dict = PyDict::new(py);
@@ -1497,6 +1710,62 @@ mod tests {
         );
     }
 
+    #[test]
+    fn runtime_mode_parses_valid_modes() {
+        assert_eq!(
+            RuntimeMode::parse("multi_thread", None),
+            Ok(RuntimeMode::MultiThread {
+                worker_threads: None
+            })
+        );
+        assert_eq!(
+            RuntimeMode::parse("multi_thread", Some(2)),
+            Ok(RuntimeMode::MultiThread {
+                worker_threads: Some(2)
+            })
+        );
+        assert_eq!(
+            RuntimeMode::parse("current_thread", None),
+            Ok(RuntimeMode::CurrentThread)
+        );
+        assert_eq!(RuntimeMode::parse("shared", None), Ok(RuntimeMode::Shared));
+    }
+
+    #[test]
+    fn runtime_mode_rejects_invalid_combinations() {
+        assert!(RuntimeMode::parse("threaded", None).is_err());
+        assert!(RuntimeMode::parse("multi_thread", Some(0)).is_err());
+        assert!(RuntimeMode::parse("current_thread", Some(2)).is_err());
+        assert!(RuntimeMode::parse("shared", Some(2)).is_err());
+    }
+
+    #[test]
+    fn shared_runtime_is_reused() {
+        let first = build_runtime(RuntimeMode::Shared).expect("shared runtime");
+        let second = build_runtime(RuntimeMode::Shared).expect("shared runtime");
+        assert!(std::ptr::eq(&*first, &*second));
+    }
+
+    #[test]
+    fn connection_spec_opens_on_each_runtime_mode() {
+        let spec = |runtime| ConnectionSpec {
+            endpoint: Channel::from_shared("http://localhost:5080".to_string())
+                .expect("valid endpoint"),
+            proxy: None,
+            interceptor: MetadataInterceptor::new("key", "2025-10").unwrap(),
+            runtime,
+        };
+        for mode in [
+            RuntimeMode::MultiThread {
+                worker_threads: Some(1),
+            },
+            RuntimeMode::CurrentThread,
+            RuntimeMode::Shared,
+        ] {
+            assert!(spec(mode).open().is_ok(), "{mode:?} should open lazily");
+        }
+    }
+
     #[test]
     fn default_timeouts_are_applied() {
         // Verify that endpoint builder accepts default timeout values without error.
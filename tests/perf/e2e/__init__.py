@@ -0,0 +1,15 @@
+"""End-to-end benchmarks against a local stand-in for the Pinecone data plane.
+
+Unlike ``tests/perf/test_grpc_throughput.py``, which measures Python dispatch
+against a mocked channel, these benchmarks send real requests over loopback,
+so request encoding, the HTTP and gRPC transports, retries, the Rust
+conversion layer and response decoding are all part of the measurement.
+
+The stand-in needs optional packages that are not SDK dependencies::
+
+    uv run --with uvicorn --with grpcio-tools python -m tests.perf.e2e --output bench.json
+
+Pass ``--baseline`` with an earlier report to fail on regressions. The
+gRPC transport additionally needs the ``pinecone._grpc`` extension
+(``maturin develop``); it is skipped when the extension is not built.
+"""
@@ -0,0 +1,74 @@
+"""Run the end-to-end benchmarks: ``python -m tests.perf.e2e --help``."""
+
+from __future__ import annotations
+
+import argparse
+import sys
+
+from tests.perf.e2e.harness import (
+    OPERATIONS,
+    TRANSPORTS,
+    compare,
+    format_table,
+    load_results,
+    run_suite,
+    write_report,
+)
+from tests.perf.e2e.server import Dataset
+
+
+def _names(value: str) -> tuple[str, ...]:
+    return tuple(name.strip() for name in value.split(",") if name.strip())
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m tests.perf.e2e", description=__doc__)
+    parser.add_argument("--transports", type=_names, default=TRANSPORTS)
+    parser.add_argument("--operations", type=_names, default=OPERATIONS)
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        action="append",
+        help="Concurrent callers; repeat for several levels (default 1).",
+    )
+    parser.add_argument("--iterations", type=int, default=500)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument("--dataset-size", type=int, default=1_000)
+    parser.add_argument("--dimension", type=int, default=128)
+    parser.add_argument("--output", help="Write the JSON report to this path.")
+    parser.add_argument("--baseline", help="Compare against an earlier JSON report.")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.15,
+        help="Allowed slowdown before a change counts as a regression (default 0.15).",
+    )
+    args = parser.parse_args(argv)
+
+    unknown = set(args.transports) - set(TRANSPORTS) or set(args.operations) - set(OPERATIONS)
+    if unknown:
+        parser.error(f"unknown names: {', '.join(sorted(unknown))}")
+
+    data = Dataset(size=args.dataset_size, dimension=args.dimension)
+    results = run_suite(
+        transports=args.transports,
+        operation_names=args.operations,
+        concurrency=tuple(args.concurrency or (1,)),
+        iterations=args.iterations,
+        warmup=args.warmup,
+        data=data,
+    )
+    print(format_table(results))
+    if args.output:
+        write_report(args.output, results, data)
+    if args.baseline:
+        regressions = compare(load_results(args.baseline), results, tolerance=args.tolerance)
+        for regression in regressions:
+            print(f"REGRESSION {regression}")
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,372 @@
+"""Measurement, reporting and regression comparison for the end-to-end benchmarks."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import json
+import math
+import os
+import platform
+import sys
+import time
+import tracemalloc
+from collections.abc import Awaitable, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from dataclasses import asdict, dataclass
+from datetime import datetime, timezone
+from typing import Any
+
+from tests.perf.e2e.server import Dataset, serve_grpc, serve_rest
+
+OPERATIONS = ("upsert", "query", "fetch", "list")
+TRANSPORTS = ("rest", "rest-async", "grpc")
+
+UPSERT_BATCH = 100
+TOP_K = 10
+FETCH_IDS = 10
+LIST_LIMIT = 100
+
+#: Iterations traced with tracemalloc, separately from the timed run.
+ALLOC_ITERATIONS = 20
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements of one operation over one transport."""
+
+    transport: str
+    operation: str
+    concurrency: int
+    iterations: int
+    ops_per_second: float
+    latency_ms: dict[str, float]
+    """``mean``, ``p50``, ``p90``, ``p99`` and ``max`` of single-operation latency."""
+    alloc_kib_per_op: float
+    """Mean peak of Python allocations during one operation (native memory not traced)."""
+
+    @property
+    def key(self) -> tuple[str, str, int]:
+        return self.transport, self.operation, self.concurrency
+
+
+@dataclass
+class Operation:
+    name: str
+    call: Callable[[], Any]
+    check: Callable[[Any], bool]
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Return the *q*-th percentile (0-100) of *sorted_values* by nearest rank."""
+    rank = max(1, math.ceil(q / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def _summarize(latencies: list[float]) -> dict[str, float]:
+    ordered = sorted(latencies)
+    return {
+        "mean": sum(ordered) / len(ordered) * 1000,
+        "p50": percentile(ordered, 50) * 1000,
+        "p90": percentile(ordered, 90) * 1000,
+        "p99": percentile(ordered, 99) * 1000,
+        "max": ordered[-1] * 1000,
+    }
+
+
+def _timed(call: Callable[[], Any], count: int) -> list[float]:
+    latencies = []
+    for _ in range(count):
+        start = time.perf_counter()
+        call()
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def _alloc_kib(call: Callable[[], Any]) -> float:
+    tracemalloc.start()
+    try:
+        peaks = []
+        for _ in range(ALLOC_ITERATIONS):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            call()
+            peaks.append(tracemalloc.get_traced_memory()[1] - before)
+    finally:
+        tracemalloc.stop()
+    return sum(peaks) / len(peaks) / 1024
+
+
+def measure(
+    transport: str,
+    op: Operation,
+    *,
+    iterations: int,
+    warmup: int,
+    concurrency: int = 1,
+) -> BenchmarkResult:
+    """Benchmark a blocking operation, from *concurrency* threads when above 1."""
+    result = op.call()
+    if not op.check(result):
+        raise AssertionError(f"{transport} {op.name} returned an unexpected response: {result!r}")
+    _timed(op.call, warmup)
+    per_worker = max(1, iterations // concurrency)
+    start = time.perf_counter()
+    if concurrency == 1:
+        latencies = _timed(op.call, per_worker)
+    else:
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            chunks = list(pool.map(lambda _: _timed(op.call, per_worker), range(concurrency)))
+        latencies = [latency for chunk in chunks for latency in chunk]
+    elapsed = time.perf_counter() - start
+    return BenchmarkResult(
+        transport=transport,
+        operation=op.name,
+        concurrency=concurrency,
+        iterations=len(latencies),
+        ops_per_second=len(latencies) / elapsed,
+        latency_ms=_summarize(latencies),
+        alloc_kib_per_op=_alloc_kib(op.call),
+    )
+
+
+async def ameasure(
+    transport: str,
+    op: Operation,
+    *,
+    iterations: int,
+    warmup: int,
+    concurrency: int = 1,
+) -> BenchmarkResult:
+    """Benchmark an operation of an async client, with *concurrency* tasks in flight."""
+    call: Callable[[], Awaitable[Any]] = op.call
+
+    async def timed(count: int) -> list[float]:
+        latencies = []
+        for _ in range(count):
+            start = time.perf_counter()
+            await call()
+            latencies.append(time.perf_counter() - start)
+        return latencies
+
+    result = await call()
+    if not op.check(result):
+        raise AssertionError(f"{transport} {op.name} returned an unexpected response: {result!r}")
+    await timed(warmup)
+    per_worker = max(1, iterations // concurrency)
+    start = time.perf_counter()
+    chunks = await asyncio.gather(*(timed(per_worker) for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    latencies = [latency for chunk in chunks for latency in chunk]
+
+    tracemalloc.start()
+    try:
+        peaks = []
+        for _ in range(ALLOC_ITERATIONS):
+            tracemalloc.reset_peak()
+            before = tracemalloc.get_traced_memory()[0]
+            await call()
+            peaks.append(tracemalloc.get_traced_memory()[1] - before)
+    finally:
+        tracemalloc.stop()
+
+    return BenchmarkResult(
+        transport=transport,
+        operation=op.name,
+        concurrency=concurrency,
+        iterations=len(latencies),
+        ops_per_second=len(latencies) / elapsed,
+        latency_ms=_summarize(latencies),
+        alloc_kib_per_op=sum(peaks) / len(peaks) / 1024,
+    )
+
+
+def operations(index: Any, data: Dataset) -> dict[str, Operation]:
+    """Return the benchmarked operations of *index*.
+
+    For an ``AsyncIndex`` the calls return coroutines and the checks apply
+    to their results.
+    """
+    batch = data.vectors(UPSERT_BATCH)
+    vector = data.values[0]
+    ids = data.ids[:FETCH_IDS]
+    return {
+        "upsert": Operation(
+            "upsert",
+            lambda: index.upsert(vectors=batch),
+            lambda r: r.upserted_count == UPSERT_BATCH,
+        ),
+        "query": Operation(
+            "query",
+            lambda: index.query(top_k=TOP_K, vector=vector, include_metadata=True),
+            lambda r: len(r.matches) == TOP_K,
+        ),
+        "fetch": Operation(
+            "fetch",
+            lambda: index.fetch(ids=ids),
+            lambda r: len(r.vectors) == FETCH_IDS,
+        ),
+        "list": Operation(
+            "list",
+            lambda: index.list_paginated(limit=LIST_LIMIT),
+            lambda r: len(r.vectors) == min(LIST_LIMIT, data.size),
+        ),
+    }
+
+
+def grpc_available() -> bool:
+    """Whether the gRPC transport can be benchmarked in this environment."""
+    return (
+        all(importlib.util.find_spec(name) is not None for name in ("grpc", "grpc_tools"))
+        and importlib.util.find_spec("pinecone._grpc") is not None
+    )
+
+
+@contextmanager
+def stand_in(data: Dataset, transports: tuple[str, ...]) -> Iterator[dict[str, str]]:
+    """Start the servers needed by *transports*; yield their hosts by protocol."""
+    with ExitStack() as stack:
+        hosts: dict[str, str] = {}
+        if any(t.startswith("rest") for t in transports):
+            hosts["rest"] = stack.enter_context(serve_rest(data))
+        if "grpc" in transports:
+            hosts["grpc"] = stack.enter_context(serve_grpc(data))
+        yield hosts
+
+
+def run_suite(
+    *,
+    transports: tuple[str, ...] = TRANSPORTS,
+    operation_names: tuple[str, ...] = OPERATIONS,
+    concurrency: tuple[int, ...] = (1,),
+    iterations: int = 200,
+    warmup: int = 20,
+    data: Dataset | None = None,
+) -> list[BenchmarkResult]:
+    """Benchmark every transport, operation and concurrency level against the stand-in."""
+    from pinecone import AsyncIndex, Index
+
+    data = data or Dataset()
+    if "grpc" in transports and not grpc_available():
+        print("Skipping grpc: grpcio-tools or the pinecone._grpc extension is missing")
+        transports = tuple(t for t in transports if t != "grpc")
+    results: list[BenchmarkResult] = []
+    with stand_in(data, transports) as hosts:
+        if "rest" in transports:
+            with Index(host=hosts["rest"], api_key="bench") as index:
+                ops = operations(index, data)
+                for name in operation_names:
+                    for level in concurrency:
+                        results.append(
+                            measure(
+                                "rest",
+                                ops[name],
+                                iterations=iterations,
+                                warmup=warmup,
+                                concurrency=level,
+                            )
+                        )
+        if "rest-async" in transports:
+
+            async def run_async() -> None:
+                async with AsyncIndex(host=hosts["rest"], api_key="bench") as index:
+                    ops = operations(index, data)
+                    for name in operation_names:
+                        for level in concurrency:
+                            results.append(
+                                await ameasure(
+                                    "rest-async",
+                                    ops[name],
+                                    iterations=iterations,
+                                    warmup=warmup,
+                                    concurrency=level,
+                                )
+                            )
+
+            asyncio.run(run_async())
+        if "grpc" in transports:
+            from pinecone.grpc import GrpcIndex
+
+            with GrpcIndex(host=hosts["grpc"], api_key="bench", secure=False) as grpc_index:
+                ops = operations(grpc_index, data)
+                for name in operation_names:
+                    for level in concurrency:
+                        results.append(
+                            measure(
+                                "grpc",
+                                ops[name],
+                                iterations=iterations,
+                                warmup=warmup,
+                                concurrency=level,
+                            )
+                        )
+    return results
+
+
+def report(results: list[BenchmarkResult], data: Dataset | None = None) -> dict[str, Any]:
+    """Return the JSON-serializable report of *results*."""
+    from pinecone import __version__
+
+    return {
+        "meta": {
+            "sdk_version": __version__,
+            "python": sys.version.split()[0],
+            "implementation": platform.python_implementation(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "dataset": (data or Dataset(size=0)).describe(),
+        },
+        "results": [asdict(result) for result in results],
+    }
+
+
+def write_report(path: str, results: list[BenchmarkResult], data: Dataset | None = None) -> None:
+    with open(path, "w") as f:
+        json.dump(report(results, data), f, indent=2)
+        f.write("\n")
+
+
+def load_results(path: str) -> list[BenchmarkResult]:
+    with open(path) as f:
+        return [BenchmarkResult(**entry) for entry in json.load(f)["results"]]
+
+
+def compare(
+    baseline: list[BenchmarkResult], current: list[BenchmarkResult], *, tolerance: float = 0.15
+) -> list[str]:
+    """Return a description of every regression beyond *tolerance* (a fraction)."""
+    before = {result.key: result for result in baseline}
+    regressions = []
+    for result in current:
+        old = before.get(result.key)
+        if old is None:
+            continue
+        label = f"{result.transport} {result.operation} x{result.concurrency}"
+        checks = (
+            ("p50 latency", old.latency_ms["p50"], result.latency_ms["p50"], "ms"),
+            ("p99 latency", old.latency_ms["p99"], result.latency_ms["p99"], "ms"),
+            ("allocations", old.alloc_kib_per_op, result.alloc_kib_per_op, "KiB"),
+        )
+        for metric, was, now, unit in checks:
+            if was > 0 and now > was * (1 + tolerance):
+                regressions.append(f"{label}: {metric} {was:.2f}{unit} -> {now:.2f}{unit}")
+        if result.ops_per_second < old.ops_per_second * (1 - tolerance):
+            regressions.append(
+                f"{label}: throughput {old.ops_per_second:.0f} -> {result.ops_per_second:.0f} ops/s"
+            )
+    return regressions
+
+
+def format_table(results: list[BenchmarkResult]) -> str:
+    header = (
+        f"{'transport':<11}{'op':<8}{'conc':>5}{'ops/s':>10}{'p50 ms':>9}{'p99 ms':>9}{'KiB/op':>9}"
+    )
+    lines = [header, "-" * len(header)]
+    for r in results:
+        lines.append(
+            f"{r.transport:<11}{r.operation:<8}{r.concurrency:>5}{r.ops_per_second:>10.0f}"
+            f"{r.latency_ms['p50']:>9.2f}{r.latency_ms['p99']:>9.2f}{r.alloc_kib_per_op:>9.1f}"
+        )
+    return "\n".join(lines)
@@ -0,0 +1,324 @@
+"""Local stand-in server for the end-to-end benchmarks.
+
+The REST side is a plain ASGI application served by uvicorn. The gRPC side
+implements ``VectorService`` from ``rust/proto/db_data_2025-10.proto`` with
+grpcio, compiling the proto with grpcio-tools on first use. Both serve the
+same fixed in-memory :class:`Dataset` and cache encoded responses, so server
+time stays small and constant and the measurements reflect the client.
+"""
+
+from __future__ import annotations
+
+import functools
+import random
+import socket
+import sys
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+from urllib.parse import parse_qs
+
+import orjson
+
+PROTO_DIR = Path(__file__).resolve().parents[3] / "rust" / "proto"
+PROTO_FILES = (
+    "db_data_2025-10.proto",
+    "google/api/annotations.proto",
+    "google/api/field_behavior.proto",
+)
+MAX_MESSAGE_SIZE = 128 * 1024 * 1024
+GENRES = ("documentary", "comedy", "drama", "thriller")
+
+
+@dataclass
+class Dataset:
+    """Deterministic vectors served by the stand-in."""
+
+    size: int = 1_000
+    dimension: int = 128
+    ids: list[str] = field(init=False)
+    values: list[list[float]] = field(init=False)
+    metadata: list[dict[str, Any]] = field(init=False)
+
+    def __post_init__(self) -> None:
+        rng = random.Random(0)  # noqa: S311
+        self.ids = [f"vec-{i:06d}" for i in range(self.size)]
+        self.values = [[rng.random() for _ in range(self.dimension)] for _ in range(self.size)]
+        self.metadata = [
+            {"genre": GENRES[i % len(GENRES)], "year": 2000 + i % 25} for i in range(self.size)
+        ]
+        self._positions = {vector_id: i for i, vector_id in enumerate(self.ids)}
+
+    def describe(self) -> dict[str, int]:
+        return {"size": self.size, "dimension": self.dimension}
+
+    def vectors(self, count: int) -> list[tuple[str, list[float], dict[str, Any]]]:
+        """Return the first *count* vectors as upsert tuples."""
+        return [(self.ids[i], self.values[i], self.metadata[i]) for i in range(count)]
+
+    def matches(self, top_k: int) -> list[tuple[int, float]]:
+        """Return ``(position, score)`` of the *top_k* best matches of any query."""
+        top_k = min(top_k, self.size)
+        return [(i, 1.0 - i / (2 * self.size)) for i in range(top_k)]
+
+    def positions(self, ids: list[str]) -> list[int]:
+        return [self._positions[i] for i in ids if i in self._positions]
+
+    def page(self, prefix: str, limit: int, token: str | None) -> tuple[list[str], str | None]:
+        """Return one page of ids and the token of the next page."""
+        start = int(token) if token else 0
+        ids = [i for i in self.ids if i.startswith(prefix)]
+        end = start + limit
+        return ids[start:end], (str(end) if end < len(ids) else None)
+
+
+def _cached(method: Callable[..., Any]) -> Callable[..., Any]:
+    """Cache a response builder on its arguments, per instance."""
+
+    @functools.wraps(method)
+    def wrapper(self: Any, *key: Any) -> Any:
+        cache: dict[Any, Any] = self._cache
+        name = method.__name__
+        if (name, key) not in cache:
+            cache[name, key] = method(self, *key)
+        return cache[name, key]
+
+    return wrapper
+
+
+class RestApp:
+    """ASGI application answering the data-plane REST endpoints used by the benchmarks."""
+
+    def __init__(self, data: Dataset) -> None:
+        self.data = data
+        self._cache: dict[Any, Any] = {}
+
+    async def __call__(self, scope: dict[str, Any], receive: Any, send: Any) -> None:
+        if scope["type"] != "http":
+            raise RuntimeError(f"unsupported ASGI scope {scope['type']!r}")
+        body = b""
+        more = True
+        while more:
+            message = await receive()
+            body += message.get("body", b"")
+            more = message.get("more_body", False)
+        status, payload = self.handle(scope["path"], scope["query_string"].decode(), body)
+        await send(
+            {
+                "type": "http.response.start",
+                "status": status,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(payload)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": payload})
+
+    def handle(self, path: str, query: str, body: bytes) -> tuple[int, bytes]:
+        params = parse_qs(query)
+        if path == "/vectors/upsert":
+            count = len(orjson.loads(body)["vectors"])
+            return 200, orjson.dumps({"upsertedCount": count})
+        if path == "/query":
+            request = orjson.loads(body)
+            return 200, self._query(
+                request["topK"],
+                request.get("includeValues", False),
+                request.get("includeMetadata", False),
+            )
+        if path == "/vectors/fetch":
+            return 200, self._fetch(tuple(params.get("ids", ())))
+        if path == "/vectors/list":
+            return 200, self._list(
+                params.get("prefix", [""])[0],
+                int(params.get("limit", ["100"])[0]),
+                params.get("paginationToken", [None])[0],
+            )
+        return 404, orjson.dumps({"error": {"code": 5, "message": f"Not found: {path}"}})
+
+    @_cached
+    def _query(self, top_k: int, include_values: bool, include_metadata: bool) -> bytes:
+        matches = []
+        for position, score in self.data.matches(top_k):
+            match: dict[str, Any] = {"id": self.data.ids[position], "score": score}
+            if include_values:
+                match["values"] = self.data.values[position]
+            if include_metadata:
+                match["metadata"] = self.data.metadata[position]
+            matches.append(match)
+        return orjson.dumps({"matches": matches, "namespace": "", "usage": {"readUnits": 5}})
+
+    @_cached
+    def _fetch(self, ids: tuple[str, ...]) -> bytes:
+        vectors = {
+            self.data.ids[p]: {
+                "id": self.data.ids[p],
+                "values": self.data.values[p],
+                "metadata": self.data.metadata[p],
+            }
+            for p in self.data.positions(list(ids))
+        }
+        return orjson.dumps({"vectors": vectors, "namespace": "", "usage": {"readUnits": 1}})
+
+    @_cached
+    def _list(self, prefix: str, limit: int, token: str | None) -> bytes:
+        ids, next_token = self.data.page(prefix, limit, token)
+        response: dict[str, Any] = {
+            "vectors": [{"id": i} for i in ids],
+            "namespace": "",
+            "usage": {"readUnits": 1},
+        }
+        if next_token is not None:
+            response["pagination"] = {"next": next_token}
+        return orjson.dumps(response)
+
+
+def _bind_loopback() -> socket.socket:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    # Accepted sockets inherit this; without it uvicorn's separate header and body
+    # writes stall on the client's delayed ACK and every response takes ~40ms.
+    sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+    sock.bind(("127.0.0.1", 0))
+    return sock
+
+
+@contextmanager
+def serve_rest(data: Dataset) -> Iterator[str]:
+    """Serve :class:`RestApp` with uvicorn on a loopback port; yield its base URL."""
+    import uvicorn
+
+    sock = _bind_loopback()
+    port = sock.getsockname()[1]
+    config = uvicorn.Config(RestApp(data), lifespan="off", log_level="warning", access_log=False)
+    server = uvicorn.Server(config)
+    thread = threading.Thread(target=server.run, kwargs={"sockets": [sock]}, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 10
+    while not server.started:
+        if not thread.is_alive() or time.monotonic() > deadline:
+            raise RuntimeError("REST stand-in server failed to start")
+        time.sleep(0.01)
+    try:
+        yield f"http://127.0.0.1:{port}"
+    finally:
+        server.should_exit = True
+        thread.join(timeout=10)
+        sock.close()
+
+
+@functools.cache
+def _proto_modules() -> tuple[Any, Any]:
+    """Compile the data-plane proto and return ``(messages, services)`` modules."""
+    import grpc_tools  # type: ignore[import-untyped]
+    from grpc_tools import protoc
+
+    out_dir = tempfile.mkdtemp(prefix="pinecone-bench-proto-")
+    include = Path(grpc_tools.__file__).parent / "_proto"
+    status = protoc.main(
+        [
+            "protoc",
+            f"-I{PROTO_DIR}",
+            f"-I{include}",
+            f"--python_out={out_dir}",
+            f"--grpc_python_out={out_dir}",
+            *PROTO_FILES,
+        ]
+    )
+    if status != 0:
+        raise RuntimeError(f"protoc failed with status {status}")
+    sys.path.insert(0, out_dir)
+    import db_data_2025_10_pb2  # type: ignore[import-not-found]
+    import db_data_2025_10_pb2_grpc  # type: ignore[import-not-found]
+
+    return db_data_2025_10_pb2, db_data_2025_10_pb2_grpc
+
+
+def _servicer(data: Dataset) -> Any:
+    from google.protobuf import struct_pb2  # type: ignore[import-untyped]
+
+    pb2, pb2_grpc = _proto_modules()
+
+    def struct(value: dict[str, Any]) -> Any:
+        message = struct_pb2.Struct()
+        message.update(value)
+        return message
+
+    class VectorService(pb2_grpc.VectorServiceServicer):  # type: ignore[misc,name-defined]
+        def __init__(self) -> None:
+            self._cache: dict[Any, Any] = {}
+
+        def Upsert(self, request: Any, context: Any) -> Any:  # noqa: N802
+            return pb2.UpsertResponse(upserted_count=len(request.vectors))
+
+        def Query(self, request: Any, context: Any) -> Any:  # noqa: N802
+            return self._query(request.top_k, request.include_values, request.include_metadata)
+
+        def Fetch(self, request: Any, context: Any) -> Any:  # noqa: N802
+            return self._fetch(tuple(request.ids))
+
+        def List(self, request: Any, context: Any) -> Any:  # noqa: N802
+            token = request.pagination_token if request.HasField("pagination_token") else None
+            limit = request.limit if request.HasField("limit") else 100
+            return self._list(request.prefix, limit, token)
+
+        @_cached
+        def _query(self, top_k: int, include_values: bool, include_metadata: bool) -> Any:
+            matches = []
+            for position, score in data.matches(top_k):
+                match = pb2.ScoredVector(id=data.ids[position], score=score)
+                if include_values:
+                    match.values.extend(data.values[position])
+                if include_metadata:
+                    match.metadata.CopyFrom(struct(data.metadata[position]))
+                matches.append(match)
+            return pb2.QueryResponse(matches=matches, usage=pb2.Usage(read_units=5))
+
+        @_cached
+        def _fetch(self, ids: tuple[str, ...]) -> Any:
+            vectors = {
+                data.ids[p]: pb2.Vector(
+                    id=data.ids[p], values=data.values[p], metadata=struct(data.metadata[p])
+                )
+                for p in data.positions(list(ids))
+            }
+            return pb2.FetchResponse(vectors=vectors, usage=pb2.Usage(read_units=1))
+
+        @_cached
+        def _list(self, prefix: str, limit: int, token: str | None) -> Any:
+            ids, next_token = data.page(prefix, limit, token)
+            response = pb2.ListResponse(
+                vectors=[pb2.ListItem(id=i) for i in ids], usage=pb2.Usage(read_units=1)
+            )
+            if next_token is not None:
+                response.pagination.next = next_token
+            return response
+
+    return VectorService()
+
+
+@contextmanager
+def serve_grpc(data: Dataset, *, workers: int = 16) -> Iterator[str]:
+    """Serve ``VectorService`` with grpcio on a loopback port; yield ``host:port``."""
+    import grpc  # type: ignore[import-untyped]
+
+    _, pb2_grpc = _proto_modules()
+    options = [
+        ("grpc.max_receive_message_length", MAX_MESSAGE_SIZE),
+        ("grpc.max_send_message_length", MAX_MESSAGE_SIZE),
+    ]
+    server = grpc.server(ThreadPoolExecutor(max_workers=workers), options=options)
+    pb2_grpc.add_VectorServiceServicer_to_server(_servicer(data), server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    try:
+        yield f"127.0.0.1:{port}"
+    finally:
+        server.stop(grace=None).wait()
@@ -0,0 +1,100 @@
+"""Cold-start budget for ``import pinecone`` and client construction.
+
+Each scenario runs in a fresh interpreter under ``python -X importtime`` so
+module caching from the test process cannot hide a regression.  The module
+set checks are exact; the time budgets are deliberately loose and compare
+the best of several runs, so they only trip on real regressions (a heavy
+import moving back onto the construction path), not on a noisy machine.
+"""
+
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from dataclasses import dataclass
+
+import pytest
+
+RUNS = 3
+
+#: Modules that must not be imported until the first request is made.
+DEFERRED_MODULES = ("httpx", "httpcore", "h2", "orjson", "msgspec", "asyncio")
+
+#: Best-of-``RUNS`` budgets, in milliseconds, of the whole import graph.
+IMPORT_BUDGET_MS = 150.0
+FIRST_REQUEST_SETUP_BUDGET_MS = 400.0
+
+_REPORT = """
+import json, sys, time
+start = time.perf_counter()
+{code}
+elapsed = time.perf_counter() - start
+print(json.dumps({{"elapsed_ms": elapsed * 1000, "modules": sorted(sys.modules)}}))
+"""
+
+
+@dataclass
+class ColdStart:
+    import_ms: float
+    """Sum of the cumulative times of top-level imports reported by ``-X importtime``."""
+    elapsed_ms: float
+    """Wall time of the scenario, measured inside the interpreter."""
+    modules: set[str]
+
+
+def _run(code: str) -> ColdStart:
+    proc = subprocess.run(  # noqa: S603 - runs the current interpreter
+        [sys.executable, "-X", "importtime", "-c", _REPORT.format(code=code)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    import_us = 0
+    for line in proc.stderr.splitlines():
+        # "import time: <self us> | <cumulative us> | <indent><module>"
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative_us, name = line.split("|")
+        # Nested imports are indented; only top-level entries add up to the total.
+        if cumulative_us.strip().isdigit() and not name[1:].startswith(" "):
+            import_us += int(cumulative_us)
+    report = json.loads(proc.stdout.strip().splitlines()[-1])
+    return ColdStart(import_us / 1000, report["elapsed_ms"], set(report["modules"]))
+
+
+def _best(code: str) -> ColdStart:
+    runs = [_run(code) for _ in range(RUNS)]
+    return min(runs, key=lambda run: run.elapsed_ms)
+
+
+def _loaded(run: ColdStart, prefixes: tuple[str, ...]) -> list[str]:
+    return sorted(
+        name for name in run.modules if any(name == p or name.startswith(p + ".") for p in prefixes)
+    )
+
+
+@pytest.mark.timeout(120)
+def test_client_construction_defers_http_stack() -> None:
+    run = _best("import pinecone\npc = pinecone.Pinecone(api_key='test-key')")
+
+    assert _loaded(run, DEFERRED_MODULES) == []
+    assert _loaded(run, ("pinecone.models", "pinecone._internal.adapters")) == []
+    assert run.import_ms < IMPORT_BUDGET_MS, f"cold start imports took {run.import_ms:.1f}ms"
+
+
+@pytest.mark.timeout(120)
+def test_first_request_setup_budget() -> None:
+    run = _best(
+        "import pinecone\n"
+        "pc = pinecone.Pinecone(api_key='test-key')\n"
+        "pc.indexes._http\n"
+        "from pinecone._internal.adapters.indexes_adapter import IndexesAdapter"
+    )
+
+    assert "httpx" in run.modules
+    # Only the index models are needed for index operations.
+    assert _loaded(run, ("pinecone.models.assistant", "pinecone.models.vectors")) == []
+    assert run.elapsed_ms < FIRST_REQUEST_SETUP_BUDGET_MS, (
+        f"first request setup took {run.elapsed_ms:.1f}ms"
+    )
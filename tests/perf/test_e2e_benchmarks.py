@@ -0,0 +1,67 @@
+"""End-to-end benchmarks of Index, AsyncIndex and GrpcIndex against a local stand-in.
+
+Runs a short pass of every operation to keep the suite honest; set
+``PINECONE_BENCH_OUTPUT`` to also write the JSON report. Use
+``python -m tests.perf.e2e`` for full-length runs and baseline comparison.
+"""
+
+from __future__ import annotations
+
+import os
+from collections.abc import Iterator
+
+import pytest
+
+pytest.importorskip("uvicorn", reason="the REST stand-in server needs uvicorn")
+
+from tests.perf.e2e.harness import (
+    OPERATIONS,
+    BenchmarkResult,
+    compare,
+    grpc_available,
+    run_suite,
+    write_report,
+)
+from tests.perf.e2e.server import Dataset
+
+ITERATIONS = 30
+
+
+@pytest.fixture(scope="module")
+def results() -> Iterator[list[BenchmarkResult]]:
+    collected: list[BenchmarkResult] = []
+    yield collected
+    path = os.environ.get("PINECONE_BENCH_OUTPUT")
+    if path and collected:
+        write_report(path, collected, Dataset())
+
+
+@pytest.mark.timeout(120)
+@pytest.mark.parametrize("transport", ["rest", "rest-async", "grpc"])
+def test_transport_benchmarks(transport: str, results: list[BenchmarkResult]) -> None:
+    if transport == "grpc" and not grpc_available():
+        pytest.skip("grpcio-tools or the pinecone._grpc extension is not installed")
+
+    measured = run_suite(
+        transports=(transport,), concurrency=(1, 4), iterations=ITERATIONS, warmup=5
+    )
+
+    assert [(r.operation, r.concurrency) for r in measured] == [
+        (op, level) for op in OPERATIONS for level in (1, 4)
+    ]
+    for r in measured:
+        assert r.iterations >= ITERATIONS - 3
+        assert 0 < r.latency_ms["p50"] <= r.latency_ms["p99"] <= r.latency_ms["max"]
+        assert r.ops_per_second > 0
+    results.extend(measured)
+
+
+def test_compare_flags_regressions() -> None:
+    def result(p50: float, ops: float) -> BenchmarkResult:
+        latency = {"mean": p50, "p50": p50, "p90": p50, "p99": p50, "max": p50}
+        return BenchmarkResult("rest", "query", 1, 100, ops, latency, 10.0)
+
+    assert compare([result(1.0, 1000)], [result(1.1, 950)]) == []
+    regressions = compare([result(1.0, 1000)], [result(2.0, 500)])
+    assert len(regressions) == 3
+    assert regressions[0].startswith("rest query x1: p50 latency")
@@ -4,9 +4,18 @@ from __future__ import annotations
 
 import sys
 
+import orjson
 import pytest
 
-from pinecone._internal.batching import chunked, validate_batch_size, with_progress
+from pinecone._internal.batching import (
+    BatchSizeTuner,
+    chunked,
+    iter_json_batches,
+    pack_batches,
+    resolve_batch_size,
+    validate_batch_size,
+    with_progress,
+)
 from pinecone.errors.exceptions import PineconeValueError
 
 
@@ -84,3 +93,71 @@ class TestWithProgress:
         result = with_progress(items, show_progress=True)
         assert result is not items
         assert list(result) == [1, 2, 3]
+
+
+class TestPackBatches:
+    def test_count_limit(self) -> None:
+        batches = pack_batches(range(5), batch_size=2, max_bytes=1000, size_of=lambda _: 1)
+        assert list(batches) == [[0, 1], [2, 3], [4]]
+
+    def test_byte_limit_includes_overhead(self) -> None:
+        batches = pack_batches(
+            range(6), batch_size=100, max_bytes=35, size_of=lambda _: 10, overhead=5
+        )
+        assert [len(b) for b in batches] == [3, 3]
+
+    def test_oversized_item_sent_alone(self) -> None:
+        batches = pack_batches([5, 50, 5, 5], batch_size=10, max_bytes=20, size_of=lambda n: n)
+        assert list(batches) == [[5], [50], [5, 5]]
+
+    def test_tuner_read_at_each_batch_start(self) -> None:
+        tuner = BatchSizeTuner(initial=2, maximum=8, window=1)
+        batches = pack_batches(range(20), batch_size=tuner, max_bytes=1000, size_of=lambda _: 1)
+        first = next(batches)
+        tuner.record(len(first), 1.0)
+        assert len(first) == 2
+        assert len(next(batches)) == 4
+
+
+class TestIterJsonBatches:
+    def test_bodies_are_valid_json_within_limit(self) -> None:
+        items = [{"id": f"v{i}", "values": [0.5] * 20, "metadata": {"i": i}} for i in range(50)]
+        batches = list(
+            iter_json_batches(
+                items, key="vectors", batch_size=100, max_bytes=1200, fields={"namespace": "ns"}
+            )
+        )
+        assert len(batches) > 1
+        assert [item for chunk, _ in batches for item in chunk] == items
+        for chunk, body in batches:
+            assert len(body) <= 1200
+            assert orjson.loads(body) == {"vectors": chunk, "namespace": "ns"}
+
+    def test_without_fields(self) -> None:
+        ((_, body),) = iter_json_batches([{"id": "a"}], key="vectors", batch_size=10)
+        assert body == b'{"vectors":[{"id":"a"}]}'
+
+
+class TestBatchSizeTuner:
+    def test_grows_while_throughput_improves_then_settles(self) -> None:
+        tuner = BatchSizeTuner(initial=10, maximum=1000, window=1)
+        # Per-request latency is flat until 40 items, so throughput peaks there.
+        for _ in range(10):
+            size = tuner.current
+            tuner.record(size, max(1.0, size / 40))
+        assert tuner.settled
+        assert tuner.current == 40
+
+    def test_stops_at_maximum(self) -> None:
+        tuner = BatchSizeTuner(initial=50, maximum=96, window=1)
+        tuner.record(50, 1.0)
+        assert tuner.current == 96
+        tuner.record(96, 1.0)
+        assert tuner.settled
+        assert tuner.current == 96
+
+    def test_resolve_batch_size(self) -> None:
+        assert resolve_batch_size(10) == 10
+        assert isinstance(resolve_batch_size("auto"), BatchSizeTuner)
+        with pytest.raises(PineconeValueError):
+            resolve_batch_size("fast")  # type: ignore[arg-type]
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from unittest.mock import MagicMock
 
 import httpx
@@ -66,3 +67,53 @@ async def test_fast_path_uses_retry_transport_not_client_send() -> None:
     result = client.post("/query", json={"vector": [0.1, 0.2]})
     assert result.status_code == 200
     assert mock_inner.handle_request.call_count == 3
+
+
+def test_fast_path_reads_multi_chunk_identity_body() -> None:
+    client = _make_client()
+
+    mock_inner = MagicMock(spec=httpx.BaseTransport)
+    mock_inner.handle_request.return_value = httpx.Response(
+        200, stream=httpx.ByteStream(b'{"a": 1}'), headers={"content-type": "application/json"}
+    )
+    client._client._transport._transport = mock_inner  # type: ignore[attr-defined]
+
+    result = client.post("/query", json={})
+    assert result.content == b'{"a": 1}'
+    assert result.json() == {"a": 1}
+    assert result.is_stream_consumed
+    assert result.is_closed
+    assert result.num_bytes_downloaded == 8
+
+
+def test_fast_path_decodes_content_encoded_body() -> None:
+    import gzip
+
+    client = _make_client()
+
+    mock_inner = MagicMock(spec=httpx.BaseTransport)
+    mock_inner.handle_request.return_value = httpx.Response(
+        200,
+        stream=httpx.ByteStream(gzip.compress(b'{"a": 1}')),
+        headers={"content-encoding": "gzip"},
+    )
+    client._client._transport._transport = mock_inner  # type: ignore[attr-defined]
+
+    result = client.post("/query", json={})
+    assert result.json() == {"a": 1}
+
+
+def test_fast_path_decodes_from_the_received_body() -> None:
+    client = _make_client()
+    body = b'{"matches": []}'
+
+    class _Stream(httpx.SyncByteStream):
+        def __iter__(self) -> Iterator[bytes]:
+            yield body
+
+    mock_inner = MagicMock(spec=httpx.BaseTransport)
+    mock_inner.handle_request.return_value = httpx.Response(200, stream=_Stream())
+    client._client._transport._transport = mock_inner  # type: ignore[attr-defined]
+
+    result = client.post("/query", json={})
+    assert result.content is body
@@ -236,3 +236,13 @@ class TestGrpcUpsertBatching:
         with patch.object(executor, "shutdown") as mock_shutdown:
             grpc_index.close()
             mock_shutdown.assert_called_once_with(wait=False)
+
+    def test_upsert_splits_batches_by_estimated_size(
+        self, grpc_index: GrpcIndex, mock_channel: MagicMock
+    ) -> None:
+        """Vectors with large metadata are split to stay under the 2 MiB request limit."""
+        vectors = [(f"v{i}", [0.1], {"text": "x" * 500_000}) for i in range(8)]
+        result = grpc_index.upsert(vectors=vectors, batch_size=100, show_progress=False)
+        assert mock_channel.upsert.call_count > 1
+        assert all(len(c.args[0]) <= 3 for c in mock_channel.upsert.call_args_list)
+        assert result.total_item_count == 8
@@ -64,6 +64,17 @@ def test_batch_upsert_250_calls_upsert_three_times(docs: PreviewDocuments) -> No
     assert result.total_batch_count == 3
 
 
+def test_batch_upsert_splits_large_documents_by_bytes(docs: PreviewDocuments) -> None:
+    documents = [{"_id": f"doc-{i}", "body": "x" * 600_000} for i in range(5)]
+
+    with patch.object(docs, "upsert", return_value=_UPSERT_RESPONSE) as mock_upsert:
+        result = docs.batch_upsert(namespace="ns", documents=documents, show_progress=False)
+
+    sizes = [len(c.kwargs["documents"]) for c in mock_upsert.call_args_list]
+    assert sorted(sizes) == [2, 3]
+    assert result.total_item_count == 5
+
+
 def test_batch_upsert_show_progress_propagated(docs: PreviewDocuments) -> None:
     with (
         patch.object(docs, "upsert", return_value=_UPSERT_RESPONSE),
@@ -252,7 +263,7 @@ async def test_async_batch_upsert_max_concurrency_zero_raises(
 
 
 def test_batch_upsert_max_workers_alias_accepted_sync(docs: PreviewDocuments) -> None:
-    with patch("pinecone.preview.documents.batch_execute") as mock_execute:
+    with patch("pinecone.preview.documents.batch_execute_stream") as mock_execute:
         mock_execute.return_value = BatchResult(
             total_item_count=1,
             successful_item_count=1,
@@ -298,7 +309,7 @@ async def test_async_batch_upsert_max_workers_alias_accepted(
     async_docs: AsyncPreviewDocuments,
 ) -> None:
     with patch(
-        "pinecone.preview.async_documents.async_batch_execute", new_callable=AsyncMock
+        "pinecone.preview.async_documents.async_batch_execute_stream", new_callable=AsyncMock
     ) as mock_execute:
         mock_execute.return_value = BatchResult(
             total_item_count=1,
@@ -0,0 +1,238 @@
+"""Unit tests for Assistants.upload_files / sync_directory and their async variants."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+import respx
+
+from pinecone._internal.config import PineconeConfig
+from pinecone._internal.polling import AsyncPoller, Poller
+from pinecone.async_client.assistants import AsyncAssistants
+from pinecone.client.assistants import Assistants
+from pinecone.errors.exceptions import PineconeTimeoutError, PineconeValueError
+from pinecone.models.assistant.file_upload import FileUploadResult
+from tests.factories import make_assistant_file_response, make_assistant_response
+
+BASE_URL = "https://api.test.pinecone.io"
+DATA_PLANE_URL = "https://test-assistant-abc123.svc.pinecone.io/assistant"
+FILES_URL = f"{DATA_PLANE_URL}/files/test-assistant"
+
+
+def _sha256(data: bytes) -> str:
+    return hashlib.sha256(data).hexdigest()
+
+
+class _FileServer:
+    """Keeps an assistant's files; uploads stay ``Processing`` until listed twice."""
+
+    def __init__(self, files: list[dict[str, Any]] | None = None, fail: str | None = None) -> None:
+        self.files = files or []
+        self.fail = fail
+        self.uploads: list[tuple[str, dict[str, Any]]] = []
+        self.list_calls = 0
+        self.deleted: list[str] = []
+
+    def post(self, request: httpx.Request) -> httpx.Response:
+        name = request.content.split(b'filename="')[1].split(b'"')[0].decode()
+        metadata = json.loads(request.url.params["metadata"])
+        self.uploads.append((name, metadata))
+        status = "ProcessingFailed" if name == self.fail else "Processing"
+        file = make_assistant_file_response(
+            id=f"file-{len(self.uploads)}", name=name, metadata=metadata, status="Processing"
+        )
+        self.files.append({**file, "_final": status})
+        return httpx.Response(200, json=file)
+
+    def list(self, request: httpx.Request) -> httpx.Response:
+        self.list_calls += 1
+        if self.list_calls > 2:
+            for file in self.files:
+                if file.get("_final") == "ProcessingFailed":
+                    file.update(status="ProcessingFailed", error_message="bad pdf")
+                elif file.get("_final"):
+                    file["status"] = "Available"
+        return httpx.Response(
+            200,
+            json={"files": [{k: v for k, v in f.items() if k != "_final"} for f in self.files]},
+        )
+
+    def delete(self, request: httpx.Request) -> httpx.Response:
+        self.deleted.append(request.url.path.rsplit("/", 1)[1])
+        return httpx.Response(200)
+
+    def mock(self) -> None:
+        respx.get(f"{BASE_URL}/assistant/assistants/test-assistant").mock(
+            return_value=httpx.Response(200, json=make_assistant_response())
+        )
+        respx.post(FILES_URL).mock(side_effect=self.post)
+        respx.get(FILES_URL).mock(side_effect=self.list)
+        respx.delete(url__startswith=f"{FILES_URL}/").mock(side_effect=self.delete)
+
+
+@pytest.fixture
+def assistants() -> Assistants:
+    assistants = Assistants(config=PineconeConfig(api_key="test-key", host=BASE_URL))
+    assistants._poller = Poller(initial=0.005, maximum=0.02, jitter=0)
+    return assistants
+
+
+@pytest.fixture
+def corpus(tmp_path: Path) -> Path:
+    (tmp_path / "sub").mkdir()
+    (tmp_path / "a.txt").write_bytes(b"alpha")
+    (tmp_path / "b.txt").write_bytes(b"beta")
+    (tmp_path / "sub" / "c.txt").write_bytes(b"gamma")
+    (tmp_path / "sub" / "copy.txt").write_bytes(b"alpha")
+    return tmp_path
+
+
+@respx.mock
+def test_upload_files_skips_existing_and_waits_for_all(
+    assistants: Assistants, corpus: Path
+) -> None:
+    existing = make_assistant_file_response(
+        id="file-old", name="a.txt", metadata={"content_sha256": _sha256(b"alpha")}
+    )
+    server = _FileServer([existing])
+    server.mock()
+
+    result = assistants.upload_files(
+        assistant_name="test-assistant",
+        paths=[corpus / "a.txt", corpus / "b.txt", corpus / "sub" / "c.txt"],
+        metadata={"team": "docs"},
+    )
+
+    assert isinstance(result, FileUploadResult)
+    assert [f.id for f in result.skipped] == ["file-old"]
+    assert sorted(name for name, _ in server.uploads) == ["b.txt", "c.txt"]
+    assert all(m["team"] == "docs" for _, m in server.uploads)
+    assert {m["content_sha256"] for _, m in server.uploads} == {
+        _sha256(b"beta"),
+        _sha256(b"gamma"),
+    }
+    assert [f.status for f in result.uploaded] == ["Available", "Available"]
+    # One listing for dedup plus one per polling round, not one describe per file.
+    assert server.list_calls == 3
+    assert not result.has_errors
+
+
+@respx.mock
+def test_upload_files_reports_processing_failures(assistants: Assistants, corpus: Path) -> None:
+    server = _FileServer(fail="b.txt")
+    server.mock()
+
+    result = assistants.upload_files(
+        assistant_name="test-assistant",
+        paths=[corpus / "a.txt", corpus / "b.txt"],
+        skip_existing=False,
+    )
+
+    assert [f.name for f in result.uploaded] == ["a.txt"]
+    assert [(e.path, e.error_message) for e in result.errors] == [
+        (str(corpus / "b.txt"), "bad pdf")
+    ]
+
+
+@respx.mock
+def test_upload_files_no_wait(assistants: Assistants, corpus: Path) -> None:
+    server = _FileServer()
+    server.mock()
+
+    result = assistants.upload_files(
+        assistant_name="test-assistant", paths=[corpus / "a.txt"], timeout=-1
+    )
+
+    assert [f.status for f in result.uploaded] == ["Processing"]
+    assert server.list_calls == 1
+
+
+@respx.mock
+def test_upload_files_timeout(assistants: Assistants, corpus: Path) -> None:
+    _FileServer().mock()
+    with pytest.raises(PineconeTimeoutError, match="1 files"):
+        assistants.upload_files(
+            assistant_name="test-assistant", paths=[corpus / "a.txt"], timeout=0
+        )
+
+
+def test_upload_files_validates_paths(assistants: Assistants, tmp_path: Path) -> None:
+    with pytest.raises(PineconeValueError, match="File not found"):
+        assistants.upload_files(assistant_name="test-assistant", paths=[tmp_path / "missing"])
+    with pytest.raises(PineconeValueError, match="max_concurrency"):
+        assistants.upload_files(
+            assistant_name="test-assistant", paths=[tmp_path], max_concurrency=0
+        )
+
+
+@respx.mock
+def test_sync_directory_uploads_changes_and_deletes_missing(
+    assistants: Assistants, corpus: Path
+) -> None:
+    server = _FileServer(
+        [
+            make_assistant_file_response(
+                id="file-a", name="a.txt", metadata={"content_sha256": _sha256(b"alpha")}
+            ),
+            make_assistant_file_response(
+                id="file-stale", name="b.txt", metadata={"content_sha256": _sha256(b"old")}
+            ),
+            make_assistant_file_response(id="file-manual", name="manual.pdf"),
+        ]
+    )
+    server.mock()
+
+    result = assistants.sync_directory(
+        assistant_name="test-assistant", directory=corpus, delete_missing=True
+    )
+
+    # a.txt and its copy are unchanged; b.txt and sub/c.txt are new content.
+    assert sorted(name for name, _ in server.uploads) == ["b.txt", "c.txt"]
+    assert [f.id for f in result.skipped] == ["file-a"]
+    assert server.deleted == ["file-stale"]
+    assert [f.id for f in result.deleted] == ["file-stale"]
+
+
+@respx.mock
+def test_sync_directory_keeps_stale_files_when_an_upload_fails(
+    assistants: Assistants, corpus: Path
+) -> None:
+    server = _FileServer(
+        [
+            make_assistant_file_response(
+                id="file-stale", name="b.txt", metadata={"content_sha256": _sha256(b"old")}
+            ),
+        ],
+        fail="b.txt",
+    )
+    server.mock()
+
+    result = assistants.sync_directory(
+        assistant_name="test-assistant", directory=corpus, delete_missing=True
+    )
+
+    assert [e.path for e in result.errors] == [str(corpus / "b.txt")]
+    assert server.deleted == []
+    assert result.deleted == []
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_async_sync_directory(corpus: Path) -> None:
+    server = _FileServer()
+    server.mock()
+    assistants = AsyncAssistants(config=PineconeConfig(api_key="test-key", host=BASE_URL))
+    assistants._poller = AsyncPoller(initial=0.005, maximum=0.02, jitter=0)
+
+    result = await assistants.sync_directory(
+        assistant_name="test-assistant", directory=corpus, pattern="*.txt", max_concurrency=2
+    )
+
+    assert sorted(name for name, _ in server.uploads) == ["a.txt", "b.txt"]
+    assert [f.name for f in result.uploaded] == ["a.txt", "b.txt"]
+    assert server.list_calls == 3
@@ -3520,10 +3520,10 @@ def test_chat_streaming_uses_config_timeout() -> None:
         captured_timeout.append(timeout)
         mock_resp = MagicMock()
         mock_resp.is_success = True
-        mock_resp.iter_lines.return_value = iter(
+        mock_resp.iter_bytes.return_value = iter(
             [
-                'data: {"type": "message_end", "id": "e1",'
-                ' "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2}}',
+                b'data: {"type": "message_end", "id": "e1",'
+                b' "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2}}\n',
             ]
         )
         yield mock_resp
@@ -3058,13 +3058,13 @@ async def test_async_chat_streaming_uses_config_timeout() -> None:
         mock_resp = MagicMock()
         mock_resp.is_success = True
 
-        async def _aiter_lines():  # type: ignore[misc]
+        async def _aiter_bytes():  # type: ignore[misc]
             yield (
-                'data: {"type": "message_end", "id": "e1",'
-                ' "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2}}'
+                b'data: {"type": "message_end", "id": "e1",'
+                b' "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2}}\n'
             )
 
-        mock_resp.aiter_lines.return_value = _aiter_lines()
+        mock_resp.aiter_bytes.return_value = _aiter_bytes()
         yield mock_resp
 
     # Force-initialize the underlying httpx client, then swap in the mock.
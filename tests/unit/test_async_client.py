@@ -141,6 +141,7 @@ class TestAsyncIndexFactory:
             ssl_verify=False,
             source_tag="my_app",
             connection_pool_maxsize=10,
+            request_listeners=(),
         )
         mock_cls.return_value = MagicMock()
 
@@ -157,6 +158,8 @@ class TestAsyncIndexFactory:
             ssl_verify=False,
             source_tag="my_app",
             connection_pool_maxsize=10,
+            request_listeners=(),
+            metadata_type=None,
         )
 
     @patch("pinecone._internal.http_client.AsyncHTTPClient")
@@ -171,6 +174,7 @@ class TestAsyncIndexFactory:
             ssl_verify=False,
             source_tag="my_app",
             connection_pool_maxsize=10,
+            request_listeners=(),
         )
         pc._host_cache["my-index"] = "cached.host.pinecone.io"
         mock_cls.return_value = MagicMock()
@@ -188,6 +192,8 @@ class TestAsyncIndexFactory:
             ssl_verify=False,
             source_tag="my_app",
             connection_pool_maxsize=10,
+            request_listeners=(),
+            metadata_type=None,
         )
 
     @patch("pinecone.async_client.async_index.AsyncIndex")
@@ -208,6 +214,8 @@ class TestAsyncIndexFactory:
             ssl_verify=True,
             source_tag="",
             connection_pool_maxsize=0,
+            request_listeners=(),
+            metadata_type=None,
         )
 
 
@@ -212,6 +212,7 @@ class TestAsyncUpsertConcurrency:
             items: list[dict[str, Any]],
             namespace: str,
             timeout: float | None,
+            body: bytes | None = None,
         ) -> UpsertResponse:
             nonlocal start_count
             start_count += 1
@@ -242,6 +243,7 @@ class TestAsyncUpsertConcurrency:
             items: list[dict[str, Any]],
             namespace: str,
             timeout: float | None,
+            body: bytes | None = None,
         ) -> UpsertResponse:
             nonlocal in_flight, peak
             in_flight += 1
@@ -290,6 +292,7 @@ class TestAsyncUpsertPartialFailure:
             items: list[dict[str, Any]],
             namespace: str,
             timeout: float | None,
+            body: bytes | None = None,
         ) -> UpsertResponse:
             nonlocal call_count
             call_count += 1
@@ -317,6 +320,7 @@ class TestAsyncUpsertPartialFailure:
             items: list[dict[str, Any]],
             namespace: str,
             timeout: float | None,
+            body: bytes | None = None,
         ) -> UpsertResponse:
             nonlocal call_count
             call_count += 1
@@ -343,6 +347,7 @@ class TestAsyncUpsertPartialFailure:
             items: list[dict[str, Any]],
             namespace: str,
             timeout: float | None,
+            body: bytes | None = None,
         ) -> UpsertResponse:
             nonlocal lsn_idx
             lsn = lsns[lsn_idx]
@@ -199,3 +199,24 @@ class TestAsyncFetchByMetadataPopulatesResponseInfo:
         result = await idx.fetch_by_metadata(filter={"genre": {"$eq": "comedy"}})
         assert result.response_info is not None
         assert result.response_info.request_id == "async-req-fbm"
+
+
+class TestAsyncLazyResponseHeaders:
+    """lazy_response_headers=True keeps the headers until raw_headers is read."""
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_async_upsert_with_lazy_response_headers(self) -> None:
+        respx.post(f"{INDEX_HOST_HTTPS}/vectors/upsert").mock(
+            return_value=httpx.Response(
+                200,
+                json={"upsertedCount": 1},
+                headers=RESPONSE_HEADERS,
+            )
+        )
+        idx = AsyncIndex(host=INDEX_HOST, api_key="test-key", lazy_response_headers=True)
+        result = await idx.upsert(vectors=[("id1", [0.1, 0.2])])
+        assert result.response_info is not None
+        assert result.response_info.request_id == "async-req-1"
+        assert result.response_info.lsn_committed == 42
+        assert result.response_info.raw_headers["x-pinecone-lsn-reconciled"] == "40"
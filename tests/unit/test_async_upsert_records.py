@@ -140,3 +140,25 @@ class TestAsyncUpsertRecords:
                 namespace="test-ns",
                 records=[{"_id": 123, "text": "hello"}],
             )
+
+    @respx.mock
+    @pytest.mark.asyncio
+    async def test_async_upsert_records_batched(self) -> None:
+        route = respx.post(UPSERT_URL).mock(return_value=httpx.Response(201, content=b""))
+        idx = _make_async_index()
+        result = await idx.upsert_records(
+            namespace="test-ns",
+            records=({"_id": f"r{i}", "text": "hello"} for i in range(5)),
+            batch_size=2,
+            show_progress=False,
+        )
+        assert route.call_count == 3
+        assert result.record_count == 5
+        assert result.total_batch_count == 3
+        assert result.has_errors is False
+
+    @pytest.mark.asyncio
+    async def test_async_upsert_records_batched_empty_iterable(self) -> None:
+        idx = _make_async_index()
+        with pytest.raises(ValidationError, match="non-empty"):
+            await idx.upsert_records(namespace="test-ns", records=iter([]), batch_size=2)
@@ -8,8 +8,12 @@ from msgspec import Struct
 from pinecone._internal.batch import (
     _chunk,
     async_batch_execute,
+    async_batch_execute_stream,
     batch_execute,
+    batch_execute_stream,
 )
+from pinecone._internal.config import BatchRetryPolicy
+from pinecone.errors.exceptions import ApiError, PineconeTimeoutError, PineconeValueError
 from pinecone.models.batch import BatchResult
 from pinecone.models.response_info import ResponseInfo
 
@@ -191,6 +195,276 @@ async def test_async_batch_execute_partial_failure() -> None:
     assert result.successful_item_count == 5
 
 
+# ---------------------------------------------------------------------------
+# Streaming executors
+# ---------------------------------------------------------------------------
+
+
+def _stream_batches(n: int, size: int, pulled: list[int]) -> object:
+    for start in range(0, n, size):
+        pulled.append(start)
+        items = [{"id": str(i)} for i in range(start, min(n, start + size))]
+        yield items, start
+
+
+def test_batch_execute_stream_partial_failure_sorted() -> None:
+    """Stream: failures are recorded per batch and sorted by batch index."""
+    pulled: list[int] = []
+
+    def op(items: list[dict], start: int) -> _FakeResp:  # type: ignore[type-arg]
+        if start in (0, 6):
+            raise RuntimeError(f"batch {start} failed")
+        return _FakeResp()
+
+    result = batch_execute_stream(
+        batches=_stream_batches(10, 3, pulled),  # type: ignore[arg-type]
+        operation=op,
+        max_concurrency=2,
+        show_progress=False,
+    )
+
+    assert pulled == [0, 3, 6, 9]
+    assert result.total_item_count == 10
+    assert result.total_batch_count == 4
+    assert result.successful_item_count == 4
+    assert [e.batch_index for e in result.errors] == [0, 2]
+    assert [item["id"] for item in result.failed_items] == ["0", "1", "2", "6", "7", "8"]
+
+
+def test_batch_execute_stream_bounds_in_flight_batches() -> None:
+    """Stream: no more than 2 * max_concurrency batches are pulled ahead."""
+    import threading
+
+    release = threading.Event()
+    pulled: list[int] = []
+
+    def op(items: list[dict], start: int) -> None:  # type: ignore[type-arg]
+        release.wait(5)
+
+    def _producer() -> object:
+        for i in range(10):
+            pulled.append(i)
+            if i == 4:
+                # The fifth batch is only pulled once a slot frees up.
+                assert len(pulled) == 5
+                release.set()
+            yield [{"id": str(i)}], i
+
+    result = batch_execute_stream(
+        batches=_producer(),  # type: ignore[arg-type]
+        operation=op,
+        max_concurrency=2,
+        show_progress=False,
+    )
+    assert result.successful_item_count == 10
+
+
+def test_batch_execute_stream_waits_before_propagating_producer_error() -> None:
+    """Stream: a producer error surfaces after in-flight batches finish."""
+    done: list[int] = []
+
+    def _producer() -> object:
+        yield [{"id": "a"}], 0
+        raise ValueError("bad record")
+
+    def op(items: list[dict], payload: int) -> None:  # type: ignore[type-arg]
+        done.append(payload)
+
+    with pytest.raises(ValueError, match="bad record"):
+        batch_execute_stream(
+            batches=_producer(),  # type: ignore[arg-type]
+            operation=op,
+            show_progress=False,
+        )
+    assert done == [0]
+
+
+@pytest.mark.asyncio
+async def test_async_batch_execute_stream_partial_failure() -> None:
+    """Async stream: failures recorded, successes counted, LSNs aggregated."""
+    pulled: list[int] = []
+
+    async def op(items: list[dict], start: int) -> _FakeResp:  # type: ignore[type-arg]
+        if start == 3:
+            raise RuntimeError("async batch failed")
+        return _FakeResp(
+            response_info=ResponseInfo(raw_headers={"x-pinecone-lsn-committed": str(start)})
+        )
+
+    result = await async_batch_execute_stream(
+        batches=_stream_batches(10, 3, pulled),  # type: ignore[arg-type]
+        operation=op,
+        max_concurrency=2,
+        show_progress=False,
+    )
+
+    assert result.total_batch_count == 4
+    assert result.failed_item_count == 3
+    assert result.successful_item_count == 7
+    assert result.errors[0].batch_index == 1
+    assert result.response_info is not None
+    assert result.response_info.lsn_committed == 9
+
+
+# ---------------------------------------------------------------------------
+# Retry policy
+# ---------------------------------------------------------------------------
+
+_NO_WAIT = BatchRetryPolicy(backoff_factor=0.0)
+
+
+def test_retry_policy_validation_and_classification() -> None:
+    with pytest.raises(PineconeValueError, match="max_attempts"):
+        BatchRetryPolicy(max_attempts=0)
+    with pytest.raises(PineconeValueError, match="backoff_factor"):
+        BatchRetryPolicy(backoff_factor=-1)
+    policy = BatchRetryPolicy()
+    assert policy.classify(ApiError(message="busy", status_code=503)) == "retry"
+    assert policy.classify(PineconeTimeoutError("slow")) == "retry"
+    assert policy.classify(ApiError(message="bad", status_code=400)) == "bisect"
+    assert policy.classify(PineconeValueError("bad")) == "bisect"
+    assert policy.classify(ApiError(message="denied", status_code=401)) is None
+    assert policy.classify(RuntimeError("bug")) is None
+    assert BatchRetryPolicy(bisect=False).classify(PineconeValueError("bad")) is None
+    assert 0.0 < policy.backoff(3) <= 2.0
+    assert policy.backoff(100) <= policy.max_wait
+
+
+def test_batch_execute_retries_transient_failures() -> None:
+    """A batch failing with a retryable status is re-sent until it succeeds."""
+    calls: list[int] = []
+
+    def op(batch: list[dict]) -> None:  # type: ignore[type-arg]
+        calls.append(len(batch))
+        if len(calls) <= 2:
+            raise ApiError(message="unavailable", status_code=503)
+
+    result = batch_execute(
+        items=_make_items(5),
+        operation=op,
+        batch_size=5,
+        max_concurrency=1,
+        show_progress=False,
+        retry_policy=_NO_WAIT,
+    )
+
+    assert calls == [5, 5, 5]
+    assert not result.has_errors
+    assert result.successful_item_count == 5
+
+
+def test_batch_execute_reports_exhausted_attempts() -> None:
+    calls: list[int] = []
+
+    def op(batch: list[dict]) -> None:  # type: ignore[type-arg]
+        calls.append(1)
+        raise ApiError(message="throttled", status_code=429)
+
+    result = batch_execute(
+        items=_make_items(2),
+        operation=op,
+        batch_size=2,
+        show_progress=False,
+        retry_policy=BatchRetryPolicy(max_attempts=3, backoff_factor=0.0),
+    )
+
+    assert len(calls) == 3
+    assert result.failed_batch_count == 1
+    assert result.failed_item_count == 2
+    assert result.errors[0].batch_index == 0
+
+
+def test_batch_execute_does_not_retry_permanent_failures() -> None:
+    calls: list[int] = []
+
+    def op(batch: list[dict]) -> None:  # type: ignore[type-arg]
+        calls.append(1)
+        raise ApiError(message="unauthorized", status_code=401)
+
+    result = batch_execute(
+        items=_make_items(4),
+        operation=op,
+        batch_size=4,
+        show_progress=False,
+        retry_policy=_NO_WAIT,
+    )
+
+    assert len(calls) == 1
+    assert result.failed_item_count == 4
+
+
+def test_batch_execute_stream_bisects_to_poison_item() -> None:
+    """A payload error splits the batch until only the bad item fails."""
+    sent: list[list[str]] = []
+
+    def op(items: list[dict], payload: str) -> None:  # type: ignore[type-arg]
+        ids = [item["id"] for item in items]
+        assert payload == ",".join(ids)
+        sent.append(ids)
+        if "5" in ids:
+            raise ApiError(message="invalid vector", status_code=400)
+
+    batches = [(items, ",".join(i["id"] for i in items)) for items in (_make_items(8),)]
+    batches.append(([{"id": "8"}, {"id": "9"}], "8,9"))
+    result = batch_execute_stream(
+        batches=batches,  # type: ignore[arg-type]
+        operation=op,
+        max_concurrency=1,
+        show_progress=False,
+        retry_policy=_NO_WAIT,
+        rebuild=lambda items: ",".join(i["id"] for i in items),
+    )
+
+    assert result.total_batch_count == 2
+    assert result.successful_item_count == 9
+    assert result.failed_batch_count == 1
+    assert [e.items for e in result.errors] == [[{"id": "5"}]]
+    assert len(sent) == 8
+
+
+def test_batch_execute_stream_without_rebuild_does_not_bisect() -> None:
+    def op(items: list[dict], payload: None) -> None:  # type: ignore[type-arg]
+        raise ApiError(message="invalid vector", status_code=400)
+
+    result = batch_execute_stream(
+        batches=[(_make_items(4), None)],  # type: ignore[arg-type]
+        operation=op,
+        show_progress=False,
+        retry_policy=_NO_WAIT,
+    )
+
+    assert result.failed_item_count == 4
+    assert len(result.errors) == 1
+
+
+@pytest.mark.asyncio
+async def test_async_batch_execute_retries_and_bisects() -> None:
+    attempts: dict[str, int] = {}
+
+    async def op(batch: list[dict]) -> _FakeResp:  # type: ignore[type-arg]
+        key = ",".join(item["id"] for item in batch)
+        attempts[key] = attempts.get(key, 0) + 1
+        if key == "0,1" and attempts[key] == 1:
+            raise PineconeTimeoutError("slow")
+        if "3" in key:
+            raise ApiError(message="too large", status_code=413)
+        return _FakeResp()
+
+    result = await async_batch_execute(
+        items=_make_items(4),
+        operation=op,
+        batch_size=2,
+        show_progress=False,
+        retry_policy=_NO_WAIT,
+    )
+
+    assert attempts["0,1"] == 2
+    assert result.successful_item_count == 3
+    assert [e.items for e in result.errors] == [[{"id": "3"}]]
+    assert result.failed_batch_count == 1
+    assert result.successful_batch_count == 1
+
+
 # ---------------------------------------------------------------------------
 # _chunk helper
 # ---------------------------------------------------------------------------
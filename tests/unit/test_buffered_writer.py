@@ -0,0 +1,278 @@
+"""Unit tests for BufferedWriter and AsyncBufferedWriter."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import msgspec
+import pytest
+import respx
+
+from pinecone import AsyncBufferedWriter, AsyncIndex, BufferedWriter, Index
+from pinecone._internal.write_buffer import WriteBuffer, split_deletes, split_upserts
+from pinecone.errors.exceptions import ApiError, PineconeTypeError, PineconeValueError
+from pinecone.grpc import GrpcIndex
+from pinecone.models.batch import BufferedWriteError
+from pinecone.models.vectors.vector import Vector
+
+INDEX_HOST = "test-index-abc1234.svc.us-east1-gcp.pinecone.io"
+INDEX_HOST_HTTPS = f"https://{INDEX_HOST}"
+
+
+def _upserted(index: MagicMock) -> list[tuple[str, list[str]]]:
+    return [
+        (c.kwargs["namespace"], [v.id for v in c.kwargs["vectors"]])
+        for c in index.upsert.call_args_list
+    ]
+
+
+class TestWriteBuffer:
+    def test_repeated_upserts_coalesce_to_last(self) -> None:
+        buf = WriteBuffer()
+        buf.add_upsert("ns", Vector(id="a", values=[1.0]))
+        buf.add_upsert("ns", Vector(id="a", values=[2.0]))
+        assert len(buf) == 1
+        (pending,) = buf.drain()
+        assert pending.upserts == [Vector(id="a", values=[2.0])]
+        assert len(buf) == 0
+        assert buf.pending_bytes == 0
+
+    def test_delete_cancels_pending_upsert(self) -> None:
+        buf = WriteBuffer()
+        buf.add_upsert("ns", Vector(id="a", values=[1.0]))
+        buf.add_delete("ns", "a")
+        (pending,) = buf.drain()
+        assert pending.upserts == []
+        assert pending.deletes == ["a"]
+
+    def test_upsert_cancels_pending_delete(self) -> None:
+        buf = WriteBuffer()
+        buf.add_delete("ns", "a")
+        buf.add_upsert("ns", Vector(id="a", values=[1.0]))
+        (pending,) = buf.drain()
+        assert pending.deletes == []
+        assert [v.id for v in pending.upserts] == ["a"]
+
+    def test_namespaces_are_independent(self) -> None:
+        buf = WriteBuffer()
+        buf.add_upsert("a", Vector(id="x", values=[1.0]))
+        buf.add_upsert("b", Vector(id="x", values=[1.0]))
+        assert sorted(p.namespace for p in buf.drain()) == ["a", "b"]
+
+    def test_byte_threshold(self) -> None:
+        buf = WriteBuffer()
+        buf.add_upsert("", Vector(id="a", values=[0.5] * 100))
+        assert buf.is_due(batch_size=1000, max_bytes=buf.pending_bytes, flush_interval=60)
+        assert not buf.is_due(batch_size=1000, max_bytes=10_000, flush_interval=60)
+
+    def test_split_upserts_respects_count_and_bytes(self) -> None:
+        vectors = [Vector(id=str(i), values=[1.0]) for i in range(5)]
+        assert [len(c) for c in split_upserts(vectors, [10] * 5, 2, 1000)] == [2, 2, 1]
+        assert [len(c) for c in split_upserts(vectors, [10] * 5, 100, 25)] == [2, 2, 1]
+        assert [len(c) for c in split_upserts(vectors, [50] * 5, 100, 25)] == [1] * 5
+
+    def test_split_deletes_caps_at_api_limit(self) -> None:
+        ids = [str(i) for i in range(2500)]
+        assert [len(c) for c in split_deletes(ids, 5000)] == [1000, 1000, 500]
+
+
+class TestBufferedWriter:
+    def test_invalid_thresholds_rejected(self) -> None:
+        with pytest.raises(PineconeValueError, match="batch_size"):
+            BufferedWriter(MagicMock(), batch_size=0)
+        with pytest.raises(PineconeValueError, match="max_bytes"):
+            BufferedWriter(MagicMock(), max_bytes=10 * 1024 * 1024)
+        with pytest.raises(PineconeValueError, match="flush_interval"):
+            BufferedWriter(MagicMock(), flush_interval=0)
+
+    def test_close_flushes_and_coalesces(self) -> None:
+        index = MagicMock()
+        writer = BufferedWriter(index, flush_interval=60)
+        writer.upsert(vectors=[("a", [1.0]), ("b", [1.0])], namespace="ns")
+        writer.upsert(vectors=[("a", [2.0])], namespace="ns")
+        writer.delete(ids=["b", "c"], namespace="ns")
+        writer.close()
+        assert _upserted(index) == [("ns", ["a"])]
+        assert index.upsert.call_args.kwargs["vectors"][0].values == [2.0]
+        index.delete.assert_called_once_with(ids=["b", "c"], namespace="ns")
+        assert writer.upserted_count == 1
+        assert writer.deleted_count == 2
+
+    def test_size_threshold_triggers_background_flush(self) -> None:
+        index = MagicMock()
+        sent = threading.Event()
+        index.upsert.side_effect = lambda **kw: sent.set()
+        with BufferedWriter(index, batch_size=3, flush_interval=60) as writer:
+            writer.upsert(vectors=[(str(i), [1.0]) for i in range(3)])
+            assert sent.wait(5)
+        assert _upserted(index) == [("", ["0", "1", "2"])]
+
+    def test_interval_triggers_background_flush(self) -> None:
+        index = MagicMock()
+        sent = threading.Event()
+        index.upsert.side_effect = lambda **kw: sent.set()
+        with BufferedWriter(index, flush_interval=0.05) as writer:
+            writer.upsert(vectors=[("a", [1.0])])
+            assert sent.wait(5)
+
+    def test_flush_waits_for_requests(self) -> None:
+        index = MagicMock()
+        index.upsert.side_effect = lambda **kw: time.sleep(0.05)
+        with BufferedWriter(index, flush_interval=60) as writer:
+            writer.upsert(vectors=[("a", [1.0])])
+            assert writer.flush(timeout=5)
+            assert index.upsert.call_count == 1
+            assert writer.pending_count == 0
+            assert writer.flush()
+
+    def test_failures_recorded_and_reported(self) -> None:
+        index = MagicMock()
+        index.upsert.side_effect = ApiError(message="boom", status_code=500)
+        seen: list[BufferedWriteError] = []
+        with BufferedWriter(index, flush_interval=60, on_error=seen.append) as writer:
+            writer.upsert(vectors=[("a", [1.0], {"k": "v"})], namespace="ns")
+        assert writer.upserted_count == 0
+        assert seen == writer.errors
+        (error,) = writer.errors
+        assert error.operation == "upsert"
+        assert error.namespace == "ns"
+        assert error.ids == ["a"]
+        assert error.items == [{"id": "a", "values": [1.0], "metadata": {"k": "v"}}]
+        assert isinstance(error.error, ApiError)
+
+    def test_callback_exception_does_not_stop_worker(self) -> None:
+        index = MagicMock()
+        index.delete.side_effect = RuntimeError("down")
+
+        def _raise(error: BufferedWriteError) -> None:
+            raise ValueError("callback bug")
+
+        with BufferedWriter(index, flush_interval=60, on_error=_raise) as writer:
+            writer.delete(ids=["a"])
+            writer.flush(timeout=5)
+            writer.upsert(vectors=[("b", [1.0])])
+        assert _upserted(index) == [("", ["b"])]
+
+    def test_invalid_vector_raises_in_caller(self) -> None:
+        with BufferedWriter(MagicMock()) as writer, pytest.raises(PineconeValueError):
+            writer.upsert(vectors=[("a", [])])
+
+    def test_invalid_delete_ids_raise_in_caller(self) -> None:
+        index = MagicMock()
+        with BufferedWriter(index, flush_interval=60) as writer:
+            with pytest.raises(PineconeTypeError, match="single string"):
+                writer.delete(ids="vec-1")
+            with pytest.raises(PineconeValueError, match="must not be empty"):
+                writer.delete(ids=["a", ""])
+        index.delete.assert_not_called()
+
+    def test_write_after_close_raises(self) -> None:
+        writer = BufferedWriter(MagicMock())
+        writer.close()
+        writer.close()
+        with pytest.raises(PineconeValueError, match="closed"):
+            writer.delete(ids=["a"])
+
+    def test_max_pending_applies_backpressure(self) -> None:
+        index = MagicMock()
+        with BufferedWriter(index, flush_interval=60, max_pending=2) as writer:
+            for i in range(10):
+                writer.upsert(vectors=[(str(i), [1.0])])
+                assert writer.pending_count <= 2
+        assert writer.upserted_count == 10
+
+
+class TestIndexBufferedWriter:
+    @respx.mock
+    def test_index_writer_sends_one_request(self) -> None:
+        route = respx.post(f"{INDEX_HOST_HTTPS}/vectors/upsert").mock(
+            return_value=httpx.Response(200, json={"upsertedCount": 50})
+        )
+        idx = Index(host=INDEX_HOST, api_key="test-key")
+        with idx.buffered_writer(flush_interval=60) as writer:
+            for i in range(50):
+                writer.upsert(vectors=[(f"v{i}", [0.1, 0.2])], namespace="events")
+        assert route.call_count == 1
+        body = msgspec.json.decode(route.calls[0].request.content)
+        assert body["namespace"] == "events"
+        assert len(body["vectors"]) == 50
+
+    def test_grpc_index_writer(self) -> None:
+        channel = MagicMock()
+        channel.upsert.return_value = {"upserted_count": 2}
+        module = MagicMock()
+        module.GrpcChannel.return_value = channel
+        with patch.dict("sys.modules", {"pinecone._grpc": module}):
+            idx = GrpcIndex(host=INDEX_HOST, api_key="test-key")
+        with idx.buffered_writer() as writer:
+            writer.upsert(vectors=[("a", [0.1]), ("b", [0.2])], namespace="ns")
+        assert channel.upsert.call_count == 1
+        assert writer.upserted_count == 2
+
+
+class TestAsyncBufferedWriter:
+    @pytest.fixture
+    def anyio_backend(self) -> str:
+        # The writer's background task is bound to an asyncio event loop.
+        return "asyncio"
+
+    async def test_close_flushes_and_coalesces(self) -> None:
+        index = MagicMock()
+        index.upsert = AsyncMock()
+        index.delete = AsyncMock()
+        async with AsyncBufferedWriter(index, flush_interval=60) as writer:
+            await writer.upsert(vectors=[("a", [1.0]), ("b", [1.0])], namespace="ns")
+            await writer.delete(ids=["a"], namespace="ns")
+        assert _upserted(index) == [("ns", ["b"])]
+        index.delete.assert_awaited_once_with(ids=["a"], namespace="ns")
+
+    async def test_invalid_delete_ids_raise_in_caller(self) -> None:
+        index = MagicMock()
+        index.delete = AsyncMock()
+        async with AsyncBufferedWriter(index, flush_interval=60) as writer:
+            with pytest.raises(PineconeTypeError, match="single string"):
+                await writer.delete(ids="vec-1")
+            with pytest.raises(PineconeValueError, match="must not be empty"):
+                await writer.delete(ids=["a", ""])
+        index.delete.assert_not_awaited()
+
+    async def test_interval_and_flush(self) -> None:
+        sent = asyncio.Event()
+        index = MagicMock()
+        index.upsert = AsyncMock(side_effect=lambda **kw: sent.set())
+        writer = AsyncBufferedWriter(index, flush_interval=0.05)
+        await writer.upsert(vectors=[("a", [1.0])])
+        await asyncio.wait_for(sent.wait(), 5)
+        assert index.upsert.await_count == 1
+        await writer.upsert(vectors=[("b", [1.0])])
+        await writer.flush()
+        assert index.upsert.await_count == 2
+        await writer.close()
+        with pytest.raises(PineconeValueError, match="closed"):
+            await writer.upsert(vectors=[("c", [1.0])])
+
+    async def test_failures_reported(self) -> None:
+        index = MagicMock()
+        index.upsert = AsyncMock(side_effect=ApiError(message="boom", status_code=429))
+        seen: list[Any] = []
+        async with AsyncBufferedWriter(index, on_error=seen.append) as writer:
+            await writer.upsert(vectors=[("a", [1.0])])
+        assert [e.ids for e in seen] == [["a"]]
+        assert writer.errors == seen
+
+    @respx.mock
+    async def test_async_index_writer(self) -> None:
+        route = respx.post(f"{INDEX_HOST_HTTPS}/vectors/upsert").mock(
+            return_value=httpx.Response(200, json={"upsertedCount": 3})
+        )
+        async with AsyncIndex(host=INDEX_HOST, api_key="test-key") as idx:
+            async with idx.buffered_writer(batch_size=3) as writer:
+                for i in range(3):
+                    await writer.upsert(vectors=[(f"v{i}", [0.1])])
+        assert route.call_count == 1
+        assert writer.upserted_count == 3
@@ -0,0 +1,210 @@
+"""Unit tests for the bulk import staging writer, validator and import waiter."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import httpx
+import orjson
+import pytest
+import respx
+
+from pinecone import AsyncIndex, ImportWriter, Index, validate_import_files
+from pinecone._internal.polling import ProgressBackoff
+from pinecone.errors.exceptions import PineconeTimeoutError, PineconeValueError
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+np = pytest.importorskip("numpy")
+
+INDEX_HOST = "test-index-abc1234.svc.us-east1-gcp.pinecone.io"
+IMPORT_URL = f"https://{INDEX_HOST}/bulk/imports/101"
+
+
+def _import(status: str, percent: float | None = None) -> httpx.Response:
+    body: dict[str, Any] = {
+        "id": "101",
+        "uri": "s3://bucket/imports/",
+        "status": status,
+        "createdAt": "2025-01-01T00:00:00Z",
+    }
+    if percent is not None:
+        body["percentComplete"] = percent
+    return httpx.Response(200, json=body)
+
+
+class TestImportWriter:
+    def test_writes_namespace_directories(self, tmp_path: Path) -> None:
+        with ImportWriter(tmp_path, sparse=True) as writer:
+            writer.write(
+                [
+                    ("a", [0.1, 0.2]),
+                    {
+                        "id": "b",
+                        "values": [0.3, 0.4],
+                        "sparse_values": {"indices": [7], "values": [0.5]},
+                        "metadata": {"genre": "drama"},
+                    },
+                ]
+            )
+            writer.write([("c", [1.0, 2.0])], namespace="ns1")
+
+        assert sorted(Path(f).relative_to(tmp_path).as_posix() for f in writer.files) == [
+            "__default__/part-00000.parquet",
+            "ns1/part-00000.parquet",
+        ]
+        table = pq.read_table(tmp_path / "__default__" / "part-00000.parquet")
+        assert table.schema.field("values").type == pa.list_(pa.float32())
+        rows = table.to_pylist()
+        assert rows[0]["sparse_values"] is None
+        assert rows[1]["sparse_values"] == {"indices": [7], "values": [0.5]}
+        assert orjson.loads(rows[1]["metadata"]) == {"genre": "drama"}
+        assert writer.rows_written == 3
+
+    def test_write_arrays_rolls_files_by_size(self, tmp_path: Path) -> None:
+        matrix = np.arange(40, dtype=np.float64).reshape(10, 4)
+        writer = ImportWriter(tmp_path, target_file_bytes=1, row_group_rows=3)
+        writer.write_arrays([f"id-{i}" for i in range(10)], matrix, namespace="ns")
+        files = writer.close()
+
+        assert len(files) == 4
+        table = pq.read_table(tmp_path / "ns")
+        assert table.column("id").to_pylist() == [f"id-{i}" for i in range(10)]
+        assert table.column("values").to_pylist()[9] == [36.0, 37.0, 38.0, 39.0]
+
+    def test_write_dataframe(self, tmp_path: Path) -> None:
+        pd = pytest.importorskip("pandas")
+        df = pd.DataFrame({"id": ["a", "b"], "values": [[1.0, 2.0], [3.0, 4.0]]})
+        with ImportWriter(tmp_path) as writer:
+            writer.write_dataframe(df)
+        assert validate_import_files(tmp_path).rows == 2
+
+    def test_rejects_mismatched_rows(self, tmp_path: Path) -> None:
+        writer = ImportWriter(tmp_path, dimension=2)
+        with pytest.raises(PineconeValueError, match="dimension 3, expected 2"):
+            writer.write([("a", [1.0, 2.0, 3.0])])
+        with pytest.raises(PineconeValueError, match="sparse=False"):
+            writer.write(
+                [
+                    {
+                        "id": "a",
+                        "values": [1.0, 2.0],
+                        "sparse_values": {"indices": [1], "values": [1]},
+                    }
+                ]
+            )
+        with pytest.raises(PineconeValueError, match="one entry per row"):
+            writer.write_arrays(["a"], np.zeros((2, 2)))
+        with pytest.raises(PineconeValueError, match="dense=True, sparse=True or both"):
+            ImportWriter(tmp_path, dense=False)
+
+
+class TestValidateImportFiles:
+    def test_valid_directory(self, tmp_path: Path) -> None:
+        with ImportWriter(tmp_path) as writer:
+            writer.write_arrays(["a", "b", "c"], np.ones((3, 5)))
+            writer.write_arrays(["a"], np.ones((1, 5)), namespace="other")
+
+        report = validate_import_files(tmp_path, dimension=5)
+
+        assert report.is_valid
+        assert (report.files, report.rows, report.dimension) == (2, 4, 5)
+        assert report.namespaces == {"__default__": 3, "other": 1}
+
+    def test_reports_row_problems(self, tmp_path: Path) -> None:
+        (tmp_path / "ns").mkdir()
+        pq.write_table(
+            pa.table(
+                {
+                    "id": ["a", "", "a", "d"],
+                    "values": [[1.0, 2.0], [1.0, 2.0], [1.0, float("nan")], [1.0]],
+                    "metadata": [None, None, None, "x" * (41 * 1024)],
+                }
+            ),
+            tmp_path / "ns" / "part.parquet",
+        )
+
+        errors = validate_import_files(tmp_path).errors
+
+        assert "ns/part.parquet: empty id at row 1" in errors
+        assert "ns/part.parquet: row 3 has dimension 1, expected 2" in errors
+        assert "ns/part.parquet: 'values' contains NaN or infinite numbers" in errors
+        assert "ns/part.parquet: row 3 has metadata over 40 KB" in errors
+        assert "namespace 'ns': 1 IDs appear more than once, e.g. ['a']" in errors
+
+    def test_reports_layout_and_schema_problems(self, tmp_path: Path) -> None:
+        pq.write_table(pa.table({"id": [1], "extra": [2]}), tmp_path / "top.parquet")
+
+        report = validate_import_files(tmp_path, max_errors=2)
+
+        assert not report.is_valid
+        assert report.errors[0].startswith("top.parquet: files must be directly inside")
+        assert report.errors[1].startswith("top.parquet: unexpected columns ['extra']")
+        assert report.errors[-1] == "... and 2 more"
+
+    def test_empty_directory(self, tmp_path: Path) -> None:
+        report = validate_import_files(tmp_path)
+        assert report.files == 0
+        assert report.errors == [f"no .parquet files found under {str(tmp_path)!r}"]
+
+
+class TestProgressBackoff:
+    def test_grows_without_progress(self) -> None:
+        backoff = ProgressBackoff(1.0, 4.0, factor=2.0)
+        assert [backoff.next_delay(None, now=t) for t in range(4)] == [1.0, 2.0, 4.0, 4.0]
+
+    def test_tracks_estimated_completion(self) -> None:
+        backoff = ProgressBackoff(1.0, 60.0)
+        backoff.next_delay(10.0, now=0.0)
+        # 10% per 10s leaves 80s for the remaining 80%; poll after a quarter of that.
+        assert backoff.next_delay(20.0, now=10.0) == 20.0
+        assert backoff.next_delay(98.0, now=20.0) == 1.0
+
+    def test_invalid_arguments(self) -> None:
+        with pytest.raises(PineconeValueError, match="must be at least initial"):
+            ProgressBackoff(2.0, 1.0)
+
+
+class TestWaitForImport:
+    @respx.mock
+    def test_polls_until_terminal(self) -> None:
+        respx.get(IMPORT_URL).mock(
+            side_effect=[_import("Pending"), _import("InProgress", 40.0), _import("Completed")]
+        )
+        seen: list[str] = []
+        idx = Index(host=INDEX_HOST, api_key="test-key")
+
+        result = idx.wait_for_import(101, on_progress=lambda m: seen.append(m.status))
+
+        assert result.status == "Completed"
+        assert seen == ["Pending", "InProgress", "Completed"]
+
+    @respx.mock
+    def test_failed_import_is_returned(self) -> None:
+        respx.get(IMPORT_URL).mock(return_value=_import("Failed"))
+        idx = Index(host=INDEX_HOST, api_key="test-key")
+        assert idx.wait_for_import("101").status == "Failed"
+
+    @respx.mock
+    def test_timeout(self) -> None:
+        respx.get(IMPORT_URL).mock(return_value=_import("InProgress", 5.0))
+        idx = Index(host=INDEX_HOST, api_key="test-key")
+        with pytest.raises(PineconeTimeoutError, match="still InProgress after 0s"):
+            idx.wait_for_import("101", timeout=0)
+
+
+class TestAsyncWaitForImport:
+    @pytest.fixture
+    def anyio_backend(self) -> str:
+        return "asyncio"
+
+    @respx.mock
+    async def test_polls_until_terminal(self) -> None:
+        route = respx.get(IMPORT_URL).mock(
+            side_effect=[_import("InProgress", 10.0), _import("Cancelled")]
+        )
+        async with AsyncIndex(host=INDEX_HOST, api_key="test-key") as idx:
+            result = await idx.wait_for_import("101")
+        assert result.status == "Cancelled"
+        assert route.call_count == 2
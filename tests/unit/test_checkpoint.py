@@ -0,0 +1,231 @@
+"""Unit tests for resumable, checkpointed batched upserts."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+
+import httpx
+import orjson
+import pytest
+import respx
+
+from pinecone import AsyncIndex, Index
+from pinecone._internal.batch import async_batch_execute_stream, batch_execute_stream
+from pinecone._internal.checkpoint import BatchCheckpoint, open_upsert_checkpoint
+from pinecone.errors.exceptions import PineconeValueError
+from pinecone.models.vectors.vector import Vector
+
+INDEX_HOST = "test-index-abc1234.svc.us-east1-gcp.pinecone.io"
+UPSERT_URL = f"https://{INDEX_HOST}/vectors/upsert"
+
+_JOB = {"operation": "upsert", "batch_size": 2}
+
+
+def _vectors(n: int) -> list[Vector]:
+    return [Vector(id=f"v{i}", values=[float(i)]) for i in range(n)]
+
+
+def _batches(n: int, size: int) -> list[tuple[list[dict[str, Any]], None]]:
+    return [
+        ([{"id": f"v{j}"} for j in range(i, min(n, i + size))], None) for i in range(0, n, size)
+    ]
+
+
+def _lines(path: Path) -> list[dict[str, Any]]:
+    return [orjson.loads(line) for line in path.read_bytes().splitlines()]
+
+
+class _Server:
+    """Upsert route that rejects any batch containing one of *poison* IDs."""
+
+    def __init__(self, poison: set[str]) -> None:
+        self.poison = poison
+        self.sent: list[list[str]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        ids = [v["id"] for v in orjson.loads(request.content)["vectors"]]
+        self.sent.append(ids)
+        if self.poison & set(ids):
+            return httpx.Response(401, json={"error": {"message": "denied"}})
+        return httpx.Response(
+            200,
+            json={"upsertedCount": len(ids)},
+            headers={"x-pinecone-lsn-committed": str(len(self.sent))},
+        )
+
+
+class TestIndexUpsertCheckpoint:
+    @respx.mock
+    def test_rerun_skips_acknowledged_batches(self, tmp_path: Path) -> None:
+        path = tmp_path / "load.ckpt"
+        server = _Server(poison={"v2"})
+        respx.post(UPSERT_URL).mock(side_effect=server)
+        idx = Index(host=INDEX_HOST, api_key="test-key")
+
+        first = idx.upsert(
+            vectors=_vectors(6),
+            batch_size=2,
+            max_concurrency=1,
+            show_progress=False,
+            checkpoint=path,
+        )
+        assert first.upserted_count == 4
+        assert [e.batch_index for e in first.errors] == [1]
+        assert len(_lines(path)) == 3
+
+        server.poison = set()
+        server.sent.clear()
+        second = idx.upsert(
+            vectors=_vectors(6),
+            batch_size=2,
+            max_concurrency=1,
+            show_progress=False,
+            checkpoint=path,
+        )
+        assert server.sent == [["v2", "v3"]]
+        assert second.upserted_count == 6
+        assert second.total_batch_count == 3
+        assert not second.has_errors
+        assert second.response_info is not None
+        assert second.response_info.lsn_committed == 3
+
+        server.sent.clear()
+        third = idx.upsert(vectors=_vectors(6), batch_size=2, show_progress=False, checkpoint=path)
+        assert server.sent == []
+        assert third.upserted_count == 6
+
+    @respx.mock
+    def test_changed_source_is_rejected(self, tmp_path: Path) -> None:
+        path = tmp_path / "load.ckpt"
+        respx.post(UPSERT_URL).mock(side_effect=_Server(poison=set()))
+        idx = Index(host=INDEX_HOST, api_key="test-key")
+        idx.upsert(vectors=_vectors(4), batch_size=2, show_progress=False, checkpoint=path)
+
+        reordered = list(reversed(_vectors(4)))
+        with pytest.raises(PineconeValueError, match="source changed"):
+            idx.upsert(vectors=reordered, batch_size=2, show_progress=False, checkpoint=path)
+        with pytest.raises(PineconeValueError, match="different job"):
+            idx.upsert(
+                vectors=_vectors(4),
+                namespace="other",
+                batch_size=2,
+                show_progress=False,
+                checkpoint=path,
+            )
+
+    def test_requires_fixed_batch_size(self, tmp_path: Path) -> None:
+        idx = Index(host=INDEX_HOST, api_key="test-key")
+        with pytest.raises(PineconeValueError, match="batch_size to be set"):
+            idx.upsert(vectors=_vectors(1), checkpoint=tmp_path / "a.ckpt")
+        with pytest.raises(PineconeValueError, match="'auto'"):
+            idx.upsert(vectors=_vectors(1), batch_size="auto", checkpoint=tmp_path / "a.ckpt")
+        assert not (tmp_path / "a.ckpt").exists()
+
+
+class TestBatchCheckpoint:
+    def test_acknowledgements_are_synced_in_groups(self, tmp_path: Path) -> None:
+        path = tmp_path / "job.ckpt"
+        checkpoint = BatchCheckpoint(path, job=_JOB, sync_every=2, sync_interval=3600)
+        checkpoint.record(0, 0, [{"id": "a"}], None)
+        assert len(_lines(path)) == 1
+        checkpoint.record(1, 1, [{"id": "b"}], None)
+        assert len(_lines(path)) == 3
+        checkpoint.record(2, 2, [{"id": "c"}], None)
+        checkpoint.close()
+        checkpoint.close()
+        assert [line.get("batch") for line in _lines(path)] == [None, 0, 1, 2]
+
+    def test_torn_last_line_is_discarded(self, tmp_path: Path) -> None:
+        path = tmp_path / "job.ckpt"
+        with BatchCheckpoint(path, job=_JOB) as checkpoint:
+            checkpoint.record(0, 0, [{"id": "v0"}, {"id": "v1"}], None)
+        with path.open("ab") as f:
+            f.write(b'{"batch":1,"sta')
+
+        with BatchCheckpoint(path, job=_JOB) as checkpoint:
+            assert checkpoint.completed_batches == 1
+            checkpoint.record(1, 2, [{"id": "v2"}, {"id": "v3"}], None)
+        assert [line.get("batch") for line in _lines(path)] == [None, 0, 1]
+
+    def test_corrupt_line_raises(self, tmp_path: Path) -> None:
+        path = tmp_path / "job.ckpt"
+        BatchCheckpoint(path, job=_JOB).close()
+        with path.open("ab") as f:
+            f.write(b"not json\n")
+        with pytest.raises(PineconeValueError, match="corrupt at line 2"):
+            BatchCheckpoint(path, job=_JOB)
+
+    def test_stream_executor_remaps_batch_indexes(self, tmp_path: Path) -> None:
+        path = tmp_path / "job.ckpt"
+        with BatchCheckpoint(path, job=_JOB) as checkpoint:
+            checkpoint.record(0, 0, [{"id": "v0"}, {"id": "v1"}], None)
+            checkpoint.record(2, 4, [{"id": "v4"}], None)
+
+        def op(items: list[dict[str, Any]], payload: None) -> None:
+            raise RuntimeError("boom")
+
+        with BatchCheckpoint(path, job=_JOB) as checkpoint:
+            result = batch_execute_stream(
+                batches=_batches(5, 2),
+                operation=op,
+                show_progress=False,
+                checkpoint=checkpoint,
+            )
+        assert result.total_item_count == 5
+        assert result.successful_item_count == 3
+        assert result.successful_batch_count == 2
+        assert [e.batch_index for e in result.errors] == [1]
+
+    def test_upsert_checkpoint_job_description(self, tmp_path: Path) -> None:
+        with open_upsert_checkpoint(
+            tmp_path / "job.ckpt", transport="grpc", namespace="ns", batch_size=10
+        ):
+            pass
+        header = _lines(tmp_path / "job.ckpt")[0]
+        assert header["job"]["transport"] == "grpc"
+        assert header["job"]["namespace"] == "ns"
+        assert header["job"]["batch_size"] == 10
+
+
+class TestAsyncCheckpoint:
+    @pytest.fixture
+    def anyio_backend(self) -> str:
+        return "asyncio"
+
+    async def test_async_stream_executor_skips_and_records(self, tmp_path: Path) -> None:
+        path = tmp_path / "job.ckpt"
+        with BatchCheckpoint(path, job=_JOB) as checkpoint:
+            checkpoint.record(1, 2, [{"id": "v2"}, {"id": "v3"}], None)
+        sent: list[str] = []
+
+        async def op(items: list[dict[str, Any]], payload: None) -> None:
+            sent.append(items[0]["id"])
+
+        with BatchCheckpoint(path, job=_JOB) as checkpoint:
+            result = await async_batch_execute_stream(
+                batches=_batches(6, 2),
+                operation=op,
+                show_progress=False,
+                checkpoint=checkpoint,
+            )
+        assert sorted(sent) == ["v0", "v4"]
+        assert result.successful_item_count == 6
+        assert result.total_batch_count == 3
+        with BatchCheckpoint(path, job=_JOB) as checkpoint:
+            assert checkpoint.completed_batches == 3
+
+    @respx.mock
+    async def test_async_index_upsert_checkpoint(self, tmp_path: Path) -> None:
+        server = _Server(poison=set())
+        respx.post(UPSERT_URL).mock(side_effect=server)
+        path = tmp_path / "load.ckpt"
+        async with AsyncIndex(host=INDEX_HOST, api_key="test-key") as idx:
+            await idx.upsert(
+                vectors=_vectors(4), batch_size=2, show_progress=False, checkpoint=path
+            )
+            response = await idx.upsert(
+                vectors=_vectors(4), batch_size=2, show_progress=False, checkpoint=path
+            )
+        assert len(server.sent) == 2
+        assert response.upserted_count == 4
@@ -232,6 +232,8 @@ class TestIndexFactory:
             ssl_verify=True,
             source_tag="",
             connection_pool_maxsize=0,
+            request_listeners=(),
+            metadata_type=None,
         )
 
     @patch("pinecone.index.Index")
@@ -255,6 +257,8 @@ class TestIndexFactory:
             ssl_verify=True,
             source_tag="",
             connection_pool_maxsize=0,
+            request_listeners=(),
+            metadata_type=None,
         )
 
     @patch("pinecone.index.Index")
@@ -286,6 +290,8 @@ class TestIndexFactory:
             ssl_verify=True,
             source_tag="",
             connection_pool_maxsize=0,
+            request_listeners=(),
+            metadata_type=None,
         )
 
     def test_no_name_or_host_raises_validation_error(self) -> None:
@@ -312,6 +318,8 @@ class TestIndexFactory:
             ssl_verify=True,
             source_tag="",
             connection_pool_maxsize=0,
+            request_listeners=(),
+            metadata_type=None,
         )
 
     @patch("pinecone.index.Index")
@@ -334,6 +342,8 @@ class TestIndexFactory:
             ssl_verify=True,
             source_tag="",
             connection_pool_maxsize=0,
+            request_listeners=(),
+            metadata_type=None,
         )
 
     @patch("pinecone._internal.http_client.HTTPClient")
@@ -349,6 +359,7 @@ class TestIndexFactory:
             ssl_verify=False,
             source_tag="my_app",
             connection_pool_maxsize=10,
+            request_listeners=(),
         )
         mock_index_cls.return_value = MagicMock()
 
@@ -365,6 +376,8 @@ class TestIndexFactory:
             ssl_verify=False,
             source_tag="my_app",
             connection_pool_maxsize=10,
+            request_listeners=(),
+            metadata_type=None,
         )
 
     @patch("pinecone._internal.http_client.HTTPClient")
@@ -379,6 +392,7 @@ class TestIndexFactory:
             ssl_verify=False,
             source_tag="my_app",
             connection_pool_maxsize=10,
+            request_listeners=(),
         )
         pc._host_cache["my-index"] = "cached.host.pinecone.io"
         mock_index_cls.return_value = MagicMock()
@@ -396,6 +410,8 @@ class TestIndexFactory:
             ssl_verify=False,
             source_tag="my_app",
             connection_pool_maxsize=10,
+            request_listeners=(),
+            metadata_type=None,
         )
 
 
@@ -415,6 +431,8 @@ class TestIndexFactoryGrpc:
             host="foo.svc.pinecone.io",
             api_key="test-key",
             source_tag=None,
+            request_listeners=(),
+            metadata_type=None,
         )
 
     @patch("pinecone.grpc.GrpcIndex")
@@ -428,6 +446,8 @@ class TestIndexFactoryGrpc:
             host="foo.svc.pinecone.io",
             api_key="test-key",
             source_tag="my_app",
+            request_listeners=(),
+            metadata_type=None,
         )
 
     @patch("pinecone.grpc.GrpcIndex")
@@ -442,6 +462,8 @@ class TestIndexFactoryGrpc:
             host="cached.host.pinecone.io",
             api_key="test-key",
             source_tag=None,
+            request_listeners=(),
+            metadata_type=None,
         )
 
     @patch("pinecone.grpc.GrpcIndex")
@@ -463,6 +485,8 @@ class TestIndexFactoryGrpc:
             host="resolved.host.pinecone.io",
             api_key="test-key",
             source_tag=None,
+            request_listeners=(),
+            metadata_type=None,
         )
 
     @patch("pinecone.index.Index")
@@ -490,6 +514,18 @@ class TestClientLifecycle:
         assert pc._inference is None
         pc.close()
 
+    def test_control_plane_client_created_on_first_use(self) -> None:
+        """The control-plane HTTP client is only built when a request needs it."""
+        pc = Pinecone(api_key="test-key")
+        assert pc._http_client is None
+        pc.close()
+        assert pc._http_client is None
+
+        http = pc._http
+        assert pc._http is http
+        pc.close()
+        assert http._client.is_closed
+
     def test_close_closes_inference_http_client(self) -> None:
         """close() closes the Inference namespace's HTTP client."""
         pc = Pinecone(api_key="test-key")
@@ -0,0 +1,205 @@
+"""Unit tests for ClientMetrics latency histograms, counters and OpenMetrics export."""
+
+from __future__ import annotations
+
+import itertools
+import math
+import random
+from typing import Any
+
+import httpx
+import pytest
+import respx
+
+from pinecone import ClientMetrics, Index, RequestAttempt, RequestEvent
+from pinecone._internal.metrics import _Histogram
+from pinecone.errors.exceptions import PineconeTimeoutError
+
+INDEX_HOST = "test-index-abc1234.svc.us-east1-gcp.pinecone.io"
+QUERY_URL = f"https://{INDEX_HOST}/query"
+QUERY_BODY = {"matches": [], "namespace": "", "usage": {"readUnits": 5}}
+
+
+def _event(**overrides: Any) -> RequestEvent:
+    fields: dict[str, Any] = {
+        "transport": "rest",
+        "operation": "query",
+        "method": "POST",
+        "path": "/query",
+        "host": INDEX_HOST,
+        "status_code": 200,
+        "request_id": None,
+        "request_bytes": 10,
+        "response_bytes": 20,
+        "started_at": 0.0,
+        "total": 0.01,
+        "serialize": None,
+        "pool_wait": None,
+        "connect": None,
+        "tls": None,
+        "ttfb": None,
+        "body_read": None,
+        "decode": None,
+        "attempts": (RequestAttempt(number=1, duration=0.01, status_code=200),),
+    }
+    fields.update(overrides)
+    return RequestEvent(**fields)
+
+
+def test_histogram_percentiles_are_within_precision() -> None:
+    rng = random.Random(0)  # noqa: S311
+    values = sorted(rng.lognormvariate(-4, 1.5) for _ in range(10_000))
+    histogram = _Histogram(significant_figures=2)
+    for value in values:
+        histogram.record(value)
+
+    snapshot = histogram.snapshot()
+    assert snapshot.count == len(values)
+    assert snapshot.sum == pytest.approx(sum(values))
+    assert (snapshot.min, snapshot.max) == (values[0], values[-1])
+    for q in (50, 90, 99, 99.9):
+        exact = values[max(1, math.ceil(q / 100 * len(values))) - 1]
+        assert snapshot.percentile(q) == pytest.approx(exact, rel=0.01, abs=1e-6)
+    assert snapshot.percentile(100) == values[-1]
+
+
+def test_histogram_buckets_cover_values_without_gaps() -> None:
+    histogram = _Histogram(significant_figures=1)
+    for micros in range(0, 5_000):
+        histogram.record(micros / 1_000_000)
+
+    buckets = histogram.snapshot().buckets
+    assert sum(count for _, _, count in buckets) == 5_000
+    for (_, upper, _), (lower, _, _) in itertools.pairwise(buckets):
+        assert upper == pytest.approx(lower)
+    assert all((upper - lower) <= max(lower / 16, 1e-6) + 1e-12 for lower, upper, _ in buckets)
+
+
+def test_empty_histogram_snapshot() -> None:
+    snapshot = _Histogram(significant_figures=2).snapshot()
+    assert (snapshot.count, snapshot.min, snapshot.max, snapshot.mean) == (0, 0.0, 0.0, 0.0)
+    assert snapshot.percentile(99) == 0.0
+    with pytest.raises(ValueError):
+        snapshot.percentile(101)
+
+
+def test_significant_figures_is_validated() -> None:
+    with pytest.raises(ValueError, match="significant_figures"):
+        ClientMetrics(significant_figures=5)
+
+
+def test_counters_from_events() -> None:
+    metrics = ClientMetrics()
+    metrics(
+        _event(
+            total=0.5,
+            attempts=(
+                RequestAttempt(number=1, duration=0.1, status_code=429, backoff=0.2),
+                RequestAttempt(number=2, duration=0.1, error=httpx.ReadTimeout("t"), backoff=0.1),
+                RequestAttempt(number=3, duration=0.1, status_code=200),
+            ),
+            read_units=5,
+        )
+    )
+    metrics(_event(operation="upsert", write_units=3))
+    metrics(_event(operation=None, error=PineconeTimeoutError("slow")))
+    metrics(_event(transport="grpc", error=RuntimeError("boom")))
+
+    snapshot = metrics.snapshot()
+    assert [(m.transport, m.operation) for m in snapshot.operations] == [
+        ("grpc", "query"),
+        ("rest", "other"),
+        ("rest", "query"),
+        ("rest", "upsert"),
+    ]
+    query = snapshot.operation("query")
+    assert query is not None
+    assert (query.requests, query.retries, query.throttled, query.timeouts) == (1, 2, 1, 1)
+    assert (query.read_units, query.write_units, query.errors) == (5, 0, 0)
+    assert query.latency.max == 0.5
+    upsert = snapshot.operation("upsert")
+    assert upsert is not None and upsert.write_units == 3
+    other = snapshot.operation("other")
+    assert other is not None and (other.errors, other.timeouts) == (1, 1)
+    grpc_query = snapshot.operation("query", transport="grpc")
+    assert grpc_query is not None and (grpc_query.errors, grpc_query.timeouts) == (1, 0)
+    assert snapshot.operation("fetch") is None
+
+
+def test_pool_gauges_from_events() -> None:
+    metrics = ClientMetrics()
+    metrics(_event(pool_in_use=3, pool_size=4, pool_wait=0.002))
+    metrics(_event(pool_in_use=1, pool_size=4, pool_wait=0.0))
+    metrics(_event(transport="grpc"))
+
+    (pool,) = metrics.snapshot().pools
+    assert (pool.host, pool.size, pool.in_use, pool.peak_in_use) == (INDEX_HOST, 4, 1, 3)
+    assert pool.wait.count == 2
+    assert pool.wait.max == 0.002
+
+
+def test_reset_discards_recorded_metrics() -> None:
+    metrics = ClientMetrics()
+    metrics(_event(pool_in_use=1, pool_size=4))
+    metrics.reset()
+    snapshot = metrics.snapshot()
+    assert (snapshot.operations, snapshot.pools) == ((), ())
+
+
+@respx.mock
+def test_metrics_include_internal_retries() -> None:
+    respx.post(QUERY_URL).mock(
+        side_effect=[
+            httpx.Response(429, headers={"retry-after": "0"}),
+            httpx.Response(200, json=QUERY_BODY),
+            httpx.Response(200, json=QUERY_BODY),
+        ]
+    )
+    metrics = ClientMetrics()
+    index = Index(host=INDEX_HOST, api_key="test-key", request_listeners=[metrics])
+
+    index.query(top_k=1, vector=[0.1])
+    index.query(top_k=1, vector=[0.1])
+
+    snapshot = metrics.snapshot()
+    query = snapshot.operation("query")
+    assert query is not None
+    assert (query.requests, query.retries, query.throttled, query.read_units) == (2, 1, 1, 10)
+    assert query.latency.count == 2
+    (pool,) = snapshot.pools
+    assert pool.host == INDEX_HOST
+    assert pool.peak_in_use == 1
+
+
+def test_openmetrics_exposition() -> None:
+    metrics = ClientMetrics()
+    metrics(_event(total=0.003, read_units=5, pool_in_use=2, pool_size=4, pool_wait=0.0005))
+    metrics(_event(total=0.2, read_units=5))
+    metrics(_event(operation='na"me', total=0.0001))
+
+    text = metrics.to_openmetrics(buckets=(0.01, 0.001))
+
+    assert text.endswith("# EOF\n")
+    lines = text.splitlines()
+    labels = 'transport="rest",operation="query"'
+    assert "# TYPE pinecone_request_duration_seconds histogram" in lines
+    assert "# UNIT pinecone_request_duration_seconds seconds" in lines
+    assert f'pinecone_request_duration_seconds_bucket{{{labels},le="0.001"}} 0' in lines
+    assert f'pinecone_request_duration_seconds_bucket{{{labels},le="0.01"}} 1' in lines
+    assert f'pinecone_request_duration_seconds_bucket{{{labels},le="+Inf"}} 2' in lines
+    assert f"pinecone_request_duration_seconds_count{{{labels}}} 2" in lines
+    assert "# TYPE pinecone_requests counter" in lines
+    assert f"pinecone_requests_total{{{labels}}} 2" in lines
+    assert f"pinecone_read_units_total{{{labels}}} 10" in lines
+    assert 'pinecone_requests_total{transport="rest",operation="na\\"me"} 1' in lines
+    pool_labels = f'host="{INDEX_HOST}"'
+    assert f"pinecone_pool_connections{{{pool_labels}}} 4" in lines
+    assert f"pinecone_pool_connections_in_use{{{pool_labels}}} 2" in lines
+    assert f'pinecone_pool_wait_seconds_bucket{{{pool_labels},le="0.001"}} 1' in lines
+    assert ClientMetrics.content_type.startswith("application/openmetrics-text")
+
+
+def test_openmetrics_exposition_when_empty() -> None:
+    text = ClientMetrics().to_openmetrics()
+    assert text.endswith("# EOF\n")
+    assert all(line.startswith("#") for line in text.splitlines())
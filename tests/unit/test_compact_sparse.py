@@ -0,0 +1,149 @@
+"""Tests for array-backed sparse values on the REST and gRPC paths."""
+
+from __future__ import annotations
+
+import json
+from array import array
+from unittest.mock import MagicMock, patch
+
+import httpx
+import orjson
+import pytest
+import respx
+
+from pinecone import Index
+from pinecone._internal.http_client import _encode_json
+from pinecone.errors.exceptions import PineconeValueError
+from pinecone.grpc import GrpcIndex, _sparse_from_grpc, _vector_to_grpc_dict
+from pinecone.models.vectors.sparse import SparseValues
+from pinecone.models.vectors.vector import Vector
+
+INDEX_HOST = "test-index-abc1234.svc.us-east1-gcp.pinecone.io"
+INDEX_HOST_HTTPS = f"https://{INDEX_HOST}"
+
+
+class TestEncodeJson:
+    def test_array_serialized_as_json_list(self) -> None:
+        body = {"indices": array("I", [1, 5]), "values": array("f", [0.5, 0.25])}
+        assert orjson.loads(_encode_json(body)) == {"indices": [1, 5], "values": [0.5, 0.25]}
+
+    def test_numpy_serialized_natively(self) -> None:
+        np = pytest.importorskip("numpy")
+        body = {"values": np.array([0.5, 0.25], dtype=np.float32)}
+        assert orjson.loads(_encode_json(body)) == {"values": [0.5, 0.25]}
+
+    def test_non_contiguous_numpy_falls_back(self) -> None:
+        np = pytest.importorskip("numpy")
+        body = {"values": np.arange(6.0).reshape(2, 3)[:, 0]}
+        assert orjson.loads(_encode_json(body)) == {"values": [0.0, 3.0]}
+
+    def test_unsupported_type_still_raises(self) -> None:
+        with pytest.raises(TypeError):
+            _encode_json({"x": object()})
+
+
+class TestGrpcPacking:
+    def test_list_sparse_passed_through(self) -> None:
+        v = Vector("a", [0.1], SparseValues([1], [0.5]))
+        assert _vector_to_grpc_dict(v)["sparse_values"] == {"indices": [1], "values": [0.5]}
+
+    def test_array_sparse_packed_to_bytes(self) -> None:
+        indices = array("I", [1, 9])
+        values = array("d", [0.5, 0.25])
+        v = Vector("a", [0.1], SparseValues(indices, values))  # type: ignore[arg-type]
+        packed = _vector_to_grpc_dict(v)["sparse_values"]
+        assert packed["indices"] == indices.tobytes()
+        assert packed["values"] == array("f", [0.5, 0.25]).tobytes()
+
+    def test_numpy_sparse_packed_to_bytes(self) -> None:
+        np = pytest.importorskip("numpy")
+        v = Vector(
+            "a",
+            [0.1],
+            SparseValues(np.array([1, 9], dtype=np.int64), np.array([0.5, 0.25])),
+        )
+        packed = _vector_to_grpc_dict(v)["sparse_values"]
+        assert packed["indices"] == array("I", [1, 9]).tobytes()
+        assert packed["values"] == array("f", [0.5, 0.25]).tobytes()
+
+    def test_out_of_range_indices_rejected_before_packing(self) -> None:
+        np = pytest.importorskip("numpy")
+        for indices in (np.array([-1, 2**33]), array("q", [-1, 2])):
+            v = Vector("a", [0.1], SparseValues(indices, [0.5, 0.25]))  # type: ignore[arg-type]
+            with pytest.raises(PineconeValueError, match="sparse_values indices"):
+                _vector_to_grpc_dict(v)
+
+    def test_packed_bytes_unpacked_into_arrays(self) -> None:
+        sv = _sparse_from_grpc(
+            {"indices": array("I", [4, 2]).tobytes(), "values": array("f", [1.5]).tobytes()}
+        )
+        assert sv.indices == array("I", [4, 2])
+        assert sv.values == array("f", [1.5])
+
+    def test_compact_sparse_forwarded_to_channel(self) -> None:
+        module = MagicMock()
+        with patch.dict("sys.modules", {"pinecone._grpc": module}):
+            GrpcIndex(host=INDEX_HOST, api_key="test-key", compact_sparse=True)
+        assert module.GrpcChannel.call_args.kwargs["compact_sparse"] is True
+
+
+class TestIndexCompactSparse:
+    @respx.mock
+    def test_upsert_sends_array_sparse_values(self) -> None:
+        route = respx.post(f"{INDEX_HOST_HTTPS}/vectors/upsert").mock(
+            return_value=httpx.Response(200, json={"upsertedCount": 1})
+        )
+        idx = Index(host=INDEX_HOST, api_key="test-key")
+        idx.upsert(
+            vectors=[
+                {
+                    "id": "a",
+                    "sparse_values": {
+                        "indices": array("I", [3]),
+                        "values": array("f", [0.5]),
+                    },
+                }
+            ]
+        )
+        body = json.loads(route.calls.last.request.content)
+        assert body["vectors"][0]["sparseValues"] == {"indices": [3], "values": [0.5]}
+
+    @respx.mock
+    def test_query_returns_array_sparse_values(self) -> None:
+        respx.post(f"{INDEX_HOST_HTTPS}/query").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "matches": [
+                        {
+                            "id": "a",
+                            "score": 0.5,
+                            "sparseValues": {"indices": [1, 2], "values": [0.5, 0.25]},
+                        }
+                    ]
+                },
+            )
+        )
+        idx = Index(host=INDEX_HOST, api_key="test-key", compact_sparse=True)
+        result = idx.query(top_k=1, vector=[0.1])
+        sv = result.matches[0].sparse_values
+        assert sv is not None
+        assert sv.indices == array("I", [1, 2])
+        assert sv.values == array("f", [0.5, 0.25])
+
+    @respx.mock
+    def test_query_lists_by_default(self) -> None:
+        respx.post(f"{INDEX_HOST_HTTPS}/query").mock(
+            return_value=httpx.Response(
+                200,
+                json={
+                    "matches": [
+                        {"id": "a", "score": 0.5, "sparseValues": {"indices": [1], "values": [0.5]}}
+                    ]
+                },
+            )
+        )
+        result = Index(host=INDEX_HOST, api_key="test-key").query(top_k=1, vector=[0.1])
+        sv = result.matches[0].sparse_values
+        assert sv is not None
+        assert sv.indices == [1]
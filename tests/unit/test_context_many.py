@@ -0,0 +1,157 @@
+"""Unit tests for Assistants.context_many and AsyncAssistants.context_many."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import httpx
+import orjson
+import pytest
+import respx
+
+from pinecone._internal.config import PineconeConfig
+from pinecone.async_client.assistants import AsyncAssistants
+from pinecone.client.assistants import Assistants
+from pinecone.errors.exceptions import ApiError, PineconeValueError
+from pinecone.models.assistant.context import MultiContextResponse
+from tests.factories import (
+    make_assistant_file_response,
+    make_assistant_response,
+    make_context_response,
+)
+
+BASE_URL = "https://api.test.pinecone.io"
+
+# assistant -> query -> [(content, score)]
+SNIPPETS: dict[str, dict[str, list[tuple[str, float]]]] = {
+    "docs": {
+        "rotate keys": [("Keys rotate in the console.", 0.9), ("Keys expire.", 0.4)],
+        "key rotation": [("Keys rotate in the console.", 0.7), ("Use two keys.", 0.6)],
+    },
+    "support": {
+        "rotate keys": [("Open a ticket to rotate keys.", 0.8), ("Keys expire.", 0.5)],
+        "key rotation": [],
+    },
+}
+
+
+def _snippet(content: str, score: float) -> dict[str, Any]:
+    return {
+        "type": "text",
+        "content": content,
+        "score": score,
+        "reference": {"file": make_assistant_file_response()},
+    }
+
+
+def _mock_assistants() -> list[dict[str, Any]]:
+    bodies: list[dict[str, Any]] = []
+    for name, by_query in SNIPPETS.items():
+        host = f"{name}-abc123.svc.pinecone.io"
+        respx.get(f"{BASE_URL}/assistant/assistants/{name}").mock(
+            return_value=httpx.Response(200, json=make_assistant_response(name=name, host=host))
+        )
+
+        def _context(request: httpx.Request, by_query: Any = by_query) -> httpx.Response:
+            body = orjson.loads(request.content)
+            bodies.append(body)
+            snippets = [_snippet(c, s) for c, s in by_query[body["query"]]]
+            return httpx.Response(
+                200,
+                json=make_context_response(
+                    snippets=snippets,
+                    usage={"prompt_tokens": 10, "completion_tokens": 0, "total_tokens": 10},
+                ),
+            )
+
+        respx.post(f"https://{host}/assistant/chat/{name}/context").mock(side_effect=_context)
+    return bodies
+
+
+@pytest.fixture
+def assistants() -> Assistants:
+    return Assistants(config=PineconeConfig(api_key="test-key", host=BASE_URL))
+
+
+@respx.mock
+def test_context_many_merges_by_score_and_dedups(assistants: Assistants) -> None:
+    bodies = _mock_assistants()
+
+    result = assistants.context_many(
+        assistant_names=["docs", "support"],
+        queries=["rotate keys", "key rotation"],
+        top_k=5,
+        filter={"team": "platform"},
+    )
+
+    assert isinstance(result, MultiContextResponse)
+    assert [(s.content, s.score) for s in result.snippets] == [
+        ("Keys rotate in the console.", 0.9),
+        ("Open a ticket to rotate keys.", 0.8),
+        ("Use two keys.", 0.6),
+        ("Keys expire.", 0.5),
+    ]
+    assert [
+        (result.sources[i].assistant_name, result.sources[i].query) for i in result.origins
+    ] == [
+        ("docs", "rotate keys"),
+        ("support", "rotate keys"),
+        ("docs", "key rotation"),
+        ("support", "rotate keys"),
+    ]
+    assert [(s.assistant_name, s.query) for s in result.sources] == [
+        ("docs", "rotate keys"),
+        ("docs", "key rotation"),
+        ("support", "rotate keys"),
+        ("support", "key rotation"),
+    ]
+    assert result.usage.total_tokens == 40
+    assert all(b["top_k"] == 5 and b["filter"] == {"team": "platform"} for b in bodies)
+
+
+@respx.mock
+def test_context_many_top_n_and_single_values(assistants: Assistants) -> None:
+    _mock_assistants()
+
+    result = assistants.context_many(assistant_names="docs", queries="rotate keys", top_n=1)
+
+    assert [s.content for s in result.snippets] == ["Keys rotate in the console."]
+    assert len(result.sources) == 1
+
+
+@respx.mock
+def test_context_many_raises_first_failure(assistants: Assistants) -> None:
+    _mock_assistants()
+    respx.post("https://docs-abc123.svc.pinecone.io/assistant/chat/docs/context").mock(
+        return_value=httpx.Response(500, json={"error": {"message": "boom"}})
+    )
+    with pytest.raises(ApiError):
+        assistants.context_many(assistant_names=["docs", "support"], queries="rotate keys")
+
+
+def test_context_many_validates_arguments(assistants: Assistants) -> None:
+    with pytest.raises(PineconeValueError, match="assistant_names"):
+        assistants.context_many(assistant_names=[], queries="q")
+    with pytest.raises(PineconeValueError, match="queries"):
+        assistants.context_many(assistant_names="docs", queries=["q", ""])
+    with pytest.raises(PineconeValueError, match="top_k"):
+        assistants.context_many(assistant_names="docs", queries="q", top_k=-1)
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_async_context_many() -> None:
+    _mock_assistants()
+    assistants = AsyncAssistants(config=PineconeConfig(api_key="test-key", host=BASE_URL))
+
+    result = await assistants.context_many(
+        assistant_names=["docs", "support"], queries="rotate keys", max_concurrency=2
+    )
+
+    assert [s.content for s in result.snippets] == [
+        "Keys rotate in the console.",
+        "Open a ticket to rotate keys.",
+        "Keys expire.",
+    ]
+    assert result.origins == [0, 1, 1]
+    assert result.usage.prompt_tokens == 20
@@ -50,7 +50,16 @@ def test_list_response_to_dict_with_pagination() -> None:
 
 def test_upsert_records_response_to_dict() -> None:
     result = UpsertRecordsResponse(record_count=5).to_dict()
-    assert result == {"record_count": 5, "response_info": None}
+    assert result == {
+        "record_count": 5,
+        "response_info": None,
+        "total_item_count": 0,
+        "failed_item_count": 0,
+        "total_batch_count": 0,
+        "successful_batch_count": 0,
+        "failed_batch_count": 0,
+        "errors": [],
+    }
 
 
 def test_to_dict_all_optional_none() -> None:
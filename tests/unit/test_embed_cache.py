@@ -0,0 +1,178 @@
+"""Unit tests for EmbeddingCache and its use by Inference.embed / embed_many."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from typing import Any
+
+import httpx
+import orjson
+import pytest
+import respx
+
+from pinecone import EmbeddingCache
+from pinecone._internal.config import PineconeConfig
+from pinecone.async_client.inference import AsyncInference
+from pinecone.client.inference import Inference
+from pinecone.errors.exceptions import PineconeValueError
+from pinecone.models.inference.embed import DenseEmbedding, SparseEmbedding
+
+BASE_URL = "https://api.test.pinecone.io"
+EMBED_URL = f"{BASE_URL}/embed"
+
+
+class _EmbedServer:
+    """Embeds input ``"n"`` as ``[n, n / 4]`` and records the texts of each request."""
+
+    def __init__(self) -> None:
+        self.requests: list[list[str]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        texts = [item["text"] for item in orjson.loads(request.content)["inputs"]]
+        self.requests.append(texts)
+        return httpx.Response(
+            200,
+            json={
+                "model": "multilingual-e5-large",
+                "vector_type": "dense",
+                "data": [{"values": [float(t), float(t) / 4]} for t in texts],
+                "usage": {"total_tokens": 10 * len(texts)},
+            },
+        )
+
+
+@pytest.fixture
+def inference() -> Inference:
+    client = Inference(config=PineconeConfig(api_key="test-key", host=BASE_URL))
+    client.cache = EmbeddingCache()
+    return client
+
+
+class TestEmbeddingCache:
+    def test_keys_depend_on_model_parameters_and_input(self) -> None:
+        a, b = EmbeddingCache.keys("m", {"input_type": "query"}, [{"text": "x"}, {"text": "y"}])
+        assert a != b
+        assert EmbeddingCache.keys("m", {"input_type": "query"}, [{"text": "x"}]) == [a]
+        assert EmbeddingCache.keys("m", {"input_type": "passage"}, [{"text": "x"}]) != [a]
+        assert EmbeddingCache.keys("other", {"input_type": "query"}, [{"text": "x"}]) != [a]
+
+    def test_round_trips_dense_and_sparse(self) -> None:
+        cache = EmbeddingCache()
+        dense = DenseEmbedding(values=[0.5, -1.25])
+        sparse = SparseEmbedding(sparse_values=[0.75], sparse_indices=[4_000_000_000])
+        cache.put_many([b"d", b"s"], [dense, sparse])
+        assert cache.get_many([b"s", b"missing", b"d"]) == [sparse, None, dense]
+        assert (cache.hits, cache.misses) == (2, 1)
+
+    def test_tokens_are_not_cached(self) -> None:
+        cache = EmbeddingCache()
+        cache.put_many(
+            [b"k"], [SparseEmbedding(sparse_values=[1.0], sparse_indices=[1], sparse_tokens=["a"])]
+        )
+        assert cache.get_many([b"k"]) == [None]
+
+    def test_memory_tier_is_lru(self) -> None:
+        cache = EmbeddingCache(max_entries=2)
+        cache.put_many([b"a", b"b"], [DenseEmbedding(values=[1.0])] * 2)
+        cache.get_many([b"a"])
+        cache.put_many([b"c"], [DenseEmbedding(values=[1.0])])
+        assert [e is not None for e in cache.get_many([b"a", b"b", b"c"])] == [True, False, True]
+
+    def test_sqlite_tier_persists(self, tmp_path: Path) -> None:
+        first = EmbeddingCache(path=tmp_path / "cache.db")
+        first.put_many([b"k"], [DenseEmbedding(values=[2.0])])
+        first.close()
+
+        second = EmbeddingCache(max_entries=0, path=tmp_path / "cache.db")
+        assert second.get_many([b"k"]) == [DenseEmbedding(values=[2.0])]
+        second.clear()
+        assert second.get_many([b"k"]) == [None]
+
+    def test_rejects_negative_size(self) -> None:
+        with pytest.raises(PineconeValueError, match="max_entries"):
+            EmbeddingCache(max_entries=-1)
+
+
+@respx.mock
+def test_embed_sends_only_misses(inference: Inference) -> None:
+    server = _EmbedServer()
+    respx.post(EMBED_URL).mock(side_effect=server)
+
+    inference.embed("multilingual-e5-large", ["1", "2"])
+    result = inference.embed("multilingual-e5-large", ["3", "1", "3", "2"])
+
+    assert server.requests == [["1", "2"], ["3"]]
+    assert [e.values for e in result] == [[3.0, 0.75], [1.0, 0.25], [3.0, 0.75], [2.0, 0.5]]
+    assert result.usage.total_tokens == 10
+
+
+@respx.mock
+def test_embed_fully_cached_makes_no_request(inference: Inference) -> None:
+    route = respx.post(EMBED_URL).mock(side_effect=_EmbedServer())
+    inference.embed("multilingual-e5-large", "1", parameters={"input_type": "query"})
+    result = inference.embed("multilingual-e5-large", "1", parameters={"input_type": "query"})
+    assert route.call_count == 1
+    assert result.usage.total_tokens == 0
+    assert result.model == "multilingual-e5-large"
+
+
+@respx.mock
+def test_embed_many_numpy_with_cache(inference: Inference) -> None:
+    np = pytest.importorskip("numpy")
+    server = _EmbedServer()
+    respx.post(EMBED_URL).mock(side_effect=server)
+    inference.embed("multilingual-e5-large", ["0", "4"])
+
+    result = inference.embed_many(
+        "multilingual-e5-large", [str(i) for i in range(6)], batch_size=2, output="numpy"
+    )
+
+    assert sorted(map(sorted, server.requests[1:])) == [["1", "2"], ["3", "5"]]
+    assert result.values.dtype == np.float32
+    assert result.values[:, 0].tolist() == [0.0, 1.0, 2.0, 3.0, 4.0, 5.0]
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_async_embed_uses_cache() -> None:
+    server = _EmbedServer()
+    respx.post(EMBED_URL).mock(side_effect=server)
+    inference = AsyncInference(config=PineconeConfig(api_key="test-key", host=BASE_URL))
+    inference.cache = EmbeddingCache()
+
+    await inference.embed("multilingual-e5-large", ["1"])
+    result = await inference.embed("multilingual-e5-large", ["2", "1"])
+
+    assert server.requests == [["1"], ["2"]]
+    assert [e.values[0] for e in result] == [2.0, 1.0]
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_async_sqlite_tier_runs_off_the_event_loop(tmp_path: Path) -> None:
+    server = _EmbedServer()
+    respx.post(EMBED_URL).mock(side_effect=server)
+    inference = AsyncInference(config=PineconeConfig(api_key="test-key", host=BASE_URL))
+    cache = EmbeddingCache(path=tmp_path / "cache.db")
+    inference.cache = cache
+    threads: list[int] = []
+    get_many, put_many = cache.get_many, cache.put_many
+
+    def record_get(*args: Any) -> Any:
+        threads.append(threading.get_ident())
+        return get_many(*args)
+
+    def record_put(*args: Any) -> Any:
+        threads.append(threading.get_ident())
+        return put_many(*args)
+
+    cache.get_many = record_get  # type: ignore[method-assign]
+    cache.put_many = record_put  # type: ignore[method-assign]
+
+    await inference.embed("multilingual-e5-large", ["1"])
+    await inference.embed_many("multilingual-e5-large", ["1", "2"], batch_size=96)
+
+    assert len(threads) == 4
+    assert threading.get_ident() not in threads
+    cache.close()
@@ -0,0 +1,184 @@
+"""Unit tests for Inference.embed_many and AsyncInference.embed_many."""
+
+from __future__ import annotations
+
+from typing import Any
+
+import httpx
+import orjson
+import pytest
+import respx
+
+from pinecone._internal.config import PineconeConfig
+from pinecone.async_client.inference import AsyncInference
+from pinecone.client.inference import Inference
+from pinecone.errors.exceptions import ApiError, ResponseParsingError, ValidationError
+from pinecone.models.inference.embed import (
+    EmbeddingMatrix,
+    EmbeddingsList,
+    SparseEmbeddingMatrix,
+)
+from tests.factories import make_model_info
+
+np = pytest.importorskip("numpy")
+
+BASE_URL = "https://api.test.pinecone.io"
+
+
+class _EmbedServer:
+    """Embeds input ``"n"`` as ``[n, n + 0.5]`` (or one sparse entry) and records batches."""
+
+    def __init__(self, vector_type: str = "dense") -> None:
+        self.vector_type = vector_type
+        self.batches: list[list[str]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = orjson.loads(request.content)
+        texts = [item["text"] for item in body["inputs"]]
+        self.batches.append(texts)
+        if self.vector_type == "sparse":
+            data = [
+                {
+                    "sparse_values": [float(t)] * (int(t) % 3),
+                    "sparse_indices": list(range(int(t) % 3)),
+                    "vector_type": "sparse",
+                }
+                for t in texts
+            ]
+        else:
+            data = [{"values": [float(t), float(t) + 0.5], "vector_type": "dense"} for t in texts]
+        return httpx.Response(
+            200,
+            json={
+                "model": body["model"],
+                "vector_type": self.vector_type,
+                "data": data,
+                "usage": {"total_tokens": len(texts)},
+            },
+        )
+
+
+@pytest.fixture
+def config() -> PineconeConfig:
+    return PineconeConfig(api_key="test-key", host=BASE_URL)
+
+
+def _inputs(n: int) -> list[str]:
+    return [str(i) for i in range(n)]
+
+
+@respx.mock
+def test_embed_many_splits_by_model_batch_size(config: PineconeConfig) -> None:
+    server = _EmbedServer()
+    respx.post(f"{BASE_URL}/embed").mock(side_effect=server)
+    model_route = respx.get(f"{BASE_URL}/models/multilingual-e5-large").mock(
+        return_value=httpx.Response(200, json=make_model_info(max_batch_size=4))
+    )
+    inference = Inference(config=config)
+
+    result = inference.embed_many("multilingual-e5-large", _inputs(10), max_concurrency=3)
+    inference.embed_many("multilingual-e5-large", _inputs(2))
+
+    assert isinstance(result, EmbeddingsList)
+    assert [e.values[0] for e in result] == [float(i) for i in range(10)]
+    assert result.usage.total_tokens == 10
+    assert sorted(len(b) for b in server.batches[:3]) == [2, 4, 4]
+    assert model_route.call_count == 1
+
+
+@respx.mock
+def test_embed_many_numpy_dense(config: PineconeConfig) -> None:
+    server = _EmbedServer()
+    respx.post(f"{BASE_URL}/embed").mock(side_effect=server)
+    inference = Inference(config=config)
+
+    result = inference.embed_many(
+        "multilingual-e5-large",
+        _inputs(7),
+        parameters={"input_type": "passage"},
+        batch_size=3,
+        output="numpy",
+    )
+
+    assert isinstance(result, EmbeddingMatrix)
+    assert result.values.dtype == np.float32
+    assert result.values.flags["C_CONTIGUOUS"]
+    assert result.values.shape == (7, 2)
+    assert result.values[:, 0].tolist() == [float(i) for i in range(7)]
+    assert len(server.batches) == 3
+
+
+@respx.mock
+def test_embed_many_numpy_sparse(config: PineconeConfig) -> None:
+    respx.post(f"{BASE_URL}/embed").mock(side_effect=_EmbedServer("sparse"))
+    inference = Inference(config=config)
+
+    result = inference.embed_many(
+        "pinecone-sparse-english-v0", _inputs(5), batch_size=2, output="numpy"
+    )
+
+    assert isinstance(result, SparseEmbeddingMatrix)
+    assert result.indptr.tolist() == [0, 0, 1, 3, 3, 4]
+    indices, values = result.row(2)
+    assert indices.tolist() == [0, 1]
+    assert values.tolist() == [2.0, 2.0]
+    assert result.indices.dtype == np.uint32
+
+
+@respx.mock
+def test_embed_many_raises_first_failure(config: PineconeConfig) -> None:
+    respx.post(f"{BASE_URL}/embed").mock(
+        return_value=httpx.Response(400, json={"error": {"message": "bad input"}})
+    )
+    inference = Inference(config=config)
+    with pytest.raises(ApiError):
+        inference.embed_many("multilingual-e5-large", _inputs(4), batch_size=2)
+
+
+@respx.mock
+@pytest.mark.parametrize("output", ["embeddings", "numpy"])
+def test_embed_many_rejects_short_response(config: PineconeConfig, output: Any) -> None:
+    server = _EmbedServer()
+
+    def short(request: httpx.Request) -> httpx.Response:
+        response = server(request)
+        body = orjson.loads(response.content)
+        body["data"] = body["data"][:-1]
+        return httpx.Response(200, json=body)
+
+    respx.post(f"{BASE_URL}/embed").mock(side_effect=short)
+    inference = Inference(config=config)
+    with pytest.raises(ResponseParsingError, match="1 embeddings for 2 inputs"):
+        inference.embed_many(
+            "multilingual-e5-large", _inputs(40), batch_size=2, max_concurrency=1, output=output
+        )
+    # The remaining requests are cancelled rather than sent in the background.
+    assert len(server.batches) < 20
+
+
+def test_embed_many_validates_arguments(config: PineconeConfig) -> None:
+    inference = Inference(config=config)
+    with pytest.raises(ValidationError, match="max_concurrency"):
+        inference.embed_many("multilingual-e5-large", ["a"], max_concurrency=0)
+    with pytest.raises(ValidationError, match="batch_size"):
+        inference.embed_many("multilingual-e5-large", ["a"], batch_size=0)
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_async_embed_many_preserves_order(config: PineconeConfig) -> None:
+    server = _EmbedServer()
+    respx.post(f"{BASE_URL}/embed").mock(side_effect=server)
+    respx.get(f"{BASE_URL}/models/multilingual-e5-large").mock(
+        return_value=httpx.Response(200, json=make_model_info(max_batch_size=3))
+    )
+    inference = AsyncInference(config=config)
+
+    result: Any = await inference.embed_many(
+        "multilingual-e5-large", _inputs(8), max_concurrency=2, output="numpy"
+    )
+
+    assert isinstance(result, EmbeddingMatrix)
+    assert result.values[:, 1].tolist() == [i + 0.5 for i in range(8)]
+    assert result.usage.total_tokens == 8
+    assert len(server.batches) == 3
@@ -0,0 +1,167 @@
+"""Unit tests for Assistants.evaluate_alignment_many and its async variant."""
+
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import httpx
+import orjson
+import pytest
+import respx
+
+from pinecone._internal.config import BatchRetryPolicy, PineconeConfig, RetryConfig
+from pinecone._internal.constants import ASSISTANT_EVALUATION_BASE_URL
+from pinecone.async_client.assistants import AsyncAssistants
+from pinecone.client.assistants import Assistants
+from pinecone.errors.exceptions import PineconeValueError
+from pinecone.models.assistant.evaluation import AlignmentEvaluation
+from tests.factories import make_alignment_response
+
+BASE_URL = "https://api.test.pinecone.io"
+EVAL_URL = f"{ASSISTANT_EVALUATION_BASE_URL}/evaluation/metrics/alignment"
+FAST_RETRY = BatchRetryPolicy(max_attempts=3, backoff_factor=0.001, max_wait=0.01)
+
+
+def _dataset(n: int) -> list[dict[str, str]]:
+    return [
+        {"question": f"q{i}", "answer": f"a{i}", "ground_truth_answer": f"g{i}"} for i in range(n)
+    ]
+
+
+class _EvalServer:
+    """Scores question ``q<i>`` as ``i / 100``; *rate_limit* questions get one 429 first."""
+
+    def __init__(self, rate_limit: set[str] | None = None, fail: set[str] | None = None) -> None:
+        self.rate_limit = set(rate_limit or ())
+        self.fail = set(fail or ())
+        self.questions: list[str] = []
+        self.lock = threading.Lock()
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        question = orjson.loads(request.content)["question"]
+        with self.lock:
+            self.questions.append(question)
+            if question in self.rate_limit:
+                self.rate_limit.discard(question)
+                return httpx.Response(429, json={"error": {"message": "slow down"}})
+        if question in self.fail:
+            return httpx.Response(400, json={"error": {"message": "bad item"}})
+        score = int(question[1:]) / 100
+        metrics = {"correctness": score, "completeness": score, "alignment": score}
+        return httpx.Response(200, json=make_alignment_response(metrics=metrics))
+
+
+@pytest.fixture
+def assistants() -> Assistants:
+    config = PineconeConfig(
+        api_key="test-key", host=BASE_URL, retry_config=RetryConfig(max_retries=1)
+    )
+    return Assistants(config=config)
+
+
+@respx.mock
+def test_evaluates_every_item_and_retries_rate_limits(assistants: Assistants) -> None:
+    server = _EvalServer(rate_limit={"q3", "q7"}, fail={"q5"})
+    respx.post(EVAL_URL).mock(side_effect=server)
+
+    evaluations = list(
+        assistants.evaluate_alignment_many(_dataset(10), max_concurrency=4, retry_policy=FAST_RETRY)
+    )
+
+    assert all(isinstance(e, AlignmentEvaluation) for e in evaluations)
+    assert sorted(e.index for e in evaluations) == list(range(10))
+    by_index = {e.index: e for e in evaluations}
+    assert by_index[7].ok
+    assert by_index[7].result is not None and by_index[7].result.scores.alignment == 0.07
+    assert not by_index[5].ok
+    assert by_index[5].error_message is not None and "bad item" in by_index[5].error_message
+    # Two rate-limited items were sent twice; the 400 was not retried.
+    assert len(server.questions) == 12
+
+
+@respx.mock
+def test_resumes_from_results_file(assistants: Assistants, tmp_path: Path) -> None:
+    results = tmp_path / "results.ndjson"
+    server = _EvalServer(fail={"q2"})
+    respx.post(EVAL_URL).mock(side_effect=server)
+
+    first = list(
+        assistants.evaluate_alignment_many(
+            _dataset(4), results_path=results, retry_policy=FAST_RETRY
+        )
+    )
+    assert sum(e.ok for e in first) == 3
+    # Simulate a crash in the middle of writing a line.
+    with open(results, "ab") as f:
+        f.write(b'{"index": 9, "quest')
+
+    server.fail.clear()
+    server.questions.clear()
+    second = list(assistants.evaluate_alignment_many(_dataset(6), results_path=results))
+
+    assert sorted(e.index for e in second) == [2, 4, 5]
+    assert sorted(server.questions) == ["q2", "q4", "q5"]
+    assert len(results.read_bytes().splitlines()) == 6
+
+
+def test_results_file_for_another_dataset_raises(assistants: Assistants, tmp_path: Path) -> None:
+    results = tmp_path / "results.ndjson"
+    record = {
+        "index": 0,
+        "question": "something else",
+        "result": {
+            "scores": {"correctness": 1.0, "completeness": 1.0, "alignment": 1.0},
+            "facts": [],
+            "usage": {"prompt_tokens": 1, "completion_tokens": 1, "total_tokens": 2},
+        },
+    }
+    results.write_bytes(orjson.dumps(record) + b"\n")
+
+    with pytest.raises(PineconeValueError, match="different question"):
+        list(assistants.evaluate_alignment_many(_dataset(2), results_path=results))
+
+
+def test_accepts_tuples_and_validates_items(assistants: Assistants) -> None:
+    with pytest.raises(PineconeValueError, match="Item 1"):
+        list(assistants.evaluate_alignment_many([("q", "a", "g"), ("q", "a")]))
+    with pytest.raises(PineconeValueError, match="max_concurrency"):
+        assistants.evaluate_alignment_many([], max_concurrency=0)
+
+
+@respx.mock
+def test_accepts_dataframe(assistants: Assistants) -> None:
+    pd = pytest.importorskip("pandas")
+    respx.post(EVAL_URL).mock(side_effect=_EvalServer())
+
+    df = pd.DataFrame(_dataset(3))
+    evaluations = list(assistants.evaluate_alignment_many(df))
+
+    assert sorted((e.index, e.question) for e in evaluations) == [(0, "q0"), (1, "q1"), (2, "q2")]
+    with pytest.raises(PineconeValueError, match="missing columns: answer"):
+        list(assistants.evaluate_alignment_many(df.drop(columns=["answer"])))
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_async_evaluate_alignment_many(tmp_path: Path) -> None:
+    server = _EvalServer(rate_limit={"q1"})
+    respx.post(EVAL_URL).mock(side_effect=server)
+    config = PineconeConfig(
+        api_key="test-key", host=BASE_URL, retry_config=RetryConfig(max_retries=1)
+    )
+    assistants = AsyncAssistants(config=config)
+
+    evaluations = [
+        e
+        async for e in assistants.evaluate_alignment_many(
+            _dataset(5),
+            max_concurrency=2,
+            retry_policy=FAST_RETRY,
+            results_path=tmp_path / "results.ndjson",
+        )
+    ]
+
+    assert sorted(e.index for e in evaluations) == list(range(5))
+    assert all(e.ok for e in evaluations)
+    assert len((tmp_path / "results.ndjson").read_bytes().splitlines()) == 5
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import pickle
+
 import pytest
 
 from pinecone.errors.exceptions import (
@@ -175,6 +177,24 @@ class TestApiErrorReprWithMetadata:
         assert "unrenderable" in result
 
 
+class TestApiErrorPickle:
+    @pytest.mark.parametrize(
+        "err",
+        [
+            ApiError("boom", status_code=503, error_code="UNAVAILABLE", request_id="req-1"),
+            NotFoundError(body={"error": "missing"}),
+            ServiceError(message="down", status_code=502, headers={"retry-after": "1"}),
+        ],
+    )
+    def test_round_trips_all_fields(self, err: ApiError) -> None:
+        restored = pickle.loads(pickle.dumps(err))  # noqa: S301
+        assert type(restored) is type(err)
+        assert restored.args == err.args
+        assert str(restored) == str(err)
+        assert repr(restored) == repr(err)
+        assert restored.headers == err.headers
+
+
 class TestSubclassRepr:
     def test_not_found_error_shows_class_name(self) -> None:
         err = NotFoundError()
@@ -115,3 +115,89 @@ class TestExtractResponseInfoAllocation:
         assert len(stats) <= 2, (
             f"Expected ≤2 allocations from vectors_adapter, got {len(stats)}: {stats}"
         )
+
+
+class TestRawHeadersDict:
+    """raw_headers is a plain dict equal to ``dict(response.headers)``."""
+
+    def test_matches_httpx_dict_including_repeated_headers(self) -> None:
+        response = httpx.Response(
+            200,
+            headers=[
+                ("X-Pinecone-Request-Id", "req-1"),
+                ("Set-Cookie", "a=1"),
+                ("set-cookie", "b=2"),
+            ],
+        )
+        info = extract_response_info(response)
+        assert type(info.raw_headers) is dict
+        assert info.raw_headers == dict(response.headers)
+        assert info.raw_headers["set-cookie"] == "a=1, b=2"
+        assert len(info.raw_headers) == 2
+
+    def test_encodes_with_msgspec(self) -> None:
+        import msgspec
+
+        info = extract_response_info(httpx.Response(200, headers={"X-Pinecone-Request-Id": "r"}))
+        assert msgspec.json.decode(msgspec.json.encode(info)) == {
+            "raw_headers": {"x-pinecone-request-id": "r"}
+        }
+
+
+class TestLazyResponseInfo:
+    """With ``lazy=True`` the received headers are kept until raw_headers is read."""
+
+    @staticmethod
+    def _info() -> ResponseInfo:
+        response = httpx.Response(
+            200,
+            headers=[
+                ("X-Pinecone-Request-Id", "req-1"),
+                ("X-Pinecone-Lsn-Committed", "7"),
+                ("Set-Cookie", "a=1"),
+                ("set-cookie", "b=2"),
+            ],
+        )
+        return extract_response_info(response, lazy=True)
+
+    def test_typed_properties_do_not_build_the_dict(self) -> None:
+        from pinecone.models.response_info import _RAW_HEADERS
+
+        info = self._info()
+        assert isinstance(info, ResponseInfo)
+        assert info.request_id == "req-1"
+        assert info.lsn_committed == 7
+        assert info.lsn_reconciled is None
+        assert info.is_reconciled(1) is False
+        assert isinstance(_RAW_HEADERS.__get__(info), httpx.Headers)
+
+    def test_raw_headers_is_built_once(self) -> None:
+        info = self._info()
+        headers = info.raw_headers
+        assert type(headers) is dict
+        assert headers == {
+            "x-pinecone-request-id": "req-1",
+            "x-pinecone-lsn-committed": "7",
+            "set-cookie": "a=1, b=2",
+        }
+        assert info.raw_headers is headers
+        assert info.request_id == "req-1"
+
+    def test_to_dict_repr_and_encoding_after_access(self) -> None:
+        import msgspec
+
+        info = self._info()
+        expected = {
+            "x-pinecone-request-id": "req-1",
+            "x-pinecone-lsn-committed": "7",
+            "set-cookie": "a=1, b=2",
+        }
+        assert info.to_dict() == {"raw_headers": expected}
+        assert repr(info) == f"ResponseInfo(raw_headers={expected!r})"
+        assert msgspec.json.decode(msgspec.json.encode(info)) == {"raw_headers": expected}
+
+    def test_raw_headers_can_be_replaced(self) -> None:
+        info = self._info()
+        info.raw_headers = {"x-pinecone-request-id": "req-2"}
+        assert info.request_id == "req-2"
+        assert info.lsn_committed is None
@@ -0,0 +1,55 @@
+"""Tests for the tokio runtime options of the Rust-backed GrpcChannel."""
+
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip(
+    "pinecone._grpc", reason="Rust extension not available; run maturin develop first"
+)
+
+from pinecone._grpc import GrpcChannel  # type: ignore[import-not-found]
+
+from pinecone.errors.exceptions import PineconeValueError
+
+_ENDPOINT = "http://localhost:1"
+_API_KEY = "test-api-key"
+_API_VERSION = "2025-10"
+_VERSION = "0.1.0"
+
+
+def _make_channel(**kwargs: object) -> GrpcChannel:
+    return GrpcChannel(_ENDPOINT, _API_KEY, _API_VERSION, _VERSION, secure=False, **kwargs)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {},
+        {"runtime": "multi_thread", "worker_threads": 1},
+        {"runtime": "current_thread"},
+        {"runtime": "shared"},
+        {"runtime": "current_thread", "lazy_runtime": True},
+    ],
+)
+def test_channel_constructs_with_runtime_options(kwargs: dict[str, object]) -> None:
+    _make_channel(**kwargs)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"runtime": "threaded"},
+        {"worker_threads": 0},
+        {"runtime": "current_thread", "worker_threads": 2},
+    ],
+)
+def test_invalid_runtime_options_raise_value_error(kwargs: dict[str, object]) -> None:
+    with pytest.raises(PineconeValueError):
+        _make_channel(**kwargs)
+
+
+def test_lazy_runtime_validates_timeout_before_first_rpc() -> None:
+    ch = _make_channel(runtime="current_thread", lazy_runtime=True)
+    with pytest.raises(PineconeValueError):
+        ch.describe_index_stats(timeout_s=-1.0)
@@ -115,6 +115,59 @@ class TestGrpcIndexInit:
         assert call_args[0][5] == 60.0  # timeout
         assert call_args[0][6] == 5.0  # connect_timeout
 
+    def test_runtime_options_default(self, mock_channel: MagicMock) -> None:
+        mock_module = MagicMock()
+        mock_module.GrpcChannel.return_value = mock_channel
+        with patch.dict("sys.modules", {_MOCK_GRPC_MODULE_PATH: mock_module}):
+            GrpcIndex(host="test-index.svc.pinecone.io", api_key="test-key")
+        kwargs = mock_module.GrpcChannel.call_args.kwargs
+        assert kwargs["runtime"] == "multi_thread"
+        assert kwargs["worker_threads"] is None
+        assert kwargs["lazy_runtime"] is False
+
+    def test_runtime_options_forwarded(self, mock_channel: MagicMock) -> None:
+        mock_module = MagicMock()
+        mock_module.GrpcChannel.return_value = mock_channel
+        with patch.dict("sys.modules", {_MOCK_GRPC_MODULE_PATH: mock_module}):
+            idx = GrpcIndex(
+                host="test-index.svc.pinecone.io",
+                api_key="test-key",
+                worker_threads=2,
+                lazy_runtime=True,
+            )
+            GrpcIndex(host="test-index.svc.pinecone.io", api_key="test-key", runtime="shared")
+        first, second = mock_module.GrpcChannel.call_args_list
+        assert first.kwargs["worker_threads"] == 2
+        assert first.kwargs["lazy_runtime"] is True
+        assert second.kwargs["runtime"] == "shared"
+        # Worker processes rebuild the client with the same runtime options.
+        assert idx._client_kwargs["worker_threads"] == 2
+
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            ({"runtime": "threaded"}, "runtime must be one of"),
+            ({"worker_threads": 0}, "worker_threads must be between"),
+            ({"runtime": "current_thread", "worker_threads": 2}, "only be set"),
+            ({"runtime": "shared", "worker_threads": 2}, "only be set"),
+        ],
+    )
+    def test_invalid_runtime_options_raise(
+        self, mock_channel: MagicMock, kwargs: dict[str, Any], match: str
+    ) -> None:
+        with pytest.raises(ValidationError, match=match):
+            _make_grpc_index(mock_channel, **kwargs)
+
+    def test_rest_client_created_on_first_use(self, mock_channel: MagicMock) -> None:
+        idx = _make_grpc_index(mock_channel)
+        assert idx._rest_client is None
+
+        http = idx._http
+        assert idx._http is http
+        assert http._config.host == "https://test-index-abc123.svc.pinecone.io"
+        idx.close()
+        assert http._client.is_closed
+
     def test_init_insecure(self, mock_channel: MagicMock) -> None:
         mock_module = MagicMock()
         mock_module.GrpcChannel.return_value = mock_channel
@@ -1054,6 +1107,25 @@ class TestGrpcIndexUpsertRecords:
         with pytest.raises(ValidationError, match=r"_id.*id"):
             idx.upsert_records(namespace="test-ns", records=[{"text": "no id here"}])
 
+    @respx.mock
+    def test_upsert_records_batched(self, mock_channel: MagicMock) -> None:
+        route = respx.post(_UPSERT_RECORDS_URL).mock(return_value=httpx.Response(201))
+        idx = _make_grpc_index(mock_channel, host=_INDEX_HOST)
+        result = idx.upsert_records(
+            namespace="test-ns",
+            records=({"_id": f"r{i}", "text": "hello"} for i in range(5)),
+            batch_size=2,
+            show_progress=False,
+        )
+        assert route.call_count == 3
+        assert result.record_count == 5
+        assert result.failed_item_count == 0
+
+    def test_upsert_records_batched_empty_iterable(self, mock_channel: MagicMock) -> None:
+        idx = _make_grpc_index(mock_channel, host=_INDEX_HOST)
+        with pytest.raises(ValidationError, match="non-empty"):
+            idx.upsert_records(namespace="test-ns", records=iter([]), batch_size=2)
+
 
 class TestGrpcIndexSearch:
     """GrpcIndex.search() delegates to REST endpoint."""
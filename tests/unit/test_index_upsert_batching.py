@@ -11,7 +11,7 @@ import orjson
 import pytest
 import respx
 
-from pinecone import Index
+from pinecone import BatchRetryPolicy, Index
 from pinecone.errors.exceptions import PineconeValueError
 from pinecone.models.vectors.responses import UpsertResponse
 from pinecone.models.vectors.vector import Vector
@@ -159,6 +159,45 @@ class TestUpsertWithBatchSize:
         assert result.upserted_count == 0
 
 
+class TestUpsertRequestSizeLimit:
+    """Batches are also split so that no request body exceeds 2 MiB."""
+
+    @respx.mock
+    def test_large_vectors_split_by_bytes(self) -> None:
+        route = respx.post(UPSERT_URL).mock(
+            return_value=httpx.Response(200, json=_make_upsert_response(upserted_count=1))
+        )
+        vectors = [
+            Vector(id=f"v{i}", values=[0.1] * 10, metadata={"text": "x" * 400_000})
+            for i in range(12)
+        ]
+        idx = _make_index()
+        result = idx.upsert(vectors=vectors, namespace="ns", batch_size=100, show_progress=False)
+
+        assert result.total_item_count == 12
+        assert route.call_count > 1
+        sent = []
+        for call in route.calls:
+            assert len(call.request.content) <= 2 * 1024 * 1024
+            body = orjson.loads(call.request.content)
+            assert body["namespace"] == "ns"
+            sent.extend(v["id"] for v in body["vectors"])
+        assert sorted(sent) == sorted(v.id for v in vectors)
+
+    @respx.mock
+    def test_auto_batch_size(self) -> None:
+        route = respx.post(UPSERT_URL).mock(
+            return_value=httpx.Response(200, json=_make_upsert_response(upserted_count=1))
+        )
+        idx = _make_index()
+        result = idx.upsert(vectors=_make_vectors(120), batch_size="auto", show_progress=False)
+
+        assert result.total_item_count == 120
+        assert not result.has_errors
+        assert sum(len(orjson.loads(c.request.content)["vectors"]) for c in route.calls) == 120
+        assert len(orjson.loads(route.calls[0].request.content)["vectors"]) == 50
+
+
 class TestUpsertInvalidBatchSize:
     """Invalid batch_size values raise PineconeValueError."""
 
@@ -407,3 +446,31 @@ class TestUpsertShowProgress:
         idx = _make_index()
         result = idx.upsert(vectors=_make_vectors(10), batch_size=5, show_progress=True)
         assert result.upserted_count == 10
+
+
+class TestUpsertRetryPolicy:
+    """retry_policy isolates the vectors a batch was rejected for."""
+
+    @respx.mock
+    def test_upsert_bisects_rejected_batch(self) -> None:
+        def _respond(req: httpx.Request) -> httpx.Response:
+            body = orjson.loads(req.content)
+            ids = [v["id"] for v in body["vectors"]]
+            assert body["namespace"] == "ns"
+            if "v3" in ids:
+                return httpx.Response(400, json={"error": {"message": "bad vector"}})
+            return httpx.Response(200, json=_make_upsert_response(upserted_count=len(ids)))
+
+        respx.post(UPSERT_URL).mock(side_effect=_respond)
+        idx = _make_index()
+        result = idx.upsert(
+            vectors=_make_vectors(8),
+            namespace="ns",
+            batch_size=4,
+            show_progress=False,
+            retry_policy=BatchRetryPolicy(backoff_factor=0.0),
+        )
+
+        assert result.upserted_count == 7
+        assert result.failed_batch_count == 1
+        assert [item["id"] for item in result.failed_items] == ["v3"]
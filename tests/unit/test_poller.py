@@ -0,0 +1,204 @@
+"""Unit tests for the shared Poller / AsyncPoller and the resource poller namespaces."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from concurrent.futures import wait
+from typing import Any
+
+import httpx
+import pytest
+import respx
+
+from pinecone import AsyncPinecone, Pinecone
+from pinecone._internal.polling import AsyncPoller, Backoff, Poller
+from pinecone.async_client.poller import AsyncResourcePoller
+from pinecone.client.poller import ResourcePoller
+from pinecone.errors.exceptions import (
+    IndexInitFailedError,
+    PineconeConnectionError,
+    PineconeError,
+    PineconeTimeoutError,
+    PineconeValueError,
+)
+from tests.factories import make_assistant_file_response, make_index_response
+
+BASE_URL = "https://api.test.pinecone.io"
+DATA_PLANE_URL = "https://test-assistant-abc123.svc.pinecone.io/assistant"
+
+
+def _fast_poller() -> Poller:
+    return Poller(initial=0.005, maximum=0.02, jitter=0)
+
+
+class _Countdown:
+    """Fetch that reports each key done after it has been polled *rounds* times."""
+
+    def __init__(self, rounds: dict[str, int]) -> None:
+        self.rounds = dict(rounds)
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def __call__(self) -> dict[str, int]:
+        with self.lock:
+            self.calls += 1
+            self.rounds = {k: v - 1 for k, v in self.rounds.items()}
+            return dict(self.rounds)
+
+
+def _done_at_zero(key: str) -> Any:
+    return lambda snapshot: f"{key}-done" if snapshot[key] <= 0 else None
+
+
+def test_backoff_grows_to_maximum_with_jitter() -> None:
+    backoff = Backoff(initial=1, maximum=5, factor=2, jitter=0.1)
+    delays = [backoff.next_delay() for _ in range(5)]
+    for delay, base in zip(delays, [1, 2, 4, 5, 5], strict=True):
+        assert base * 0.9 <= delay <= base * 1.1
+    backoff.reset()
+    assert backoff.next_delay() <= 1.1
+
+
+def test_backoff_validates_arguments() -> None:
+    with pytest.raises(PineconeValueError, match="jitter"):
+        Backoff(jitter=1)
+    with pytest.raises(PineconeValueError, match="maximum"):
+        Poller(initial=2, maximum=1)
+
+
+def test_poller_shares_one_fetch_per_group() -> None:
+    fetch = _Countdown({"a": 2, "b": 3, "c": 3})
+    poller = _fast_poller()
+
+    futures = [poller.watch(fetch, _done_at_zero(k), group="g") for k in ("a", "b", "c")]
+    wait(futures, timeout=5)
+
+    assert [f.result() for f in futures] == ["a-done", "b-done", "c-done"]
+    assert fetch.calls == 3
+
+
+def test_poller_times_out_pending_watch() -> None:
+    poller = _fast_poller()
+    future = poller.watch(lambda: {"a": 1}, lambda s: None, timeout=0.02, label="Thing 'a'")
+    with pytest.raises(PineconeTimeoutError, match=r"Thing 'a' not complete after 0\.02s"):
+        future.result(timeout=5)
+
+
+def test_poller_propagates_resolve_and_fetch_errors() -> None:
+    poller = _fast_poller()
+
+    def failed(snapshot: object) -> None:
+        raise PineconeError("boom")
+
+    def broken() -> None:
+        raise httpx.ConnectError("down")
+
+    with pytest.raises(PineconeError, match="boom"):
+        poller.watch(lambda: {}, failed).result(timeout=5)
+    with pytest.raises(httpx.ConnectError):
+        poller.watch(broken, lambda s: s).result(timeout=5)
+
+
+def test_poller_retries_transient_fetch_errors() -> None:
+    fetch = _Countdown({"a": 3, "b": 3})
+    failures = iter([PineconeConnectionError("reset"), PineconeTimeoutError("slow")])
+
+    def flaky() -> dict[str, int]:
+        error = next(failures, None)
+        if error is not None:
+            raise error
+        return fetch()
+
+    poller = _fast_poller()
+    futures = [poller.watch(flaky, _done_at_zero(k), group="g", timeout=5) for k in ("a", "b")]
+    wait(futures, timeout=5)
+
+    assert [f.result() for f in futures] == ["a-done", "b-done"]
+    assert fetch.calls == 3
+
+
+def test_poller_times_out_when_fetch_keeps_failing_transiently() -> None:
+    def down() -> None:
+        raise PineconeConnectionError("down")
+
+    future = _fast_poller().watch(down, lambda s: s, timeout=0.05, label="Thing 'a'")
+    with pytest.raises(PineconeTimeoutError, match="Thing 'a' not complete") as exc_info:
+        future.result(timeout=5)
+    assert isinstance(exc_info.value.__cause__, PineconeConnectionError)
+
+
+@respx.mock
+def test_resource_poller_waits_for_many_indexes_with_one_list_per_round() -> None:
+    rounds = {"n": 0}
+
+    def list_indexes(request: httpx.Request) -> httpx.Response:
+        rounds["n"] += 1
+        state = "Ready" if rounds["n"] >= 2 else "Initializing"
+        indexes = [
+            make_index_response(name=f"idx-{i}", status={"ready": state == "Ready", "state": state})
+            for i in range(3)
+        ]
+        indexes.append(
+            make_index_response(
+                name="broken", status={"ready": False, "state": "InitializationFailed"}
+            )
+        )
+        return httpx.Response(200, json={"indexes": indexes})
+
+    respx.get(f"{BASE_URL}/indexes").mock(side_effect=list_indexes)
+    pc = Pinecone(api_key="test-key", host=BASE_URL)
+    poller = ResourcePoller(pc, _fast_poller())
+
+    futures = [poller.index_ready(f"idx-{i}", timeout=5) for i in range(3)]
+    failed = poller.index_ready("broken")
+    wait([*futures, failed], timeout=5)
+
+    assert [f.result().name for f in futures] == ["idx-0", "idx-1", "idx-2"]
+    assert isinstance(failed.exception(), IndexInitFailedError)
+    assert rounds["n"] == 2
+
+
+def test_pinecone_exposes_poller_namespace() -> None:
+    pc = Pinecone(api_key="test-key")
+    assert isinstance(pc.poller, ResourcePoller)
+    assert pc.poller is pc.poller
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_async_resource_poller_waits_for_files() -> None:
+    respx.get(f"{BASE_URL}/assistant/assistants/test-assistant").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "name": "test-assistant",
+                "status": "Ready",
+                "host": "test-assistant-abc123.svc.pinecone.io",
+            },
+        )
+    )
+    listings = [
+        [("f1", "Processing"), ("f2", "Processing")],
+        [("f1", "Available"), ("f2", "ProcessingFailed")],
+    ]
+    calls = {"n": 0}
+
+    def list_files(request: httpx.Request) -> httpx.Response:
+        listing = listings[min(calls["n"], len(listings) - 1)]
+        calls["n"] += 1
+        files = [make_assistant_file_response(id=i, status=s) for i, s in listing]
+        return httpx.Response(200, json={"files": files})
+
+    respx.get(f"{DATA_PLANE_URL}/files/test-assistant").mock(side_effect=list_files)
+    pc = AsyncPinecone(api_key="test-key", host=BASE_URL)
+    poller = AsyncResourcePoller(pc, AsyncPoller(initial=0.005, maximum=0.02, jitter=0))
+
+    done = poller.file_processed("test-assistant", "f1", timeout=5)
+    failed = poller.file_processed("test-assistant", "f2", timeout=5)
+    results = await asyncio.gather(done, failed, return_exceptions=True)
+
+    assert results[0].id == "f1"
+    assert isinstance(results[1], PineconeError)
+    assert calls["n"] == 2
+    await pc.close()
@@ -0,0 +1,141 @@
+"""Unit tests for the process-pool upsert mode."""
+
+from __future__ import annotations
+
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+import httpx
+import orjson
+import pytest
+import respx
+
+from pinecone import Index
+from pinecone._internal import process_upsert
+from pinecone._internal.process_upsert import (
+    pack_shard,
+    release_shard,
+    resolve_process_count,
+    shard_size,
+    unpack_shard,
+)
+from pinecone.errors.exceptions import PineconeValueError
+from pinecone.models.vectors.sparse import SparseValues
+from pinecone.models.vectors.vector import Vector
+
+INDEX_HOST = "test-index-abc1234.svc.us-east1-gcp.pinecone.io"
+UPSERT_URL = f"https://{INDEX_HOST}/vectors/upsert"
+
+
+def _round_trip(vectors: list[Any]) -> list[Any]:
+    shm, skeletons, value_count = pack_shard(vectors)
+    try:
+        return unpack_shard(shm.name, skeletons, value_count)
+    finally:
+        release_shard(shm)
+
+
+class TestShardPacking:
+    def test_round_trips_every_input_format(self) -> None:
+        vectors: list[Any] = [
+            Vector(
+                id="a",
+                values=[0.5, -1.25],
+                sparse_values=SparseValues(indices=[3], values=[0.1]),
+                metadata={"genre": "drama"},
+            ),
+            ("b", [1.0, 2.0]),
+            ("c", array("f", [3.0, 4.0]), {"year": 2020}),
+            {"id": "d", "values": [5.0, 6.0], "metadata": {"k": "v"}},
+            {"id": "e", "sparse_values": {"indices": [1], "values": [0.2]}},
+        ]
+        restored = _round_trip(vectors)
+        assert restored[0] == vectors[0]
+        assert restored[1] == ("b", [1.0, 2.0])
+        assert restored[2] == ("c", [3.0, 4.0], {"year": 2020})
+        assert restored[3] == vectors[3]
+        assert restored[4] == vectors[4]
+
+    def test_malformed_items_are_passed_through(self) -> None:
+        vectors: list[Any] = [("a", "not-a-vector"), ("b",), 42, ("c", [1.0])]
+        assert _round_trip(vectors) == [("a", "not-a-vector"), ("b",), 42, ("c", [1.0])]
+
+    def test_empty_shard(self) -> None:
+        assert _round_trip([]) == []
+
+
+class TestResolveProcessCount:
+    def test_thread_mode(self) -> None:
+        assert resolve_process_count("thread", 4, batch_size=None) is None
+
+    def test_process_mode_defaults_to_cpu_count(self) -> None:
+        assert (resolve_process_count("process", None, batch_size=100) or 0) >= 1
+        assert resolve_process_count("process", 3, batch_size="auto") == 3
+
+    @pytest.mark.parametrize(
+        ("workers", "processes", "batch_size", "checkpoint", "match"),
+        [
+            ("fork", None, 10, None, "'thread' or 'process'"),
+            ("process", None, None, None, "requires batch_size"),
+            ("process", None, 10, "job.ckpt", "checkpoint is not supported"),
+            ("process", 0, 10, None, "processes"),
+        ],
+    )
+    def test_invalid(
+        self,
+        workers: Any,
+        processes: int | None,
+        batch_size: int | None,
+        checkpoint: str | None,
+        match: str,
+    ) -> None:
+        with pytest.raises(PineconeValueError, match=match):
+            resolve_process_count(workers, processes, batch_size=batch_size, checkpoint=checkpoint)
+
+    def test_shard_size_spreads_small_inputs(self) -> None:
+        assert shard_size(100, 4, 10, 4) == 25
+        assert shard_size(1_000_000, 4, 100, 4) == 800
+        assert shard_size(0, 4, "auto", 4) == 1
+
+
+class TestIndexProcessUpsert:
+    """Drive process mode through a thread pool standing in for the processes."""
+
+    @respx.mock
+    def test_shards_are_merged_in_order(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        sent: list[list[str]] = []
+
+        def _handler(request: httpx.Request) -> httpx.Response:
+            body = orjson.loads(request.content)
+            ids = [v["id"] for v in body["vectors"]]
+            sent.append(ids)
+            if "v5" in ids:
+                return httpx.Response(400, json={"error": {"message": "bad vector"}})
+            assert body["vectors"][0]["values"] == [float(ids[0][1:])]
+            return httpx.Response(200, json={"upsertedCount": len(ids)})
+
+        respx.post(UPSERT_URL).mock(side_effect=_handler)
+        idx = Index(host=INDEX_HOST, api_key="test-key")
+        monkeypatch.setattr(process_upsert, "_worker_client", idx)
+        with ThreadPoolExecutor(2) as pool:
+            monkeypatch.setattr(idx, "_get_process_pool", lambda processes: pool)
+            response = idx.upsert(
+                vectors=[(f"v{i}", [float(i)]) for i in range(10)],
+                batch_size=2,
+                show_progress=False,
+                workers="process",
+                processes=2,
+            )
+
+        assert sorted(id_ for ids in sent for id_ in ids) == sorted(f"v{i}" for i in range(10))
+        assert response.upserted_count == 8
+        # Two shards of five vectors, each cut into batches of 2, 2 and 1.
+        assert response.total_batch_count == 6
+        assert [e.batch_index for e in response.errors] == [3]
+        assert [item["id"] for item in response.failed_items] == ["v5", "v6"]
+
+    def test_process_mode_requires_batch_size(self) -> None:
+        idx = Index(host=INDEX_HOST, api_key="test-key")
+        with pytest.raises(PineconeValueError, match="requires batch_size"):
+            idx.upsert(vectors=[("v0", [0.0])], workers="process")
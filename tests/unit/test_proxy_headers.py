@@ -21,7 +21,7 @@ class TestProxyHeadersPassedToHttpxClient:
                 api_key="test-key",
                 proxy_url="http://proxy.example.com:8080",
                 proxy_headers=headers,
-            )
+            )._http  # the control-plane client is built on first use
             call_kwargs = mock_client_cls.call_args[1]
             proxy = call_kwargs["proxy"]
             assert isinstance(proxy, httpx.Proxy)
@@ -38,7 +38,7 @@ class TestProxyHeadersDefaultEmpty:
             Pinecone(
                 api_key="test-key",
                 proxy_url="http://proxy.example.com:8080",
-            )
+            )._http
             call_kwargs = mock_client_cls.call_args[1]
             proxy = call_kwargs["proxy"]
             assert proxy == "http://proxy.example.com:8080"
@@ -46,7 +46,7 @@ class TestProxyHeadersDefaultEmpty:
     def test_no_proxy_url_means_no_proxy(self) -> None:
         with patch("pinecone._internal.http_client.httpx.Client") as mock_client_cls:
             mock_client_cls.return_value = mock_client_cls
-            Pinecone(api_key="test-key")
+            Pinecone(api_key="test-key")._http
             call_kwargs = mock_client_cls.call_args[1]
             assert call_kwargs["proxy"] is None
 
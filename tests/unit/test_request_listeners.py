@@ -0,0 +1,235 @@
+"""Unit tests for request lifecycle events (``request_listeners``)."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import httpx
+import orjson
+import pytest
+import respx
+
+from pinecone import AsyncIndex, Index, Pinecone, RequestEvent
+from pinecone._internal.config import PineconeConfig, RetryConfig
+from pinecone.errors.exceptions import ApiError, PineconeConnectionError
+from pinecone.grpc import GrpcIndex
+
+INDEX_HOST = "test-index-abc1234.svc.us-east1-gcp.pinecone.io"
+QUERY_URL = f"https://{INDEX_HOST}/query"
+QUERY_BODY = {"matches": [{"id": "v1", "score": 0.9}], "namespace": "", "usage": {"readUnits": 5}}
+
+
+def _make_index(events: list[RequestEvent], **kwargs: Any) -> Index:
+    return Index(host=INDEX_HOST, api_key="test-key", request_listeners=[events.append], **kwargs)
+
+
+def _query_response(**kwargs: Any) -> httpx.Response:
+    return httpx.Response(200, json=QUERY_BODY, **kwargs)
+
+
+@respx.mock
+def test_operation_event_has_sizes_request_id_and_phases() -> None:
+    respx.post(QUERY_URL).mock(
+        return_value=_query_response(headers={"x-pinecone-request-id": "req-1"})
+    )
+    events: list[RequestEvent] = []
+
+    _make_index(events).query(top_k=1, vector=[0.1, 0.2])
+
+    assert len(events) == 1
+    event = events[0]
+    assert (event.transport, event.operation, event.method, event.path) == (
+        "rest",
+        "query",
+        "POST",
+        "/query",
+    )
+    assert event.host == INDEX_HOST
+    assert event.status_code == 200
+    assert event.request_id == "req-1"
+    assert event.read_units == 5
+    assert event.write_units is None
+    assert event.pool_in_use == 1
+    assert event.pool_size is not None and event.pool_size >= 1
+    assert event.request_bytes == len(respx.calls.last.request.content)
+    assert event.response_bytes == len(orjson.dumps(QUERY_BODY))
+    assert event.serialize is not None and event.serialize >= 0
+    assert event.decode is not None and event.decode >= 0
+    assert event.body_read is not None
+    assert event.total >= event.serialize + event.decode
+    assert [a.number for a in event.attempts] == [1]
+    assert event.retries == 0
+    assert event.error is None
+
+
+@respx.mock
+def test_retries_are_reported_as_attempts_with_backoff() -> None:
+    respx.post(QUERY_URL).mock(
+        side_effect=[
+            httpx.Response(429, headers={"retry-after": "0.25"}),
+            httpx.Response(503, headers={"retry-after": "0.5"}),
+            _query_response(),
+        ]
+    )
+    events: list[RequestEvent] = []
+
+    _make_index(events).query(top_k=1, vector=[0.1])
+
+    (event,) = events
+    assert [(a.number, a.status_code, a.backoff) for a in event.attempts] == [
+        (1, 429, 0.25),
+        (2, 503, 0.5),
+        (3, 200, 0.0),
+    ]
+    assert event.retries == 2
+    assert event.backoff == 0.75
+    assert event.status_code == 200
+
+
+def test_transport_failure_is_reported_with_error() -> None:
+    events: list[RequestEvent] = []
+    index = _make_index(events)
+
+    with respx.mock:
+        respx.post(QUERY_URL).mock(side_effect=httpx.ConnectError("refused"))
+        with pytest.raises(PineconeConnectionError):
+            index.query(top_k=1, vector=[0.1])
+
+    (event,) = events
+    assert event.operation == "query"
+    assert event.status_code is None
+    assert len(event.attempts) == RetryConfig().max_retries
+    assert all(isinstance(a.error, httpx.ConnectError) for a in event.attempts)
+    assert isinstance(event.error, PineconeConnectionError)
+
+
+@respx.mock
+def test_error_status_is_reported_with_api_error() -> None:
+    respx.post(QUERY_URL).mock(return_value=httpx.Response(400, json={"message": "bad"}))
+    events: list[RequestEvent] = []
+
+    with pytest.raises(ApiError):
+        _make_index(events).query(top_k=1, vector=[0.1])
+
+    (event,) = events
+    assert event.status_code == 400
+    assert isinstance(event.error, ApiError)
+
+
+@respx.mock
+def test_requests_outside_an_operation_are_reported_alone() -> None:
+    respx.get("https://api.pinecone.io/indexes").mock(
+        return_value=httpx.Response(200, json={"indexes": []})
+    )
+    events: list[RequestEvent] = []
+
+    Pinecone(api_key="test-key", request_listeners=[events.append]).indexes.list()
+
+    (event,) = events
+    assert (event.operation, event.method, event.path) == (None, "GET", "/indexes")
+    assert event.serialize is None
+    assert event.decode is None
+
+
+@respx.mock
+def test_no_events_without_listeners() -> None:
+    route = respx.post(QUERY_URL).mock(return_value=_query_response())
+
+    Index(host=INDEX_HOST, api_key="test-key").query(top_k=1, vector=[0.1])
+
+    assert "trace" not in route.calls.last.request.extensions
+
+
+@respx.mock
+def test_failing_listener_is_logged_not_raised(caplog: pytest.LogCaptureFixture) -> None:
+    respx.post(QUERY_URL).mock(return_value=_query_response())
+    events: list[RequestEvent] = []
+
+    def broken(event: RequestEvent) -> None:
+        raise RuntimeError("listener bug")
+
+    index = Index(host=INDEX_HOST, api_key="test-key", request_listeners=[broken, events.append])
+    with caplog.at_level(logging.ERROR, logger="pinecone._internal.instrumentation"):
+        response = index.query(top_k=1, vector=[0.1])
+
+    assert response.matches[0].id == "v1"
+    assert len(events) == 1
+    assert "Request listener" in caplog.text
+
+
+def test_config_stores_listeners_as_tuple() -> None:
+    listener = MagicMock()
+    config = PineconeConfig(api_key="k", request_listeners=[listener])  # type: ignore[arg-type]
+    assert config.request_listeners == (listener,)
+
+
+@pytest.mark.asyncio
+@respx.mock
+async def test_async_operation_event() -> None:
+    respx.post(QUERY_URL).mock(
+        side_effect=[httpx.Response(503, headers={"retry-after": "0"}), _query_response()]
+    )
+    events: list[RequestEvent] = []
+
+    async with AsyncIndex(
+        host=INDEX_HOST, api_key="test-key", request_listeners=[events.append]
+    ) as index:
+        await index.query(top_k=1, vector=[0.1])
+
+    (event,) = events
+    assert event.operation == "query"
+    assert [a.status_code for a in event.attempts] == [503, 200]
+    assert event.serialize is not None
+    assert event.decode is not None
+    assert event.response_bytes == len(orjson.dumps(QUERY_BODY))
+
+
+def _make_grpc_index(mock_channel: MagicMock, events: list[RequestEvent]) -> GrpcIndex:
+    mock_module = MagicMock()
+    mock_module.GrpcChannel.return_value = mock_channel
+    with patch.dict("sys.modules", {"pinecone._grpc": mock_module}):
+        return GrpcIndex(
+            host="test-index-abc123.svc.pinecone.io",
+            api_key="test-api-key",
+            request_listeners=[events.append],
+        )
+
+
+def test_grpc_rpcs_are_reported() -> None:
+    channel = MagicMock()
+    channel.query.return_value = {"matches": [], "namespace": "", "usage": {"read_units": 1}}
+    events: list[RequestEvent] = []
+
+    _make_grpc_index(channel, events).query(top_k=1, vector=[0.1])
+
+    (event,) = events
+    assert (event.transport, event.operation, event.method, event.path) == (
+        "grpc",
+        "query",
+        "Query",
+        "/VectorService/Query",
+    )
+    assert event.host == "test-index-abc123.svc.pinecone.io"
+    assert event.status_code == 200
+    assert event.serialize is not None
+    assert event.decode is not None
+    assert len(event.attempts) == 1
+    assert event.read_units == 1
+    assert event.pool_in_use is None
+
+
+def test_grpc_errors_are_reported_with_status() -> None:
+    channel = MagicMock()
+    channel.fetch.side_effect = ApiError("slow down", 429)
+    events: list[RequestEvent] = []
+
+    with pytest.raises(ApiError):
+        _make_grpc_index(channel, events).fetch(ids=["v1"])
+
+    (event,) = events
+    assert event.operation == "fetch"
+    assert event.status_code == 429
+    assert event.attempts[0].status_code == 429
+    assert isinstance(event.error, ApiError)
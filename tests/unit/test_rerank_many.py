@@ -0,0 +1,138 @@
+"""Unit tests for Inference.rerank_many and AsyncInference.rerank_many."""
+
+from __future__ import annotations
+
+import httpx
+import orjson
+import pytest
+import respx
+
+from pinecone._internal.config import PineconeConfig
+from pinecone.async_client.inference import AsyncInference
+from pinecone.client.inference import Inference
+from pinecone.errors.exceptions import ApiError, ValidationError
+from tests.factories import make_model_info
+
+BASE_URL = "https://api.test.pinecone.io"
+RERANK_URL = f"{BASE_URL}/rerank"
+
+
+class _RerankServer:
+    """Scores document ``"n"`` as ``n / 100`` and records each request body."""
+
+    def __init__(self) -> None:
+        self.bodies: list[dict[str, object]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        body = orjson.loads(request.content)
+        self.bodies.append(body)
+        scored = sorted(
+            ((int(doc["text"]) / 100, i) for i, doc in enumerate(body["documents"])),
+            reverse=True,
+        )
+        top_n = body.get("top_n") or len(scored)
+        return httpx.Response(
+            200,
+            json={
+                "model": body["model"],
+                "data": [{"index": i, "score": score} for score, i in scored[:top_n]],
+                "usage": {"rerank_units": 1},
+            },
+        )
+
+
+@pytest.fixture
+def inference() -> Inference:
+    return Inference(config=PineconeConfig(api_key="test-key", host=BASE_URL))
+
+
+def _documents(n: int) -> list[str]:
+    # Scores are not monotonic in input position.
+    return [str((i * 37) % n) for i in range(n)]
+
+
+@respx.mock
+def test_rerank_many_merges_shards_by_score(inference: Inference) -> None:
+    server = _RerankServer()
+    respx.post(RERANK_URL).mock(side_effect=server)
+    documents = _documents(50)
+
+    result = inference.rerank_many(
+        "bge-reranker-v2-m3", "q", documents, top_n=5, batch_size=8, max_concurrency=3
+    )
+
+    assert [documents[d.index] for d in result.data] == ["49", "48", "47", "46", "45"]
+    assert [d.document for d in result.data] == [
+        {"text": t} for t in ("49", "48", "47", "46", "45")
+    ]
+    assert result.usage.rerank_units == 7
+    assert len(server.bodies) == 7
+    # Each shard returns only its best five; the last shard has two documents.
+    assert [b["top_n"] for b in server.bodies].count(5) == 6
+    assert all(b["return_documents"] is False for b in server.bodies)
+
+
+@respx.mock
+def test_rerank_many_without_top_n_ranks_everything(inference: Inference) -> None:
+    respx.post(RERANK_URL).mock(side_effect=_RerankServer())
+    respx.get(f"{BASE_URL}/models/bge-reranker-v2-m3").mock(
+        return_value=httpx.Response(200, json=make_model_info(max_batch_size=4))
+    )
+    documents = _documents(10)
+
+    result = inference.rerank_many("bge-reranker-v2-m3", "q", documents, return_documents=False)
+
+    assert [documents[d.index] for d in result.data] == [str(n) for n in range(9, -1, -1)]
+    assert all(d.document is None for d in result.data)
+    assert result.usage.rerank_units == 3
+
+
+@respx.mock
+def test_rerank_many_second_round_reranks_finalists(inference: Inference) -> None:
+    server = _RerankServer()
+    respx.post(RERANK_URL).mock(side_effect=server)
+    documents = _documents(20)
+
+    result = inference.rerank_many(
+        "bge-reranker-v2-m3", "q", documents, top_n=2, batch_size=10, finalists=4
+    )
+
+    final = server.bodies[-1]
+    assert final["documents"] == [{"text": t} for t in ("19", "18", "17", "16")]
+    assert final["top_n"] == 2
+    assert [documents[d.index] for d in result.data] == ["19", "18"]
+    assert result.usage.rerank_units == 3
+
+
+@respx.mock
+def test_rerank_many_raises_first_failure(inference: Inference) -> None:
+    respx.post(RERANK_URL).mock(
+        return_value=httpx.Response(400, json={"error": {"message": "bad input"}})
+    )
+    with pytest.raises(ApiError):
+        inference.rerank_many("bge-reranker-v2-m3", "q", _documents(4), batch_size=2)
+
+
+def test_rerank_many_validates_arguments(inference: Inference) -> None:
+    with pytest.raises(ValidationError, match="top_n"):
+        inference.rerank_many("bge-reranker-v2-m3", "q", ["a"], top_n=0)
+    with pytest.raises(ValidationError, match="finalists"):
+        inference.rerank_many("bge-reranker-v2-m3", "q", ["a"], batch_size=5, finalists=6)
+    with pytest.raises(ValidationError, match="finalists"):
+        inference.rerank_many("bge-reranker-v2-m3", "q", ["a"], top_n=3, batch_size=5, finalists=2)
+
+
+@respx.mock
+@pytest.mark.asyncio
+async def test_async_rerank_many() -> None:
+    server = _RerankServer()
+    respx.post(RERANK_URL).mock(side_effect=server)
+    inference = AsyncInference(config=PineconeConfig(api_key="test-key", host=BASE_URL))
+    documents = _documents(30)
+
+    result = await inference.rerank_many(
+        "bge-reranker-v2-m3", "q", documents, top_n=3, batch_size=7, finalists=5
+    )
+
+    assert [documents[d.index] for d in result.data] == ["29", "28", "27"]
+    assert result.usage.rerank_units == 6
@@ -189,3 +189,23 @@ class TestFetchByMetadataPopulatesResponseInfo:
         result = idx.fetch_by_metadata(filter={"genre": {"$eq": "comedy"}})
         assert result.response_info is not None
         assert result.response_info.request_id == "req-fbm"
+
+
+class TestLazyResponseHeaders:
+    """lazy_response_headers=True keeps the headers until raw_headers is read."""
+
+    @respx.mock
+    def test_query_with_lazy_response_headers(self) -> None:
+        respx.post(f"{INDEX_HOST_HTTPS}/query").mock(
+            return_value=httpx.Response(
+                200,
+                json={"matches": [], "namespace": "", "usage": {"readUnits": 1}},
+                headers=RESPONSE_HEADERS,
+            )
+        )
+        idx = Index(host=INDEX_HOST, api_key="test-key", lazy_response_headers=True)
+        result = idx.query(top_k=10, vector=[0.1, 0.2])
+        assert result.response_info is not None
+        assert result.response_info.request_id == "req-abc"
+        assert result.response_info.lsn_reconciled == 40
+        assert result.response_info.raw_headers["x-pinecone-lsn-committed"] == "42"
@@ -0,0 +1,76 @@
+"""Unit tests for SSE framing and chat stream chunk decoding."""
+
+from __future__ import annotations
+
+import pytest
+
+from pinecone._internal.adapters.assistants_adapter import AssistantsAdapter
+from pinecone._internal.sse import SSEFramer, aiter_sse_data, iter_sse_data
+from pinecone.errors.exceptions import ResponseParsingError
+from pinecone.models.assistant.streaming import StreamContentChunk
+
+STREAM = (
+    b": keep-alive\n"
+    b"event: message\n"
+    b'data: {"n": 1}\n'
+    b"\n"
+    b'data:{"n": 2}\r\n'
+    b"\r\n"
+    b'data: {"n": 3}\r'
+    b'data: {"n": 4}\n'
+    b"data: [DONE]\n"
+    b'data: {"n": 5}\n'
+)
+PAYLOADS = [b'{"n": 1}', b'{"n": 2}', b'{"n": 3}', b'{"n": 4}']
+
+
+@pytest.mark.parametrize("size", [1, 2, 7, len(STREAM)])
+def test_framer_handles_any_chunking(size: int) -> None:
+    chunks = [STREAM[i : i + size] for i in range(0, len(STREAM), size)]
+    assert list(iter_sse_data(chunks)) == PAYLOADS
+
+
+def test_framer_flushes_final_line_without_newline() -> None:
+    assert list(iter_sse_data([b'data: {"a": 1}\ndata: {"b"', b": 2}"])) == [
+        b'{"a": 1}',
+        b'{"b": 2}',
+    ]
+
+
+def test_framer_ignores_input_after_done() -> None:
+    framer = SSEFramer()
+    assert framer.feed(b"data: [DONE]\n") == []
+    assert framer.done
+    assert framer.feed(b'data: {"late": true}\n') == []
+    assert framer.flush() == []
+
+
+@pytest.mark.anyio
+async def test_async_framer() -> None:
+    async def _chunks():  # type: ignore[no-untyped-def]
+        for i in range(0, len(STREAM), 5):
+            yield STREAM[i : i + 5]
+
+    assert [p async for p in aiter_sse_data(_chunks())] == PAYLOADS
+
+
+@pytest.fixture
+def anyio_backend() -> str:
+    return "asyncio"
+
+
+def test_chat_stream_chunk_decodes_by_type() -> None:
+    chunk = AssistantsAdapter.to_chat_stream_chunk(
+        b'{"type": "content_chunk", "id": "c1", "model": "gpt-4o", "delta": {"content": "Hi"}}'
+    )
+    assert isinstance(chunk, StreamContentChunk)
+    assert chunk.delta.content == "Hi"
+
+
+def test_chat_stream_chunk_unknown_type_is_none() -> None:
+    assert AssistantsAdapter.to_chat_stream_chunk(b'{"type": "reasoning", "id": "r1"}') is None
+
+
+def test_chat_stream_chunk_invalid_json_raises() -> None:
+    with pytest.raises(ResponseParsingError):
+        AssistantsAdapter.to_chat_stream_chunk(b'{"type": ')
@@ -0,0 +1,158 @@
+"""Unit tests for decoding vector metadata into a caller-registered type."""
+
+from __future__ import annotations
+
+import dataclasses
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import httpx
+import msgspec
+import pytest
+import respx
+
+from pinecone import AsyncIndex, Index
+from pinecone._internal.adapters.vectors_adapter import VectorsAdapter, typed_vector_models
+from pinecone.errors.exceptions import PineconeValueError, ResponseParsingError
+from pinecone.grpc import GrpcIndex
+from pinecone.models.vectors.responses import FetchResponse, QueryResponse
+from pinecone.models.vectors.search import SearchRecordsResponse
+from pinecone.models.vectors.vector import ScoredVector, Vector
+
+INDEX_HOST = "test-index-abc1234.svc.us-east1-gcp.pinecone.io"
+INDEX_HOST_HTTPS = f"https://{INDEX_HOST}"
+
+
+class Movie(msgspec.Struct):
+    genre: str
+    year: int = 0
+
+
+@dataclasses.dataclass
+class Article:
+    title: str
+
+
+def _query_payload(metadata: dict[str, Any]) -> bytes:
+    return msgspec.json.encode(
+        {
+            "matches": [
+                {"id": "v1", "score": 0.9, "metadata": metadata},
+                {"id": "v2", "score": 0.5},
+            ],
+            "namespace": "ns",
+        }
+    )
+
+
+class TestTypedVectorModels:
+    def test_models_are_cached_per_type(self) -> None:
+        assert typed_vector_models(Movie) is typed_vector_models(Movie)
+
+    def test_models_subclass_untyped_models(self) -> None:
+        models = typed_vector_models(Movie)
+        assert issubclass(models.vector, Vector)
+        assert issubclass(models.scored_vector, ScoredVector)
+        assert issubclass(models.query_response, QueryResponse)
+        assert issubclass(models.search_response, SearchRecordsResponse)
+
+    @pytest.mark.parametrize("bad", [dict, int, "Movie", Movie(genre="x")])
+    def test_rejects_non_struct_types(self, bad: Any) -> None:
+        with pytest.raises(PineconeValueError, match="metadata_type"):
+            typed_vector_models(bad)
+
+
+class TestAdapterDecoding:
+    def test_query_metadata_decoded_into_struct(self) -> None:
+        result = VectorsAdapter.to_query_response(_query_payload({"genre": "drama"}), Movie)
+        assert isinstance(result, QueryResponse)
+        assert result.matches[0].metadata == Movie(genre="drama")
+        assert result.matches[1].metadata is None
+        assert result.namespace == "ns"
+
+    def test_query_metadata_validated(self) -> None:
+        with pytest.raises(ResponseParsingError, match=r"metadata\.genre"):
+            VectorsAdapter.to_query_response(_query_payload({"genre": 1}), Movie)
+
+    def test_fetch_metadata_decoded_into_dataclass(self) -> None:
+        data = msgspec.json.encode(
+            {"vectors": {"a": {"id": "a", "values": [0.1], "metadata": {"title": "t"}}}}
+        )
+        result = VectorsAdapter.to_fetch_response(data, Article)
+        assert isinstance(result, FetchResponse)
+        assert result.vectors["a"].metadata == Article(title="t")
+        assert result.to_dict()["vectors"]["a"]["metadata"] == {"title": "t"}
+
+    def test_search_hit_fields_decoded(self) -> None:
+        data = msgspec.json.encode(
+            {
+                "result": {"hits": [{"_id": "a", "_score": 0.3, "fields": {"genre": "comedy"}}]},
+                "usage": {"read_units": 1},
+            }
+        )
+        result = VectorsAdapter.to_search_response(data, Movie)
+        assert result.result.hits[0].fields == Movie(genre="comedy")
+        assert result.result.hits[0].id == "a"
+
+    def test_untyped_decoding_unchanged(self) -> None:
+        result = VectorsAdapter.to_query_response(_query_payload({"genre": "drama"}))
+        assert result.matches[0].metadata == {"genre": "drama"}
+
+
+class TestIndexMetadataType:
+    def test_invalid_type_rejected_at_construction(self) -> None:
+        with pytest.raises(PineconeValueError):
+            Index(host=INDEX_HOST, api_key="test-key", metadata_type=dict)
+
+    @respx.mock
+    def test_query_returns_typed_metadata(self) -> None:
+        respx.post(f"{INDEX_HOST_HTTPS}/query").mock(
+            return_value=httpx.Response(200, content=_query_payload({"genre": "drama", "year": 1}))
+        )
+        idx = Index(host=INDEX_HOST, api_key="test-key", metadata_type=Movie)
+        result = idx.query(top_k=2, vector=[0.1, 0.2])
+        assert result.matches[0].metadata == Movie(genre="drama", year=1)
+        assert result.response_info is not None
+
+    @respx.mock
+    async def test_async_query_returns_typed_metadata(self) -> None:
+        respx.post(f"{INDEX_HOST_HTTPS}/query").mock(
+            return_value=httpx.Response(200, content=_query_payload({"genre": "drama"}))
+        )
+        async with AsyncIndex(host=INDEX_HOST, api_key="test-key", metadata_type=Movie) as idx:
+            result = await idx.query(top_k=2, vector=[0.1, 0.2])
+        assert result.matches[0].metadata == Movie(genre="drama")
+
+
+class TestGrpcIndexMetadataType:
+    def _make(self, channel: MagicMock) -> GrpcIndex:
+        module = MagicMock()
+        module.GrpcChannel.return_value = channel
+        with patch.dict("sys.modules", {"pinecone._grpc": module}):
+            return GrpcIndex(host=INDEX_HOST, api_key="test-key", metadata_type=Movie)
+
+    def test_query_converts_metadata(self) -> None:
+        channel = MagicMock()
+        channel.query.return_value = {
+            "matches": [{"id": "v1", "score": 0.9, "metadata": {"genre": "drama"}}],
+            "namespace": "",
+        }
+        result = self._make(channel).query(top_k=1, vector=[0.1])
+        assert result.matches[0].metadata == Movie(genre="drama")
+
+    def test_fetch_converts_metadata(self) -> None:
+        channel = MagicMock()
+        channel.fetch.return_value = {
+            "vectors": {"a": {"values": [0.1], "metadata": {"genre": "x", "year": 2}}},
+            "namespace": "",
+        }
+        result = self._make(channel).fetch(ids=["a"])
+        assert result.vectors["a"].metadata == Movie(genre="x", year=2)
+
+    def test_fetch_invalid_metadata_raises(self) -> None:
+        channel = MagicMock()
+        channel.fetch.return_value = {
+            "vectors": {"a": {"values": [0.1], "metadata": {"year": 2}}},
+        }
+        with pytest.raises(ResponseParsingError):
+            self._make(channel).fetch(ids=["a"])
@@ -9,6 +9,7 @@ import pytest
 import respx
 
 from pinecone import Index
+from pinecone._internal.records import iter_ndjson_batches
 from pinecone.errors.exceptions import ValidationError
 from pinecone.models.vectors.responses import UpsertRecordsResponse
 
@@ -211,3 +212,105 @@ class TestUpsertRecords:
         )
 
         assert result["record_count"] == 1
+
+
+class TestNdjsonBatches:
+    """Tests for the lazy NDJSON batch encoder."""
+
+    def test_splits_by_record_count(self) -> None:
+        records = [{"_id": str(i), "text": "t"} for i in range(7)]
+        batches = list(iter_ndjson_batches(records, batch_size=3))
+        assert [len(items) for items, _ in batches] == [3, 3, 1]
+        assert batches[0][0][0] is records[0]
+        assert (
+            batches[0][1]
+            == b"\n".join(json.dumps(r, separators=(",", ":")).encode() for r in records[:3])
+            + b"\n"
+        )
+
+    def test_splits_by_payload_bytes(self) -> None:
+        records = [{"_id": str(i), "text": "x" * 100} for i in range(5)]
+        batches = list(iter_ndjson_batches(records, batch_size=96, max_bytes=250))
+        assert [len(items) for items, _ in batches] == [2, 2, 1]
+        assert all(len(body) <= 250 for _, body in batches)
+
+    def test_oversized_record_sent_alone(self) -> None:
+        records = [{"_id": "a", "text": "x" * 500}, {"_id": "b"}]
+        batches = list(iter_ndjson_batches(records, batch_size=96, max_bytes=100))
+        assert [[r["_id"] for r in items] for items, _ in batches] == [["a"], ["b"]]
+
+    def test_invalid_record_raises_when_reached(self) -> None:
+        batches = iter_ndjson_batches([{"_id": "a"}, {"_id": "b"}, {"text": "x"}], batch_size=2)
+        assert len(next(batches)[0]) == 2
+        with pytest.raises(ValidationError, match="Record at index 2"):
+            next(batches)
+
+    def test_caller_records_not_mutated(self) -> None:
+        record = {"id": "r1", "text": "hello"}
+        ((_, body),) = iter_ndjson_batches([record], batch_size=1)
+        assert record == {"id": "r1", "text": "hello"}
+        assert json.loads(body) == {"_id": "r1", "text": "hello"}
+
+
+class TestUpsertRecordsBatched:
+    """Tests for upsert_records(batch_size=...) — concurrent, streamed batches."""
+
+    @respx.mock
+    def test_generator_input_sent_in_batches(self) -> None:
+        route = respx.post(UPSERT_URL).mock(return_value=httpx.Response(201))
+        idx = _make_index()
+        result = idx.upsert_records(
+            namespace="test-ns",
+            records=({"_id": f"r{i}", "text": "hello"} for i in range(10)),
+            batch_size=4,
+            show_progress=False,
+        )
+
+        assert route.call_count == 3
+        sent = sorted(
+            json.loads(line)["_id"]
+            for call in route.calls
+            for line in call.request.content.decode().splitlines()
+        )
+        assert sent == sorted(f"r{i}" for i in range(10))
+        assert result.record_count == 10
+        assert result.total_batch_count == 3
+        assert result.has_errors is False
+
+    @respx.mock
+    def test_partial_failure_reported(self) -> None:
+        def _respond(request: httpx.Request) -> httpx.Response:
+            if b'"r0"' in request.content:
+                return httpx.Response(400, json={"error": {"message": "bad batch"}})
+            return httpx.Response(201, headers={"x-pinecone-lsn-committed": "7"})
+
+        respx.post(UPSERT_URL).mock(side_effect=_respond)
+        idx = _make_index()
+        result = idx.upsert_records(
+            namespace="test-ns",
+            records=[{"_id": f"r{i}", "text": "hello"} for i in range(4)],
+            batch_size=2,
+            show_progress=False,
+        )
+
+        assert result.has_errors is True
+        assert result.record_count == 2
+        assert result.failed_item_count == 2
+        assert [r["_id"] for r in result.failed_items] == ["r0", "r1"]
+        assert result.response_info is not None
+        assert result.response_info.lsn_committed == 7
+
+    def test_batch_size_above_api_limit_rejected(self) -> None:
+        idx = _make_index()
+        with pytest.raises(ValidationError, match="batch_size"):
+            idx.upsert_records(namespace="test-ns", records=[{"_id": "r1"}], batch_size=97)
+
+    def test_empty_list_rejected(self) -> None:
+        idx = _make_index()
+        with pytest.raises(ValidationError, match="non-empty"):
+            idx.upsert_records(namespace="test-ns", records=[], batch_size=10)
+
+    def test_empty_iterable_rejected(self) -> None:
+        idx = _make_index()
+        with pytest.raises(ValidationError, match="non-empty"):
+            idx.upsert_records(namespace="test-ns", records=iter([]), batch_size=10)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from array import array
+
 import pytest
 
 from pinecone._internal.vector_factory import VectorFactory
@@ -228,6 +230,96 @@ class TestSparseValuesValidation:
             )
 
 
+class TestCompactSparseValues:
+    """Array-backed sparse components are accepted and kept unboxed."""
+
+    def test_array_components_kept_as_is(self) -> None:
+        indices = array("I", [3, 7])
+        values = array("f", [0.5, 0.25])
+        result = VectorFactory.build(
+            {"id": "v1", "values": [0.1], "sparse_values": {"indices": indices, "values": values}}
+        )
+        assert result.sparse_values is not None
+        assert result.sparse_values.indices is indices
+        assert result.sparse_values.values is values
+
+    def test_numpy_components_kept_as_is(self) -> None:
+        np = pytest.importorskip("numpy")
+        indices = np.array([1, 2], dtype=np.uint32)
+        values = np.array([0.1, 0.2], dtype=np.float32)
+        result = VectorFactory.build(
+            {"id": "v1", "sparse_values": {"indices": indices, "values": values}}
+        )
+        assert result.sparse_values is not None
+        assert result.sparse_values.indices is indices
+
+    def test_float_index_array_rejected(self) -> None:
+        with pytest.raises(PineconeTypeError, match="integer array"):
+            VectorFactory.build(
+                {
+                    "id": "v1",
+                    "sparse_values": {"indices": array("f", [1.0]), "values": array("f", [1.0])},
+                }
+            )
+
+    def test_two_dimensional_numpy_rejected(self) -> None:
+        np = pytest.importorskip("numpy")
+        with pytest.raises(PineconeTypeError, match="values must be floats"):
+            VectorFactory.build(
+                {
+                    "id": "v1",
+                    "sparse_values": {
+                        "indices": np.array([1, 2], dtype=np.uint32),
+                        "values": np.ones((2, 1), dtype=np.float32),
+                    },
+                }
+            )
+
+    def test_mismatched_lengths_rejected(self) -> None:
+        with pytest.raises(PineconeValueError, match="same length"):
+            VectorFactory.build(
+                {
+                    "id": "v1",
+                    "sparse_values": {"indices": array("I", [1, 2]), "values": array("f", [1.0])},
+                }
+            )
+
+    def test_out_of_range_numpy_indices_rejected(self) -> None:
+        np = pytest.importorskip("numpy")
+        for indices in (np.array([-1, 2]), np.array([1, 2**33])):
+            with pytest.raises(PineconeValueError, match="between 0 and 4294967295"):
+                VectorFactory.build(
+                    {
+                        "id": "v1",
+                        "sparse_values": {"indices": indices, "values": np.array([0.1, 0.2])},
+                    }
+                )
+
+    @pytest.mark.parametrize(
+        ("indices", "bad"),
+        [
+            (array("q", [-1, 2]), -1),
+            (array("i", [2, -7]), -7),
+            (array("h", [-3, 2]), -3),
+            (array("q", [1, 2**32]), 2**32),
+            (array("Q", [1, 2**40]), 2**40),
+        ],
+    )
+    def test_out_of_range_array_indices_rejected(self, indices: array[int], bad: int) -> None:
+        with pytest.raises(PineconeValueError, match=f"got {bad}"):
+            VectorFactory.build(
+                {"id": "v1", "sparse_values": {"indices": indices, "values": [0.1, 0.2]}}
+            )
+
+    def test_wide_array_within_range_accepted(self) -> None:
+        indices = array("q", [0, 2**32 - 1])
+        result = VectorFactory.build(
+            {"id": "v1", "sparse_values": {"indices": indices, "values": [0.1, 0.2]}}
+        )
+        assert result.sparse_values is not None
+        assert result.sparse_values.indices is indices
+
+
 class TestGeneralValidation:
     """unified-vecfmt-0016, 0017."""
 
@@ -286,3 +378,68 @@ class TestUnsupportedTypes:
     def test_int_rejected(self) -> None:
         with pytest.raises(PineconeTypeError, match="got int"):
             VectorFactory.build(42)
+
+
+class TestBuildMany:
+    """VectorFactory.build_many — bulk conversion with per-batch shape detection."""
+
+    def test_empty_input(self) -> None:
+        assert VectorFactory.build_many([]) == []
+
+    def test_tuples(self) -> None:
+        result = VectorFactory.build_many([("a", [0.1]), ("b", (0.2,), {"k": "v"})])
+        assert result == [Vector("a", [0.1]), Vector("b", [0.2], None, {"k": "v"})]
+
+    def test_dense_dicts(self) -> None:
+        result = VectorFactory.build_many(
+            [{"id": "a", "values": [0.1]}, {"id": "b", "values": [0.2], "metadata": {"k": 1}}]
+        )
+        assert result == [Vector("a", [0.1]), Vector("b", [0.2], None, {"k": 1})]
+
+    def test_vectors_passthrough(self) -> None:
+        vectors = [Vector("a", [0.1]), Vector("b", [0.2])]
+        result = VectorFactory.build_many(vectors)
+        assert result == vectors
+        assert result is not vectors
+
+    def test_accepts_generator(self) -> None:
+        result = VectorFactory.build_many((f"id{i}", [float(i)]) for i in range(3))
+        assert [v.id for v in result] == ["id0", "id1", "id2"]
+
+    def test_mixed_shapes_fall_back(self) -> None:
+        result = VectorFactory.build_many(
+            [
+                ("a", [0.1]),
+                {"id": "b", "sparse_values": {"indices": [1], "values": [0.5]}},
+                Vector("c", [0.3]),
+            ]
+        )
+        assert [v.id for v in result] == ["a", "b", "c"]
+        assert result[1].sparse_values == SparseValues([1], [0.5])
+
+    def test_sparse_dicts(self) -> None:
+        result = VectorFactory.build_many(
+            [{"id": "a", "values": [0.1], "sparse_values": {"indices": [1], "values": [1]}}]
+        )
+        assert result[0].sparse_values == SparseValues([1], [1.0])
+
+    @pytest.mark.parametrize(
+        "items",
+        [
+            [("a", [0.1]), ("b\x00", [0.2])],
+            [{"id": "a", "values": [0.1]}, {"id": "é", "values": [0.2]}],
+        ],
+    )
+    def test_invalid_id_in_batch_raises_per_item_error(self, items: list[object]) -> None:
+        with pytest.raises(PineconeValueError, match="Vector ID must"):
+            VectorFactory.build_many(items)
+
+    def test_unrecognized_key_after_fast_prefix(self) -> None:
+        with pytest.raises(PineconeValueError, match="unrecognized keys"):
+            VectorFactory.build_many(
+                [{"id": "a", "values": [0.1]}, {"id": "b", "values": [0.2], "extra": 1}]
+            )
+
+    def test_invalid_metadata_type_raises(self) -> None:
+        with pytest.raises(PineconeTypeError, match="metadata must be a dict"):
+            VectorFactory.build_many([("a", [0.1], "not-a-dict")])
@@ -0,0 +1,231 @@
+"""Unit tests for upsert_from_file and the memory-mapped vector file readers."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import httpx
+import orjson
+import pytest
+import respx
+
+from pinecone import AsyncIndex, Index
+from pinecone._internal.vector_files import VectorFile, iter_file_vectors, iter_ids
+from pinecone.errors.exceptions import PineconeValueError
+from pinecone.grpc import GrpcIndex
+
+np = pytest.importorskip("numpy")
+
+INDEX_HOST = "test-index-abc1234.svc.us-east1-gcp.pinecone.io"
+UPSERT_URL = f"https://{INDEX_HOST}/vectors/upsert"
+
+
+def _matrix(rows: int, dim: int = 3) -> Any:
+    return np.arange(rows * dim, dtype=np.float32).reshape(rows, dim) / 4
+
+
+def _write_vecs(path: Path, matrix: Any, dtype: str) -> Path:
+    rows, dim = matrix.shape
+    dims = np.full((rows, 1), dim, dtype="<i4")
+    body = matrix.astype(dtype)
+    with path.open("wb") as f:
+        for i in range(rows):
+            f.write(dims[i].tobytes())
+            f.write(body[i].tobytes())
+    return path
+
+
+class _Server:
+    def __init__(self) -> None:
+        self.sent: list[dict[str, Any]] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        vectors = orjson.loads(request.content)["vectors"]
+        self.sent.extend(vectors)
+        return httpx.Response(200, json={"upsertedCount": len(vectors)})
+
+
+class TestVectorFile:
+    def test_npy_rows_are_views_of_the_mapping(self, tmp_path: Path) -> None:
+        matrix = _matrix(5)
+        np.save(tmp_path / "v.npy", matrix)
+        with VectorFile(tmp_path / "v.npy") as file:
+            assert (len(file), file.dimension) == (5, 3)
+            block = file.read(1, 4)
+            assert isinstance(block.base, np.memmap) or isinstance(block, np.memmap)
+            np.testing.assert_array_equal(block, matrix[1:4])
+
+    def test_fvecs_and_bvecs(self, tmp_path: Path) -> None:
+        matrix = _matrix(4)
+        fvecs = _write_vecs(tmp_path / "v.fvecs", matrix, "<f4")
+        bvecs = _write_vecs(tmp_path / "v.bvecs", np.arange(12).reshape(4, 3), "u1")
+        with VectorFile(fvecs) as file:
+            np.testing.assert_array_equal(file.read(0, 4), matrix)
+        with VectorFile(bvecs) as file:
+            block = file.read(2, 4)
+            assert block.dtype == np.float32
+            assert block.tolist() == [[6.0, 7.0, 8.0], [9.0, 10.0, 11.0]]
+
+    def test_fvecs_rejects_mixed_dimensions(self, tmp_path: Path) -> None:
+        path = _write_vecs(tmp_path / "v.fvecs", _matrix(3), "<f4")
+        raw = bytearray(path.read_bytes())
+        raw[32:36] = np.int32(7).tobytes()  # dimension field of row 2
+        path.write_bytes(bytes(raw))
+        with (
+            VectorFile(path) as file,
+            pytest.raises(PineconeValueError, match=r"Row 2 .* has dimension 7"),
+        ):
+            file.read(0, 3)
+
+    def test_invalid_files(self, tmp_path: Path) -> None:
+        (tmp_path / "v.fvecs").write_bytes(np.int32(3).tobytes() + b"\x00" * 5)
+        with pytest.raises(PineconeValueError, match=r"not a valid \.fvecs"):
+            VectorFile(tmp_path / "v.fvecs")
+        np.save(tmp_path / "flat.npy", np.zeros(4, dtype=np.float32))
+        with pytest.raises(PineconeValueError, match="two-dimensional"):
+            VectorFile(tmp_path / "flat.npy")
+        with pytest.raises(PineconeValueError, match="infer the format"):
+            VectorFile(tmp_path / "v.bin")
+
+    def test_hdf5_dataset(self, tmp_path: Path) -> None:
+        h5py = pytest.importorskip("h5py")
+        with h5py.File(tmp_path / "ann.hdf5", "w") as f:
+            f["train"] = _matrix(3)
+        with VectorFile(tmp_path / "ann.hdf5") as file:
+            np.testing.assert_array_equal(file.read(0, 3), _matrix(3))
+
+
+class TestIds:
+    def test_sources(self, tmp_path: Path) -> None:
+        (tmp_path / "ids.txt").write_text("a\nb\r\nc\nd\n")
+        assert list(iter_ids(None, 2, 4)) == ["2", "3"]
+        assert list(iter_ids(range(100, 110), 1, 3)) == ["101", "102"]
+        assert list(iter_ids(tmp_path / "ids.txt", 1, 3)) == ["b", "c"]
+        assert list(iter_ids(np.array([b"x", b"y"]), 0, 2)) == ["x", "y"]
+        assert list(iter_ids(np.arange(5), 3, 5)) == ["3", "4"]
+
+    def test_short_sources_raise(self, tmp_path: Path) -> None:
+        (tmp_path / "ids.txt").write_text("a\nb\n")
+        with pytest.raises(PineconeValueError, match="has 2 lines"):
+            list(iter_ids(tmp_path / "ids.txt", 0, 3))
+        with pytest.raises(PineconeValueError, match="has 2 entries"):
+            list(iter_ids(["a", "b"], 0, 3))
+
+    @pytest.mark.parametrize(
+        ("ids", "match"),
+        [(["a", ""], "must not be empty"), (["a", "é"], "ASCII"), (["a\x00"], "null")],
+    )
+    def test_invalid_ids_raise(self, ids: list[str], match: str, tmp_path: Path) -> None:
+        (tmp_path / "ids.txt").write_text("\n".join(ids) + "\n", encoding="utf-8")
+        with pytest.raises(PineconeValueError, match=match):
+            list(iter_ids(ids, 0, len(ids)))
+        with pytest.raises(PineconeValueError, match=match):
+            list(iter_ids(tmp_path / "ids.txt", 0, len(ids)))
+
+    def test_rows_cross_block_boundaries(self, tmp_path: Path) -> None:
+        np.save(tmp_path / "v.npy", _matrix(2500, 2))
+        with VectorFile(tmp_path / "v.npy") as file:
+            items = list(iter_file_vectors(file, None, start=1000, stop=2100, as_lists=True))
+        assert len(items) == 1100
+        assert items[-1] == {"id": "2099", "values": (_matrix(2500, 2)[2099]).tolist()}
+
+
+class TestIndexUpsertFromFile:
+    @respx.mock
+    def test_streams_rows_in_batches(self, tmp_path: Path) -> None:
+        server = _Server()
+        route = respx.post(UPSERT_URL).mock(side_effect=server)
+        np.save(tmp_path / "v.npy", _matrix(7))
+        idx = Index(host=INDEX_HOST, api_key="test-key")
+
+        response = idx.upsert_from_file(
+            tmp_path / "v.npy",
+            ids=[f"doc-{i}" for i in range(7)],
+            start=2,
+            batch_size=2,
+            show_progress=False,
+        )
+
+        assert route.call_count == 3
+        assert response.upserted_count == 5
+        assert response.total_batch_count == 3
+        assert [v["id"] for v in server.sent] == [f"doc-{i}" for i in range(2, 7)]
+        assert server.sent[0]["values"] == _matrix(7)[2].tolist()
+
+    @respx.mock
+    def test_checkpoint_resumes(self, tmp_path: Path) -> None:
+        server = _Server()
+        respx.post(UPSERT_URL).mock(side_effect=server)
+        _write_vecs(tmp_path / "v.fvecs", _matrix(4), "<f4")
+        idx = Index(host=INDEX_HOST, api_key="test-key")
+        for _ in range(2):
+            response = idx.upsert_from_file(
+                tmp_path / "v.fvecs",
+                batch_size=2,
+                show_progress=False,
+                checkpoint=tmp_path / "load.ckpt",
+            )
+        assert len(server.sent) == 4
+        assert response.upserted_count == 4
+
+    @respx.mock
+    def test_invalid_id_is_rejected_before_sending(self, tmp_path: Path) -> None:
+        route = respx.post(UPSERT_URL).mock(side_effect=_Server())
+        np.save(tmp_path / "v.npy", _matrix(2))
+        idx = Index(host=INDEX_HOST, api_key="test-key")
+        with pytest.raises(PineconeValueError, match="ASCII"):
+            idx.upsert_from_file(tmp_path / "v.npy", ids=["é", "b"], show_progress=False)
+        assert route.call_count == 0
+
+    def test_invalid_row_range(self, tmp_path: Path) -> None:
+        np.save(tmp_path / "v.npy", _matrix(2))
+        idx = Index(host=INDEX_HOST, api_key="test-key")
+        with pytest.raises(PineconeValueError, match="must not be less than start"):
+            idx.upsert_from_file(tmp_path / "v.npy", start=2, stop=1)
+
+
+class TestGrpcUpsertFromFile:
+    def test_sends_rows_as_lists(self, tmp_path: Path) -> None:
+        channel = MagicMock()
+        channel.upsert.side_effect = lambda chunk, ns, timeout_s: {"upserted_count": len(chunk)}
+        module = MagicMock()
+        module.GrpcChannel.return_value = channel
+        with patch.dict("sys.modules", {"pinecone._grpc": module}):
+            idx = GrpcIndex(host="test-index-abc123.svc.pinecone.io", api_key="test-api-key")
+        np.save(tmp_path / "v.npy", _matrix(3).astype(np.float64))
+
+        response = idx.upsert_from_file(
+            tmp_path / "v.npy", ids=range(10, 13), namespace="ns", batch_size=2, show_progress=False
+        )
+
+        assert response.upserted_count == 3
+        first, namespace = channel.upsert.call_args_list[0].args
+        assert namespace == "ns"
+        assert first == [
+            {"id": "10", "values": _matrix(3)[0].tolist()},
+            {"id": "11", "values": _matrix(3)[1].tolist()},
+        ]
+
+
+class TestAsyncUpsertFromFile:
+    @pytest.fixture
+    def anyio_backend(self) -> str:
+        return "asyncio"
+
+    @respx.mock
+    async def test_streams_rows(self, tmp_path: Path) -> None:
+        server = _Server()
+        respx.post(UPSERT_URL).mock(side_effect=server)
+        _write_vecs(tmp_path / "v.bvecs", np.arange(6).reshape(2, 3), "u1")
+        (tmp_path / "ids.txt").write_text("x\ny\n")
+        async with AsyncIndex(host=INDEX_HOST, api_key="test-key") as idx:
+            response = await idx.upsert_from_file(
+                tmp_path / "v.bvecs", ids=tmp_path / "ids.txt", show_progress=False
+            )
+        assert response.upserted_count == 2
+        assert server.sent == [
+            {"id": "x", "values": [0.0, 1.0, 2.0]},
+            {"id": "y", "values": [3.0, 4.0, 5.0]},
+        ]